@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from functools import cmp_to_key
 from typing import Any, Iterable, Mapping
 
+from django.db import connections
 from django.db.models import QuerySet
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from rest_framework.exceptions import ValidationError
 
+ESTIMATED_COUNT_EXACT_BELOW = 10_000
+
 
 @dataclass(frozen=True)
 class OrderingConfig:
@@ -210,3 +214,30 @@ def sort_records(
 ) -> list[dict[str, Any]]:
     """Sort a list of API records using the same ordering model as querysets."""
     return config.sort_records(records, raw)
+
+
+def estimated_count(
+    queryset: QuerySet,
+    *,
+    exact_below: int = ESTIMATED_COUNT_EXACT_BELOW,
+) -> tuple[int, bool]:
+    """Return ``(count, is_exact)`` from the PostgreSQL planner's row estimate.
+
+    Estimates under *exact_below* are replaced by an exact ``COUNT(*)``,
+    which is cheap there and where planner statistics are least reliable.
+    Other backends always count exactly.
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count(), True
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < exact_below:
+        return queryset.count(), True
+    return estimate, False
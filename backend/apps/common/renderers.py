@@ -0,0 +1,92 @@
+"""JSON renderers for large, row-oriented API payloads.
+
+``TimedJSONRenderer`` is DRF's JSON renderer plus a ``Server-Timing``
+``serialize`` entry. ``ColumnarJSONRenderer`` is the opt-in fast path,
+selected with ``?format=columnar`` or its media type: it reshapes the view's
+row list into one array per field, so field names are written once per
+payload instead of once per row, and encodes it with DRF's JSON encoder.
+"""
+
+from __future__ import annotations
+
+import json
+from time import perf_counter
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+SERVER_TIMING_HEADER = "Server-Timing"
+DEFAULT_COLUMNAR_ROWS_KEY = "results"
+
+
+def columnar_rows(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Return ``{field: [value, ...]}`` for *rows*; absent fields become None."""
+    columns: dict[str, list[Any]] = {}
+    for index, row in enumerate(rows):
+        for key in row:
+            if key not in columns:
+                columns[key] = [None] * index
+        for key, values in columns.items():
+            values.append(row.get(key))
+    return columns
+
+
+def add_server_timing(renderer_context: dict[str, Any] | None, name: str, seconds: float) -> None:
+    """Append a ``name;dur=<ms>`` entry to the response's Server-Timing header."""
+    response = (renderer_context or {}).get("response")
+    if response is None:
+        return
+    entry = f"{name};dur={seconds * 1000:.2f}"
+    existing = response.get(SERVER_TIMING_HEADER)
+    response[SERVER_TIMING_HEADER] = f"{existing}, {entry}" if existing else entry
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """Default JSON rendering that reports its own duration."""
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        started = perf_counter()
+        content = super().render(data, accepted_media_type, renderer_context)
+        add_server_timing(renderer_context, "serialize", perf_counter() - started)
+        return content
+
+
+class ColumnarJSONRenderer(TimedJSONRenderer):
+    """Column-oriented JSON for bulk chart and history payloads.
+
+    Views name their row list with ``columnar_rows_key`` (default
+    ``results``); other keys of the payload are rendered unchanged.
+    """
+
+    media_type = "application/vnd.autoforex.columnar+json"
+    format = "columnar"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        started = perf_counter()
+        view = (renderer_context or {}).get("view")
+        key = getattr(view, "columnar_rows_key", DEFAULT_COLUMNAR_ROWS_KEY)
+        rows = data.get(key) if isinstance(data, dict) else None
+        if isinstance(rows, list) and all(isinstance(row, dict) for row in rows):
+            data = {**data, key: columnar_rows(rows)}
+        content = _dumps(data)
+        add_server_timing(renderer_context, "serialize", perf_counter() - started)
+        return content
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
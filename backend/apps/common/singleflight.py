@@ -0,0 +1,102 @@
+"""Cross-process single-flight loading on top of the Django cache."""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections.abc import Callable
+from logging import Logger, getLogger
+from typing import Any, TypeVar
+
+from django.core.cache import cache as default_cache
+
+logger: Logger = getLogger(name=__name__)
+
+T = TypeVar("T")
+
+DEFAULT_LOCK_SECONDS = 30.0
+DEFAULT_WAIT_SECONDS = 10.0
+DEFAULT_POLL_SECONDS = 0.05
+
+
+class CacheSingleFlight:
+    """Coalesce concurrent loads of the same cache key across workers.
+
+    The first caller to claim ``<key>:lock`` with ``cache.add`` runs the
+    loader and stores its result under ``key``; everyone else polls ``key``
+    until the result appears. Waiters fall back to loading themselves when the
+    leader releases the lock without a result (its load failed) or the wait
+    budget runs out, so a stuck leader never blocks callers indefinitely.
+    Loader exceptions and ``None`` results are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Any = None,
+        lock_seconds: float = DEFAULT_LOCK_SECONDS,
+        wait_seconds: float = DEFAULT_WAIT_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.cache = cache if cache is not None else default_cache
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_seconds = poll_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+    @staticmethod
+    def lock_key(key: str) -> str:
+        return f"{key}:lock"
+
+    def get_or_load(self, key: str, loader: Callable[[], T], *, ttl_seconds: float) -> T:
+        """Return the cached value for *key*, loading it at most once at a time."""
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        lock_key = self.lock_key(key)
+        token = secrets.token_hex(8)
+        if self.cache.add(lock_key, token, timeout=self.lock_seconds):
+            return self._load_as_leader(key, lock_key, token, loader, ttl_seconds)
+
+        value = self._wait_for_leader(key, lock_key)
+        if value is not None:
+            return value
+
+        logger.debug("Single-flight wait for %s gave up; loading directly", key)
+        return self._store(key, loader(), ttl_seconds)
+
+    def _store(self, key: str, value: T, ttl_seconds: float) -> T:
+        if value is not None:
+            self.cache.set(key, value, timeout=ttl_seconds)
+        return value
+
+    def _load_as_leader(
+        self,
+        key: str,
+        lock_key: str,
+        token: str,
+        loader: Callable[[], T],
+        ttl_seconds: float,
+    ) -> T:
+        try:
+            return self._store(key, loader(), ttl_seconds)
+        finally:
+            # Only release a lock we still own; a slow load may have outlived it.
+            if self.cache.get(lock_key) == token:
+                self.cache.delete(lock_key)
+
+    def _wait_for_leader(self, key: str, lock_key: str) -> Any:
+        deadline = self._clock() + max(0.0, self.wait_seconds)
+        while self._clock() < deadline:
+            self._sleep(self.poll_seconds)
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+            if self.cache.get(lock_key) is None:
+                # Leader finished without storing a value.
+                return self.cache.get(key)
+        return None
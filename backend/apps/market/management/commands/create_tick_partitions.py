@@ -0,0 +1,80 @@
+"""Create upcoming tick_data partitions and optionally drop expired ones."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.market.models import TickData
+from apps.market.services.tick_partitions import (
+    add_months,
+    drop_tick_partitions_before,
+    ensure_future_tick_partitions,
+    ensure_tick_partitions,
+    is_partitioned,
+    month_start,
+)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise CommandError(f"Invalid datetime: {value}") from exc
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+class Command(BaseCommand):
+    """Maintain the monthly partitions of ``tick_data``."""
+
+    help = "Create monthly tick_data partitions ahead of time and drop expired ones."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=None,
+            help="Months after the current one to create (default: settings).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Also create partitions from this month, e.g. before a historical load.",
+        )
+        parser.add_argument(
+            "--drop-expired",
+            action="store_true",
+            help="Drop partitions older than the tick retention period.",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=None,
+            help="Retention used with --drop-expired (default: TICK_DATA_RETENTION_DAYS).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not is_partitioned():
+            self.stdout.write("tick_data is not partitioned on this database; nothing to do.")
+            return
+        months_ahead = options.get("months_ahead")
+        if months_ahead is not None and months_ahead < 0:
+            raise CommandError("--months-ahead must not be negative.")
+
+        created = ensure_future_tick_partitions(months_ahead)
+        since = _parse_datetime(options.get("since"))
+        if since is not None:
+            created += ensure_tick_partitions(since, add_months(month_start(timezone.now()), 1))
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} tick_data partitions."))
+
+        if options.get("drop_expired"):
+            retention_days = options.get("retention_days") or TickData.get_retention_days()
+            cutoff = timezone.now() - timedelta(days=retention_days)
+            dropped, rows = drop_tick_partitions_before(cutoff)
+            self.stdout.write(
+                self.style.SUCCESS(f"Dropped {len(dropped)} tick_data partitions (~{rows} rows).")
+            )
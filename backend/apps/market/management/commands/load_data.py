@@ -15,6 +15,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 
 from apps.market.models import TickData
+from apps.market.services.tick_partitions import ensure_tick_partitions
 
 
 @dataclass(frozen=True)
@@ -485,6 +486,8 @@ class Command(BaseCommand):
         total_created = 0
         batch: list[TickData] = []
         batch_size = 1000
+        first_ts: datetime | None = None
+        last_ts: datetime | None = None
 
         with path.open(newline="") as f:
             reader = csv_mod.DictReader(f)
@@ -496,6 +499,8 @@ class Command(BaseCommand):
                     ask = _coerce_decimal(row["ask"])
                     mid_raw = row.get("mid", "").strip()
                     mid = _coerce_decimal(mid_raw) if mid_raw else TickData.calculate_mid(bid, ask)
+                    first_ts = timestamp if first_ts is None else min(first_ts, timestamp)
+                    last_ts = timestamp if last_ts is None else max(last_ts, timestamp)
 
                     batch.append(
                         TickData(
@@ -514,6 +519,11 @@ class Command(BaseCommand):
                 if batch:
                     total_created += _flush(batch)
 
+        # Rows outside existing monthly partitions were parked in the default
+        # partition; creating their months moves them out.
+        if first_ts is not None and last_ts is not None:
+            ensure_tick_partitions(first_ts, last_ts)
+
         self.stdout.write(self.style.SUCCESS(f"Inserted {total_created} tick rows from {csv_path}"))
 
     def _handle_athena(self, options: dict[str, Any]) -> None:
@@ -582,6 +592,8 @@ class Command(BaseCommand):
             TickData.objects.bulk_create(unique_batch, **upsert_kwargs)
             return len(unique_batch)
 
+        ensure_tick_partitions(start_dt, end_dt)
+
         start_date = start_dt.astimezone(UTC).date()
         end_date = end_dt.astimezone(UTC).date()
 
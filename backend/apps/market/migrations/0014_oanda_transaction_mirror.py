@@ -0,0 +1,266 @@
+# Generated by Django 5.2.13 on 2026-10-18 21:48
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("market", "0013_tickdata_latest_lookup_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OandaTransactionSyncState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "last_transaction_id",
+                    models.BigIntegerField(
+                        default=0, help_text="Highest OANDA transaction ID applied to the mirror"
+                    ),
+                ),
+                (
+                    "caught_up",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the last sync reached the end of the broker's transaction log",
+                    ),
+                ),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.CharField(blank=True, default="", max_length=512)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "account",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transaction_sync_state",
+                        to="market.oandaaccounts",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OANDA Transaction Sync State",
+                "verbose_name_plural": "OANDA Transaction Sync States",
+                "db_table": "oanda_transaction_sync_states",
+            },
+        ),
+        migrations.CreateModel(
+            name="OandaOrderRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("order_id", models.BigIntegerField()),
+                ("instrument", models.CharField(blank=True, default="", max_length=32)),
+                (
+                    "order_type",
+                    models.CharField(help_text="OANDA order type, e.g. LIMIT", max_length=32),
+                ),
+                (
+                    "units",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=5,
+                        help_text="Signed order units (+ long, - short)",
+                        max_digits=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "price",
+                    models.DecimalField(blank=True, decimal_places=10, max_digits=20, null=True),
+                ),
+                ("time_in_force", models.CharField(blank=True, default="", max_length=16)),
+                ("state", models.CharField(default="PENDING", max_length=16)),
+                (
+                    "take_profit",
+                    models.DecimalField(blank=True, decimal_places=10, max_digits=20, null=True),
+                ),
+                (
+                    "stop_loss",
+                    models.DecimalField(blank=True, decimal_places=10, max_digits=20, null=True),
+                ),
+                ("trade_id", models.BigIntegerField(blank=True, null=True)),
+                ("create_time", models.DateTimeField(blank=True, null=True)),
+                ("fill_time", models.DateTimeField(blank=True, null=True)),
+                ("cancel_time", models.DateTimeField(blank=True, null=True)),
+                ("last_transaction_id", models.BigIntegerField(default=0)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mirrored_orders",
+                        to="market.oandaaccounts",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OANDA Order Record",
+                "verbose_name_plural": "OANDA Order Records",
+                "db_table": "oanda_order_records",
+                "indexes": [
+                    models.Index(
+                        fields=["account", "-create_time", "-order_id"],
+                        name="oanda_order_account_ctime_idx",
+                    ),
+                    models.Index(
+                        fields=["account", "instrument", "-create_time"],
+                        name="oanda_order_account_instr_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "order_id"), name="uniq_oanda_order_record_per_account"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="OandaTradeRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("trade_id", models.BigIntegerField()),
+                ("instrument", models.CharField(max_length=32)),
+                (
+                    "initial_units",
+                    models.DecimalField(
+                        decimal_places=5,
+                        help_text="Signed units at open (+ long, - short)",
+                        max_digits=20,
+                    ),
+                ),
+                ("current_units", models.DecimalField(decimal_places=5, max_digits=20)),
+                ("entry_price", models.DecimalField(decimal_places=10, max_digits=20)),
+                (
+                    "close_price",
+                    models.DecimalField(blank=True, decimal_places=10, max_digits=20, null=True),
+                ),
+                ("realized_pl", models.DecimalField(decimal_places=5, default=0, max_digits=20)),
+                ("state", models.CharField(default="OPEN", max_length=16)),
+                ("open_time", models.DateTimeField(blank=True, null=True)),
+                ("close_time", models.DateTimeField(blank=True, null=True)),
+                ("last_transaction_id", models.BigIntegerField(default=0)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mirrored_trades",
+                        to="market.oandaaccounts",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OANDA Trade Record",
+                "verbose_name_plural": "OANDA Trade Records",
+                "db_table": "oanda_trade_records",
+                "indexes": [
+                    models.Index(
+                        fields=["account", "state", "-open_time", "-trade_id"],
+                        name="oanda_trade_account_state_idx",
+                    ),
+                    models.Index(
+                        fields=["account", "instrument", "-open_time"],
+                        name="oanda_trade_account_instr_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "trade_id"), name="uniq_oanda_trade_record_per_account"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="OandaTransaction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("transaction_id", models.BigIntegerField(help_text="OANDA transaction ID")),
+                ("transaction_type", models.CharField(max_length=64)),
+                ("time", models.DateTimeField(blank=True, null=True)),
+                ("instrument", models.CharField(blank=True, default="", max_length=32)),
+                (
+                    "order_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="Order referenced by this transaction (orderID)",
+                        null=True,
+                    ),
+                ),
+                (
+                    "trade_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="Trade opened, or first trade closed, by this transaction",
+                        null=True,
+                    ),
+                ),
+                ("batch_id", models.BigIntegerField(blank=True, null=True)),
+                (
+                    "units",
+                    models.DecimalField(blank=True, decimal_places=5, max_digits=20, null=True),
+                ),
+                (
+                    "price",
+                    models.DecimalField(blank=True, decimal_places=10, max_digits=20, null=True),
+                ),
+                ("pl", models.DecimalField(blank=True, decimal_places=5, max_digits=20, null=True)),
+                ("reason", models.CharField(blank=True, default="", max_length=64)),
+                ("raw", models.JSONField(default=dict)),
+                ("synced_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mirrored_transactions",
+                        to="market.oandaaccounts",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OANDA Transaction",
+                "verbose_name_plural": "OANDA Transactions",
+                "db_table": "oanda_transactions",
+                "ordering": ["account", "-transaction_id"],
+                "indexes": [
+                    models.Index(
+                        fields=["account", "transaction_type", "-transaction_id"],
+                        name="oanda_txn_account_type_idx",
+                    ),
+                    models.Index(
+                        fields=["account", "instrument", "-transaction_id"],
+                        name="oanda_txn_account_instr_idx",
+                    ),
+                    models.Index(
+                        fields=["account", "order_id"], name="oanda_txn_account_order_idx"
+                    ),
+                    models.Index(fields=["account", "time"], name="oanda_txn_account_time_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "transaction_id"),
+                        name="uniq_oanda_transaction_per_account",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,169 @@
+# Generated by Django 5.2.13
+
+from datetime import UTC, datetime
+
+from django.db import migrations, models, transaction
+
+# Rebuild ``tick_data`` as a table range-partitioned by month on
+# ``timestamp``.  The swap (rename the old table, create the partitioned one
+# with a partition per month the old rows span, the next few months and a
+# DEFAULT partition) commits on its own; new ticks go to the partitioned
+# table from then on.  Old rows are then copied one month per transaction so
+# no single transaction holds the whole table, and the old table is dropped
+# last.  If the copy is interrupted, re-running the migration resumes it:
+# the swap is skipped while ``tick_data_unpartitioned`` exists and already
+# copied rows are ignored on conflict.  The ``create_tick_partitions``
+# command keeps future months ahead of the live stream afterwards.
+MONTHS_AHEAD = 3
+OLD_TABLE = "tick_data_unpartitioned"
+
+
+def _month(value):
+    value = value.astimezone(UTC)
+    return datetime(value.year, value.month, 1, tzinfo=UTC)
+
+
+def _next_month(value):
+    return value.replace(year=value.year + value.month // 12, month=value.month % 12 + 1)
+
+
+def _primary_key_name(schema_editor, table):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+def _table_exists(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [table])
+        return cursor.fetchone()[0]
+
+
+def _old_rows_bounds(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN("timestamp"), MAX("timestamp") FROM "{OLD_TABLE}"')
+        return cursor.fetchone()
+
+
+def _swap_in_partitioned_table(schema_editor):
+    execute = schema_editor.execute
+    execute(f'ALTER TABLE "tick_data" RENAME TO "{OLD_TABLE}"')
+    pk_name = _primary_key_name(schema_editor, OLD_TABLE)
+    execute(f'ALTER TABLE "{OLD_TABLE}" RENAME CONSTRAINT "{pk_name}" TO "{OLD_TABLE}_pkey"')
+    execute('DROP INDEX IF EXISTS "tick_instr_ts_desc_idx"')
+    execute(
+        f'CREATE TABLE "tick_data" (LIKE "{OLD_TABLE}" INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE ("timestamp")'
+    )
+    execute(
+        'ALTER TABLE "tick_data" ADD CONSTRAINT "tick_data_pkey" '
+        'PRIMARY KEY ("instrument", "timestamp")'
+    )
+    execute('CREATE INDEX "tick_instr_ts_desc_idx" ON "tick_data" ("instrument", "timestamp" DESC)')
+    execute('CREATE TABLE "tick_data_default" PARTITION OF "tick_data" DEFAULT')
+
+    first, last = _old_rows_bounds(schema_editor.connection)
+    now = _month(datetime.now(tz=UTC))
+    month = _month(first) if first is not None else now
+    end = now
+    for _ in range(MONTHS_AHEAD):
+        end = _next_month(end)
+    if last is not None:
+        end = max(end, _month(last))
+    while month <= end:
+        upper = _next_month(month)
+        execute(
+            f'CREATE TABLE "tick_data_p{month:%Y%m}" PARTITION OF "tick_data" '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+
+
+def _copy_old_rows(connection):
+    first, last = _old_rows_bounds(connection)
+    if first is None:
+        return
+    month = _month(first)
+    while month <= last:
+        upper = _next_month(month)
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO "tick_data" SELECT * FROM "{OLD_TABLE}" '
+                'WHERE "timestamp" >= %s AND "timestamp" < %s ON CONFLICT DO NOTHING',
+                [month, upper],
+            )
+        month = upper
+
+
+def _partition_tick_data(apps, schema_editor):
+    _ = apps
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    if not _table_exists(connection, OLD_TABLE):
+        with transaction.atomic(using=connection.alias):
+            _swap_in_partitioned_table(schema_editor)
+    _copy_old_rows(connection)
+    schema_editor.execute(f'DROP TABLE "{OLD_TABLE}"')
+
+
+def _unpartition_tick_data(apps, schema_editor):
+    # Reversal copies in one transaction: ticks written to the partitioned
+    # table during a batched copy would be lost when it is dropped.
+    _ = apps
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with transaction.atomic(using=connection.alias):
+        _restore_plain_table(schema_editor.execute)
+
+
+def _restore_plain_table(execute):
+    execute(f'CREATE TABLE "{OLD_TABLE}" (LIKE "tick_data" INCLUDING DEFAULTS)')
+    execute(f'INSERT INTO "{OLD_TABLE}" SELECT * FROM "tick_data"')
+    execute('DROP TABLE "tick_data" CASCADE')
+    execute(f'ALTER TABLE "{OLD_TABLE}" RENAME TO "tick_data"')
+    execute(
+        'ALTER TABLE "tick_data" ADD CONSTRAINT "tick_data_pkey" '
+        'PRIMARY KEY ("instrument", "timestamp")'
+    )
+    execute('CREATE INDEX "tick_instr_ts_desc_idx" ON "tick_data" ("instrument", "timestamp" DESC)')
+
+
+class Migration(migrations.Migration):
+    # The monthly copy batches commit individually; see the comment above.
+    atomic = False
+
+    dependencies = [
+        ("market", "0014_oanda_transaction_mirror"),
+    ]
+
+    operations = [
+        # The (instrument, timestamp) primary key already covers these.
+        migrations.RemoveIndex(
+            model_name="tickdata",
+            name="tick_data_instrum_7f586e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="tickdata",
+            name="tick_data_timesta_a4b109_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="tickdata",
+            name="tick_data_created_69aebd_idx",
+        ),
+        migrations.AlterField(
+            model_name="tickdata",
+            name="instrument",
+            field=models.CharField(help_text="Currency pair (e.g., 'EUR_USD')", max_length=10),
+        ),
+        migrations.AlterField(
+            model_name="tickdata",
+            name="timestamp",
+            field=models.DateTimeField(help_text="Timestamp when the tick was received"),
+        ),
+        migrations.RunPython(_partition_tick_data, _unpartition_tick_data),
+    ]
@@ -9,6 +9,12 @@ from apps.market.models.health import OandaApiHealthStatus
 from apps.market.models.oanda import OandaAccounts
 from apps.market.models.retry import OandaRetryMetric
 from apps.market.models.tick import TickData
+from apps.market.models.transaction import (
+    OandaOrderRecord,
+    OandaTradeRecord,
+    OandaTransaction,
+    OandaTransactionSyncState,
+)
 
 __all__: List[str] = [
     "CeleryTaskStatus",
@@ -16,6 +22,10 @@ __all__: List[str] = [
     "MarketEvent",
     "OandaAccounts",
     "OandaApiHealthStatus",
+    "OandaOrderRecord",
     "OandaRetryMetric",
+    "OandaTradeRecord",
+    "OandaTransaction",
+    "OandaTransactionSyncState",
     "TickData",
 ]
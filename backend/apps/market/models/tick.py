@@ -14,15 +14,17 @@ class TickData(models.Model):
 
     Stores bid, ask, and mid prices for each instrument at specific timestamps.
     Includes data retention policy for automatic cleanup of old data.
+
+    On PostgreSQL the table is range-partitioned by month on ``timestamp``
+    (see :mod:`apps.market.services.tick_partitions`), so the composite
+    primary key doubles as the per-partition range index.
     """
 
     instrument = models.CharField(
         max_length=10,
-        db_index=True,
         help_text="Currency pair (e.g., 'EUR_USD')",
     )
     timestamp = models.DateTimeField(
-        db_index=True,
         help_text="Timestamp when the tick was received",
     )
 
@@ -53,13 +55,10 @@ class TickData(models.Model):
         db_table = "tick_data"
         verbose_name = "Tick Data"
         verbose_name_plural = "Tick Data"
+        # The (instrument, timestamp) primary key serves instrument lookups
+        # and range scans; partition pruning covers timestamp-only filters.
         indexes = [
-            # Single field indexes for basic queries
-            models.Index(fields=["instrument"]),
-            models.Index(fields=["timestamp"]),
             models.Index(fields=["instrument", "-timestamp"], name="tick_instr_ts_desc_idx"),
-            # Index for data retention cleanup
-            models.Index(fields=["created_at"]),
         ]
         ordering = ["-timestamp"]
 
@@ -95,19 +94,30 @@ class TickData(models.Model):
     @classmethod
     def cleanup_old_data(cls, retention_days: int | None = None) -> int:
         """
-        Delete tick data older than the retention period.
+        Delete tick data whose timestamp is older than the retention period.
+
+        On a partitioned table whole monthly partitions are dropped, so ticks
+        are kept until their entire month has expired.
 
         Args:
             retention_days: Number of days to retain (uses default if None)
 
         Returns:
-            Number of records deleted
+            Number of records deleted (a planner estimate for dropped partitions)
         """
+        from apps.market.services.tick_partitions import (
+            drop_tick_partitions_before,
+            is_partitioned,
+        )
+
         if retention_days is None:
             retention_days = cls.get_retention_days()
 
         cutoff_date = timezone.now() - timedelta(days=retention_days)
-        deleted_count, _ = cls.objects.filter(created_at__lt=cutoff_date).delete()
+        if is_partitioned():
+            _, deleted_count = drop_tick_partitions_before(cutoff_date)
+            return deleted_count
+        deleted_count, _ = cls.objects.filter(timestamp__lt=cutoff_date).delete()
         return deleted_count
 
     @staticmethod
@@ -0,0 +1,194 @@
+"""Local mirror of the OANDA transaction stream and its order/trade projections."""
+
+from django.db import models
+from django.utils import timezone
+
+
+class OandaTransaction(models.Model):
+    """One OANDA account transaction, mirrored verbatim for history queries."""
+
+    account = models.ForeignKey(
+        "market.OandaAccounts",
+        on_delete=models.CASCADE,
+        related_name="mirrored_transactions",
+    )
+    transaction_id = models.BigIntegerField(help_text="OANDA transaction ID")
+    transaction_type = models.CharField(max_length=64)
+    time = models.DateTimeField(null=True, blank=True)
+    instrument = models.CharField(max_length=32, blank=True, default="")
+    order_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Order referenced by this transaction (orderID)",
+    )
+    trade_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Trade opened, or first trade closed, by this transaction",
+    )
+    batch_id = models.BigIntegerField(null=True, blank=True)
+    units = models.DecimalField(max_digits=20, decimal_places=5, null=True, blank=True)
+    price = models.DecimalField(max_digits=20, decimal_places=10, null=True, blank=True)
+    pl = models.DecimalField(max_digits=20, decimal_places=5, null=True, blank=True)
+    reason = models.CharField(max_length=64, blank=True, default="")
+    raw = models.JSONField(default=dict)
+    synced_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "oanda_transactions"
+        verbose_name = "OANDA Transaction"
+        verbose_name_plural = "OANDA Transactions"
+        ordering = ["account", "-transaction_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "transaction_id"],
+                name="uniq_oanda_transaction_per_account",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["account", "transaction_type", "-transaction_id"],
+                name="oanda_txn_account_type_idx",
+            ),
+            models.Index(
+                fields=["account", "instrument", "-transaction_id"],
+                name="oanda_txn_account_instr_idx",
+            ),
+            models.Index(fields=["account", "order_id"], name="oanda_txn_account_order_idx"),
+            models.Index(fields=["account", "time"], name="oanda_txn_account_time_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.account_id}#{self.transaction_id} {self.transaction_type}"
+
+
+class OandaTransactionSyncState(models.Model):
+    """Incremental sync cursor for one account's transaction mirror."""
+
+    account = models.OneToOneField(
+        "market.OandaAccounts",
+        on_delete=models.CASCADE,
+        related_name="transaction_sync_state",
+    )
+    last_transaction_id = models.BigIntegerField(
+        default=0,
+        help_text="Highest OANDA transaction ID applied to the mirror",
+    )
+    caught_up = models.BooleanField(
+        default=False,
+        help_text="Whether the last sync reached the end of the broker's transaction log",
+    )
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.CharField(max_length=512, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "oanda_transaction_sync_states"
+        verbose_name = "OANDA Transaction Sync State"
+        verbose_name_plural = "OANDA Transaction Sync States"
+
+    def __str__(self) -> str:
+        return f"{self.account_id} @ {self.last_transaction_id}"
+
+
+class OandaOrderRecord(models.Model):
+    """Order lifecycle projected from mirrored order/fill/cancel transactions."""
+
+    account = models.ForeignKey(
+        "market.OandaAccounts",
+        on_delete=models.CASCADE,
+        related_name="mirrored_orders",
+    )
+    order_id = models.BigIntegerField()
+    instrument = models.CharField(max_length=32, blank=True, default="")
+    order_type = models.CharField(max_length=32, help_text="OANDA order type, e.g. LIMIT")
+    units = models.DecimalField(
+        max_digits=20,
+        decimal_places=5,
+        null=True,
+        blank=True,
+        help_text="Signed order units (+ long, - short)",
+    )
+    price = models.DecimalField(max_digits=20, decimal_places=10, null=True, blank=True)
+    time_in_force = models.CharField(max_length=16, blank=True, default="")
+    state = models.CharField(max_length=16, default="PENDING")
+    take_profit = models.DecimalField(max_digits=20, decimal_places=10, null=True, blank=True)
+    stop_loss = models.DecimalField(max_digits=20, decimal_places=10, null=True, blank=True)
+    trade_id = models.BigIntegerField(null=True, blank=True)
+    create_time = models.DateTimeField(null=True, blank=True)
+    fill_time = models.DateTimeField(null=True, blank=True)
+    cancel_time = models.DateTimeField(null=True, blank=True)
+    last_transaction_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "oanda_order_records"
+        verbose_name = "OANDA Order Record"
+        verbose_name_plural = "OANDA Order Records"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "order_id"],
+                name="uniq_oanda_order_record_per_account",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["account", "-create_time", "-order_id"],
+                name="oanda_order_account_ctime_idx",
+            ),
+            models.Index(
+                fields=["account", "instrument", "-create_time"],
+                name="oanda_order_account_instr_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.account_id} order {self.order_id} {self.state}"
+
+
+class OandaTradeRecord(models.Model):
+    """Trade lifecycle projected from mirrored ORDER_FILL transactions."""
+
+    account = models.ForeignKey(
+        "market.OandaAccounts",
+        on_delete=models.CASCADE,
+        related_name="mirrored_trades",
+    )
+    trade_id = models.BigIntegerField()
+    instrument = models.CharField(max_length=32)
+    initial_units = models.DecimalField(
+        max_digits=20,
+        decimal_places=5,
+        help_text="Signed units at open (+ long, - short)",
+    )
+    current_units = models.DecimalField(max_digits=20, decimal_places=5)
+    entry_price = models.DecimalField(max_digits=20, decimal_places=10)
+    close_price = models.DecimalField(max_digits=20, decimal_places=10, null=True, blank=True)
+    realized_pl = models.DecimalField(max_digits=20, decimal_places=5, default=0)
+    state = models.CharField(max_length=16, default="OPEN")
+    open_time = models.DateTimeField(null=True, blank=True)
+    close_time = models.DateTimeField(null=True, blank=True)
+    last_transaction_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "oanda_trade_records"
+        verbose_name = "OANDA Trade Record"
+        verbose_name_plural = "OANDA Trade Records"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "trade_id"],
+                name="uniq_oanda_trade_record_per_account",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["account", "state", "-open_time", "-trade_id"],
+                name="oanda_trade_account_state_idx",
+            ),
+            models.Index(
+                fields=["account", "instrument", "-open_time"],
+                name="oanda_trade_account_instr_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.account_id} trade {self.trade_id} {self.state}"
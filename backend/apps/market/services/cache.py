@@ -53,3 +53,35 @@ def invalidate_market_metadata_cache(hostnames: Iterable[str]) -> None:
         current = cache.get(version_key)
         next_version = current + 1 if isinstance(current, int) and current > 0 else 2
         cache.set(version_key, next_version, timeout=None)
+
+
+def _broker_snapshot_version_key(account_pk: int | str) -> str:
+    return f"market:broker_snapshot:version:{account_pk}"
+
+
+def get_broker_snapshot_cache_version(account_pk: int | str) -> int:
+    """Return the current broker snapshot cache namespace version for an account."""
+    version = cache.get(_broker_snapshot_version_key(account_pk))
+    if isinstance(version, int) and version > 0:
+        return version
+    return 1
+
+
+def build_broker_snapshot_cache_key(account_pk: int | str, kind: str, instrument: str = "") -> str:
+    """Build the cache key for a shared broker read (account details, trades, orders)."""
+    version = get_broker_snapshot_cache_version(account_pk)
+    suffix = f":{instrument.upper()}" if instrument else ""
+    return f"market:broker_snapshot:{account_pk}:{kind}{suffix}:v{version}"
+
+
+def invalidate_broker_snapshot_cache(account_pk: int | str) -> None:
+    """Drop cached broker reads for an account after it places or closes orders."""
+    version_key = _broker_snapshot_version_key(account_pk)
+    current = cache.get(version_key)
+    next_version = current + 1 if isinstance(current, int) and current > 0 else 2
+    cache.set(version_key, next_version, timeout=None)
+
+
+def build_pricing_cache_key(hostname: str, instrument: str) -> str:
+    """Build the cache key for the latest pricing snapshot of an instrument."""
+    return f"market:pricing:{_normalize_hostname(hostname)}:{instrument.upper()}"
@@ -2,18 +2,61 @@
 
 from __future__ import annotations
 
+import time as time_module
+from collections.abc import Callable
 from logging import Logger, getLogger
 from typing import Any
 
+from django.conf import settings
+
+from apps.common.singleflight import CacheSingleFlight
 from apps.market.models import OandaAccounts
 from apps.market.services.cache import (
     build_instrument_detail_cache_key,
+    build_pricing_cache_key,
     build_supported_instruments_cache_key,
 )
 from apps.market.services.oanda_retry import OandaApiRequestExecutor
 
 logger: Logger = getLogger(name=__name__)
 
+DEFAULT_PRICING_CACHE_TTL_SECONDS = 2.0
+DEFAULT_LIVE_PRICING_WRITE_INTERVAL_SECONDS = 0.25
+
+
+def pricing_cache_ttl_seconds() -> float:
+    """Return how long a cached pricing snapshot counts as current."""
+    return float(
+        getattr(settings, "MARKET_PRICING_CACHE_TTL_SECONDS", DEFAULT_PRICING_CACHE_TTL_SECONDS)
+    )
+
+
+def pricing_snapshot(
+    *,
+    bid: Any,
+    ask: Any,
+    tradeable: bool | None = None,
+    time: Any = None,
+) -> dict[str, Any]:
+    """Shape a best bid/ask quote into the instrument detail pricing payload."""
+    best_bid = float(bid) if bid is not None else None
+    best_ask = float(ask) if ask is not None else None
+
+    spread = None
+    spread_pips = None
+    if best_bid and best_ask:
+        spread = best_ask - best_bid
+        spread_pips = spread * 10000
+
+    return {
+        "bid": str(best_bid) if best_bid else None,
+        "ask": str(best_ask) if best_ask else None,
+        "spread": f"{spread:.5f}" if spread else None,
+        "spread_pips": f"{spread_pips:.1f}" if spread_pips else None,
+        "tradeable": tradeable,
+        "time": time,
+    }
+
 
 class OandaAccountSelector:
     """Select a user's active OANDA account for market-data lookups."""
@@ -36,7 +79,13 @@ class OandaAccountSelector:
 
 
 class OandaInstrumentCache:
-    """Cache OANDA instrument catalog responses."""
+    """Cache OANDA instrument catalog responses.
+
+    Misses are loaded through :class:`CacheSingleFlight`, so a burst of
+    requests after ``invalidate_market_metadata_cache`` bumps the version (or
+    a pricing entry expires) sends one request to OANDA instead of one per
+    caller.
+    """
 
     def __init__(
         self,
@@ -44,10 +93,14 @@ class OandaInstrumentCache:
         cache_backend: Any,
         instruments_ttl_seconds: int,
         detail_ttl_seconds: int,
+        pricing_ttl_seconds: float = DEFAULT_PRICING_CACHE_TTL_SECONDS,
+        single_flight: CacheSingleFlight | None = None,
     ) -> None:
         self.cache = cache_backend
         self.instruments_ttl_seconds = instruments_ttl_seconds
         self.detail_ttl_seconds = detail_ttl_seconds
+        self.pricing_ttl_seconds = pricing_ttl_seconds
+        self.single_flight = single_flight or CacheSingleFlight(cache=cache_backend)
 
     def supported_instruments(self, account: OandaAccounts) -> list[str] | None:
         """Return cached supported instruments for an account hostname."""
@@ -69,6 +122,19 @@ class OandaInstrumentCache:
             self.instruments_ttl_seconds,
         )
 
+    def load_supported_instruments(
+        self,
+        *,
+        account: OandaAccounts,
+        loader: Callable[[], list[str]],
+    ) -> list[str]:
+        """Return supported instruments, loading them once across concurrent misses."""
+        return self.single_flight.get_or_load(
+            build_supported_instruments_cache_key(account.api_hostname),
+            loader,
+            ttl_seconds=self.instruments_ttl_seconds,
+        )
+
     def detail(self, *, account: OandaAccounts, instrument: str) -> dict[str, Any] | None:
         """Return cached instrument detail when available."""
         cached = self.cache.get(build_instrument_detail_cache_key(account.api_hostname, instrument))
@@ -88,6 +154,95 @@ class OandaInstrumentCache:
             self.detail_ttl_seconds,
         )
 
+    def load_detail(
+        self,
+        *,
+        account: OandaAccounts,
+        instrument: str,
+        loader: Callable[[], dict[str, Any] | None],
+    ) -> dict[str, Any] | None:
+        """Return instrument detail, loading it once across concurrent misses."""
+        return self.single_flight.get_or_load(
+            build_instrument_detail_cache_key(account.api_hostname, instrument),
+            loader,
+            ttl_seconds=self.detail_ttl_seconds,
+        )
+
+    def set_pricing(self, *, hostname: str, instrument: str, pricing: dict[str, Any]) -> None:
+        """Cache the latest pricing snapshot, e.g. from the live tick publisher."""
+        self.cache.set(
+            build_pricing_cache_key(hostname, instrument),
+            pricing,
+            self.pricing_ttl_seconds,
+        )
+
+    def load_pricing(
+        self,
+        *,
+        hostname: str,
+        instrument: str,
+        loader: Callable[[], dict[str, Any] | None],
+    ) -> dict[str, Any] | None:
+        """Return a fresh pricing snapshot, loading it once across concurrent misses."""
+        return self.single_flight.get_or_load(
+            build_pricing_cache_key(hostname, instrument),
+            loader,
+            ttl_seconds=self.pricing_ttl_seconds,
+        )
+
+
+class LivePricingCacheWriter:
+    """Feed the pricing cache from a live tick stream.
+
+    Writes are throttled per instrument so a busy stream costs at most a few
+    cache writes per second while keeping entries well inside their TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        hostname: str,
+        cache_backend: Any,
+        ttl_seconds: float,
+        min_interval_seconds: float = DEFAULT_LIVE_PRICING_WRITE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time_module.monotonic,
+    ) -> None:
+        self.hostname = hostname
+        self.cache = cache_backend
+        self.ttl_seconds = ttl_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self._clock = clock
+        self._last_written_at: dict[str, float] = {}
+
+    @classmethod
+    def for_account(
+        cls, account: OandaAccounts, *, cache_backend: Any
+    ) -> LivePricingCacheWriter | None:
+        """Return a writer for *account*'s environment, or ``None`` when disabled."""
+        ttl_seconds = pricing_cache_ttl_seconds()
+        hostname = str(getattr(account, "api_hostname", "") or "")
+        if ttl_seconds <= 0 or not hostname:
+            return None
+        return cls(hostname=hostname, cache_backend=cache_backend, ttl_seconds=ttl_seconds)
+
+    def write(self, *, instrument: str, bid: Any, ask: Any, time: Any) -> bool:
+        """Store the quote unless *instrument* was written within the interval."""
+        now = self._clock()
+        last = self._last_written_at.get(instrument)
+        if last is not None and now - last < self.min_interval_seconds:
+            return False
+        try:
+            self.cache.set(
+                build_pricing_cache_key(self.hostname, instrument),
+                pricing_snapshot(bid=bid, ask=ask, tradeable=True, time=time),
+                self.ttl_seconds,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.debug("Failed to cache live pricing for %s", instrument, exc_info=True)
+            return False
+        self._last_written_at[instrument] = now
+        return True
+
 
 class OandaInstrumentCatalogService:
     """Fetch and shape OANDA supported instruments and instrument details."""
@@ -117,19 +272,10 @@ class OandaInstrumentCatalogService:
             if cached is not None:
                 return cached
 
-            api = self._api_context(account)
-            response = self.request_executor.request(
-                api.account.instruments,
-                account.account_id,
-                label="Fetch OANDA instruments",
-                failure_message="Failed to fetch OANDA instruments",
-            )
-            instruments = self._forex_instrument_names(response.body.get("instruments", []))
-            self.instrument_cache.set_supported_instruments(
+            return self.instrument_cache.load_supported_instruments(
                 account=account,
-                instruments=instruments,
+                loader=lambda: self._fetch_supported_instruments(account),
             )
-            return instruments
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.error("Failed to fetch instruments from OANDA: %s", exc)
             return None
@@ -152,11 +298,16 @@ class OandaInstrumentCatalogService:
                 api=api,
                 account_id=account.account_id,
                 instrument=instrument,
+                hostname=account.api_hostname,
             )
             detail = self.instrument_cache.detail(account=account, instrument=instrument)
             if detail is None:
-                detail = self.fetch_and_cache_detail(
-                    api=api, account=account, instrument=instrument
+                detail = self.instrument_cache.load_detail(
+                    account=account,
+                    instrument=instrument,
+                    loader=lambda: self._fetch_detail(
+                        api=api, account=account, instrument=instrument
+                    ),
                 )
                 if detail is None:
                     return None
@@ -173,6 +324,55 @@ class OandaInstrumentCatalogService:
         instrument: str,
     ) -> dict[str, Any] | None:
         """Fetch one instrument detail from OANDA and cache it."""
+        detail = self._fetch_detail(api=api, account=account, instrument=instrument)
+        if detail is not None:
+            self.instrument_cache.set_detail(account=account, instrument=instrument, detail=detail)
+        return detail
+
+    def current_pricing(
+        self,
+        *,
+        api: Any,
+        account_id: str,
+        instrument: str,
+        hostname: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Fetch current pricing for spread calculation.
+
+        With a *hostname*, a snapshot cached within the pricing TTL - written
+        by the live tick publisher or by a concurrent request - is reused.
+        """
+        try:
+            if hostname is None:
+                return self._fetch_pricing(api=api, account_id=account_id, instrument=instrument)
+            return self.instrument_cache.load_pricing(
+                hostname=hostname,
+                instrument=instrument,
+                loader=lambda: self._fetch_pricing(
+                    api=api, account_id=account_id, instrument=instrument
+                ),
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to fetch pricing for %s: %s", instrument, exc)
+            return None
+
+    def _fetch_supported_instruments(self, account: OandaAccounts) -> list[str]:
+        api = self._api_context(account)
+        response = self.request_executor.request(
+            api.account.instruments,
+            account.account_id,
+            label="Fetch OANDA instruments",
+            failure_message="Failed to fetch OANDA instruments",
+        )
+        return self._forex_instrument_names(response.body.get("instruments", []))
+
+    def _fetch_detail(
+        self,
+        *,
+        api: Any,
+        account: OandaAccounts,
+        instrument: str,
+    ) -> dict[str, Any] | None:
         response = self.request_executor.request(
             api.account.instruments,
             account.account_id,
@@ -184,33 +384,26 @@ class OandaInstrumentCatalogService:
         if not instruments_list:
             logger.warning("Instrument %s not found", instrument)
             return None
-        detail = self._detail_from_oanda(instruments_list[0])
-        self.instrument_cache.set_detail(account=account, instrument=instrument, detail=detail)
-        return detail
+        return self._detail_from_oanda(instruments_list[0])
 
-    def current_pricing(
+    def _fetch_pricing(
         self,
         *,
         api: Any,
         account_id: str,
         instrument: str,
     ) -> dict[str, Any] | None:
-        """Fetch current pricing for spread calculation."""
-        try:
-            response = self.request_executor.request(
-                api.pricing.get,
-                account_id,
-                label="Fetch OANDA pricing",
-                failure_message="Failed to fetch OANDA pricing",
-                instruments=instrument,
-            )
-            prices = response.body.get("prices", [])
-            if not prices:
-                return None
-            return self._pricing_from_oanda(prices[0])
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            logger.warning("Failed to fetch pricing for %s: %s", instrument, exc)
+        response = self.request_executor.request(
+            api.pricing.get,
+            account_id,
+            label="Fetch OANDA pricing",
+            failure_message="Failed to fetch OANDA pricing",
+            instruments=instrument,
+        )
+        prices = response.body.get("prices", [])
+        if not prices:
             return None
+        return self._pricing_from_oanda(prices[0])
 
     def _api_context(self, account: OandaAccounts) -> Any:
         return self.v20.Context(
@@ -260,20 +453,9 @@ class OandaInstrumentCatalogService:
     def _pricing_from_oanda(self, price: Any) -> dict[str, Any]:
         bids = price.bids if hasattr(price, "bids") and price.bids else []
         asks = price.asks if hasattr(price, "asks") and price.asks else []
-        best_bid = float(bids[0].price) if bids else None
-        best_ask = float(asks[0].price) if asks else None
-
-        spread = None
-        spread_pips = None
-        if best_bid and best_ask:
-            spread = best_ask - best_bid
-            spread_pips = spread * 10000
-
-        return {
-            "bid": str(best_bid) if best_bid else None,
-            "ask": str(best_ask) if best_ask else None,
-            "spread": f"{spread:.5f}" if spread else None,
-            "spread_pips": f"{spread_pips:.1f}" if spread_pips else None,
-            "tradeable": price.tradeable if hasattr(price, "tradeable") else None,
-            "time": price.time if hasattr(price, "time") else None,
-        }
+        return pricing_snapshot(
+            bid=bids[0].price if bids else None,
+            ask=asks[0].price if asks else None,
+            tradeable=price.tradeable if hasattr(price, "tradeable") else None,
+            time=price.time if hasattr(price, "time") else None,
+        )
@@ -21,6 +21,7 @@ from django.conf import settings
 from apps.market.enums import MarketEventSeverity, MarketEventType
 from apps.market.models import OandaAccounts, TickData
 from apps.market.services.broker_order_guard import BrokerOrderGuard, BrokerOrderGuardError
+from apps.market.services.cache import invalidate_broker_snapshot_cache
 from apps.market.services.compliance import ComplianceService, ComplianceViolationError
 from apps.market.services.events import MarketEventService
 from apps.market.services.oanda_clients import (
@@ -40,6 +41,7 @@ from apps.market.services.oanda_retry import (
     OandaRetryPolicy,
     OandaRetryService,
 )
+from apps.market.services.oanda_stream import PriceTick
 from apps.market.services.oanda_types import (
     AccountDetails,
     CancelledOrder,
@@ -152,13 +154,13 @@ class OandaService:
             rest_hostname = str(account.api_hostname)
             stream_hostname = self.context_factory.stream_hostname(rest_hostname)
 
-            self.api = self.context_factory.create_rest_context(account)
+            self.api = self.context_factory.create_rest_context(account, owner=self)
 
             # v20 Context uses a single hostname for both REST and streaming.
             # OANDA streams live on a different hostname (stream-*) than REST (api-*).
             # If we use the REST host for pricing.stream, OANDA returns 404.
             self.stream_hostname = stream_hostname
-            self.stream_api = self.context_factory.create_stream_context(account)
+            self.stream_api = self.context_factory.create_stream_context(account, owner=self)
 
             self.compliance_manager = ComplianceService(account)
 
@@ -212,11 +214,24 @@ class OandaService:
         """
         return self.account_client.get_resource(refresh=refresh)
 
+    def _invalidate_broker_snapshot(self) -> None:
+        """Expire shared broker reads once this account may have changed exposure."""
+        account = getattr(self, "account", None)
+        if getattr(self, "dry_run", False) or getattr(account, "pk", None) is None:
+            return
+        invalidate_broker_snapshot_cache(account.pk)
+
     def cancel_order(self, order: Order) -> CancelledOrder:
-        return self.order_client.cancel_order(order)
+        try:
+            return self.order_client.cancel_order(order)
+        finally:
+            self._invalidate_broker_snapshot()
 
     def close_trade(self, trade: OpenTrade, units: Decimal | None = None) -> MarketOrder:
-        return self.trade_client.close_trade(trade=trade, units=units)
+        try:
+            return self.trade_client.close_trade(trade=trade, units=units)
+        finally:
+            self._invalidate_broker_snapshot()
 
     def close_position(
         self,
@@ -224,11 +239,14 @@ class OandaService:
         units: Decimal | None = None,
         override_price: Decimal | None = None,
     ) -> MarketOrder:
-        return self.position_client.close_position(
-            position=position,
-            units=units,
-            override_price=override_price,
-        )
+        try:
+            return self.position_client.close_position(
+                position=position,
+                units=units,
+                override_price=override_price,
+            )
+        finally:
+            self._invalidate_broker_snapshot()
 
     def _simulate_position_close(
         self,
@@ -244,23 +262,35 @@ class OandaService:
         )
 
     def create_limit_order(self, request: LimitOrderRequest) -> LimitOrder:
-        return self.order_client.create_limit_order(request)
+        try:
+            return self.order_client.create_limit_order(request)
+        finally:
+            self._invalidate_broker_snapshot()
 
     def create_market_order(
         self,
         request: MarketOrderRequest,
         override_price: Decimal | None = None,
     ) -> MarketOrder:
-        return self.order_client.create_market_order(
-            request,
-            override_price=override_price,
-        )
+        try:
+            return self.order_client.create_market_order(
+                request,
+                override_price=override_price,
+            )
+        finally:
+            self._invalidate_broker_snapshot()
 
     def create_stop_order(self, request: StopOrderRequest) -> StopOrder:
-        return self.order_client.create_stop_order(request)
+        try:
+            return self.order_client.create_stop_order(request)
+        finally:
+            self._invalidate_broker_snapshot()
 
     def create_oco_order(self, request: OcoOrderRequest) -> OcoOrder:
-        return self.order_client.create_oco_order(request)
+        try:
+            return self.order_client.create_oco_order(request)
+        finally:
+            self._invalidate_broker_snapshot()
 
     def get_account_details(self) -> AccountDetails:
         return self.account_client.get_details()
@@ -311,12 +341,14 @@ class OandaService:
         to_time: datetime | None = None,
         page_size: int = 100,
         transaction_type: str | None = None,
+        since_transaction_id: str | int | None = None,
     ) -> list[Transaction]:
         return self.transaction_client.get_transaction_history(
             from_time=from_time,
             to_time=to_time,
             page_size=page_size,
             transaction_type=transaction_type,
+            since_transaction_id=since_transaction_id,
         )
 
     def stream_pricing_ticks(
@@ -332,6 +364,14 @@ class OandaService:
             include_heartbeats=include_heartbeats,
         )
 
+    def stream_raw_pricing_ticks(
+        self,
+        instruments: list[str] | str,
+        *,
+        snapshot: bool = True,
+    ) -> Iterator[PriceTick]:
+        return self.pricing_stream_client.stream_raw_pricing_ticks(instruments, snapshot=snapshot)
+
     @staticmethod
     def _as_pending_order(order: Order) -> PendingOrder:
         return oanda_parsing.OANDA_RESPONSE_PARSER.as_pending_order(order)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Iterator
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -9,12 +10,19 @@ from logging import Logger, getLogger
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
+import requests
 import v20
 from django.conf import settings
 from v20.transaction import StopLossDetails, TakeProfitDetails
 
 from apps.market.enums import MarketEventSeverity, MarketEventType
 from apps.market.models import TickData
+from apps.market.services.oanda_pool import (
+    OANDA_CONTEXT_POOL,
+    OandaContextPool,
+    credentials_fingerprint,
+)
+from apps.market.services.oanda_stream import PriceTick, parse_price_line
 from apps.market.services.oanda_types import (
     AccountDetails,
     CancelledOrder,
@@ -72,12 +80,26 @@ class OandaClientBase:
 
 
 class OandaContextFactory:
-    """Factory for REST and stream v20 contexts."""
+    """Factory for REST and stream v20 contexts.
+
+    Contexts are shared through the process-wide ``OandaContextPool`` so
+    repeated ``OandaService`` construction reuses keep-alive connections.
+    Passing ``owner`` checks the context out of the pool until the owner is
+    garbage collected.
+    Set ``OANDA_CLIENT_POOL_ENABLED = False`` to build a fresh context per call.
+    """
 
-    def __init__(self, *, v20_module: Any = v20, settings_module: Any = settings) -> None:
+    def __init__(
+        self,
+        *,
+        v20_module: Any = v20,
+        settings_module: Any = settings,
+        pool: OandaContextPool | None = None,
+    ) -> None:
         """Initialize with patchable v20/settings dependencies."""
         self.v20_module = v20_module
         self.settings_module = settings_module
+        self.pool = pool
 
     @staticmethod
     def stream_hostname(hostname: str) -> str:
@@ -91,22 +113,73 @@ class OandaContextFactory:
             return "stream-" + host[len("api-") :]
         return host
 
-    def create_rest_context(self, account: Any) -> v20.Context:
-        """Create a REST API context for an account."""
-        return self.v20_module.Context(
-            hostname=str(account.api_hostname),
-            token=account.get_api_token(),
-            poll_timeout=10,
+    def create_rest_context(self, account: Any, *, owner: Any = None) -> v20.Context:
+        """Create (or reuse) a REST API context for an account."""
+        hostname = str(account.api_hostname)
+        token = account.get_api_token()
+        return self._pooled(
+            account,
+            owner=owner,
+            kind="rest",
+            hostname=hostname,
+            token=token,
+            factory=lambda: self.v20_module.Context(
+                hostname=hostname,
+                token=token,
+                poll_timeout=10,
+            ),
+        )
+
+    def create_stream_context(self, account: Any, *, owner: Any = None) -> v20.Context:
+        """Create (or reuse) a streaming API context for an account."""
+        hostname = self.stream_hostname(str(account.api_hostname))
+        token = account.get_api_token()
+        stream_timeout = int(getattr(self.settings_module, "OANDA_STREAM_TIMEOUT", 30))
+        return self._pooled(
+            account,
+            owner=owner,
+            kind=f"stream:{stream_timeout}",
+            hostname=hostname,
+            token=token,
+            factory=lambda: self.v20_module.Context(
+                hostname=hostname,
+                token=token,
+                stream_timeout=stream_timeout,
+                poll_timeout=10,
+            ),
         )
 
-    def create_stream_context(self, account: Any) -> v20.Context:
-        """Create a streaming API context for an account."""
-        return self.v20_module.Context(
-            hostname=self.stream_hostname(str(account.api_hostname)),
-            token=account.get_api_token(),
-            stream_timeout=int(getattr(self.settings_module, "OANDA_STREAM_TIMEOUT", 30)),
-            poll_timeout=10,
+    def _pooled(
+        self,
+        account: Any,
+        *,
+        owner: Any,
+        kind: str,
+        hostname: str,
+        token: str,
+        factory: Any,
+    ) -> v20.Context:
+        pool = self._active_pool()
+        if pool is None:
+            return factory()
+        context = pool.acquire(
+            account_id=str(getattr(account, "account_id", "") or getattr(account, "pk", "")),
+            fingerprint=credentials_fingerprint(hostname=hostname, token=str(token or "")),
+            kind=kind,
+            factory=factory,
+            constructor=self.v20_module.Context,
+            hold=owner is not None,
         )
+        if owner is not None:
+            weakref.finalize(owner, pool.release, context)
+        return context
+
+    def _active_pool(self) -> OandaContextPool | None:
+        if self.pool is not None:
+            return self.pool
+        if not bool(getattr(self.settings_module, "OANDA_CLIENT_POOL_ENABLED", True)):
+            return None
+        return OANDA_CONTEXT_POOL
 
 
 class OandaAccountClient(OandaClientBase):
@@ -1092,11 +1165,15 @@ class OandaTransactionClient(OandaClientBase):
         to_time: datetime | None = None,
         page_size: int = 100,
         transaction_type: str | None = None,
+        since_transaction_id: str | int | None = None,
     ) -> list[Transaction]:
         service = self.service
         assert service.api is not None, "API client not initialized"
         assert service.account is not None, "Account not initialized"
 
+        if since_transaction_id is not None:
+            return self._get_transactions_since(since_transaction_id)
+
         try:
             kwargs: dict[str, Any] = {"pageSize": page_size}
             if from_time:
@@ -1172,24 +1249,58 @@ class OandaTransactionClient(OandaClientBase):
                 internal_detail=str(e),
             ) from e
 
+    def _get_transactions_since(self, since_transaction_id: str | int) -> list[Transaction]:
+        """Fetch transactions after an ID (OANDA's sinceid endpoint, max 1000 per call)."""
+        service = self.service
+        try:
+            response = self.request(
+                service.api.transaction.since,
+                service.account.account_id,
+                label="Fetch transactions since ID",
+                failure_message="Failed to fetch transactions",
+                exception_message="Error fetching transactions",
+                id=str(since_transaction_id),
+            )
+            body = response.body or {}
+            raw_transactions = (
+                body.get("transactions", [])
+                if isinstance(body, dict)
+                else getattr(body, "transactions", None) or []
+            )
+            transactions: list[Transaction] = []
+            for txn in raw_transactions:
+                if not isinstance(txn, dict) and callable(getattr(txn, "dict", None)):
+                    txn = txn.dict()
+                if isinstance(txn, dict):
+                    transactions.append(service._parse_transaction(txn))
+            return transactions
+        except OandaAPIError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Error fetching transactions since %s for %s: %s",
+                since_transaction_id,
+                service.account.account_id,
+                str(e),
+                exc_info=True,
+            )
+            raise OandaAPIError(
+                "Error fetching transactions",
+                internal_detail=str(e),
+            ) from e
+
 
 class OandaPricingStreamClient(OandaClientBase):
     """Pricing stream client."""
 
-    def stream_pricing_ticks(
-        self,
-        instruments: list[str] | str,
-        *,
-        snapshot: bool = True,
-        include_heartbeats: bool = False,
-    ) -> Iterator[TickData]:
+    def _open_stream(self, instruments: list[str] | str, *, snapshot: bool) -> Any:
         service = self.service
         assert service.stream_api is not None, "Stream API client not initialized"
         assert service.account is not None, "Account not initialized"
 
         instruments_param = instruments if isinstance(instruments, str) else ",".join(instruments)
 
-        response = self.request(
+        return self.request(
             service.stream_api.pricing.stream,
             service.account.account_id,
             label="Start pricing stream",
@@ -1198,6 +1309,57 @@ class OandaPricingStreamClient(OandaClientBase):
             instruments=instruments_param,
         )
 
+    def stream_raw_pricing_ticks(
+        self,
+        instruments: list[str] | str,
+        *,
+        snapshot: bool = True,
+    ) -> Iterator[PriceTick]:
+        """Yield best bid/ask records parsed directly from the raw stream lines.
+
+        Bypasses v20's per-line ``ClientPrice`` deserialization and the
+        ``TickData`` model construction of :meth:`stream_pricing_ticks`; prices
+        stay as the wire strings. Responses without raw lines fall back to the
+        object path.
+        """
+        response = self._open_stream(instruments, snapshot=snapshot)
+        lines = getattr(response, "lines", None)
+        if lines is None:
+            for tick in self._ticks_from_response(response):
+                yield PriceTick(
+                    instrument=tick.instrument,
+                    time=tick.timestamp.isoformat(),
+                    bid=str(tick.bid),
+                    ask=str(tick.ask),
+                )
+            return
+
+        try:
+            for line in lines:
+                if not line:
+                    continue
+                tick = parse_price_line(line)
+                if tick is not None:
+                    yield tick
+        except requests.exceptions.ConnectionError as exc:
+            raise v20.errors.V20Timeout(getattr(response, "path", ""), "stream") from exc
+        except requests.exceptions.ChunkedEncodingError as exc:
+            raise v20.errors.V20ConnectionError(getattr(response, "path", "")) from exc
+
+    def stream_pricing_ticks(
+        self,
+        instruments: list[str] | str,
+        *,
+        snapshot: bool = True,
+        include_heartbeats: bool = False,
+    ) -> Iterator[TickData]:
+        _ = include_heartbeats
+        response = self._open_stream(instruments, snapshot=snapshot)
+        yield from self._ticks_from_response(response)
+
+    def _ticks_from_response(self, response: Any) -> Iterator[TickData]:
+        service = self.service
+
         # v20 returns a Response object for streams; the stream messages are
         # yielded via response.parts() as (type, obj) tuples.
         parts_iter = getattr(response, "parts", None)
@@ -1219,7 +1381,6 @@ class OandaPricingStreamClient(OandaClientBase):
                 or getattr(msg, "type", None) == "HEARTBEAT"
                 or (isinstance(msg, dict) and msg.get("type") == "HEARTBEAT")
             ):
-                _ = include_heartbeats
                 continue
 
             # Dict-style messages (older mocks).
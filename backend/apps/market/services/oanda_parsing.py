@@ -131,12 +131,7 @@ class OandaResponseParser:
             return None
 
     def parse_order(self, order: Any) -> Order:
-        raw_type = str(self.object_field(order, "type") or "").upper()
-        order_type = {
-            "MARKET": OrderType.MARKET,
-            "LIMIT": OrderType.LIMIT,
-            "STOP": OrderType.STOP,
-        }.get(raw_type, OrderType.MARKET)
+        order_type = OrderType.from_raw(self.object_field(order, "type"))
 
         units_signed = self.to_decimal(self.object_field(order, "units")) or Decimal("0")
         direction = (
@@ -0,0 +1,288 @@
+"""Process-wide pool of OANDA v20 contexts shared across OandaService instances."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import Logger, getLogger
+from typing import Any
+
+from django.conf import settings
+
+logger: Logger = getLogger(name=__name__)
+
+DEFAULT_IDLE_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 64
+
+
+def credentials_fingerprint(*, hostname: str, token: str) -> str:
+    """Return a stable, non-reversible fingerprint of account credentials."""
+    digest = hashlib.sha256(f"{hostname}\0{token}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class OandaContextPoolStats:
+    """Point-in-time counters for the pooled v20 contexts."""
+
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    connections_opened: int = 0
+    requests_sent: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests served over an already-open HTTP connection."""
+        return max(0, self.requests_sent - self.connections_opened)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Return a JSON-serializable metric map."""
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "connections_opened": self.connections_opened,
+            "requests_sent": self.requests_sent,
+            "connections_reused": self.connections_reused,
+        }
+
+
+@dataclass(slots=True)
+class _PooledContext:
+    context: Any
+    last_used: float
+    holders: int = 0
+
+
+class OandaContextPool:
+    """Thread-safe registry of v20 contexts keyed by account and credentials.
+
+    Every ``v20.Context`` owns a ``requests.Session`` and therefore an urllib3
+    connection pool. Sharing one context per (account, credentials, kind)
+    lets short-lived ``OandaService`` instances - one per API request or
+    Celery task - reuse keep-alive HTTP connections and TLS sessions instead
+    of handshaking with OANDA on every call. Rotated tokens or hostnames
+    produce a new fingerprint, so stale credentials are never reused.
+
+    Contexts acquired with ``hold=True`` count as checked out until
+    :meth:`release`; idle and size-based eviction never closes them, so a
+    long-running stream keeps its session.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float | None = None,
+        max_entries: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._idle_seconds = idle_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], _PooledContext] = OrderedDict()
+        self._released: deque[tuple[Any, float]] = deque()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._retired_connections = 0
+        self._retired_requests = 0
+
+    @property
+    def idle_seconds(self) -> float:
+        if self._idle_seconds is not None:
+            return float(self._idle_seconds)
+        return float(getattr(settings, "OANDA_CLIENT_POOL_IDLE_SECONDS", DEFAULT_IDLE_SECONDS))
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return int(self._max_entries)
+        return int(getattr(settings, "OANDA_CLIENT_POOL_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+
+    def acquire(
+        self,
+        *,
+        account_id: str,
+        fingerprint: str,
+        kind: str,
+        factory: Callable[[], Any],
+        constructor: Any = None,
+        hold: bool = False,
+    ) -> Any:
+        """Return the pooled context for this key, building it on a miss.
+
+        ``constructor`` is part of the key so contexts created by a different
+        ``Context`` implementation (for example a patched one) never leak
+        into callers expecting another. With ``hold`` the caller must
+        :meth:`release` the context once it stops using it.
+        """
+        key = (account_id, fingerprint, kind, constructor)
+        with self._lock:
+            now = self._clock()
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used = now
+                entry.holders += int(hold)
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.context
+            self._misses += 1
+
+        # Build outside the lock; a concurrent miss for the same key keeps
+        # whichever context was registered first.
+        context = factory()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.holders += int(hold)
+                self._close(context)
+                return entry.context
+            self._entries[key] = _PooledContext(
+                context=context, last_used=self._clock(), holders=int(hold)
+            )
+            self._evict_overflow(keep=key)
+        return context
+
+    def release(self, context: Any) -> None:
+        """Return a context acquired with ``hold=True`` to the idle pool.
+
+        Safe to call from a ``weakref.finalize`` callback: if the lock is
+        busy (possibly held by this very thread during garbage collection)
+        the release is applied by the next pool operation instead.
+        """
+        self._released.append((context, self._clock()))
+        if self._lock.acquire(blocking=False):
+            try:
+                self._apply_releases()
+            finally:
+                self._lock.release()
+
+    def evict_idle(self) -> int:
+        """Close contexts unused for longer than the idle timeout."""
+        with self._lock:
+            return self._evict_idle(self._clock())
+
+    def clear(self) -> None:
+        """Close every pooled context."""
+        with self._lock:
+            while self._entries:
+                _, entry = self._entries.popitem(last=False)
+                self._retire(entry)
+
+    def reset_after_fork(self) -> None:
+        """Drop inherited contexts without touching sockets owned by the parent."""
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._released = deque()
+
+    def stats(self) -> OandaContextPoolStats:
+        """Return hit/miss counters and HTTP connection reuse for this process."""
+        with self._lock:
+            connections = self._retired_connections
+            requests_sent = self._retired_requests
+            for entry in self._entries.values():
+                opened, sent = _connection_counters(entry.context)
+                connections += opened
+                requests_sent += sent
+            return OandaContextPoolStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                connections_opened=connections,
+                requests_sent=requests_sent,
+            )
+
+    def _apply_releases(self) -> None:
+        while self._released:
+            context, released_at = self._released.popleft()
+            for entry in self._entries.values():
+                if entry.context is context:
+                    entry.holders = max(0, entry.holders - 1)
+                    entry.last_used = max(entry.last_used, released_at)
+                    break
+
+    def _evict_idle(self, now: float) -> int:
+        self._apply_releases()
+        idle_seconds = self.idle_seconds
+        if idle_seconds <= 0:
+            return 0
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if not entry.holders and now - entry.last_used > idle_seconds
+        ]
+        for key in expired:
+            self._retire(self._entries.pop(key))
+        return len(expired)
+
+    def _evict_overflow(self, *, keep: tuple[Any, ...]) -> None:
+        # Least recently used first; checked-out contexts may push the pool
+        # over its limit until they are released.
+        overflow = len(self._entries) - max(1, self.max_entries)
+        idle = [key for key, entry in self._entries.items() if not entry.holders and key != keep]
+        for key in idle[: max(0, overflow)]:
+            self._retire(self._entries.pop(key))
+
+    def _retire(self, entry: _PooledContext) -> None:
+        opened, sent = _connection_counters(entry.context)
+        self._retired_connections += opened
+        self._retired_requests += sent
+        self._evictions += 1
+        self._close(entry.context)
+
+    @staticmethod
+    def _close(context: Any) -> None:
+        session = getattr(context, "_session", None)
+        close = getattr(session, "close", None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception:  # pragma: no cover - best-effort socket cleanup
+            logger.debug("Failed to close pooled OANDA session", exc_info=True)
+
+
+def _connection_counters(context: Any) -> tuple[int, int]:
+    """Sum urllib3 connection/request counters for a context's session."""
+    session = getattr(context, "_session", None)
+    adapters = getattr(session, "adapters", None)
+    if not isinstance(adapters, dict):
+        return 0, 0
+    opened = 0
+    sent = 0
+    for adapter in adapters.values():
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            num_connections = getattr(pool, "num_connections", 0)
+            num_requests = getattr(pool, "num_requests", 0)
+            if isinstance(num_connections, int) and isinstance(num_requests, int):
+                opened += num_connections
+                sent += num_requests
+    return opened, sent
+
+
+OANDA_CONTEXT_POOL = OandaContextPool()
+
+if hasattr(os, "register_at_fork"):
+    # Celery prefork children must not share the parent's sockets.
+    os.register_at_fork(after_in_child=OANDA_CONTEXT_POOL.reset_after_fork)
@@ -0,0 +1,240 @@
+"""Raw OANDA pricing stream parsing and non-blocking stream transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from logging import Logger, getLogger
+from urllib.parse import urlencode
+
+logger: Logger = getLogger(name=__name__)
+
+_PRICE_TYPE = b'"type":"PRICE"'
+_INSTRUMENT_FIELD = b'"instrument":"'
+_TIME_FIELD = b'"time":"'
+_BIDS_FIELD = b'"bids":[{'
+_ASKS_FIELD = b'"asks":[{'
+_PRICE_FIELD = b'"price":"'
+_QUOTE = b'"'
+_TWO = Decimal("2")
+
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+# OANDA sends a heartbeat every 5 seconds; treat a much longer silence as a
+# dead connection.
+DEFAULT_READ_TIMEOUT_SECONDS = 30.0
+MAX_LINE_BYTES = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class PriceTick:
+    """Best bid/ask from one PRICE message, kept as the wire strings."""
+
+    instrument: str
+    time: str
+    bid: str
+    ask: str
+
+    @property
+    def mid(self) -> Decimal:
+        return (Decimal(self.bid) + Decimal(self.ask)) / _TWO
+
+    @property
+    def timestamp(self) -> datetime:
+        parsed = datetime.fromisoformat(self.time)
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _field(line: bytes, marker: bytes, start: int = 0) -> tuple[str, int] | None:
+    index = line.find(marker, start)
+    if index < 0:
+        return None
+    begin = index + len(marker)
+    end = line.find(_QUOTE, begin)
+    if end < 0:
+        return None
+    return line[begin:end].decode("ascii"), end
+
+
+def _first_price(line: bytes, marker: bytes) -> str | None:
+    index = line.find(marker)
+    if index < 0:
+        return None
+    # Only accept the price of the first bucket, i.e. before its closing brace.
+    close = line.find(b"}", index)
+    found = _field(line, _PRICE_FIELD, index)
+    if found is None or (close >= 0 and found[1] > close):
+        return None
+    return found[0]
+
+
+def parse_price_line(line: bytes | str) -> PriceTick | None:
+    """Extract instrument/time/best bid/best ask from one stream line.
+
+    Heartbeats and other message types return ``None``. OANDA emits compact
+    JSON, so the fields are located with byte searches instead of building a
+    full object graph; lines in any other layout fall back to ``json.loads``.
+    """
+    raw = line.encode("utf-8") if isinstance(line, str) else line
+    if _PRICE_TYPE not in raw:
+        if b'"PRICE"' not in raw:
+            return None
+        return _parse_price_json(raw)
+
+    instrument = _field(raw, _INSTRUMENT_FIELD)
+    time_value = _field(raw, _TIME_FIELD)
+    bid = _first_price(raw, _BIDS_FIELD)
+    ask = _first_price(raw, _ASKS_FIELD)
+    if instrument is None or time_value is None or bid is None or ask is None:
+        return _parse_price_json(raw)
+    return PriceTick(instrument=instrument[0], time=time_value[0], bid=bid, ask=ask)
+
+
+def _parse_price_json(raw: bytes) -> PriceTick | None:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(message, dict) or message.get("type") != "PRICE":
+        return None
+    bids = message.get("bids") or []
+    asks = message.get("asks") or []
+    instrument = message.get("instrument")
+    time_value = message.get("time")
+    if not bids or not asks or not instrument or not time_value:
+        return None
+    bid = bids[0].get("price") if isinstance(bids[0], dict) else None
+    ask = asks[0].get("price") if isinstance(asks[0], dict) else None
+    if bid is None or ask is None:
+        return None
+    return PriceTick(instrument=str(instrument), time=str(time_value), bid=str(bid), ask=str(ask))
+
+
+class OandaStreamHTTPError(Exception):
+    """The pricing stream endpoint answered with a non-200 status."""
+
+    def __init__(self, status: int, body: str = "") -> None:
+        super().__init__(f"OANDA pricing stream returned HTTP {status}: {body[:200]}")
+        self.status = status
+
+
+@dataclass(frozen=True, slots=True)
+class PricingStreamEndpoint:
+    """Connection parameters for one account's pricing stream."""
+
+    hostname: str
+    account_id: str
+    token: str
+    instruments: tuple[str, ...]
+    snapshot: bool = True
+    port: int = 443
+    tls: bool = True
+
+    @property
+    def path(self) -> str:
+        query = urlencode(
+            {
+                "instruments": ",".join(self.instruments),
+                "snapshot": "true" if self.snapshot else "false",
+            }
+        )
+        return f"/v3/accounts/{self.account_id}/pricing/stream?{query}"
+
+
+async def open_pricing_stream(
+    endpoint: PricingStreamEndpoint,
+    *,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    read_timeout: float = DEFAULT_READ_TIMEOUT_SECONDS,
+    ssl_context: ssl.SSLContext | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield raw newline-delimited messages from an OANDA pricing stream.
+
+    Speaks just enough HTTP/1.1 over ``asyncio`` streams (status line,
+    headers, chunked or close-delimited body) to follow one long-lived GET,
+    so many accounts can share one event loop without a thread each.
+    """
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(
+            endpoint.hostname,
+            endpoint.port,
+            ssl=(ssl_context or ssl.create_default_context()) if endpoint.tls else None,
+            limit=MAX_LINE_BYTES,
+        ),
+        timeout=connect_timeout,
+    )
+    try:
+        request = (
+            f"GET {endpoint.path} HTTP/1.1\r\n"
+            f"Host: {endpoint.hostname}\r\n"
+            f"Authorization: Bearer {endpoint.token}\r\n"
+            "Accept-Datetime-Format: RFC3339\r\n"
+            "Accept: application/json\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(request.encode("ascii"))
+        await writer.drain()
+
+        status, headers = await _read_head(reader, read_timeout)
+        chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        body = _chunked_body(reader, read_timeout) if chunked else _plain_body(reader, read_timeout)
+        if status != 200:
+            text = b"".join([part async for part in body]).decode("utf-8", "replace")
+            raise OandaStreamHTTPError(status, text)
+
+        pending = b""
+        async for data in body:
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+            if len(pending) > MAX_LINE_BYTES:
+                raise ValueError("OANDA pricing stream line exceeds maximum length")
+        if pending.strip():
+            yield pending
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.debug("Failed to close pricing stream socket", exc_info=True)
+
+
+async def _read_head(reader: asyncio.StreamReader, timeout: float) -> tuple[int, dict[str, str]]:
+    status_line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+    parts = status_line.decode("latin-1").split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise ConnectionError(f"Malformed HTTP status line: {status_line[:80]!r}")
+    headers: dict[str, str] = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def _chunked_body(reader: asyncio.StreamReader, timeout: float) -> AsyncIterator[bytes]:
+    while True:
+        size_line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+        if not size_line:
+            raise ConnectionError("OANDA pricing stream closed mid-chunk")
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            return
+        data = await asyncio.wait_for(reader.readexactly(size + 2), timeout=timeout)
+        yield data[:-2]
+
+
+async def _plain_body(reader: asyncio.StreamReader, timeout: float) -> AsyncIterator[bytes]:
+    while True:
+        data = await asyncio.wait_for(reader.read(65536), timeout=timeout)
+        if not data:
+            return
+        yield data
@@ -19,6 +19,15 @@ class OrderType(str, Enum):
     STOP = "stop"
     OCO = "oco"
 
+    @classmethod
+    def from_raw(cls, value: Any) -> "OrderType":
+        """Map an OANDA order type; dependent (TP/SL, ...) orders read as market."""
+        return {
+            "MARKET": cls.MARKET,
+            "LIMIT": cls.LIMIT,
+            "STOP": cls.STOP,
+        }.get(str(value or "").upper(), cls.MARKET)
+
 
 class OrderDirection(str, Enum):
     LONG = "long"
@@ -0,0 +1,242 @@
+"""Server-side tick downsampling for charts.
+
+A window is split into equal-width time buckets. Each bucket keeps its first,
+lowest, highest and last tick (M4 aggregation), which draws the same line as
+the raw ticks at one bucket per pixel. ``lttb`` runs Largest-Triangle-Three-
+Buckets over those min/max candidates instead of over every tick.
+
+Both read the ``(instrument, timestamp)`` primary-key range without sorting
+it. PostgreSQL aggregates the buckets in SQL; other backends stream the range
+once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from django.db import connection
+
+from apps.market.models import TickData
+
+DOWNSAMPLE_METHODS = ("minmax", "lttb")
+DOWNSAMPLE_PRICE_FIELDS = ("mid", "bid", "ask")
+DOWNSAMPLE_MAX_POINTS = 10000
+# Every bucket contributes at most its first, low, high and last tick.
+M4_POINTS_PER_BUCKET = 4
+DOWNSAMPLE_MIN_POINTS = M4_POINTS_PER_BUCKET
+
+
+@dataclass(frozen=True, slots=True)
+class DownsampledTicks:
+    points: list[tuple[datetime, Decimal]]
+    bucket_seconds: float
+    source_count: int
+
+
+@dataclass(slots=True)
+class _Bucket:
+    first: tuple[datetime, Decimal]
+    low: tuple[datetime, Decimal]
+    high: tuple[datetime, Decimal]
+    last: tuple[datetime, Decimal]
+    count: int
+
+    def update(self, timestamp: datetime, value: Decimal) -> None:
+        if value < self.low[1]:
+            self.low = (timestamp, value)
+        if value > self.high[1]:
+            self.high = (timestamp, value)
+        self.last = (timestamp, value)
+        self.count += 1
+
+    def points(self) -> list[tuple[datetime, Decimal]]:
+        return sorted({self.first, self.low, self.high, self.last})
+
+
+def downsample_ticks(
+    *,
+    instrument: str,
+    since: datetime,
+    until: datetime,
+    points: int,
+    method: str = "minmax",
+    price: str = "mid",
+) -> DownsampledTicks:
+    """Return at most *points* ticks that preserve the shape of the window."""
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsample method: {method}")
+    if price not in DOWNSAMPLE_PRICE_FIELDS:
+        raise ValueError(f"Unsupported price field: {price}")
+    # LTTB picks *points* ticks from up to four candidates per point.
+    bucket_count = points if method == "lttb" else max(1, points // M4_POINTS_PER_BUCKET)
+    width = max((until - since).total_seconds() / bucket_count, 1e-6)
+
+    if connection.vendor == "postgresql":
+        buckets = _sql_buckets(
+            instrument=instrument,
+            since=since,
+            until=until,
+            width=width,
+            bucket_count=bucket_count,
+            price=price,
+        )
+    else:
+        buckets = _scanned_buckets(
+            instrument=instrument,
+            since=since,
+            until=until,
+            width=width,
+            bucket_count=bucket_count,
+            price=price,
+        )
+
+    selected = [point for bucket in buckets for point in bucket.points()]
+    if method == "lttb":
+        selected = lttb(selected, points)
+    return DownsampledTicks(
+        points=selected,
+        bucket_seconds=width,
+        source_count=sum(bucket.count for bucket in buckets),
+    )
+
+
+def lttb(points: list[tuple[datetime, Decimal]], threshold: int) -> list[tuple[datetime, Decimal]]:
+    """Largest-Triangle-Three-Buckets over time-ordered ``(timestamp, value)`` points."""
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+    xs = [point[0].timestamp() for point in points]
+    ys = [float(point[1]) for point in points]
+    every = (len(points) - 2) / (threshold - 2)
+    selected = [points[0]]
+    anchor = 0
+    for index in range(threshold - 2):
+        start = int(index * every) + 1
+        end = int((index + 1) * every) + 1
+        next_end = min(int((index + 2) * every) + 1, len(points))
+        if next_end > end:
+            avg_x = sum(xs[end:next_end]) / (next_end - end)
+            avg_y = sum(ys[end:next_end]) / (next_end - end)
+        else:
+            avg_x, avg_y = xs[-1], ys[-1]
+        best, best_area = start, -1.0
+        for candidate in range(start, end):
+            area = abs(
+                (xs[anchor] - avg_x) * (ys[candidate] - ys[anchor])
+                - (xs[anchor] - xs[candidate]) * (avg_y - ys[anchor])
+            )
+            if area > best_area:
+                best, best_area = candidate, area
+        selected.append(points[best])
+        anchor = best
+    selected.append(points[-1])
+    return selected
+
+
+def _scanned_buckets(
+    *,
+    instrument: str,
+    since: datetime,
+    until: datetime,
+    width: float,
+    bucket_count: int,
+    price: str,
+) -> list[_Bucket]:
+    origin = since.timestamp()
+    buckets: dict[int, _Bucket] = {}
+    rows = (
+        TickData.objects.filter(
+            instrument=instrument,
+            timestamp__gte=since,
+            timestamp__lte=until,
+        )
+        .order_by("timestamp")
+        .values_list("timestamp", price)
+        .iterator(chunk_size=5000)
+    )
+    for timestamp, value in rows:
+        index = min(int((timestamp.timestamp() - origin) // width), bucket_count - 1)
+        bucket = buckets.get(index)
+        if bucket is None:
+            point = (timestamp, value)
+            buckets[index] = _Bucket(first=point, low=point, high=point, last=point, count=1)
+        else:
+            bucket.update(timestamp, value)
+    return [buckets[index] for index in sorted(buckets)]
+
+
+def _sql_buckets(
+    *,
+    instrument: str,
+    since: datetime,
+    until: datetime,
+    width: float,
+    bucket_count: int,
+    price: str,
+) -> list[_Bucket]:
+    # Plain aggregates give each bucket's time span, price range and count.
+    # The earliest ticks at the low and high come from joining the range to
+    # those per-bucket rows, and the first and last prices from primary-key
+    # lookups, instead of sorting every bucket's ticks once per extremum.
+    quote = connection.ops.quote_name
+    table = quote(TickData._meta.db_table)
+    column = quote(price)
+    bucket = 'LEAST(floor((extract(epoch FROM {alias}"timestamp") - %s) / %s)::bigint, %s)'
+    in_range = '{alias}"instrument" = %s AND {alias}"timestamp" >= %s AND {alias}"timestamp" <= %s'
+    sql = f"""
+        WITH stats AS (
+            SELECT
+                {bucket.format(alias="")} AS bucket,
+                min("timestamp") AS first_ts,
+                max("timestamp") AS last_ts,
+                min({column}) AS low,
+                max({column}) AS high,
+                count(*) AS ticks
+            FROM {table}
+            WHERE {in_range.format(alias="")}
+            GROUP BY 1
+        ),
+        extremes AS (
+            SELECT
+                s.bucket,
+                min(t."timestamp") FILTER (WHERE t.{column} = s.low) AS low_ts,
+                min(t."timestamp") FILTER (WHERE t.{column} = s.high) AS high_ts
+            FROM {table} AS t
+            JOIN stats AS s ON s.bucket = {bucket.format(alias="t.")}
+            WHERE {in_range.format(alias="t.")} AND t.{column} IN (s.low, s.high)
+            GROUP BY s.bucket
+        )
+        SELECT
+            s.first_ts, first_tick.{column}, e.low_ts, s.low,
+            e.high_ts, s.high, s.last_ts, last_tick.{column}, s.ticks
+        FROM stats AS s
+        JOIN extremes AS e ON e.bucket = s.bucket
+        JOIN {table} AS first_tick
+            ON first_tick."instrument" = %s AND first_tick."timestamp" = s.first_ts
+        JOIN {table} AS last_tick
+            ON last_tick."instrument" = %s AND last_tick."timestamp" = s.last_ts
+        ORDER BY s.bucket
+    """  # noqa: S608 - identifiers are quoted and come from the model/allow-list
+    bucket_params: list[Any] = [since.timestamp(), width, bucket_count - 1]
+    range_params: list[Any] = [instrument, since, until]
+    params = [*bucket_params, *range_params]
+    params += [*bucket_params, *range_params, instrument, instrument]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        _Bucket(
+            first=(_aware(first_ts), first),
+            low=(_aware(low_ts), low),
+            high=(_aware(high_ts), high),
+            last=(_aware(last_ts), last),
+            count=count,
+        )
+        for first_ts, first, low_ts, low, high_ts, high, last_ts, last, count in rows
+    ]
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
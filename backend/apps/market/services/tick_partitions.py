@@ -0,0 +1,196 @@
+"""Monthly range partitions of the ``tick_data`` table.
+
+On PostgreSQL ``tick_data`` is partitioned by ``timestamp`` into one
+partition per UTC month named ``tick_data_pYYYYMM``, plus a DEFAULT partition
+that catches ticks outside every month created so far. Range scans on
+``(instrument, timestamp)`` only touch the months they overlap, and retention
+drops whole months instead of deleting rows. Other backends keep a plain
+table; every helper here is a no-op for them.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging import Logger, getLogger
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger: Logger = getLogger(name=__name__)
+
+TICK_TABLE = "tick_data"
+DEFAULT_PARTITION = f"{TICK_TABLE}_default"
+DEFAULT_PARTITION_MONTHS_AHEAD = 3
+_PARTITION_NAME_RE = re.compile(rf"^{TICK_TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+@dataclass(frozen=True, slots=True)
+class TickPartition:
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(value: datetime) -> datetime:
+    aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    aware = aware.astimezone(UTC)
+    return datetime(aware.year, aware.month, 1, tzinfo=UTC)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def partition_for(value: datetime) -> TickPartition:
+    """Return the monthly partition that holds *value*."""
+    start = month_start(value)
+    return TickPartition(
+        name=f"{TICK_TABLE}_p{start:%Y%m}",
+        start=start,
+        end=add_months(start, 1),
+    )
+
+
+def months_between(since: datetime, until: datetime) -> list[TickPartition]:
+    """Return the monthly partitions overlapping ``[since, until]``."""
+    current = month_start(since)
+    last = month_start(until)
+    partitions = []
+    while current <= last:
+        partitions.append(partition_for(current))
+        current = add_months(current, 1)
+    return partitions
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT 1
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = %s AND c.relnamespace = current_schema()::regnamespace
+            """,
+            [TICK_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_tick_partitions() -> list[TickPartition]:
+    """Return the existing monthly partitions in time order."""
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = %s AND parent.relnamespace = current_schema()::regnamespace
+            """,
+            [TICK_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = _PARTITION_NAME_RE.match(name)
+        if match:
+            partitions.append(partition_for(datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def ensure_tick_partitions(since: datetime, until: datetime) -> list[str]:
+    """Create the missing monthly partitions overlapping ``[since, until]``.
+
+    Ticks already parked in the DEFAULT partition for a new month are moved
+    into it. Returns the names of the partitions created.
+    """
+    if not is_partitioned():
+        return []
+    existing = {partition.name for partition in list_tick_partitions()}
+    created = []
+    for partition in months_between(since, until):
+        if partition.name in existing:
+            continue
+        _create_partition(partition)
+        created.append(partition.name)
+    if created:
+        logger.info("Created tick_data partitions: %s", ", ".join(created))
+    return created
+
+
+def ensure_future_tick_partitions(months_ahead: int | None = None) -> list[str]:
+    """Create partitions from the current month through *months_ahead* months."""
+    if months_ahead is None:
+        months_ahead = int(
+            getattr(
+                settings,
+                "TICK_DATA_PARTITION_MONTHS_AHEAD",
+                DEFAULT_PARTITION_MONTHS_AHEAD,
+            )
+        )
+    now = timezone.now()
+    return ensure_tick_partitions(now, add_months(month_start(now), months_ahead))
+
+
+def drop_tick_partitions_before(cutoff: datetime) -> tuple[list[str], int]:
+    """Drop every monthly partition that ends at or before *cutoff*.
+
+    Returns the dropped partition names and their row count as estimated by
+    the planner statistics; counting the rows exactly would cost a scan of
+    each month being dropped.
+    """
+    expired = [partition for partition in list_tick_partitions() if partition.end <= cutoff]
+    if not expired:
+        return [], 0
+    names = [partition.name for partition in expired]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0)::bigint
+            FROM pg_class
+            WHERE relname = ANY(%s) AND relnamespace = current_schema()::regnamespace
+            """,
+            [names],
+        )
+        rows = int(cursor.fetchone()[0])
+        for name in names:
+            cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+    logger.info("Dropped tick_data partitions: %s (~%d rows)", ", ".join(names), rows)
+    return names, rows
+
+
+def _create_partition(partition: TickPartition) -> None:
+    quote = connection.ops.quote_name
+    table, name, default = quote(TICK_TABLE), quote(partition.name), quote(DEFAULT_PARTITION)
+    bounds = f"FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+    in_range = '"timestamp" >= %s AND "timestamp" < %s'
+    params = [partition.start, partition.end]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_class WHERE relname = %s "
+            "AND relnamespace = current_schema()::regnamespace",
+            [DEFAULT_PARTITION],
+        )
+        parked = False
+        if cursor.fetchone() is not None:
+            cursor.execute(f"SELECT 1 FROM {default} WHERE {in_range} LIMIT 1", params)
+            parked = cursor.fetchone() is not None
+        if not parked:
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}")
+            return
+        # PostgreSQL refuses a new partition whose range still has rows in
+        # DEFAULT, so build it detached and attach it after moving them.
+        cursor.execute(
+            f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(f"INSERT INTO {name} SELECT * FROM {default} WHERE {in_range}", params)
+        cursor.execute(f"DELETE FROM {default} WHERE {in_range}", params)
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}")
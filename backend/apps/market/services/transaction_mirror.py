@@ -0,0 +1,445 @@
+"""Incremental local mirror of OANDA account transactions.
+
+The mirror pulls new transactions with OANDA's ``sinceid`` endpoint, stores
+them verbatim in ``OandaTransaction`` and folds order/fill/cancel events into
+the ``OandaOrderRecord`` and ``OandaTradeRecord`` projections that back the
+order and position history endpoints.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+from logging import Logger, getLogger
+from typing import Any, Protocol
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.market.models import (
+    OandaAccounts,
+    OandaOrderRecord,
+    OandaTradeRecord,
+    OandaTransaction,
+    OandaTransactionSyncState,
+)
+from apps.market.services import oanda_parsing
+from apps.market.services.oanda import OandaService
+from apps.market.services.oanda_types import OandaAPIError, Transaction
+
+logger: Logger = getLogger(name=__name__)
+
+ORDER_CREATE_TYPES = frozenset(
+    {
+        "MARKET_ORDER",
+        "FIXED_PRICE_ORDER",
+        "LIMIT_ORDER",
+        "STOP_ORDER",
+        "MARKET_IF_TOUCHED_ORDER",
+        "TAKE_PROFIT_ORDER",
+        "STOP_LOSS_ORDER",
+        "GUARANTEED_STOP_LOSS_ORDER",
+        "TRAILING_STOP_LOSS_ORDER",
+    }
+)
+ORDER_FILL = "ORDER_FILL"
+ORDER_CANCEL = "ORDER_CANCEL"
+
+_ORDER_UPDATE_FIELDS = ["state", "fill_time", "cancel_time", "trade_id", "last_transaction_id"]
+_TRADE_UPDATE_FIELDS = [
+    "current_units",
+    "close_price",
+    "realized_pl",
+    "state",
+    "close_time",
+    "last_transaction_id",
+]
+
+
+class OandaTransactionFeed(Protocol):
+    """Source of account transactions newer than a transaction ID."""
+
+    def fetch_since(
+        self,
+        account: OandaAccounts,
+        since_transaction_id: int,
+    ) -> Sequence[Transaction]: ...
+
+
+class OandaServiceTransactionFeed:
+    """Transaction feed backed by ``OandaService.get_transaction_history``."""
+
+    def fetch_since(
+        self,
+        account: OandaAccounts,
+        since_transaction_id: int,
+    ) -> Sequence[Transaction]:
+        return OandaService(account).get_transaction_history(
+            since_transaction_id=since_transaction_id
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionSyncResult:
+    """Outcome of one incremental sync run for an account."""
+
+    account_id: int
+    fetched: int
+    applied: int
+    last_transaction_id: int
+    caught_up: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "account_id": self.account_id,
+            "fetched": self.fetched,
+            "applied": self.applied,
+            "last_transaction_id": self.last_transaction_id,
+            "caught_up": self.caught_up,
+        }
+
+
+@dataclass(slots=True)
+class _ProjectionBatch:
+    """Order/trade projections touched while applying one page."""
+
+    orders: dict[int, OandaOrderRecord]
+    trades: dict[int, OandaTradeRecord]
+    new_orders: set[int] = field(default_factory=set)
+    new_trades: set[int] = field(default_factory=set)
+    dirty_orders: set[int] = field(default_factory=set)
+    dirty_trades: set[int] = field(default_factory=set)
+
+
+class OandaTransactionMirror:
+    """Pull new OANDA transactions into the local mirror tables."""
+
+    def __init__(
+        self,
+        *,
+        feed: OandaTransactionFeed | None = None,
+        max_pages: int | None = None,
+    ) -> None:
+        self.feed = feed or OandaServiceTransactionFeed()
+        self.max_pages = max(
+            int(
+                max_pages
+                if max_pages is not None
+                else getattr(settings, "OANDA_TRANSACTION_SYNC_MAX_PAGES", 10)
+            ),
+            1,
+        )
+
+    def sync(self, account: OandaAccounts) -> TransactionSyncResult:
+        """Fetch and apply transactions after the account's stored cursor."""
+        state, _ = OandaTransactionSyncState.objects.get_or_create(account=account)
+        cursor = state.last_transaction_id
+        fetched = 0
+        applied = 0
+        caught_up = False
+        try:
+            for _ in range(self.max_pages):
+                page = self.feed.fetch_since(account, cursor)
+                fetched += len(page)
+                new = sorted(
+                    (txn for txn in page if _as_int(txn.transaction_id) > cursor),
+                    key=lambda txn: _as_int(txn.transaction_id),
+                )
+                if not new:
+                    caught_up = True
+                    break
+                with transaction.atomic():
+                    applied += self._apply_page(account, new)
+                    cursor = _as_int(new[-1].transaction_id)
+                    state.last_transaction_id = cursor
+                    state.save(update_fields=["last_transaction_id", "updated_at"])
+        except OandaAPIError as exc:
+            state.caught_up = False
+            state.last_error = str(exc)[:512]
+            state.save(update_fields=["caught_up", "last_error", "updated_at"])
+            raise
+
+        state.caught_up = caught_up
+        state.last_synced_at = timezone.now()
+        state.last_error = ""
+        state.save(update_fields=["caught_up", "last_synced_at", "last_error", "updated_at"])
+        return TransactionSyncResult(
+            account_id=account.pk,
+            fetched=fetched,
+            applied=applied,
+            last_transaction_id=cursor,
+            caught_up=caught_up,
+        )
+
+    def _apply_page(self, account: OandaAccounts, page: list[Transaction]) -> int:
+        created = OandaTransaction.objects.bulk_create(
+            [_transaction_row(account, txn) for txn in page],
+            ignore_conflicts=True,
+        )
+        batch = self._load_projections(account, page)
+        for txn in page:
+            raw = txn.raw or {}
+            if txn.type in ORDER_CREATE_TYPES:
+                self._order_created(account, batch, txn, raw)
+            elif txn.type == ORDER_FILL:
+                self._order_filled(account, batch, txn, raw)
+            elif txn.type == ORDER_CANCEL:
+                self._order_cancelled(batch, txn, raw)
+        self._save_projections(batch)
+        return len(created)
+
+    @staticmethod
+    def _load_projections(account: OandaAccounts, page: list[Transaction]) -> _ProjectionBatch:
+        order_ids: set[int] = set()
+        trade_ids: set[int] = set()
+        for txn in page:
+            raw = txn.raw or {}
+            if raw.get("orderID") is not None:
+                order_ids.add(_as_int(raw["orderID"]))
+            if raw.get("tradeID") is not None:
+                trade_ids.add(_as_int(raw["tradeID"]))
+            trade_ids.update(_as_int(item.get("tradeID")) for item in _trade_changes(raw))
+        return _ProjectionBatch(
+            orders={
+                record.order_id: record
+                for record in OandaOrderRecord.objects.filter(
+                    account=account, order_id__in=order_ids
+                )
+            },
+            trades={
+                record.trade_id: record
+                for record in OandaTradeRecord.objects.filter(
+                    account=account, trade_id__in=trade_ids
+                )
+            },
+        )
+
+    @staticmethod
+    def _save_projections(batch: _ProjectionBatch) -> None:
+        OandaOrderRecord.objects.bulk_create(
+            [batch.orders[order_id] for order_id in sorted(batch.new_orders)]
+        )
+        OandaTradeRecord.objects.bulk_create(
+            [batch.trades[trade_id] for trade_id in sorted(batch.new_trades)]
+        )
+        dirty_orders = batch.dirty_orders - batch.new_orders
+        if dirty_orders:
+            OandaOrderRecord.objects.bulk_update(
+                [batch.orders[order_id] for order_id in dirty_orders],
+                _ORDER_UPDATE_FIELDS,
+            )
+        dirty_trades = batch.dirty_trades - batch.new_trades
+        if dirty_trades:
+            OandaTradeRecord.objects.bulk_update(
+                [batch.trades[trade_id] for trade_id in dirty_trades],
+                _TRADE_UPDATE_FIELDS,
+            )
+
+    @staticmethod
+    def _order_created(
+        account: OandaAccounts,
+        batch: _ProjectionBatch,
+        txn: Transaction,
+        raw: dict[str, Any],
+    ) -> None:
+        order_id = _as_int(txn.transaction_id)
+        if order_id in batch.orders:
+            return
+        trade_id = _as_optional_int(raw.get("tradeID"))
+        instrument = str(raw.get("instrument") or "")
+        if not instrument and trade_id is not None and trade_id in batch.trades:
+            instrument = batch.trades[trade_id].instrument
+        batch.orders[order_id] = OandaOrderRecord(
+            account=account,
+            order_id=order_id,
+            instrument=instrument,
+            order_type=txn.type.removesuffix("_ORDER"),
+            units=txn.units,
+            price=txn.price,
+            time_in_force=str(raw.get("timeInForce") or ""),
+            state="PENDING",
+            take_profit=_nested_price(raw, "takeProfitOnFill"),
+            stop_loss=_nested_price(raw, "stopLossOnFill"),
+            trade_id=trade_id,
+            create_time=txn.time,
+            last_transaction_id=order_id,
+        )
+        batch.new_orders.add(order_id)
+
+    @staticmethod
+    def _order_filled(
+        account: OandaAccounts,
+        batch: _ProjectionBatch,
+        txn: Transaction,
+        raw: dict[str, Any],
+    ) -> None:
+        transaction_id = _as_int(txn.transaction_id)
+        order = batch.orders.get(_as_int(raw.get("orderID")))
+
+        opened = raw.get("tradeOpened")
+        if isinstance(opened, dict) and opened.get("tradeID") is not None:
+            trade_id = _as_int(opened["tradeID"])
+            units = _decimal(opened.get("units")) or Decimal("0")
+            if trade_id not in batch.trades:
+                batch.trades[trade_id] = OandaTradeRecord(
+                    account=account,
+                    trade_id=trade_id,
+                    instrument=str(raw.get("instrument") or ""),
+                    initial_units=units,
+                    current_units=units,
+                    entry_price=_decimal(opened.get("price")) or txn.price or Decimal("0"),
+                    open_time=txn.time,
+                    state="OPEN",
+                    last_transaction_id=transaction_id,
+                )
+                batch.new_trades.add(trade_id)
+            if order is not None:
+                order.trade_id = trade_id
+
+        reduced = raw.get("tradeReduced")
+        if isinstance(reduced, dict):
+            trade = batch.trades.get(_as_int(reduced.get("tradeID")))
+            if trade is not None:
+                trade.current_units += _decimal(reduced.get("units")) or Decimal("0")
+                trade.realized_pl += _decimal(reduced.get("realizedPL")) or Decimal("0")
+                trade.last_transaction_id = transaction_id
+                batch.dirty_trades.add(trade.trade_id)
+
+        for closed in raw.get("tradesClosed") or []:
+            if not isinstance(closed, dict):
+                continue
+            trade = batch.trades.get(_as_int(closed.get("tradeID")))
+            if trade is None:
+                continue
+            trade.current_units = Decimal("0")
+            trade.realized_pl += _decimal(closed.get("realizedPL")) or Decimal("0")
+            trade.close_price = _decimal(closed.get("price")) or txn.price
+            trade.close_time = txn.time
+            trade.state = "CLOSED"
+            trade.last_transaction_id = transaction_id
+            batch.dirty_trades.add(trade.trade_id)
+
+        if order is not None:
+            order.state = "FILLED"
+            order.fill_time = txn.time
+            order.last_transaction_id = transaction_id
+            batch.dirty_orders.add(order.order_id)
+
+    @staticmethod
+    def _order_cancelled(batch: _ProjectionBatch, txn: Transaction, raw: dict[str, Any]) -> None:
+        order = batch.orders.get(_as_int(raw.get("orderID")))
+        if order is None:
+            return
+        order.state = "CANCELLED"
+        order.cancel_time = txn.time
+        order.last_transaction_id = _as_int(txn.transaction_id)
+        batch.dirty_orders.add(order.order_id)
+
+
+def mirror_ready(accounts: Sequence[OandaAccounts]) -> bool:
+    """Return whether every account's mirror is caught up and fresh enough to serve."""
+    if not accounts or not bool(getattr(settings, "OANDA_TRANSACTION_MIRROR_ENABLED", True)):
+        return False
+    max_age = int(getattr(settings, "OANDA_TRANSACTION_MIRROR_MAX_STALENESS_SECONDS", 300))
+    ready = OandaTransactionSyncState.objects.filter(
+        account__in=accounts,
+        caught_up=True,
+        last_synced_at__gte=timezone.now() - timedelta(seconds=max_age),
+    ).count()
+    return ready == len(accounts)
+
+
+def mirrored_orders(
+    accounts: Sequence[OandaAccounts],
+    *,
+    instrument: str | None = None,
+    created_from: Any = None,
+    created_to: Any = None,
+) -> QuerySet[OandaOrderRecord]:
+    """Return mirrored order history for the accounts, newest first."""
+    queryset = OandaOrderRecord.objects.filter(
+        account__in=accounts,
+        create_time__isnull=False,
+    ).select_related("account")
+    if instrument:
+        queryset = queryset.filter(instrument=instrument)
+    if created_from is not None:
+        queryset = queryset.filter(create_time__gte=created_from)
+    if created_to is not None:
+        queryset = queryset.filter(create_time__lte=created_to)
+    return queryset.order_by("-create_time", "-order_id")
+
+
+def mirrored_closed_trades(
+    accounts: Sequence[OandaAccounts],
+    *,
+    instrument: str | None = None,
+    range_from: Any = None,
+    range_to: Any = None,
+) -> QuerySet[OandaTradeRecord]:
+    """Return mirrored closed trades overlapping the range, newest first."""
+    queryset = OandaTradeRecord.objects.filter(
+        account__in=accounts,
+        state="CLOSED",
+        open_time__isnull=False,
+    ).select_related("account")
+    if instrument:
+        queryset = queryset.filter(instrument=instrument)
+    if range_to is not None:
+        queryset = queryset.filter(open_time__lte=range_to)
+    if range_from is not None:
+        queryset = queryset.filter(Q(close_time__isnull=True) | Q(close_time__gte=range_from))
+    return queryset.order_by("-open_time", "-trade_id")
+
+
+def _transaction_row(account: OandaAccounts, txn: Transaction) -> OandaTransaction:
+    raw = txn.raw or {}
+    return OandaTransaction(
+        account=account,
+        transaction_id=_as_int(txn.transaction_id),
+        transaction_type=txn.type,
+        time=txn.time,
+        instrument=txn.instrument or "",
+        order_id=_as_optional_int(txn.order_id),
+        trade_id=_as_optional_int(txn.trade_id),
+        batch_id=_as_optional_int(raw.get("batchID")),
+        units=txn.units,
+        price=txn.price,
+        pl=txn.pl,
+        reason=(txn.reason or "")[:64],
+        raw=raw,
+    )
+
+
+def _trade_changes(raw: dict[str, Any]) -> list[dict[str, Any]]:
+    changes = [raw.get("tradeOpened"), raw.get("tradeReduced"), *(raw.get("tradesClosed") or [])]
+    return [item for item in changes if isinstance(item, dict) and item.get("tradeID")]
+
+
+def _nested_price(raw: dict[str, Any], key: str) -> Decimal | None:
+    details = raw.get(key)
+    if not isinstance(details, dict):
+        return None
+    return _decimal(details.get("price"))
+
+
+def _decimal(value: Any) -> Decimal | None:
+    return oanda_parsing.to_decimal(value)
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(str(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _as_optional_int(value: Any) -> int | None:
+    if value in (None, ""):
+        return None
+    parsed = _as_int(value)
+    return parsed or None
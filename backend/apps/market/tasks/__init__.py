@@ -11,9 +11,15 @@ from apps.market.tasks.backtest import (
     publish_ticks_for_backtest,
 )
 from apps.market.tasks.load_data import load_daily_tick_data
+from apps.market.tasks.multiplexer import (
+    MultiplexedTickPublisherRunner,
+    publish_oanda_ticks_multiplexed,
+)
+from apps.market.tasks.partitions import create_tick_partitions
 from apps.market.tasks.publisher import TickPublisherRunner, publish_oanda_ticks
 from apps.market.tasks.subscriber import TickSubscriberRunner, subscribe_ticks_to_db
 from apps.market.tasks.supervisor import TickSupervisorRunner, ensure_tick_pubsub_running
+from apps.market.tasks.transactions import sync_oanda_transactions
 
 # Create singleton instances for runners that need them
 supervisor_runner = TickSupervisorRunner()
@@ -23,6 +29,7 @@ subscriber_runner = TickSubscriberRunner()
 __all__: List[str] = [
     # Runner classes
     "BacktestTickPublisherRunner",
+    "MultiplexedTickPublisherRunner",
     "TickPublisherRunner",
     "TickSubscriberRunner",
     "TickSupervisorRunner",
@@ -31,10 +38,13 @@ __all__: List[str] = [
     "subscriber_runner",
     "supervisor_runner",
     # Task functions (for Celery autodiscovery)
+    "create_tick_partitions",
     "ensure_tick_pubsub_running",
     "load_daily_tick_data",
     "publish_oanda_ticks",
+    "publish_oanda_ticks_multiplexed",
     "publish_ticks_for_backtest",
     "refresh_oanda_account_snapshots",
     "subscribe_ticks_to_db",
+    "sync_oanda_transactions",
 ]
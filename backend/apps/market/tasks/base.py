@@ -10,6 +10,20 @@ import redis
 from celery import current_task
 from django.conf import settings
 
+# Owner-checked TTL refresh/release, shared by sync and asyncio lock holders.
+REFRESH_LOCK_IF_OWNER_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+  return redis.call("expire", KEYS[1], tonumber(ARGV[2]))
+end
+return 0
+"""
+RELEASE_LOCK_IF_OWNER_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+  return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 def current_task_id() -> str | None:
     """Get current Celery task ID."""
@@ -100,13 +114,7 @@ def refresh_lock_if_owner(
     ttl_seconds: int,
 ) -> bool:
     """Refresh a lock TTL only when the caller still owns it."""
-    script = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-      return redis.call("expire", KEYS[1], tonumber(ARGV[2]))
-    end
-    return 0
-    """
-    return bool(client.eval(script, 1, key, owner, ttl_seconds))
+    return bool(client.eval(REFRESH_LOCK_IF_OWNER_SCRIPT, 1, key, owner, ttl_seconds))
 
 
 def release_lock_if_owner(client: redis.Redis, key: str, owner: str | None) -> bool:
@@ -114,13 +122,7 @@ def release_lock_if_owner(client: redis.Redis, key: str, owner: str | None) -> b
     if not owner:
         return False
 
-    script = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-      return redis.call("del", KEYS[1])
-    end
-    return 0
-    """
-    return bool(client.eval(script, 1, key, owner))
+    return bool(client.eval(RELEASE_LOCK_IF_OWNER_SCRIPT, 1, key, owner))
 
 
 class LockHeartbeat:
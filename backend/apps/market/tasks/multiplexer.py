@@ -0,0 +1,403 @@
+"""Asyncio publisher that streams pricing for many OANDA accounts in one task."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging import Logger, getLogger
+from typing import Any
+
+import redis.asyncio as redis_asyncio
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.market.models import CeleryTaskStatus, OandaAccounts
+from apps.market.services.celery import CeleryTaskService
+from apps.market.services.instruments import LivePricingCacheWriter
+from apps.market.services.oanda_clients import OandaContextFactory
+from apps.market.services.oanda_stream import (
+    PricingStreamEndpoint,
+    PriceTick,
+    open_pricing_stream,
+    parse_price_line,
+)
+from apps.market.tasks.base import (
+    RELEASE_LOCK_IF_OWNER_SCRIPT,
+    REFRESH_LOCK_IF_OWNER_SCRIPT,
+    current_task_id,
+    isoformat,
+    lock_value,
+    new_lock_owner,
+)
+from apps.market.tasks.publisher import (
+    build_tick_latency_payload,
+    normalize_instruments,
+    publisher_lock_key_for_account,
+)
+
+logger: Logger = getLogger(name=__name__)
+
+MULTIPLEXED_PUBLISHER_TASK_NAME = "market.tasks.publish_oanda_ticks_multiplexed"
+PUBLISHER_LOCK_TTL_SECONDS = 60
+
+
+@shared_task(bind=True, name=MULTIPLEXED_PUBLISHER_TASK_NAME)
+def publish_oanda_ticks_multiplexed(self: Any, targets: dict[str, list[str]]) -> None:
+    """Stream live pricing for several accounts from one worker slot.
+
+    Args:
+        targets: Instruments to stream keyed by OANDA account primary key
+    """
+    runner = MultiplexedTickPublisherRunner()
+    runner.run(targets)
+
+
+@dataclass(frozen=True, slots=True)
+class AccountStream:
+    """One account's pricing stream inside the multiplexer."""
+
+    account_pk: int
+    oanda_account_id: str
+    endpoint: PricingStreamEndpoint
+    pricing_writer: LivePricingCacheWriter | None = None
+
+
+@dataclass(slots=True)
+class AccountStreamState:
+    """Live counters reported in the multiplexer heartbeat."""
+
+    status: str = "starting"
+    published: int = 0
+    reconnects: int = 0
+    last_error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "published": self.published,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error,
+        }
+
+
+class PricingStreamMultiplexer:
+    """Hold many OANDA pricing streams on one event loop.
+
+    Each account keeps the per-account publisher contract: it must own
+    ``publisher_lock_key_for_account`` before streaming (so it never runs
+    alongside a ``publish_oanda_ticks`` task for the same account), publishes
+    the same payload to the shared and ``live:{oanda_id}:{instrument}``
+    channels, and reconnects with capped exponential backoff on its own
+    without disturbing the other accounts.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis: Any,
+        shared_channel: str,
+        lock_ttl_seconds: int = PUBLISHER_LOCK_TTL_SECONDS,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 60.0,
+        connector: Callable[[PricingStreamEndpoint], AsyncIterator[bytes]] = open_pricing_stream,
+    ) -> None:
+        self.redis = redis
+        self.shared_channel = shared_channel
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.connector = connector
+        self.states: dict[int, AccountStreamState] = {}
+        self._pricing_writes: dict[int, asyncio.Future[bool]] = {}
+
+    async def run(self, streams: list[AccountStream], stop: asyncio.Event) -> None:
+        """Stream every account until *stop* is set."""
+        for stream in streams:
+            self.states[stream.account_pk] = AccountStreamState()
+        await asyncio.gather(*(self._run_account(stream, stop) for stream in streams))
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Return the jittered reconnect delay for the *attempt*-th consecutive failure."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)  # nosec B311 - jitter only
+
+    async def _run_account(self, stream: AccountStream, stop: asyncio.Event) -> None:
+        state = self.states[stream.account_pk]
+        lock_key = publisher_lock_key_for_account(stream.account_pk)
+        owner = new_lock_owner()
+        attempt = 0
+        while not stop.is_set():
+            if await self.redis.set(lock_key, owner, nx=True, ex=self.lock_ttl_seconds):
+                break
+            state.status = "locked"
+            await self._wait(stop, self.lock_ttl_seconds / 3)
+        else:
+            state.status = "stopped"
+            return
+
+        lock_lost = asyncio.Event()
+        refresher = asyncio.create_task(self._refresh_lock(lock_key, owner, stop, lock_lost))
+        try:
+            while not stop.is_set() and not lock_lost.is_set():
+                state.status = "connecting"
+                published_before = state.published
+                try:
+                    await self._until_halted(self._stream_once(stream, state), stop, lock_lost)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    state.last_error = str(exc)[:200]
+                    logger.warning(
+                        "Multiplexer: stream error (account_pk=%s): %s",
+                        stream.account_pk,
+                        exc,
+                    )
+                if stop.is_set() or lock_lost.is_set():
+                    break
+                # A connection that delivered ticks resets the backoff.
+                attempt = 1 if state.published > published_before else attempt + 1
+                state.reconnects += 1
+                state.status = "backoff"
+                await self._wait(stop, self.backoff_seconds(attempt))
+        finally:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+            with contextlib.suppress(Exception):
+                await self.redis.eval(RELEASE_LOCK_IF_OWNER_SCRIPT, 1, lock_key, owner)
+            state.status = "lock_lost" if lock_lost.is_set() else "stopped"
+
+    async def _stream_once(self, stream: AccountStream, state: AccountStreamState) -> None:
+        async for line in self.connector(stream.endpoint):
+            tick = parse_price_line(line)
+            if tick is None:
+                continue
+            await self._publish(stream, tick)
+            state.status = "streaming"
+            state.published += 1
+        raise ConnectionError("pricing stream ended")
+
+    @staticmethod
+    async def _until_halted(coro: Any, *events: asyncio.Event) -> None:
+        """Await *coro*, cancelling it as soon as any of *events* is set."""
+        work = asyncio.ensure_future(coro)
+        waiters = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            await asyncio.wait({work, *waiters}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            if not work.done():
+                work.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await work
+        if not work.cancelled():
+            work.result()
+
+    async def _publish(self, stream: AccountStream, tick: PriceTick) -> None:
+        observed_at = datetime.now(UTC)
+        timestamp = tick.timestamp
+        payload = {
+            "instrument": tick.instrument,
+            "timestamp": isoformat(timestamp),
+            "bid": tick.bid,
+            "ask": tick.ask,
+            "mid": str(tick.mid),
+        }
+        payload.update(build_tick_latency_payload(timestamp, observed_at=observed_at))
+        encoded_payload = json.dumps(payload)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.publish(self.shared_channel, encoded_payload)
+        pipe.publish(f"live:{stream.oanda_account_id}:{tick.instrument}", encoded_payload)
+        await pipe.execute()
+        if stream.pricing_writer is not None:
+            self._write_pricing(stream, stream.pricing_writer, tick, payload["timestamp"])
+
+    def _write_pricing(
+        self,
+        stream: AccountStream,
+        writer: LivePricingCacheWriter,
+        tick: PriceTick,
+        timestamp: str,
+    ) -> None:
+        """Hand *tick* to the pricing cache without blocking the event loop.
+
+        The cache write is a synchronous Django cache call, so it runs in a
+        worker thread. Ticks arriving while the account's previous write is
+        still in flight skip the cache; the writer is throttled anyway and the
+        next tick after it finishes refreshes the entry.
+        """
+        pending = self._pricing_writes.get(stream.account_pk)
+        if pending is not None and not pending.done():
+            return
+        write = asyncio.ensure_future(
+            asyncio.to_thread(
+                writer.write,
+                instrument=tick.instrument,
+                bid=tick.bid,
+                ask=tick.ask,
+                time=timestamp,
+            )
+        )
+        write.add_done_callback(_log_pricing_write_failure)
+        self._pricing_writes[stream.account_pk] = write
+
+    async def _refresh_lock(
+        self,
+        lock_key: str,
+        owner: str,
+        stop: asyncio.Event,
+        lock_lost: asyncio.Event,
+    ) -> None:
+        interval = max(self.lock_ttl_seconds / 3.0, 1.0)
+        while not stop.is_set():
+            await self._wait(stop, interval)
+            if stop.is_set():
+                return
+            try:
+                refreshed = await self.redis.eval(
+                    REFRESH_LOCK_IF_OWNER_SCRIPT, 1, lock_key, owner, self.lock_ttl_seconds
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning("Multiplexer: lock refresh failed (lock=%s)", lock_key)
+                continue
+            if not refreshed:
+                logger.error("Multiplexer: lost publisher lock %s", lock_key)
+                lock_lost.set()
+                return
+
+    @staticmethod
+    async def _wait(stop: asyncio.Event, seconds: float) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+
+
+def _log_pricing_write_failure(write: asyncio.Future[bool]) -> None:
+    if not write.cancelled() and write.exception() is not None:
+        logger.warning("Multiplexer: pricing cache write failed", exc_info=write.exception())
+
+
+class MultiplexedTickPublisherRunner:
+    """Runner for the multiplexed OANDA tick publisher task."""
+
+    def __init__(self) -> None:
+        self.task_service: CeleryTaskService | None = None
+        self.multiplexer: PricingStreamMultiplexer | None = None
+
+    def run(self, targets: dict[str, list[str]]) -> None:
+        """Resolve accounts, then stream them until a stop is requested."""
+        self.task_service = CeleryTaskService(
+            task_name=MULTIPLEXED_PUBLISHER_TASK_NAME,
+            instance_key="default",
+            stop_check_interval_seconds=1.0,
+            heartbeat_interval_seconds=5.0,
+        )
+        normalized = {
+            str(account_pk): normalize_instruments(instruments)
+            for account_pk, instruments in targets.items()
+        }
+        self.task_service.start(
+            celery_task_id=current_task_id(),
+            worker=lock_value(),
+            meta={"kind": "multiplexed_publisher", "targets": normalized},
+        )
+        streams = self.account_streams(normalized)
+        if not streams:
+            logger.warning("Multiplexer exiting: no active accounts in targets=%s", normalized)
+            self.task_service.mark_stopped(status_message="No active accounts")
+            return
+
+        logger.info(
+            "Multiplexer starting (accounts=%s, worker=%s)",
+            [stream.account_pk for stream in streams],
+            lock_value(),
+        )
+        try:
+            asyncio.run(self._serve(streams))
+        except Exception as exc:
+            logger.exception("Multiplexer failed: %s", exc)
+            self.task_service.mark_stopped(
+                status=CeleryTaskStatus.Status.FAILED,
+                status_message=str(exc)[:500],
+            )
+            raise
+        self.task_service.mark_stopped(status_message=self._summary())
+
+    @staticmethod
+    def account_streams(targets: dict[str, list[str]]) -> list[AccountStream]:
+        """Build stream endpoints for the active accounts among *targets*."""
+        accounts = OandaAccounts.objects.filter(
+            id__in=[int(account_pk) for account_pk in targets],
+            is_active=True,
+        ).order_by("id")
+        streams: list[AccountStream] = []
+        for account in accounts:
+            rest_hostname = str(account.api_hostname)
+            streams.append(
+                AccountStream(
+                    account_pk=int(account.pk),
+                    oanda_account_id=str(account.account_id),
+                    endpoint=PricingStreamEndpoint(
+                        hostname=OandaContextFactory.stream_hostname(rest_hostname),
+                        account_id=str(account.account_id),
+                        token=account.get_api_token(),
+                        instruments=tuple(targets[str(account.pk)]),
+                    ),
+                    pricing_writer=LivePricingCacheWriter.for_account(account, cache_backend=cache),
+                )
+            )
+        return streams
+
+    async def _serve(self, streams: list[AccountStream]) -> None:
+        client = redis_asyncio.Redis.from_url(settings.MARKET_REDIS_URL, decode_responses=True)
+        self.multiplexer = PricingStreamMultiplexer(
+            redis=client,
+            shared_channel=getattr(settings, "MARKET_TICK_CHANNEL", "market:ticks"),
+            backoff_max_seconds=float(
+                getattr(settings, "MARKET_TICK_MULTIPLEXER_BACKOFF_MAX_SECONDS", 60)
+            ),
+        )
+        stop = asyncio.Event()
+        control = asyncio.create_task(self._watch_control(stop))
+        try:
+            await self.multiplexer.run(streams, stop)
+        finally:
+            stop.set()
+            control.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await control
+            await client.aclose()
+
+    async def _watch_control(self, stop: asyncio.Event) -> None:
+        """Poll the task row for stop requests and publish per-account heartbeats."""
+        assert self.task_service is not None
+        while not stop.is_set():
+            if await asyncio.to_thread(self.task_service.should_stop):
+                logger.info("Multiplexer: stop requested")
+                stop.set()
+                return
+            await asyncio.to_thread(
+                self.task_service.heartbeat,
+                status_message=self._summary(),
+                meta_update={"accounts": self._account_states()},
+            )
+            await PricingStreamMultiplexer._wait(stop, 1.0)
+
+    def _account_states(self) -> dict[str, dict[str, Any]]:
+        if self.multiplexer is None:
+            return {}
+        return {
+            str(account_pk): state.to_dict()
+            for account_pk, state in self.multiplexer.states.items()
+        }
+
+    def _summary(self) -> str:
+        states = self._account_states().values()
+        published = sum(int(state["published"]) for state in states)
+        return f"accounts={len(states)} published={published}"
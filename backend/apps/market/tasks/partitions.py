@@ -0,0 +1,19 @@
+"""Celery task keeping future tick_data partitions in place."""
+
+from __future__ import annotations
+
+from celery import shared_task
+
+from apps.market.services.tick_partitions import ensure_future_tick_partitions
+
+
+@shared_task(name="market.tasks.create_tick_partitions")
+def create_tick_partitions() -> dict[str, int]:
+    """Create the monthly tick_data partitions for the coming months.
+
+    Retention is not applied here: dropping months is left to
+    ``manage.py create_tick_partitions --drop-expired`` because backtests
+    read historical ticks.
+    """
+    created = ensure_future_tick_partitions()
+    return {"created": len(created)}
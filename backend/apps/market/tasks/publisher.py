@@ -10,9 +10,11 @@ from typing import Any
 
 from celery import shared_task
 from django.conf import settings
+from django.core.cache import cache
 
 from apps.market.models import CeleryTaskStatus, OandaAccounts
 from apps.market.services.celery import CeleryTaskService
+from apps.market.services.instruments import LivePricingCacheWriter
 from apps.market.services.oanda import OandaService
 from apps.market.tasks.base import (
     acquire_lock,
@@ -36,6 +38,12 @@ def publisher_lock_key_for_account(account_id: int) -> str:
     return f"{base_key}:{account_id}"
 
 
+def multiplexed_publisher_enabled() -> bool:
+    """Return whether live ticks stream through the single multiplexed publisher."""
+    mode = str(getattr(settings, "MARKET_TICK_PUBLISHER_MODE", "per_account") or "")
+    return mode.strip().lower() == "multiplexed"
+
+
 def normalize_instruments(instruments: list[str] | tuple[str, ...] | None) -> list[str]:
     """Return a stable, de-duplicated instrument list for publisher state."""
     source = instruments or getattr(settings, "MARKET_TICK_INSTRUMENTS", ["EUR_USD"])
@@ -192,13 +200,16 @@ class TickPublisherRunner:
         Each tick is published to both the shared market channel and the
         account-specific ``live:{oanda_account_id}:{instrument}`` channel.
         The shared channel feeds DB persistence while the account channel
-        serves trading tasks that must follow the exact OANDA account.
+        serves trading tasks that must follow the exact OANDA account. The
+        latest quote per instrument also refreshes the short-TTL pricing
+        cache read by the instrument detail endpoint.
         """
         assert self.account is not None
         assert self.task_service is not None
         oanda_account_id = self.account.account_id
         shared_channel = getattr(settings, "MARKET_TICK_CHANNEL", "market:ticks")
         latency_log_interval_seconds = self._live_tick_latency_metric_interval_seconds()
+        pricing_writer = LivePricingCacheWriter.for_account(self.account, cache_backend=cache)
         last_latency_log_at_by_instrument: dict[str, datetime] = {}
 
         ticks_published = 0
@@ -219,21 +230,22 @@ class TickPublisherRunner:
                         account_id,
                     )
                     service = OandaService(self.account)
-                    for tick in service.stream_pricing_ticks(instruments_list, snapshot=True):
+                    for tick in service.stream_raw_pricing_ticks(instruments_list, snapshot=True):
                         if self.task_service.should_stop():
                             break
 
-                        instrument = str(tick.instrument)
+                        instrument = tick.instrument
+                        tick_timestamp = tick.timestamp
                         observed_at = datetime.now(UTC)
                         latency_payload = build_tick_latency_payload(
-                            tick.timestamp,
+                            tick_timestamp,
                             observed_at=observed_at,
                         )
                         payload = {
                             "instrument": instrument,
-                            "timestamp": isoformat(tick.timestamp),
-                            "bid": str(tick.bid),
-                            "ask": str(tick.ask),
+                            "timestamp": isoformat(tick_timestamp),
+                            "bid": tick.bid,
+                            "ask": tick.ask,
                             "mid": str(tick.mid),
                         }
                         payload.update(latency_payload)
@@ -241,6 +253,13 @@ class TickPublisherRunner:
                         client.publish(shared_channel, encoded_payload)
                         client.publish(f"live:{oanda_account_id}:{instrument}", encoded_payload)
                         ticks_published += 1
+                        if pricing_writer is not None:
+                            pricing_writer.write(
+                                instrument=instrument,
+                                bid=tick.bid,
+                                ask=tick.ask,
+                                time=payload["timestamp"],
+                            )
 
                         if ticks_published == 1:
                             logger.info(
@@ -267,7 +286,7 @@ class TickPublisherRunner:
                                 account_id,
                                 oanda_account_id,
                                 instrument,
-                                isoformat(tick.timestamp),
+                                payload["timestamp"],
                                 latency_payload[OANDA_TICK_PUBLISHED_AT_KEY],
                                 latency_payload[OANDA_TICK_PUBLISH_LATENCY_SECONDS_KEY],
                                 ticks_published,
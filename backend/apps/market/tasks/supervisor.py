@@ -15,7 +15,10 @@ from django.utils import timezone
 
 from apps.market.models import CeleryTaskStatus
 from apps.market.services.celery import CeleryTaskService
-from apps.market.tasks.publisher import publisher_lock_key_for_account
+from apps.market.tasks.publisher import (
+    multiplexed_publisher_enabled,
+    publisher_lock_key_for_account,
+)
 from apps.market.tasks.base import (
     acquire_lock,
     current_task_id,
@@ -115,7 +118,10 @@ class TickSupervisorRunner:
                     "Supervisor: ensuring tick publishers for targets=%s",
                     account_targets,
                 )
-                self._ensure_publishers_running(client, account_targets)
+                if multiplexed_publisher_enabled():
+                    self._ensure_multiplexed_publisher_running(account_targets)
+                else:
+                    self._ensure_publishers_running(client, account_targets)
 
             # Check and restart subscriber if needed
             self._ensure_subscriber_running(client)
@@ -292,6 +298,45 @@ class TickSupervisorRunner:
                     queue="market",
                 )
 
+    def _ensure_multiplexed_publisher_running(
+        self, account_targets: list[AccountStreamTarget]
+    ) -> None:
+        """Ensure one multiplexed publisher streams every target account."""
+        from apps.market.tasks.multiplexer import (
+            MULTIPLEXED_PUBLISHER_TASK_NAME,
+            publish_oanda_ticks_multiplexed,
+        )
+
+        desired = {str(target.account_pk): list(target.instruments) for target in account_targets}
+        row = self._fresh_market_task(
+            task_name=MULTIPLEXED_PUBLISHER_TASK_NAME,
+            instance_key="default",
+        )
+        if row is not None:
+            meta = row.meta if isinstance(row.meta, dict) else {}
+            if meta.get("targets") == desired:
+                return
+            updated = CeleryTaskStatus.objects.filter(
+                task_name=MULTIPLEXED_PUBLISHER_TASK_NAME,
+                instance_key="default",
+                status=CeleryTaskStatus.Status.RUNNING,
+            ).update(
+                status=CeleryTaskStatus.Status.STOPPING,
+                status_message="Restarting multiplexed publisher with updated targets",
+            )
+            if updated:
+                logger.warning(
+                    "Supervisor: requested multiplexed publisher restart for targets=%s",
+                    desired,
+                )
+            return
+
+        logger.info("Supervisor: spawning multiplexed publisher (targets=%s)", desired)
+        publish_oanda_ticks_multiplexed.apply_async(
+            kwargs={"targets": desired},
+            queue="market",
+        )
+
     def _ensure_subscriber_running(self, client: Any) -> None:
         """Ensure the shared DB subscriber task is running."""
         from apps.market.tasks import subscribe_ticks_to_db
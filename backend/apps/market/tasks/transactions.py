@@ -0,0 +1,44 @@
+"""Celery tasks for the local OANDA transaction mirror."""
+
+from __future__ import annotations
+
+from logging import getLogger
+
+from celery import shared_task
+from django.conf import settings
+
+from apps.market.models import OandaAccounts
+from apps.market.services.transaction_mirror import OandaTransactionMirror
+
+logger = getLogger(__name__)
+
+
+@shared_task(bind=True, name="market.tasks.sync_oanda_transactions")
+def sync_oanda_transactions(self, account_id: int | None = None) -> dict[str, int]:
+    """Pull new OANDA transactions into the local mirror for active accounts."""
+    if not bool(getattr(settings, "OANDA_TRANSACTION_MIRROR_ENABLED", True)):
+        return {"synced": 0, "failed": 0, "applied": 0}
+
+    queryset = OandaAccounts.objects.filter(is_active=True).order_by("id")
+    if account_id is not None:
+        queryset = queryset.filter(pk=account_id)
+
+    mirror = OandaTransactionMirror()
+    synced = 0
+    failed = 0
+    applied = 0
+    for account in queryset.iterator():
+        try:
+            result = mirror.sync(account)
+        except Exception:
+            failed += 1
+            logger.warning(
+                "OANDA transaction mirror sync failed for account_id=%s",
+                account.pk,
+                exc_info=True,
+            )
+        else:
+            synced += 1
+            applied += result.applied
+
+    return {"synced": synced, "failed": failed, "applied": applied}
@@ -16,6 +16,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.common.querying import OrderingConfig
+from apps.common.renderers import ColumnarJSONRenderer, TimedJSONRenderer
 from apps.market.models import OandaAccounts
 from apps.market.services.oanda_candles import (
     OANDA_GRANULARITY_SECONDS,
@@ -38,10 +39,15 @@ CANDLE_ORDERING = OrderingConfig(
 
 
 class CandleDataView(APIView):
-    """API endpoint for fetching candle data."""
+    """API endpoint for fetching candle data.
+
+    ``format=columnar`` returns ``candles`` as one array per field.
+    """
 
     permission_classes = [IsAuthenticated]
     throttle_classes: list = []
+    renderer_classes = [TimedJSONRenderer, ColumnarJSONRenderer]
+    columnar_rows_key = "candles"
     candle_parser = OandaCandleParser()
     candle_history = OandaCandleHistoryService(
         gateway=OandaCandleGateway(),
@@ -17,6 +17,7 @@ from apps.market.services.instruments import (
     OandaAccountSelector,
     OandaInstrumentCache,
     OandaInstrumentCatalogService,
+    pricing_cache_ttl_seconds,
 )
 from apps.market.services.oanda_retry import OandaApiRequestExecutor
 from apps.trading import utils as trading_utils
@@ -60,6 +61,7 @@ class OandaInstrumentServiceMixin:
                 cache_backend=cache,
                 instruments_ttl_seconds=INSTRUMENTS_CACHE_TTL_SECONDS,
                 detail_ttl_seconds=INSTRUMENT_DETAIL_CACHE_TTL_SECONDS,
+                pricing_ttl_seconds=pricing_cache_ttl_seconds(),
             ),
             v20_module=v20,
             request_executor=self.request_executor,
@@ -0,0 +1,62 @@
+"""Helpers for serving history lists from the local OANDA transaction mirror."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from django.db.models import Model, QuerySet
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.common.querying import OrderingConfig, invalid_query_param
+from apps.trading.views.pagination import HistoryCursorPagination, StandardPagination
+
+CURSOR_QUERY_PARAM = HistoryCursorPagination.cursor_query_param
+
+
+def paginate_mirrored_history(
+    request: Request,
+    queryset: QuerySet[Any],
+    *,
+    ordering: OrderingConfig,
+    formatter: Callable[[Any], dict[str, Any]],
+) -> Response:
+    """Paginate a mirrored history queryset in the database.
+
+    Page-number mode (``page``/``page_size``) matches the upstream-backed
+    responses. Passing ``cursor`` (empty for the first page) switches to
+    keyset pagination, which stays cheap however deep the client pages.
+    """
+    _normalized, terms = ordering.parse(request.query_params.get("ordering"))
+    if CURSOR_QUERY_PARAM in request.query_params:
+        if not _is_concrete_field(queryset.model, terms[0]):
+            raise invalid_query_param(
+                "ordering by this field is not supported with cursor pagination"
+            )
+        cursor_paginator = HistoryCursorPagination()
+        cursor_paginator.ordering = tuple(terms)
+        rows = cursor_paginator.paginate_queryset(queryset, request) or []
+        return cursor_paginator.get_paginated_response([formatter(row) for row in rows])
+
+    paginator = StandardPagination()
+    rows = paginator.paginate_queryset(queryset.order_by(*terms), request) or []
+    return paginator.get_paginated_response([formatter(row) for row in rows])
+
+
+def decimal_text(value: Decimal | None) -> str | None:
+    """Render a stored decimal without the column's trailing zero padding."""
+    if value is None:
+        return None
+    return format(value.normalize(), "f")
+
+
+def _is_concrete_field(model: type[Model], term: str) -> bool:
+    name = term.lstrip("-")
+    if "__" in name:
+        return False
+    try:
+        return model._meta.get_field(name).concrete
+    except Exception:
+        return False
@@ -1,6 +1,7 @@
 """Order views."""
 
 from datetime import datetime
+from decimal import Decimal
 from logging import Logger, getLogger
 from typing import Any
 
@@ -21,7 +22,7 @@ from apps.common.querying import (
     invalid_query_param,
     parse_datetime_param,
 )
-from apps.market.models import OandaAccounts
+from apps.market.models import OandaAccounts, OandaOrderRecord
 from apps.market.serializers import OrderSerializer
 from apps.market.services.compliance import ComplianceViolationError
 from apps.market.services.oanda import (
@@ -31,9 +32,12 @@ from apps.market.services.oanda import (
     OandaService,
     OcoOrderRequest,
     Order,
+    OrderType,
     StopOrderRequest,
 )
+from apps.market.services.transaction_mirror import mirror_ready, mirrored_orders
 from apps.market.views.account_helpers import get_user_accounts
+from apps.market.views.mirrored_lists import decimal_text, paginate_mirrored_history
 from apps.market.views.order_errors import order_error_response
 from apps.market.views.upstream_lists import fetch_account_lists, upstream_history_count
 from apps.trading.views.pagination import StandardPagination
@@ -61,6 +65,27 @@ MARKET_ORDER_ORDERING = OrderingConfig(
     default="-create_time",
 )
 
+MIRRORED_ORDER_ORDERING = OrderingConfig(
+    fields={
+        "id": "order_id",
+        "instrument": "instrument",
+        "type": "order_type",
+        "direction": "units",
+        "units": "units",
+        "price": "price",
+        "state": "state",
+        "time_in_force": "time_in_force",
+        "create_time": "create_time",
+        "fill_time": "fill_time",
+        "cancel_time": "cancel_time",
+        "take_profit": "take_profit",
+        "stop_loss": "stop_loss",
+        "account_name": "account__account_id",
+        "account_db_id": "account_id",
+    },
+    default="-create_time",
+)
+
 
 def _string_or_none(value: object) -> str | None:
     if value in (None, ""):
@@ -126,6 +151,28 @@ def _format_order_dict(order_obj: Any, account: OandaAccounts | None = None) ->
     return data
 
 
+def _format_order_record(record: OandaOrderRecord) -> dict:
+    """Format a mirrored order record like an upstream order."""
+    units = record.units or Decimal("0")
+    return {
+        "id": str(record.order_id),
+        "instrument": record.instrument,
+        "type": OrderType.from_raw(record.order_type).value,
+        "direction": "short" if units < 0 else "long",
+        "units": decimal_text(abs(units)),
+        "price": decimal_text(record.price),
+        "state": record.state,
+        "time_in_force": record.time_in_force or None,
+        "create_time": record.create_time.isoformat() if record.create_time else None,
+        "fill_time": record.fill_time.isoformat() if record.fill_time else None,
+        "cancel_time": record.cancel_time.isoformat() if record.cancel_time else None,
+        "take_profit": decimal_text(record.take_profit),
+        "stop_loss": decimal_text(record.stop_loss),
+        "account_name": record.account.account_id,
+        "account_db_id": record.account_id,
+    }
+
+
 class MarketOrderSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """Schema serializer for a single market order response item."""
 
@@ -181,6 +228,15 @@ class OrderView(APIView):
             OpenApiParameter(name="ordering", type=str, required=False),
             OpenApiParameter(name="timestamp_from", type=str, required=False),
             OpenApiParameter(name="timestamp_to", type=str, required=False),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                required=False,
+                description=(
+                    "Keyset cursor for order history served from the local transaction "
+                    "mirror. Pass an empty value to start; the response omits count."
+                ),
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -193,7 +249,10 @@ class OrderView(APIView):
                 },
             )
         },
-        description="List user's orders from OANDA API.",
+        description=(
+            "List user's orders. Order history is read from the local OANDA "
+            "transaction mirror when it is up to date, otherwise from OANDA."
+        ),
     )
     def get(self, request: Request) -> Response:
         """
@@ -229,6 +288,19 @@ class OrderView(APIView):
         if not accounts:
             return Response({"count": 0, "next": None, "previous": None, "results": []})
 
+        if order_status != "pending" and mirror_ready(accounts):
+            return paginate_mirrored_history(
+                request,
+                mirrored_orders(
+                    accounts,
+                    instrument=instrument,
+                    created_from=created_from,
+                    created_to=created_to,
+                ),
+                ordering=MIRRORED_ORDER_ORDERING,
+                formatter=_format_order_record,
+            )
+
         page_number = _positive_int(request.query_params.get("page"), default=1)
         page_size = _positive_int(
             request.query_params.get("page_size"),
@@ -16,7 +16,7 @@ from apps.common.querying import (
     invalid_query_param,
     parse_datetime_param,
 )
-from apps.market.models import OandaAccounts
+from apps.market.models import OandaAccounts, OandaTradeRecord
 from apps.market.serializers import PositionSerializer
 from apps.market.services.compliance import ComplianceViolationError
 from apps.market.services.oanda import (
@@ -25,7 +25,9 @@ from apps.market.services.oanda import (
     OandaService,
     OpenTrade,
 )
+from apps.market.services.transaction_mirror import mirror_ready, mirrored_closed_trades
 from apps.market.views.account_helpers import get_user_accounts
+from apps.market.views.mirrored_lists import decimal_text, paginate_mirrored_history
 from apps.market.views.order_errors import order_error_response
 from apps.market.views.upstream_lists import fetch_account_lists, upstream_history_count
 from apps.trading.views.pagination import StandardPagination
@@ -50,6 +52,24 @@ MARKET_POSITION_ORDERING = OrderingConfig(
     default="-open_time",
 )
 
+MIRRORED_POSITION_ORDERING = OrderingConfig(
+    fields={
+        "id": "trade_id",
+        "instrument": "instrument",
+        "direction": "initial_units",
+        "units": "initial_units",
+        "entry_price": "entry_price",
+        "unrealized_pnl": "realized_pl",
+        "open_time": "open_time",
+        "close_time": "close_time",
+        "state": "state",
+        "status": "state",
+        "account_name": "account__account_id",
+        "account_db_id": "account_id",
+    },
+    default="-open_time",
+)
+
 
 class MarketPositionListItemSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """Schema serializer for market position list items."""
@@ -60,6 +80,7 @@ class MarketPositionListItemSerializer(serializers.Serializer):  # pylint: disab
     units = serializers.CharField()
     entry_price = serializers.CharField()
     unrealized_pnl = serializers.CharField()
+    realized_pnl = serializers.CharField(allow_null=True, required=False)
     open_time = serializers.DateTimeField(allow_null=True)
     close_time = serializers.DateTimeField(allow_null=True, required=False)
     state = serializers.CharField()
@@ -89,6 +110,7 @@ def _format_trade_position(trade: OpenTrade, account: OandaAccounts) -> dict:
         "units": str(trade.units),
         "entry_price": str(trade.entry_price),
         "unrealized_pnl": str(pnl_value),
+        "realized_pnl": None if trade.realized_pnl is None else str(trade.realized_pnl),
         "open_time": trade.open_time.isoformat() if trade.open_time else None,
         "close_time": trade.close_time.isoformat() if trade.close_time else None,
         "state": trade.state,
@@ -98,6 +120,25 @@ def _format_trade_position(trade: OpenTrade, account: OandaAccounts) -> dict:
     }
 
 
+def _format_trade_record(record: OandaTradeRecord) -> dict:
+    """Format a mirrored closed trade like an upstream closed trade."""
+    return {
+        "id": str(record.trade_id),
+        "instrument": record.instrument,
+        "direction": "short" if record.initial_units < 0 else "long",
+        "units": decimal_text(abs(record.initial_units)),
+        "entry_price": decimal_text(record.entry_price),
+        "unrealized_pnl": "0",
+        "realized_pnl": decimal_text(record.realized_pl),
+        "open_time": record.open_time.isoformat() if record.open_time else None,
+        "close_time": record.close_time.isoformat() if record.close_time else None,
+        "state": record.state,
+        "account_name": record.account.account_id,
+        "account_db_id": record.account_id,
+        "status": "closed",
+    }
+
+
 def _filter_positions_by_overlap(
     positions: list[dict],
     *,
@@ -157,6 +198,15 @@ class PositionView(APIView):
             OpenApiParameter(name="ordering", type=str, required=False),
             OpenApiParameter(name="range_from", type=str, required=False),
             OpenApiParameter(name="range_to", type=str, required=False),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                required=False,
+                description=(
+                    "Keyset cursor for closed positions served from the local transaction "
+                    "mirror. Pass an empty value to start; the response omits count."
+                ),
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -320,6 +370,19 @@ class PositionView(APIView):
         if not accounts:
             return Response({"count": 0, "next": None, "previous": None, "results": []})
 
+        if position_status == "closed" and mirror_ready(accounts):
+            return paginate_mirrored_history(
+                request,
+                mirrored_closed_trades(
+                    accounts,
+                    instrument=instrument,
+                    range_from=range_from,
+                    range_to=range_to,
+                ),
+                ordering=MIRRORED_POSITION_ORDERING,
+                formatter=_format_trade_record,
+            )
+
         page_number = _positive_int(request.query_params.get("page"), default=1)
         page_size = _positive_int(
             request.query_params.get("page_size"),
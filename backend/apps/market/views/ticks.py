@@ -16,7 +16,15 @@ from apps.common.querying import (
     invalid_query_param,
     parse_datetime_param,
 )
+from apps.common.renderers import ColumnarJSONRenderer, TimedJSONRenderer
 from apps.market.models import TickData
+from apps.market.services.tick_downsample import (
+    DOWNSAMPLE_MAX_POINTS,
+    DOWNSAMPLE_METHODS,
+    DOWNSAMPLE_MIN_POINTS,
+    DOWNSAMPLE_PRICE_FIELDS,
+    downsample_ticks,
+)
 
 logger: Logger = getLogger(name=__name__)
 
@@ -33,9 +41,16 @@ class TickDataView(APIView):
     Supports cursor-based pagination using the ``cursor`` parameter.
     Each response includes a ``next_cursor`` value that can be passed
     as ``cursor`` in the next request to fetch the following page.
+    ``format=columnar`` returns ``ticks`` as one array per field.
+
+    Passing ``points`` (with ``from_time`` and ``to_time``) switches to a
+    downsampled chart series of at most that many ticks for the whole window,
+    reduced server-side with min/max buckets or LTTB; it is never paginated.
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [TimedJSONRenderer, ColumnarJSONRenderer]
+    columnar_rows_key = "ticks"
 
     @extend_schema(
         operation_id="market_ticks",
@@ -68,6 +83,29 @@ class TickDataView(APIView):
                 required=False,
                 description="timestamp or -timestamp",
             ),
+            OpenApiParameter(
+                name="points",
+                type=int,
+                required=False,
+                description=(
+                    f"Downsample from_time..to_time to at most this many ticks "
+                    f"({DOWNSAMPLE_MIN_POINTS}-{DOWNSAMPLE_MAX_POINTS})"
+                ),
+            ),
+            OpenApiParameter(
+                name="method",
+                type=str,
+                required=False,
+                enum=list(DOWNSAMPLE_METHODS),
+                description="Downsampling method (default minmax)",
+            ),
+            OpenApiParameter(
+                name="price",
+                type=str,
+                required=False,
+                enum=list(DOWNSAMPLE_PRICE_FIELDS),
+                description="Price series to downsample (default mid)",
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -76,15 +114,20 @@ class TickDataView(APIView):
                     "count": serializers.IntegerField(),
                     "instrument": serializers.CharField(),
                     "next_cursor": serializers.CharField(allow_null=True),
+                    "downsampled": serializers.BooleanField(required=False),
+                    "method": serializers.CharField(required=False),
+                    "price": serializers.CharField(required=False),
+                    "bucket_seconds": serializers.FloatField(required=False),
+                    "source_count": serializers.IntegerField(required=False),
                     "ticks": serializers.ListField(
                         child=inline_serializer(
                             "MarketTickItem",
                             fields={
-                                "instrument": serializers.CharField(),
+                                "instrument": serializers.CharField(required=False),
                                 "timestamp": serializers.CharField(),
-                                "bid": serializers.CharField(),
-                                "ask": serializers.CharField(),
-                                "mid": serializers.CharField(),
+                                "bid": serializers.CharField(required=False),
+                                "ask": serializers.CharField(required=False),
+                                "mid": serializers.CharField(required=False),
                             },
                         )
                     ),
@@ -108,6 +151,9 @@ class TickDataView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if "points" in request.query_params:
+            return self._downsampled(request, instrument)
+
         try:
             limit = int(limit_raw)
             if limit < 1 or limit > 5000:
@@ -185,6 +231,63 @@ class TickDataView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _downsampled(self, request: Request, instrument: str) -> Response:
+        params = request.query_params
+        try:
+            points = int(params.get("points", ""))
+        except ValueError:
+            raise invalid_query_param("points must be a valid integer") from None
+        if not DOWNSAMPLE_MIN_POINTS <= points <= DOWNSAMPLE_MAX_POINTS:
+            raise invalid_query_param(
+                f"points must be between {DOWNSAMPLE_MIN_POINTS} and {DOWNSAMPLE_MAX_POINTS}"
+            )
+        method = params.get("method") or "minmax"
+        if method not in DOWNSAMPLE_METHODS:
+            raise invalid_query_param(f"method must be one of: {', '.join(DOWNSAMPLE_METHODS)}")
+        price = params.get("price") or "mid"
+        if price not in DOWNSAMPLE_PRICE_FIELDS:
+            raise invalid_query_param(f"price must be one of: {', '.join(DOWNSAMPLE_PRICE_FIELDS)}")
+        from_dt = parse_datetime_param(params.get("from_time"), field_name="from_time")
+        to_dt = parse_datetime_param(params.get("to_time"), field_name="to_time")
+        if from_dt is None or to_dt is None:
+            raise invalid_query_param("from_time and to_time are required with points")
+        if from_dt > to_dt:
+            raise invalid_query_param("from_time must be earlier than or equal to to_time")
+
+        try:
+            sampled = downsample_ticks(
+                instrument=instrument,
+                since=from_dt,
+                until=to_dt,
+                points=points,
+                method=method,
+                price=price,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error("Error downsampling ticks: %s", exc, exc_info=True)
+            return Response(
+                {"error": "Failed to fetch ticks"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        results = [
+            {"timestamp": timestamp.isoformat().replace("+00:00", "Z"), price: str(value)}
+            for timestamp, value in sampled.points
+        ]
+        return Response(
+            {
+                "count": len(results),
+                "instrument": instrument,
+                "next_cursor": None,
+                "downsampled": True,
+                "method": method,
+                "price": price,
+                "bucket_seconds": sampled.bucket_seconds,
+                "source_count": sampled.source_count,
+                "ticks": results,
+            }
+        )
+
 
 class TickDataRangeView(APIView):
     """API endpoint returning the available date range of tick data per instrument."""
@@ -9,6 +9,7 @@ from typing import Any
 
 OANDA_TICK_PUBLISH_LATENCY_SECONDS_KEY = "oanda_tick_publish_latency_seconds"
 OANDA_TICK_PUBLISHED_AT_KEY = "oanda_tick_published_at"
+TRADING_TICK_RECEIVED_AT_KEY = "trading_tick_received_at"
 
 
 def _parse_datetime(value: Any) -> datetime:
@@ -64,6 +65,8 @@ class Tick:
         oanda_tick_publish_latency_seconds: Seconds between the tick timestamp and
             the publisher receiving/publishing it from OANDA.
         oanda_tick_published_at: Publisher wall-clock timestamp for the latency sample.
+        trading_tick_received_at: Wall-clock time the live data source read the
+            tick from Redis, before batching.
     Example:
         >>> from datetime import datetime, UTC
         >>> tick = Tick(
@@ -82,6 +85,7 @@ class Tick:
     mid: Decimal
     oanda_tick_publish_latency_seconds: Decimal | None = None
     oanda_tick_published_at: datetime | None = None
+    trading_tick_received_at: datetime | None = None
 
     def __post_init__(self) -> None:
         """Calculate mid if not provided."""
@@ -174,6 +178,9 @@ class Tick:
                 data.get(OANDA_TICK_PUBLISH_LATENCY_SECONDS_KEY)
             ),
             oanda_tick_published_at=_parse_optional_datetime(data.get(OANDA_TICK_PUBLISHED_AT_KEY)),
+            trading_tick_received_at=_parse_optional_datetime(
+                data.get(TRADING_TICK_RECEIVED_AT_KEY)
+            ),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -196,4 +203,6 @@ class Tick:
             )
         if self.oanda_tick_published_at is not None:
             data[OANDA_TICK_PUBLISHED_AT_KEY] = self.oanda_tick_published_at.isoformat()
+        if self.trading_tick_received_at is not None:
+            data[TRADING_TICK_RECEIVED_AT_KEY] = self.trading_tick_received_at.isoformat()
         return data
@@ -9,6 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from logging import Logger, getLogger
 
+from django.db import transaction
 from django.utils import timezone as dj_timezone
 
 from apps.trading.dataclasses import EntryExecutionBinding, EventExecutionResult
@@ -110,6 +111,22 @@ class PositionExecutionCache:
             self.position_cache[str(position.id)] = position
         self.position_map[layer_number] = open_positions[-1]
 
+    def first_open_position(self, layer_number: int, direction: Direction) -> Position | None:
+        """Return the oldest open position in a layer for one direction."""
+        return (
+            Position.objects.filter(
+                task_type=self.order_service.task_type,
+                task_id=self.task_pk,
+                execution_id=self.execution_id,
+                instrument=self.instrument,
+                direction=direction,
+                is_open=True,
+                layer_index=layer_number,
+            )
+            .order_by("entry_time")
+            .first()
+        )
+
     def prune_closed_position(self, layer_number: int, position: Position) -> None:
         """Remove a closed position from every in-memory index."""
         pos_id = str(position.id)
@@ -187,6 +204,8 @@ class EventHandler:
         self._current_sequence_number: int = 0
         self._current_replay_mode = False
         self._affected_refs = self._new_affected_refs()
+        # Cycles with trades written since the last flush_cycle_summaries().
+        self._dirty_cycle_ids: set[str] = set()
 
     @staticmethod
     def _event_type_key(strategy_event: StrategyEvent) -> str:
@@ -271,20 +290,7 @@ class EventHandler:
         if result:
             return result
 
-        fallback = (
-            Position.objects.filter(
-                task_type=self.order_service.task_type,
-                task_id=self._task_pk,
-                execution_id=self._execution_id,
-                instrument=self.instrument,
-                direction=direction,
-                is_open=True,
-                layer_index=layer_number,
-            )
-            .order_by("entry_time")
-            .first()
-        )
-        return fallback
+        return self.positions.first_open_position(layer_number, direction)
 
     def _prune_closed_position(self, layer_number: int, position: Position) -> None:
         self.positions.prune_closed_position(layer_number, position)
@@ -344,8 +350,38 @@ class EventHandler:
             margin_ratio=margin_ratio,
             is_rebuild=is_rebuild,
         )
+        if cycle_id:
+            self._dirty_cycle_ids.add(str(cycle_id))
         return trade
 
+    def flush_cycle_summaries(self) -> None:
+        """Refresh the materialized summaries of cycles traded since the last flush.
+
+        Each touched cycle is folded once per flush rather than once per
+        trade, so a long cycle is not rescanned for every fill. Every refresh
+        runs in its own savepoint; a failed one is logged and rewritten from
+        scratch the next time the cycle trades.
+        """
+        from apps.trading.services.cycle_summaries import record_cycle_trade
+
+        dirty, self._dirty_cycle_ids = self._dirty_cycle_ids, set()
+        for cycle_id in sorted(dirty):
+            try:
+                with transaction.atomic():
+                    record_cycle_trade(
+                        task_type=self.order_service.task_type.value,
+                        task_id=self._task_pk,
+                        execution_id=self._execution_id,
+                        cycle_id=cycle_id,
+                    )
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Failed to refresh cycle summary - task_id=%s, cycle_id=%s",
+                    self._task_pk,
+                    cycle_id,
+                    exc_info=True,
+                )
+
     def _trade_execution_timestamp(
         self,
         *,
@@ -708,6 +744,7 @@ class EventHandler:
             trade.cycle_id = str(trade.id)
             trade.save(update_fields=["cycle_id"])
             cycle_id = str(trade.id)
+            self._dirty_cycle_ids.add(cycle_id)
 
         # Store for _dispatch_open_position to include in the binding.
         self._last_open_cycle_id = cycle_id
@@ -881,19 +918,11 @@ class EventHandler:
         # handle_open_position may have treated this as a new cycle
         # (parent_entry_id is None for R0 rebuilds).  Correct the
         # trade's cycle_id and re-seed the mapping.
-        latest_trade = (
-            Trade.objects.filter(
-                task_type=self.order_service.task_type.value,
-                task_id=self._task_pk,
-                execution_id=self._execution_id,
-                position_id=str(position.id),
-            )
-            .order_by("-created_at")
-            .first()
-        )
+        latest_trade = self._latest_trade_for_position(position)
         if latest_trade:
             needs_save = False
-            if str(latest_trade.cycle_id) != cycle_id:
+            previous_cycle_id = latest_trade.cycle_id
+            if str(previous_cycle_id) != cycle_id:
                 latest_trade.cycle_id = cycle_id
                 needs_save = True
             if not latest_trade.is_rebuild:
@@ -902,6 +931,11 @@ class EventHandler:
                 needs_save = True
             if needs_save:
                 latest_trade.save(update_fields=["cycle_id", "is_rebuild", "execution_method"])
+                # Both the cycle the trade left and the one it joined changed.
+                if previous_cycle_id:
+                    self._dirty_cycle_ids.add(str(previous_cycle_id))
+                if cycle_id:
+                    self._dirty_cycle_ids.add(str(cycle_id))
 
         # Ensure the mapping is correct after handle_open_position
         # (which may have overwritten it with the trade's own id).
@@ -944,6 +978,19 @@ class EventHandler:
 
         return position
 
+    def _latest_trade_for_position(self, position: Position) -> Trade | None:
+        """Return the most recently recorded trade for a position."""
+        return (
+            Trade.objects.filter(
+                task_type=self.order_service.task_type.value,
+                task_id=self._task_pk,
+                execution_id=self._execution_id,
+                position_id=str(position.id),
+            )
+            .order_by("-created_at")
+            .first()
+        )
+
     def _resolve_rebuild_cycle_id(self, event: RebuildPositionEvent) -> str | None:
         """Resolve cycle_id for a rebuild event.
 
@@ -972,22 +1019,25 @@ class EventHandler:
 
         # 3. DB fallback via original position's Trade record
         if event.original_position_id:
-            existing = (
-                Trade.objects.filter(
-                    task_type=self.order_service.task_type.value,
-                    task_id=self._task_pk,
-                    execution_id=self._execution_id,
-                    position_id=event.original_position_id,
-                    cycle_id__isnull=False,
-                )
-                .values_list("cycle_id", flat=True)
-                .first()
-            )
-            if existing is not None:
-                return str(existing)
+            return self._resolve_cycle_id_for_original_position(event.original_position_id)
 
         return None
 
+    def _resolve_cycle_id_for_original_position(self, original_position_id: str) -> str | None:
+        """Look up the cycle of a closed position from its Trade records."""
+        existing = (
+            Trade.objects.filter(
+                task_type=self.order_service.task_type.value,
+                task_id=self._task_pk,
+                execution_id=self._execution_id,
+                position_id=original_position_id,
+                cycle_id__isnull=False,
+            )
+            .values_list("cycle_id", flat=True)
+            .first()
+        )
+        return str(existing) if existing is not None else None
+
     def handle_close_position(self, event: ClosePositionEvent) -> tuple[Decimal, Decimal]:
         """Close one or more positions.
 
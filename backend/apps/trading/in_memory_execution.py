@@ -19,7 +19,10 @@ from apps.trading.events import (
     RebuildPositionEvent,
     VolatilityLockEvent,
 )
-from apps.trading.events.handler import CycleResolutionError, EventHandler
+from apps.trading.events.handler import (
+    EventHandler,
+    PositionExecutionCache,
+)
 from apps.trading.models import Order, Position, Trade
 from apps.trading.models.orders import OrderStatus, OrderType
 from apps.trading.order import OrderService
@@ -152,6 +155,8 @@ class InMemoryPositionRepository:
         self.task_id = task_id
         self.execution_id = execution_id
         self._open_positions: dict[str, Position] = {}
+        # (layer_index, direction) -> open positions in creation order.
+        self._layer_positions: dict[tuple[int | None, str], dict[str, Position]] = defaultdict(dict)
 
     def create_or_update(
         self,
@@ -203,8 +208,47 @@ class InMemoryPositionRepository:
         position.updated_at = now
         _disable_persistence(position)
         self._open_positions[str(position.id)] = position
+        self._layer_positions[(position.layer_index, position.direction)][str(position.id)] = (
+            position
+        )
         return position
 
+    def get_open(self, position_id: str) -> Position | None:
+        """Return an open position by id."""
+        position = self._open_positions.get(str(position_id))
+        return position if position is not None and position.is_open else None
+
+    def open_in_layer(self, *, instrument: str, layer_index: int) -> list[Position]:
+        """Return open positions of one layer, oldest first."""
+        positions = [
+            position
+            for direction in (Direction.LONG.value, Direction.SHORT.value)
+            for position in self._layer_positions.get((layer_index, direction), {}).values()
+            if position.is_open and position.instrument == instrument
+        ]
+        return sorted(
+            positions,
+            key=lambda position: (position.entry_time, getattr(position, "created_at", None)),
+        )
+
+    def first_open_in_layer(
+        self,
+        *,
+        instrument: str,
+        layer_index: int,
+        direction: Direction,
+    ) -> Position | None:
+        """Return the oldest open position of one layer and direction."""
+        direction_value = direction.value if isinstance(direction, Direction) else str(direction)
+        candidates = [
+            position
+            for position in self._layer_positions.get((layer_index, direction_value), {}).values()
+            if position.is_open and position.instrument == instrument
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda position: position.entry_time)
+
     def latest_open_position(self, *, instrument: str, direction: Direction) -> Position | None:
         direction_value = direction.value if isinstance(direction, Direction) else str(direction)
         matches = [
@@ -231,6 +275,16 @@ class InMemoryPositionRepository:
             for position_id, position in self._open_positions.items()
             if position.is_open
         }
+        for key, positions in list(self._layer_positions.items()):
+            live = {
+                position_id: position
+                for position_id, position in positions.items()
+                if position_id in self._open_positions
+            }
+            if live:
+                self._layer_positions[key] = live
+            else:
+                self._layer_positions.pop(key, None)
 
     def _merge_position(
         self,
@@ -250,8 +304,12 @@ class InMemoryPositionRepository:
         ) / total_units
         position.units = total_units
         position.entry_price = new_avg_price
-        if layer_index is not None:
+        if layer_index is not None and layer_index != position.layer_index:
+            self._layer_positions[(position.layer_index, position.direction)].pop(
+                str(position.id), None
+            )
             position.layer_index = layer_index
+            self._layer_positions[(layer_index, position.direction)][str(position.id)] = position
         if oanda_trade_id is not None:
             position.oanda_trade_id = oanda_trade_id
         if retracement_count is not None:
@@ -290,15 +348,159 @@ class InMemoryOrderService(OrderService):
         return result
 
 
+class InMemoryPositionExecutionCache(PositionExecutionCache):
+    """Position lookups served from the in-memory position repository."""
+
+    def _repository(self) -> InMemoryPositionRepository | None:
+        repository = getattr(self.order_service, "position_repository", None)
+        return repository if isinstance(repository, InMemoryPositionRepository) else None
+
+    def get_open_position_by_id(self, position_id: str) -> Position | None:
+        """Return a cached or repository-held open position by id."""
+        cached = self.position_cache.get(position_id)
+        if cached and cached.is_open:
+            return cached
+        repository = self._repository()
+        position = repository.get_open(position_id) if repository is not None else None
+        if position:
+            self.position_cache[position_id] = position
+        return position
+
+    def rehydrate_layer_positions(self, layer_number: int) -> None:
+        """Load layer positions from the repository when the stack is empty."""
+        if self.layer_position_ids.get(layer_number):
+            return
+        repository = self._repository()
+        if repository is None:
+            return
+        open_positions = repository.open_in_layer(
+            instrument=self.instrument,
+            layer_index=layer_number,
+        )
+        if not open_positions:
+            return
+        self.layer_position_ids[layer_number] = [str(p.id) for p in open_positions]
+        for position in open_positions:
+            self.position_cache[str(position.id)] = position
+        self.position_map[layer_number] = open_positions[-1]
+
+    def first_open_position(self, layer_number: int, direction: Direction) -> Position | None:
+        """Return the oldest open position in a layer for one direction."""
+        repository = self._repository()
+        if repository is None:
+            return None
+        return repository.first_open_in_layer(
+            instrument=self.instrument,
+            layer_index=layer_number,
+            direction=direction,
+        )
+
+
+class InMemoryCycleRegistry:
+    """Index cycle membership by entry id, position id and cycle id.
+
+    ``entry_cycle_ids`` is shared with the owning handler's
+    ``_entry_id_to_cycle_id`` so the base EventHandler lookups and this
+    registry always see the same mapping.
+    """
+
+    def __init__(self, entry_cycle_ids: dict[int, str]) -> None:
+        self.entry_cycle_ids = entry_cycle_ids
+        self.position_cycle_ids: dict[str, str] = {}
+        self.cycle_position_ids: dict[str, set[str]] = defaultdict(set)
+        self.cycle_entry_ids: dict[str, set[int]] = defaultdict(set)
+        self.pending_rebuild_cycle_ids: dict[str, str] = {}
+
+    def cycle_for_position(self, position_id: str) -> str | None:
+        """Return the cycle a position (open or awaiting rebuild) belongs to."""
+        return self.pending_rebuild_cycle_ids.get(position_id) or self.position_cycle_ids.get(
+            position_id
+        )
+
+    def cycle_for_entries(self, *entry_ids: int | None) -> str | None:
+        """Return the cycle of the first known entry id."""
+        for entry_id in entry_ids:
+            if entry_id is not None and entry_id in self.entry_cycle_ids:
+                return self.entry_cycle_ids[entry_id]
+        return None
+
+    def bind(self, *, position_id: str, cycle_id: str, entry_ids: tuple[int | None, ...]) -> None:
+        """Attach a position and its strategy entry ids to a cycle."""
+        previous_cycle_id = self.position_cycle_ids.get(position_id)
+        if previous_cycle_id is not None and previous_cycle_id != cycle_id:
+            self.cycle_position_ids[previous_cycle_id].discard(position_id)
+            if not self.cycle_position_ids[previous_cycle_id]:
+                self._drop_cycle(previous_cycle_id)
+
+        self.position_cycle_ids[position_id] = cycle_id
+        self.cycle_position_ids[cycle_id].add(position_id)
+        for entry_id in entry_ids:
+            if entry_id is None:
+                continue
+            self.entry_cycle_ids[entry_id] = cycle_id
+            self.cycle_entry_ids[cycle_id].add(int(entry_id))
+
+    def track_pending_rebuild(self, *, position_id: str, cycle_id: str) -> None:
+        """Keep a stopped-out position's cycle alive until it is rebuilt."""
+        self.pending_rebuild_cycle_ids[position_id] = cycle_id
+
+    def resolve_pending_rebuild(self, position_id: str) -> None:
+        """Forget a pending rebuild once it has been executed."""
+        self.pending_rebuild_cycle_ids.pop(position_id, None)
+
+    def prune(self, open_position_ids: set[str]) -> None:
+        """Drop cycles with no open positions and no pending rebuilds."""
+        for position_id in list(self.position_cycle_ids):
+            if position_id in self.pending_rebuild_cycle_ids:
+                continue
+            if position_id not in open_position_ids:
+                self.position_cycle_ids.pop(position_id, None)
+
+        pending_cycle_ids = set(self.pending_rebuild_cycle_ids.values())
+        for cycle_id, position_ids in list(self.cycle_position_ids.items()):
+            live_position_ids = position_ids & open_position_ids
+            if live_position_ids:
+                self.cycle_position_ids[cycle_id] = live_position_ids
+                continue
+            if cycle_id in pending_cycle_ids:
+                continue
+            self._drop_cycle(cycle_id)
+
+    def clear(self) -> None:
+        """Drop every index."""
+        self.position_cycle_ids.clear()
+        self.cycle_position_ids.clear()
+        self.cycle_entry_ids.clear()
+        self.pending_rebuild_cycle_ids.clear()
+
+    def _drop_cycle(self, cycle_id: str) -> None:
+        self.cycle_position_ids.pop(cycle_id, None)
+        for entry_id in self.cycle_entry_ids.pop(cycle_id, set()):
+            if self.entry_cycle_ids.get(entry_id) == cycle_id:
+                self.entry_cycle_ids.pop(entry_id, None)
+
+
 class InMemoryEventHandler(EventHandler):
-    """Event handler that emits transient trades and prunes completed cycles."""
+    """Event handler that emits transient trades and prunes completed cycles.
+
+    Every position and cycle lookup is answered from in-memory indexes, so
+    event handling for an in-memory backtest never touches the database.
+    """
 
     def __init__(self, order_service: OrderService, instrument: str):
         super().__init__(order_service, instrument)
-        self._position_id_to_cycle_id: dict[str, str] = {}
-        self._cycle_id_to_position_ids: dict[str, set[str]] = defaultdict(set)
-        self._cycle_id_to_entry_ids: dict[str, set[int]] = defaultdict(set)
-        self._pending_rebuild_position_ids: dict[str, str] = {}
+        self.positions = InMemoryPositionExecutionCache(
+            order_service=order_service,
+            instrument=instrument,
+        )
+        self.position_map = self.positions.position_map
+        self.layer_position_ids = self.positions.layer_position_ids
+        self._position_cache = self.positions.position_cache
+        self.cycles = InMemoryCycleRegistry(self._entry_id_to_cycle_id)
+        self._position_id_to_cycle_id = self.cycles.position_cycle_ids
+        self._cycle_id_to_position_ids = self.cycles.cycle_position_ids
+        self._cycle_id_to_entry_ids = self.cycles.cycle_entry_ids
+        self._pending_rebuild_position_ids = self.cycles.pending_rebuild_cycle_ids
         self._last_recorded_trade: Trade | None = None
 
     def _resolve_cycle_id_from_db(
@@ -312,10 +514,19 @@ class InMemoryEventHandler(EventHandler):
         return None
 
     def _resolve_cycle_id_for_position(self, position: Position) -> str | None:
-        return self._position_id_to_cycle_id.get(str(position.id)) or getattr(
+        return self.cycles.position_cycle_ids.get(str(position.id)) or getattr(
             position, "_cycle_id", None
         )
 
+    def _resolve_cycle_id_for_original_position(self, original_position_id: str) -> str | None:
+        return self.cycles.cycle_for_position(str(original_position_id))
+
+    def _latest_trade_for_position(self, position: Position) -> Trade | None:
+        trade = self._last_recorded_trade
+        if trade is None or trade.position is not position:
+            return None
+        return trade
+
     def _ordered_positions_for_margin_close(self) -> list[Position]:
         return sorted(
             self.order_service.get_open_positions(instrument=self.instrument),
@@ -366,31 +577,14 @@ class InMemoryEventHandler(EventHandler):
         return position
 
     def handle_rebuild_position(self, event: RebuildPositionEvent) -> Position:
-        cycle_id = self._resolve_rebuild_cycle_id(event)
-        if cycle_id is None:
-            raise CycleResolutionError(
-                f"Cannot resolve cycle_id for rebuild: "
-                f"entry_id={event.entry_id}, root_entry_id={event.root_entry_id}, "
-                f"original_position_id={event.original_position_id}. "
-                f"This indicates corrupt strategy state — stopping task."
-            )
-
-        if event.root_entry_id is not None:
-            self._entry_id_to_cycle_id[event.root_entry_id] = cycle_id
-        if event.entry_id is not None:
-            self._entry_id_to_cycle_id[event.entry_id] = cycle_id
-
         position = super().handle_rebuild_position(event)
-        latest_trade = self._last_recorded_trade
-        if latest_trade is not None:
-            latest_trade.cycle_id = cycle_id
-            latest_trade.is_rebuild = True
-            latest_trade.execution_method = str(event.event_type.value)
-
-        self._last_open_cycle_id = cycle_id
-        self._bind_position_to_cycle(position=position, cycle_id=cycle_id, event=event)
+        self._bind_position_to_cycle(
+            position=position,
+            cycle_id=self._last_open_cycle_id,
+            event=event,
+        )
         if event.original_position_id:
-            self._pending_rebuild_position_ids.pop(str(event.original_position_id), None)
+            self.cycles.resolve_pending_rebuild(str(event.original_position_id))
         return position
 
     def handle_close_position(self, event: ClosePositionEvent) -> tuple[Decimal, Decimal]:
@@ -416,23 +610,9 @@ class InMemoryEventHandler(EventHandler):
 
     def clear_positions(self) -> None:
         super().clear_positions()
-        self._position_id_to_cycle_id.clear()
-        self._cycle_id_to_position_ids.clear()
-        self._cycle_id_to_entry_ids.clear()
-        self._pending_rebuild_position_ids.clear()
+        self.cycles.clear()
         self._last_recorded_trade = None
 
-    def _resolve_rebuild_cycle_id(self, event: RebuildPositionEvent) -> str | None:
-        cycle_id = super()._resolve_rebuild_cycle_id(event)
-        if cycle_id is not None:
-            return cycle_id
-        if event.original_position_id:
-            position_id = str(event.original_position_id)
-            return self._pending_rebuild_position_ids.get(
-                position_id
-            ) or self._position_id_to_cycle_id.get(position_id)
-        return None
-
     def _bind_position_to_cycle(
         self,
         *,
@@ -440,69 +620,40 @@ class InMemoryEventHandler(EventHandler):
         cycle_id: str,
         event: OpenPositionEvent | RebuildPositionEvent,
     ) -> None:
-        position_id = str(position.id)
-        previous_cycle_id = self._position_id_to_cycle_id.get(position_id)
-        if previous_cycle_id is not None and previous_cycle_id != cycle_id:
-            self._cycle_id_to_position_ids[previous_cycle_id].discard(position_id)
-            if not self._cycle_id_to_position_ids[previous_cycle_id]:
-                self._cycle_id_to_position_ids.pop(previous_cycle_id, None)
-                for entry_id in self._cycle_id_to_entry_ids.pop(previous_cycle_id, set()):
-                    if self._entry_id_to_cycle_id.get(entry_id) == previous_cycle_id:
-                        self._entry_id_to_cycle_id.pop(entry_id, None)
-
         setattr(position, "_cycle_id", cycle_id)
-        self._position_id_to_cycle_id[position_id] = cycle_id
-        self._cycle_id_to_position_ids[cycle_id].add(position_id)
-        for entry_id in (
-            getattr(event, "entry_id", None),
-            getattr(event, "root_entry_id", None),
-            getattr(event, "parent_entry_id", None),
-        ):
-            if entry_id is None:
-                continue
-            self._entry_id_to_cycle_id[entry_id] = cycle_id
-            self._cycle_id_to_entry_ids[cycle_id].add(int(entry_id))
+        self.cycles.bind(
+            position_id=str(position.id),
+            cycle_id=cycle_id,
+            entry_ids=(
+                getattr(event, "entry_id", None),
+                getattr(event, "root_entry_id", None),
+                getattr(event, "parent_entry_id", None),
+            ),
+        )
 
     def _track_pending_rebuild_cycle(self, event: ClosePositionEvent) -> None:
         cycle_id = self._resolve_cycle_id_for_closed_event(event)
         position_id = getattr(event, "position_id", None)
         if cycle_id is not None and position_id:
-            self._pending_rebuild_position_ids[str(position_id)] = cycle_id
+            self.cycles.track_pending_rebuild(position_id=str(position_id), cycle_id=cycle_id)
 
     def _resolve_cycle_id_for_closed_event(self, event: ClosePositionEvent) -> str | None:
-        for entry_id in (
+        cycle_id = self.cycles.cycle_for_entries(
             getattr(event, "entry_id", None),
             getattr(event, "root_entry_id", None),
             getattr(event, "parent_entry_id", None),
-        ):
-            if entry_id is not None and entry_id in self._entry_id_to_cycle_id:
-                return self._entry_id_to_cycle_id[entry_id]
+        )
+        if cycle_id is not None:
+            return cycle_id
         position_id = getattr(event, "position_id", None)
         if position_id:
-            return self._position_id_to_cycle_id.get(str(position_id))
+            return self.cycles.position_cycle_ids.get(str(position_id))
         return None
 
     def _prune_completed_cycles(self) -> None:
-        open_position_ids = {
-            str(position.id)
-            for position in self.order_service.get_open_positions(instrument=self.instrument)
-        }
-        for position_id in list(self._position_id_to_cycle_id):
-            cycle_id = self._position_id_to_cycle_id[position_id]
-            if position_id in self._pending_rebuild_position_ids:
-                continue
-            if position_id not in open_position_ids:
-                self._position_id_to_cycle_id.pop(position_id, None)
-
-        pending_cycle_ids = set(self._pending_rebuild_position_ids.values())
-        for cycle_id, position_ids in list(self._cycle_id_to_position_ids.items()):
-            live_position_ids = position_ids & open_position_ids
-            if live_position_ids:
-                self._cycle_id_to_position_ids[cycle_id] = live_position_ids
-                continue
-            if cycle_id in pending_cycle_ids:
-                continue
-            self._cycle_id_to_position_ids.pop(cycle_id, None)
-            for entry_id in self._cycle_id_to_entry_ids.pop(cycle_id, set()):
-                if self._entry_id_to_cycle_id.get(entry_id) == cycle_id:
-                    self._entry_id_to_cycle_id.pop(entry_id, None)
+        self.cycles.prune(
+            {
+                str(position.id)
+                for position in self.order_service.get_open_positions(instrument=self.instrument)
+            }
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trading", "0072_backtesttask_backtest_tick_batch_size"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="backtesttask",
+            name="debug_options",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text='Debug settings. Supported: {"tracemalloc": true, "profile": true}',
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tradingtask",
+            name="debug_options",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text='Debug settings. Supported: {"tracemalloc": true, "profile": true}',
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.13
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0073_alter_backtesttask_debug_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TradeCycleSummary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('task_type', models.CharField(max_length=32)),
+                ('task_id', models.UUIDField()),
+                ('execution_id', models.UUIDField(blank=True, help_text='Execution run UUID (shared with Celery task_id)', null=True)),
+                ('cycle_id', models.UUIDField(help_text="Cycle identifier shared by the cycle's trades")),
+                ('status', models.CharField(help_text='Status derived from the cycle trades (active, pending or completed)', max_length=16)),
+                ('direction', models.CharField(blank=True, default='', max_length=10)),
+                ('started_at', models.DateTimeField(blank=True, help_text='Timestamp of the first trade in the cycle', null=True)),
+                ('last_trade_at', models.DateTimeField(blank=True, help_text='Timestamp of the latest trade in the cycle', null=True)),
+                ('last_price', models.DecimalField(blank=True, decimal_places=10, help_text='Execution price of the latest trade in the cycle', max_digits=20, null=True)),
+                ('trade_count', models.PositiveIntegerField(default=0)),
+                ('open_count', models.PositiveIntegerField(default=0)),
+                ('close_count', models.PositiveIntegerField(default=0)),
+                ('open_units_total', models.PositiveIntegerField(default=0)),
+                ('rebuild_count', models.PositiveIntegerField(default=0)),
+                ('protection_count', models.PositiveIntegerField(default=0)),
+                ('initial_position_seed_count', models.PositiveIntegerField(default=0)),
+                ('realized_pnl', models.DecimalField(decimal_places=10, default=0, help_text="Realized PnL in quote currency summed over the cycle's closes", max_digits=30)),
+                ('position_ids', models.JSONField(blank=True, default=list, help_text='Sorted ids of every position traded in the cycle')),
+                ('open_position_ids', models.JSONField(blank=True, default=list, help_text='Ids of positions opened in the cycle and not yet closed')),
+                ('initial_is_closed', models.BooleanField(default=False)),
+                ('has_unresolved_rebuilds', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Trade Cycle Summary',
+                'verbose_name_plural': 'Trade Cycle Summaries',
+                'db_table': 'trade_cycle_summaries',
+                'ordering': ['started_at', 'cycle_id'],
+                'indexes': [models.Index(fields=['task_type', 'task_id', 'execution_id', 'started_at', 'cycle_id'], name='trade_cycle_sum_started_idx'), models.Index(fields=['task_type', 'task_id', 'execution_id', 'status', 'started_at'], name='trade_cycle_sum_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('task_type', 'task_id', 'execution_id', 'cycle_id'), name='uniq_trade_cycle_summary', nulls_distinct=False)],
+            },
+        ),
+    ]
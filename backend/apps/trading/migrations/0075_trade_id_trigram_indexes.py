@@ -0,0 +1,49 @@
+# Generated by Django 5.2.13
+
+from django.db import migrations
+
+# Expression indexes backing the cycle list's position/trade id substring
+# filters.  They index the ``::text`` casts the query helpers compare with
+# ``LIKE '%needle%'``, which pg_trgm GIN indexes can answer without a scan.
+TRIGRAM_INDEXES = (
+    (
+        "trades_position_id_trgm_idx",
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS "trades_position_id_trgm_idx" '
+        'ON "trades" USING gin ((("position_id")::text) gin_trgm_ops)',
+    ),
+    (
+        "trades_id_trgm_idx",
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS "trades_id_trgm_idx" '
+        'ON "trades" USING gin ((("id")::text) gin_trgm_ops)',
+    ),
+)
+
+
+def _create_trigram_indexes(apps, schema_editor):
+    _ = apps
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for _index_name, create_sql in TRIGRAM_INDEXES:
+        schema_editor.execute(create_sql)
+
+
+def _drop_trigram_indexes(apps, schema_editor):
+    _ = apps
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _create_sql in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('trading', '0074_trade_cycle_summary'),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_trigram_indexes, _drop_trigram_indexes),
+    ]
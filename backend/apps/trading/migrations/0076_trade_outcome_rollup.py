@@ -0,0 +1,38 @@
+# Generated by Django 5.2.13
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0075_trade_id_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TradeOutcomeRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('task_type', models.CharField(max_length=32)),
+                ('task_id', models.UUIDField()),
+                ('execution_id', models.UUIDField(blank=True, help_text='Execution run UUID (shared with Celery task_id)', null=True)),
+                ('hour', models.DateTimeField(help_text='Start of the UTC hour covered by this rollup')),
+                ('open_positions', models.PositiveIntegerField(default=0)),
+                ('rebuild_opens', models.PositiveIntegerField(default=0)),
+                ('tp_closes', models.PositiveIntegerField(default=0)),
+                ('sl_closes', models.PositiveIntegerField(default=0)),
+                ('tp_profit', models.DecimalField(decimal_places=10, default=0, help_text='Realized quote-currency PnL of take-profit closes in the hour', max_digits=30)),
+                ('sl_loss', models.DecimalField(decimal_places=10, default=0, help_text='Realized quote-currency PnL of stop-loss closes in the hour', max_digits=30)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'trade_outcome_rollups',
+                'ordering': ['hour'],
+                'indexes': [models.Index(fields=['task_type', 'task_id', 'execution_id', 'hour'], name='trade_outcome_roll_hour_idx')],
+                'constraints': [models.UniqueConstraint(fields=('task_type', 'task_id', 'execution_id', 'hour'), name='uniq_trade_outcome_rollup_hour', nulls_distinct=False)],
+            },
+        ),
+    ]
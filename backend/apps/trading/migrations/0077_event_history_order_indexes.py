@@ -0,0 +1,21 @@
+# Generated by Django 5.2.13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0076_trade_outcome_rollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='strategyeventrecord',
+            index=models.Index(fields=['task_type', 'task_id', 'execution_id', 'event_timestamp', 'sequence_number'], name='strategy_ev_task_ty_3324b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradingevent',
+            index=models.Index(fields=['task_type', 'task_id', 'execution_id', 'event_timestamp', 'sequence_number'], name='trading_eve_task_ty_654710_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.13
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0077_event_history_order_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NetChartBucket',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('task_type', models.CharField(max_length=32)),
+                ('task_id', models.UUIDField()),
+                ('execution_id', models.UUIDField(blank=True, help_text='Execution run UUID (shared with Celery task_id)', null=True)),
+                ('granularity', models.CharField(help_text='Chart granularity token such as M1, M5, M30, H4, or D.', max_length=8)),
+                ('bucket', models.DateTimeField(help_text='Start timestamp of the chart bucket')),
+                ('source_timestamp', models.DateTimeField(help_text='Timestamp of the minute metrics row represented by this bucket')),
+                ('net_units', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('average_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('current_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('target_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('next_add_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('theoretical_next_add_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('pips_from_average', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('loss_cut_threshold_pips', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('margin_ratio_pct', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('margin_ratio', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('add_count', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('mid_price', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('realized_pnl', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('realized_pnl_quote', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('unrealized_pnl', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('unrealized_pnl_quote', models.DecimalField(blank=True, decimal_places=10, max_digits=30, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'net_chart_buckets',
+                'ordering': ['bucket'],
+                'constraints': [models.UniqueConstraint(fields=('task_type', 'task_id', 'execution_id', 'granularity', 'bucket'), name='uniq_net_chart_bucket', nulls_distinct=False)],
+            },
+        ),
+    ]
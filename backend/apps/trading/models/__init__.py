@@ -24,12 +24,18 @@ from apps.trading.models.configs import (
 from apps.trading.models.equities import Equity
 from apps.trading.models.events import StrategyEventRecord, TradingEvent
 from apps.trading.models.logs import RecoveryAttempt, TaskLog
-from apps.trading.models.metrics import ExecutionMetricAggregate, Metrics, MetricsRollup
+from apps.trading.models.metrics import (
+    ExecutionMetricAggregate,
+    Metrics,
+    MetricsRollup,
+    NetChartBucket,
+    TradeOutcomeRollup,
+)
 from apps.trading.models.orders import Order
 from apps.trading.models.positions import Position
 from apps.trading.models.snapshots import TaskExecutionSnapshot
 from apps.trading.models.state import ExecutionState
-from apps.trading.models.trades import Trade
+from apps.trading.models.trades import Trade, TradeCycleSummary
 from apps.trading.models.trading import (
     TradingTask,
     TradingTaskManager,
@@ -58,9 +64,12 @@ __all__ = [
     "Order",
     "Position",
     "Trade",
+    "TradeCycleSummary",
     "Equity",
     "Metrics",
     "ExecutionMetricAggregate",
     "MetricsRollup",
+    "NetChartBucket",
+    "TradeOutcomeRollup",
     "TaskExecutionSnapshot",
 ]
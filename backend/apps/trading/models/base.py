@@ -107,7 +107,7 @@ class ExecutableTaskModel(UUIDModel):
     debug_options = models.JSONField(
         default=dict,
         blank=True,
-        help_text='Debug settings. Supported: {"tracemalloc": true}',
+        help_text='Debug settings. Supported: {"tracemalloc": true, "profile": true}',
     )
     sell_on_stop = models.BooleanField(
         default=False,
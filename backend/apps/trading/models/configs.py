@@ -223,9 +223,16 @@ class StrategyConfiguration(UUIDModel):
     def validate_parameters(self) -> tuple[bool, str | None]:
         """Validate parameters through strategy registry plugins.
 
+        The result is cached per saved revision (id and updated_at).
+
         Returns:
             Tuple of (is_valid, error_message)
         """
+        from apps.trading.strategies.config_cache import STRATEGY_CONFIG_VALIDATIONS
+
+        return STRATEGY_CONFIG_VALIDATIONS.get_or_create(self, self._validate_parameters)
+
+    def _validate_parameters(self) -> tuple[bool, str | None]:
         from apps.trading.strategies.registry import registry
 
         if not registry.is_registered(self.strategy_type):
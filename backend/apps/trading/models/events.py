@@ -165,6 +165,15 @@ class TradingEvent(models.Model):
                     "event_timestamp",
                 ]
             ),
+            models.Index(
+                fields=[
+                    "task_type",
+                    "task_id",
+                    "execution_id",
+                    "event_timestamp",
+                    "sequence_number",
+                ]
+            ),
         ]
 
     def __str__(self) -> str:
@@ -325,6 +334,15 @@ class StrategyEventRecord(models.Model):
                     "event_timestamp",
                 ]
             ),
+            models.Index(
+                fields=[
+                    "task_type",
+                    "task_id",
+                    "execution_id",
+                    "event_timestamp",
+                    "sequence_number",
+                ]
+            ),
             models.Index(
                 fields=[
                     "task_type",
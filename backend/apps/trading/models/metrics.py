@@ -175,3 +175,129 @@ class MetricsRollup(models.Model):
             f"{self.task_type}:{self.task_id}:exec={self.execution_id}, "
             f"{self.granularity}@{self.bucket})"
         )
+
+
+class TradeOutcomeRollup(models.Model):
+    """Position activity and TP/SL outcomes of one execution in one UTC hour.
+
+    Local-timezone day/week/month/year periods are assembled from these rows
+    by the periodic metrics endpoint instead of rescanning trading events.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    task_type = models.CharField(max_length=32)
+    task_id = models.UUIDField()
+    execution_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Execution run UUID (shared with Celery task_id)",
+    )
+    hour = models.DateTimeField(help_text="Start of the UTC hour covered by this rollup")
+    open_positions = models.PositiveIntegerField(default=0)
+    rebuild_opens = models.PositiveIntegerField(default=0)
+    tp_closes = models.PositiveIntegerField(default=0)
+    sl_closes = models.PositiveIntegerField(default=0)
+    tp_profit = models.DecimalField(
+        max_digits=30,
+        decimal_places=10,
+        default=0,
+        help_text="Realized quote-currency PnL of take-profit closes in the hour",
+    )
+    sl_loss = models.DecimalField(
+        max_digits=30,
+        decimal_places=10,
+        default=0,
+        help_text="Realized quote-currency PnL of stop-loss closes in the hour",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "trade_outcome_rollups"
+        ordering = ["hour"]
+        indexes = [
+            models.Index(
+                fields=["task_type", "task_id", "execution_id", "hour"],
+                name="trade_outcome_roll_hour_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task_type", "task_id", "execution_id", "hour"],
+                name="uniq_trade_outcome_rollup_hour",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self) -> str:
+        return (
+            "TradeOutcomeRollup("
+            f"{self.task_type}:{self.task_id}:exec={self.execution_id}, {self.hour})"
+        )
+
+
+def _net_chart_value() -> models.DecimalField:
+    return models.DecimalField(max_digits=30, decimal_places=10, null=True, blank=True)
+
+
+class NetChartBucket(models.Model):
+    """Typed SnowballNet chart inputs for one execution bucket.
+
+    Written by ``MetricsAggregator`` in the same flush as the minute metrics,
+    one row per chart granularity holding the latest minute snapshot of the
+    bucket, so the net chart reads a range of narrow rows instead of
+    unpacking every metrics JSON document in the window.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    task_type = models.CharField(max_length=32)
+    task_id = models.UUIDField()
+    execution_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Execution run UUID (shared with Celery task_id)",
+    )
+    granularity = models.CharField(
+        max_length=8,
+        help_text="Chart granularity token such as M1, M5, M30, H4, or D.",
+    )
+    bucket = models.DateTimeField(help_text="Start timestamp of the chart bucket")
+    source_timestamp = models.DateTimeField(
+        help_text="Timestamp of the minute metrics row represented by this bucket"
+    )
+    net_units = _net_chart_value()
+    average_price = _net_chart_value()
+    current_price = _net_chart_value()
+    target_price = _net_chart_value()
+    next_add_price = _net_chart_value()
+    theoretical_next_add_price = _net_chart_value()
+    pips_from_average = _net_chart_value()
+    loss_cut_threshold_pips = _net_chart_value()
+    margin_ratio_pct = _net_chart_value()
+    margin_ratio = _net_chart_value()
+    add_count = _net_chart_value()
+    mid_price = _net_chart_value()
+    realized_pnl = _net_chart_value()
+    realized_pnl_quote = _net_chart_value()
+    unrealized_pnl = _net_chart_value()
+    unrealized_pnl_quote = _net_chart_value()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "net_chart_buckets"
+        ordering = ["bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task_type", "task_id", "execution_id", "granularity", "bucket"],
+                name="uniq_net_chart_bucket",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self) -> str:
+        return (
+            "NetChartBucket("
+            f"{self.task_type}:{self.task_id}:exec={self.execution_id}, "
+            f"{self.granularity}@{self.bucket})"
+        )
@@ -174,3 +174,98 @@ class Trade(models.Model):
     def __str__(self) -> str:
         direction_str = self.direction or "CLOSE"
         return f"{direction_str} {self.units} {self.instrument} @ {self.price}"
+
+
+class TradeCycleSummary(models.Model):
+    """Materialized per-cycle aggregate of the trades sharing a ``cycle_id``.
+
+    Refreshed whenever a cycle trade is recorded so the cycles list can sort,
+    filter and paginate with indexed queries instead of folding every trade
+    of the execution on each request. ``status`` is the trade-derived status;
+    an authoritative status from the strategy state still takes precedence.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    task_type = models.CharField(max_length=32)
+    task_id = models.UUIDField()
+    execution_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Execution run UUID (shared with Celery task_id)",
+    )
+    cycle_id = models.UUIDField(help_text="Cycle identifier shared by the cycle's trades")
+    status = models.CharField(
+        max_length=16,
+        help_text="Status derived from the cycle trades (active, pending or completed)",
+    )
+    direction = models.CharField(max_length=10, blank=True, default="")
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp of the first trade in the cycle",
+    )
+    last_trade_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp of the latest trade in the cycle",
+    )
+    last_price = models.DecimalField(
+        max_digits=20,
+        decimal_places=10,
+        null=True,
+        blank=True,
+        help_text="Execution price of the latest trade in the cycle",
+    )
+    trade_count = models.PositiveIntegerField(default=0)
+    open_count = models.PositiveIntegerField(default=0)
+    close_count = models.PositiveIntegerField(default=0)
+    open_units_total = models.PositiveIntegerField(default=0)
+    rebuild_count = models.PositiveIntegerField(default=0)
+    protection_count = models.PositiveIntegerField(default=0)
+    initial_position_seed_count = models.PositiveIntegerField(default=0)
+    realized_pnl = models.DecimalField(
+        max_digits=30,
+        decimal_places=10,
+        default=0,
+        help_text="Realized PnL in quote currency summed over the cycle's closes",
+    )
+    position_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Sorted ids of every position traded in the cycle",
+    )
+    open_position_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Ids of positions opened in the cycle and not yet closed",
+    )
+    initial_is_closed = models.BooleanField(default=False)
+    has_unresolved_rebuilds = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "trade_cycle_summaries"
+        verbose_name = "Trade Cycle Summary"
+        verbose_name_plural = "Trade Cycle Summaries"
+        ordering = ["started_at", "cycle_id"]
+        indexes = [
+            models.Index(
+                fields=["task_type", "task_id", "execution_id", "started_at", "cycle_id"],
+                name="trade_cycle_sum_started_idx",
+            ),
+            models.Index(
+                fields=["task_type", "task_id", "execution_id", "status", "started_at"],
+                name="trade_cycle_sum_status_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task_type", "task_id", "execution_id", "cycle_id"],
+                name="uniq_trade_cycle_summary",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"TradeCycleSummary({self.task_type}:{self.task_id}:{self.cycle_id}, {self.status})"
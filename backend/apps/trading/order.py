@@ -29,6 +29,11 @@ from apps.trading.models import Order, Position
 from apps.trading.models.orders import OrderType
 from apps.trading.order_client_ids import TradingOrderClientIdFactory
 from apps.trading.order_repositories import OrderRepository, PositionRepository
+from apps.trading.services.latency_histogram import (
+    LATENCY_STAGE_FILL,
+    LATENCY_STAGE_SUBMIT,
+    LiveLatencyRecorder,
+)
 from apps.trading.utils import Instrument, Units
 
 if TYPE_CHECKING:
@@ -49,6 +54,9 @@ class OrderService:
     Supports both live trading and dry-run (backtest) modes.
     """
 
+    # Set by live executors to record tick-to-submit and tick-to-fill latency.
+    latency_recorder: LiveLatencyRecorder | None = None
+
     def __init__(
         self,
         account: OandaAccounts | None,
@@ -124,6 +132,12 @@ class OrderService:
             account_currency = getattr(self.task, "account_currency", "")
         return AccountCurrency(str(account_currency or ""))
 
+    def _observe_latency(self, stage: str, tick_timestamp: datetime | None) -> None:
+        recorder = self.latency_recorder
+        if recorder is None or tick_timestamp is None or self.dry_run:
+            return
+        recorder.observe(stage, tick_timestamp)
+
     def open_position(
         self,
         instrument: str,
@@ -261,6 +275,7 @@ class OrderService:
                     state="OPEN",
                     account_id=str(self.account.account_id) if self.account else "",
                 )
+                self._observe_latency(LATENCY_STAGE_SUBMIT, tick_timestamp)
                 oanda_order = self.oanda_service.close_trade(
                     trade=trade,
                     units=close_units_decimal if units is not None else None,
@@ -268,11 +283,13 @@ class OrderService:
             else:
                 # Fallback: instrument-based close (dry-run or legacy positions without trade ID)
                 oanda_position = self._position_to_oanda_position(position)
+                self._observe_latency(LATENCY_STAGE_SUBMIT, tick_timestamp)
                 oanda_order = self.oanda_service.close_position(
                     position=oanda_position,
                     units=close_units_decimal if units is not None else None,
                     override_price=override_price,
                 )
+            self._observe_latency(LATENCY_STAGE_FILL, tick_timestamp)
 
             # Create order record for the closing trade
             order = self._create_order_record(
@@ -444,9 +461,11 @@ class OrderService:
             )
 
             # Execute via OANDA service
+            self._observe_latency(LATENCY_STAGE_SUBMIT, tick_timestamp)
             oanda_order = self.oanda_service.create_market_order(
                 request, override_price=override_price
             )
+            self._observe_latency(LATENCY_STAGE_FILL, tick_timestamp)
 
             # Create or update position first so we can link the order to it
             entry_time = self._order_execution_time(
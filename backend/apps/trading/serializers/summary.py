@@ -23,6 +23,8 @@ class TickDeliveryInfoSerializer(serializers.Serializer):
     age_seconds = serializers.FloatField(allow_null=True)
     max_age_seconds = serializers.IntegerField(allow_null=True)
     message = serializers.CharField(allow_null=True)
+    conflated_ticks = serializers.IntegerField(allow_null=True, required=False)
+    batch_size = serializers.IntegerField(allow_null=True, required=False)
 
 
 class PnlInfoSerializer(serializers.Serializer):
@@ -84,6 +86,11 @@ class ExecutionInfoSerializer(serializers.Serializer):
     )
     reconciled_at = serializers.CharField(allow_null=True, required=False)
     tick_delivery = TickDeliveryInfoSerializer(allow_null=True, required=False)
+    latency = serializers.DictField(
+        child=serializers.DictField(),
+        allow_null=True,
+        required=False,
+    )
 
 
 class TaskInfoSerializer(serializers.Serializer):
@@ -20,15 +20,19 @@ from apps.trading.models import (
     ExecutionMetricAggregate,
     ExecutionState,
     Metrics,
+    NetChartBucket,
     Order,
     Position,
     StrategyEventRecord,
     Trade,
+    TradeCycleSummary,
+    TradeOutcomeRollup,
     TradingTask,
     TradingEvent,
 )
 from apps.trading.money import AccountCurrency
 from apps.trading.order import OrderService
+from apps.trading.services.cycle_summaries import refresh_cycle_summaries_for_trades
 from apps.trading.strategies.snowball.calculators import SnowballCalculator
 from apps.trading.strategies.snowball.cycle_state import (
     SnowballCycle,
@@ -614,6 +618,7 @@ class BacktestInitialPositionService:
                     updated_at=event.timestamp,
                     is_initial_position_seed=True,
                 )
+                refresh_cycle_summaries_for_trades(result.trade_ids)
             if result.position_ids:
                 Position.objects.filter(pk__in=result.position_ids).update(
                     created_at=event.timestamp,
@@ -652,9 +657,12 @@ class BacktestInitialPositionService:
         TradingEvent.objects.filter(**scope).delete()
         StrategyEventRecord.objects.filter(**scope).delete()
         Trade.objects.filter(**scope).delete()
+        TradeCycleSummary.objects.filter(**scope).delete()
         Order.objects.filter(**scope).delete()
         Position.objects.filter(**scope).delete()
         Metrics.objects.filter(**scope).delete()
+        TradeOutcomeRollup.objects.filter(**scope).delete()
+        NetChartBucket.objects.filter(**scope).delete()
         ExecutionMetricAggregate.objects.filter(**scope).delete()
         ExecutionState.objects.filter(**scope).delete()
 
@@ -6,6 +6,14 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from django.conf import settings
+
+from apps.common.singleflight import CacheSingleFlight
+from apps.market.services.cache import build_broker_snapshot_cache_key
+
+DEFAULT_SHARED_SNAPSHOT_TTL_SECONDS = 5.0
+DEFAULT_SHARED_SNAPSHOT_WAIT_SECONDS = 10.0
+
 
 @dataclass(slots=True)
 class BrokerSnapshot:
@@ -31,6 +39,58 @@ class BrokerSnapshot:
         return trades
 
 
+class SharedBrokerSnapshotCache:
+    """Short-lived broker reads shared by every task trading one account.
+
+    Runtime drift checks and position syncs for tasks on the same OANDA
+    account ask for the same account details, open trades and pending orders.
+    Entries live in the Django cache for a few seconds and are loaded through
+    :class:`CacheSingleFlight`, so concurrent workers issue one upstream
+    request per key. ``OandaService`` bumps the account's cache version after
+    every order mutation, so a task never reads a snapshot taken before its
+    own fills.
+    """
+
+    def __init__(
+        self,
+        *,
+        account_key: int | str,
+        ttl_seconds: float,
+        single_flight: CacheSingleFlight | None = None,
+    ) -> None:
+        self.account_key = account_key
+        self.ttl_seconds = ttl_seconds
+        self.single_flight = single_flight or CacheSingleFlight(
+            wait_seconds=float(
+                getattr(
+                    settings,
+                    "TRADING_BROKER_SNAPSHOT_CACHE_WAIT_SECONDS",
+                    DEFAULT_SHARED_SNAPSHOT_WAIT_SECONDS,
+                )
+            ),
+        )
+
+    @classmethod
+    def for_account(cls, account: Any) -> SharedBrokerSnapshotCache | None:
+        """Return a shared cache for *account*, or ``None`` when disabled."""
+        ttl_seconds = float(
+            getattr(
+                settings,
+                "TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS",
+                DEFAULT_SHARED_SNAPSHOT_TTL_SECONDS,
+            )
+        )
+        account_key = getattr(account, "pk", None)
+        if ttl_seconds <= 0 or not isinstance(account_key, (int, str)):
+            return None
+        return cls(account_key=account_key, ttl_seconds=ttl_seconds)
+
+    def get_or_load(self, *, kind: str, loader: Callable[[], Any], instrument: str = "") -> Any:
+        """Return the shared value for (*kind*, *instrument*), loading it once."""
+        key = build_broker_snapshot_cache_key(self.account_key, kind, instrument)
+        return self.single_flight.get_or_load(key, loader, ttl_seconds=self.ttl_seconds)
+
+
 class BrokerSnapshotLoader:
     """Load broker-side state through a retry-aware request runner."""
 
@@ -40,18 +100,28 @@ class BrokerSnapshotLoader:
         broker_service: Any,
         request_runner: Callable[..., Any],
         snapshot: BrokerSnapshot | None = None,
+        shared_cache: SharedBrokerSnapshotCache | None = None,
     ) -> None:
         self.broker_service = broker_service
         self.request_runner = request_runner
         self.snapshot = snapshot or BrokerSnapshot()
+        self.shared_cache = shared_cache
+
+    def _load(self, *, kind: str, instrument: str = "", loader: Callable[[], Any]) -> Any:
+        if self.shared_cache is None:
+            return loader()
+        return self.shared_cache.get_or_load(kind=kind, instrument=instrument, loader=loader)
 
     def account_details(self, *, label: str = "Fetch account snapshot") -> Any:
         """Return cached account details, loading from the broker once if needed."""
         if self.snapshot.account_details is not None:
             return self.snapshot.account_details
-        details = self.request_runner(
-            self.broker_service.get_account_details,
-            label=label,
+        details = self._load(
+            kind="account_details",
+            loader=lambda: self.request_runner(
+                self.broker_service.get_account_details,
+                label=label,
+            ),
         )
         return self.snapshot.cache_account_details(details)
 
@@ -64,10 +134,16 @@ class BrokerSnapshotLoader:
         """Return cached pending orders for *instrument*."""
         if instrument in self.snapshot.pending_orders_by_instrument:
             return self.snapshot.pending_orders_by_instrument[instrument]
-        orders = self.request_runner(
-            self.broker_service.get_pending_orders,
+        orders = self._load(
+            kind="pending_orders",
             instrument=instrument,
-            label=label,
+            loader=lambda: list(
+                self.request_runner(
+                    self.broker_service.get_pending_orders,
+                    instrument=instrument,
+                    label=label,
+                )
+            ),
         )
         return self.snapshot.cache_pending_orders(instrument=instrument, orders=list(orders))
 
@@ -80,9 +156,15 @@ class BrokerSnapshotLoader:
         """Return cached open trades for *instrument*."""
         if instrument in self.snapshot.open_trades_by_instrument:
             return self.snapshot.open_trades_by_instrument[instrument]
-        trades = self.request_runner(
-            self.broker_service.get_open_trades,
+        trades = self._load(
+            kind="open_trades",
             instrument=instrument,
-            label=label,
+            loader=lambda: list(
+                self.request_runner(
+                    self.broker_service.get_open_trades,
+                    instrument=instrument,
+                    label=label,
+                )
+            ),
         )
         return self.snapshot.cache_open_trades(instrument=instrument, trades=list(trades))
@@ -0,0 +1,186 @@
+"""Materialized per-cycle trade aggregates backing the cycles list.
+
+Every trade recorded with a ``cycle_id`` refreshes that cycle's
+:class:`~apps.trading.models.trades.TradeCycleSummary` by folding the cycle's
+trades with the same logic the cycles API uses. Executions whose trades were
+written before the table existed (or by paths that bypass the event handler)
+are backfilled in one pass the first time they are read or written.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import Decimal
+from itertools import groupby
+from logging import Logger, getLogger
+from typing import Any
+
+from apps.trading.models.trades import Trade, TradeCycleSummary
+from apps.trading.services.strategy_cycles import (
+    _AGGREGATE_TRADE_FIELDS,
+    _aggregate_cycle,
+    _resolve_cycle_status,
+)
+
+logger: Logger = getLogger(name=__name__)
+
+_BACKFILL_BATCH_SIZE = 500
+
+
+def _summary_fields(aggregate: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "status": _resolve_cycle_status(aggregate, None),
+        "direction": aggregate["direction"],
+        "started_at": aggregate["started_at"],
+        "last_trade_at": aggregate["last_timestamp"],
+        "last_price": aggregate["last_price"],
+        "trade_count": aggregate["trade_count"],
+        "open_count": aggregate["open_count"],
+        "close_count": aggregate["close_count"],
+        "open_units_total": aggregate["open_units_total"],
+        "rebuild_count": aggregate["rebuild_count"],
+        "protection_count": aggregate["protection_count"],
+        "initial_position_seed_count": aggregate["initial_position_seed_count"],
+        "realized_pnl": aggregate["realized_pnl"],
+        "position_ids": aggregate["position_ids"],
+        "open_position_ids": sorted(aggregate["still_open_position_ids"]),
+        "initial_is_closed": aggregate["initial_is_closed"],
+        "has_unresolved_rebuilds": aggregate["has_unresolved_rebuilds"],
+    }
+
+
+def summary_aggregate(summary: TradeCycleSummary) -> dict[str, Any]:
+    """Return *summary* in the aggregate shape produced by ``_aggregate_cycle``."""
+    open_position_ids = {str(pid) for pid in summary.open_position_ids or []}
+    return {
+        "cycle_id": str(summary.cycle_id),
+        "direction": summary.direction,
+        "trade_count": summary.trade_count,
+        "open_count": summary.open_count,
+        "close_count": summary.close_count,
+        "open_units_total": summary.open_units_total,
+        "position_ids": list(summary.position_ids or []),
+        "realized_pnl": Decimal(str(summary.realized_pnl)),
+        "rebuild_count": summary.rebuild_count,
+        "initial_position_seed_count": summary.initial_position_seed_count,
+        "is_initial_position_seed": summary.initial_position_seed_count > 0,
+        "protection_count": summary.protection_count,
+        "has_protection": summary.protection_count > 0,
+        "started_at": summary.started_at,
+        "last_timestamp": summary.last_trade_at,
+        "last_price": (
+            Decimal(str(summary.last_price)) if summary.last_price is not None else None
+        ),
+        "still_open_position_ids": open_position_ids,
+        "initial_is_closed": summary.initial_is_closed,
+        "has_unresolved_rebuilds": summary.has_unresolved_rebuilds,
+        "has_open_remaining": bool(open_position_ids),
+    }
+
+
+def _execution_trades(*, task_type: str, task_id: Any, execution_id: Any) -> Any:
+    return Trade.objects.filter(
+        task_type=task_type,
+        task_id=task_id,
+        execution_id=execution_id,
+        cycle_id__isnull=False,
+    )
+
+
+def refresh_cycle_summary(
+    *,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    cycle_id: Any,
+) -> TradeCycleSummary | None:
+    """Rebuild one cycle's summary from its trades; drop it when none remain."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    trades = list(
+        _execution_trades(**scope)
+        .filter(cycle_id=cycle_id)
+        .order_by("timestamp")
+        .values(*_AGGREGATE_TRADE_FIELDS)
+    )
+    if not trades:
+        TradeCycleSummary.objects.filter(**scope, cycle_id=cycle_id).delete()
+        return None
+    aggregate = _aggregate_cycle(str(cycle_id), trades)
+    summary, _created = TradeCycleSummary.objects.update_or_create(
+        **scope,
+        cycle_id=cycle_id,
+        defaults=_summary_fields(aggregate),
+    )
+    return summary
+
+
+def backfill_cycle_summaries(*, task_type: str, task_id: Any, execution_id: Any) -> int:
+    """Rebuild every cycle summary of an execution; returns the number written."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    rows = (
+        _execution_trades(**scope)
+        .order_by("cycle_id", "timestamp")
+        .values(*_AGGREGATE_TRADE_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+    TradeCycleSummary.objects.filter(**scope).delete()
+    pending: list[TradeCycleSummary] = []
+    written = 0
+    for cycle_id, trades in groupby(rows, key=lambda row: row["cycle_id"]):
+        aggregate = _aggregate_cycle(str(cycle_id), list(trades))
+        pending.append(TradeCycleSummary(**scope, cycle_id=cycle_id, **_summary_fields(aggregate)))
+        if len(pending) >= _BACKFILL_BATCH_SIZE:
+            TradeCycleSummary.objects.bulk_create(pending)
+            written += len(pending)
+            pending = []
+    if pending:
+        TradeCycleSummary.objects.bulk_create(pending)
+        written += len(pending)
+    return written
+
+
+def ensure_cycle_summaries(*, task_type: str, task_id: Any, execution_id: Any) -> None:
+    """Backfill an execution whose cycle trades have no summaries yet."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    if TradeCycleSummary.objects.filter(**scope).exists():
+        return
+    if not _execution_trades(**scope).exists():
+        return
+    count = backfill_cycle_summaries(**scope)
+    logger.info(
+        "Backfilled %s cycle summaries - task_type=%s, task_id=%s, execution_id=%s",
+        count,
+        task_type,
+        task_id,
+        execution_id,
+    )
+
+
+def record_cycle_trade(*, task_type: str, task_id: Any, execution_id: Any, cycle_id: Any) -> None:
+    """Keep the summary table current after a cycle trade is written.
+
+    The first write of an execution without summaries backfills all of its
+    cycles, so a run that started before the table existed is never listed
+    with only the cycles that traded afterwards.
+    """
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    if not TradeCycleSummary.objects.filter(**scope).exists():
+        backfill_cycle_summaries(**scope)
+        return
+    refresh_cycle_summary(**scope, cycle_id=cycle_id)
+
+
+def refresh_cycle_summaries_for_trades(trade_ids: Iterable[Any]) -> None:
+    """Refresh the summaries of the cycles touched by *trade_ids*."""
+    keys = set(
+        Trade.objects.filter(pk__in=list(trade_ids), cycle_id__isnull=False).values_list(
+            "task_type", "task_id", "execution_id", "cycle_id"
+        )
+    )
+    for task_type, task_id, execution_id, cycle_id in keys:
+        refresh_cycle_summary(
+            task_type=task_type,
+            task_id=task_id,
+            execution_id=execution_id,
+            cycle_id=cycle_id,
+        )
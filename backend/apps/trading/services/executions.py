@@ -535,10 +535,10 @@ def delete_task_execution(
     Returns True if the execution was found and deleted, False otherwise.
     """
     from apps.trading.models import CeleryTaskStatus, TaskExecutionSnapshot
-    from apps.trading.models.metrics import Metrics
+    from apps.trading.models.metrics import Metrics, NetChartBucket, TradeOutcomeRollup
     from apps.trading.models.positions import Position
     from apps.trading.models.state import ExecutionState
-    from apps.trading.models.trades import Trade
+    from apps.trading.models.trades import Trade, TradeCycleSummary
     from apps.trading.models.events import TradingEvent, StrategyEventRecord
 
     task_id = str(task.pk)
@@ -572,6 +572,18 @@ def delete_task_execution(
         execution_id=execution_id,
     ).delete()
 
+    TradeOutcomeRollup.objects.filter(
+        task_type=task_type,
+        task_id=task_id,
+        execution_id=execution_id,
+    ).delete()
+
+    NetChartBucket.objects.filter(
+        task_type=task_type,
+        task_id=task_id,
+        execution_id=execution_id,
+    ).delete()
+
     Position.objects.filter(
         task_type=task_type,
         task_id=task_id,
@@ -584,6 +596,12 @@ def delete_task_execution(
         execution_id=execution_id,
     ).delete()
 
+    TradeCycleSummary.objects.filter(
+        task_type=task_type,
+        task_id=task_id,
+        execution_id=execution_id,
+    ).delete()
+
     TradingEvent.objects.filter(
         task_type=task_type,
         task_id=task_id,
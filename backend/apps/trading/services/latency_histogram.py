@@ -0,0 +1,307 @@
+"""Fixed-bucket latency histograms for the live tick-to-order path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from functools import lru_cache
+from logging import Logger, getLogger
+from time import monotonic
+from typing import Any
+
+from django.conf import settings
+
+logger: Logger = getLogger(name=__name__)
+
+# Each stage is measured from the OANDA tick time, so stage N minus stage N-1
+# is the time spent between the two hops.
+LATENCY_STAGE_PUBLISH = "publish"
+LATENCY_STAGE_RECEIVE = "receive"
+LATENCY_STAGE_DECISION = "decision"
+LATENCY_STAGE_SUBMIT = "submit"
+LATENCY_STAGE_FILL = "fill"
+LATENCY_STAGES: tuple[str, ...] = (
+    LATENCY_STAGE_PUBLISH,
+    LATENCY_STAGE_RECEIVE,
+    LATENCY_STAGE_DECISION,
+    LATENCY_STAGE_SUBMIT,
+    LATENCY_STAGE_FILL,
+)
+
+# 2**5 sub-buckets per power of two keeps every bucket within ~3% of the
+# recorded value, the same trade-off as an HDR histogram with ~1.5
+# significant digits.
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# Values are recorded in microseconds and clamped to one hour.
+MAX_TRACKABLE_MICROS = 3_600_000_000
+
+LATENCY_HISTOGRAM_KEY_PREFIX = "trading:latency_histogram"
+DEFAULT_REDIS_TIMEOUT_SECONDS = 1.0
+SUMMARY_PERCENTILES: tuple[tuple[str, float], ...] = (
+    ("p50", 50.0),
+    ("p90", 90.0),
+    ("p99", 99.0),
+    ("p999", 99.9),
+)
+
+
+def bucket_index(micros: int) -> int:
+    """Return the histogram bucket holding a microsecond value."""
+    value = min(max(int(micros), 0), MAX_TRACKABLE_MICROS)
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKET_COUNT + ((value >> shift) - SUB_BUCKET_COUNT)
+
+
+def bucket_upper_micros(index: int) -> int:
+    """Return the highest microsecond value that maps to *index*."""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_COUNT - 1
+    mantissa = index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Sparse log-linear histogram of latencies with bounded relative error."""
+
+    __slots__ = ("counts", "total_count", "max_micros")
+
+    def __init__(self, counts: Mapping[int, int] | None = None) -> None:
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.max_micros = 0
+        if counts:
+            self.merge_counts(counts)
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        micros = int(max(seconds, 0.0) * 1_000_000)
+        index = bucket_index(micros)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.max_micros = max(self.max_micros, min(micros, MAX_TRACKABLE_MICROS))
+
+    def merge_counts(self, counts: Mapping[int, int]) -> None:
+        for index, count in counts.items():
+            if count <= 0:
+                continue
+            self.counts[index] = self.counts.get(index, 0) + count
+            self.total_count += count
+            self.max_micros = max(self.max_micros, bucket_upper_micros(index))
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the latency in seconds at *percent* (0-100), or None when empty."""
+        if self.total_count <= 0:
+            return None
+        target = max(1, int(-(-self.total_count * percent // 100)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(bucket_upper_micros(index), self.max_micros) / 1_000_000
+        return self.max_micros / 1_000_000
+
+    def summary(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"count": self.total_count}
+        for name, percent in SUMMARY_PERCENTILES:
+            payload[name] = self.percentile(percent)
+        payload["max"] = self.max_micros / 1_000_000 if self.total_count else None
+        return payload
+
+    def __bool__(self) -> bool:
+        return self.total_count > 0
+
+
+def build_latency_histogram_key(task_id: str | int, execution_id: str | int | None) -> str:
+    return f"{LATENCY_HISTOGRAM_KEY_PREFIX}:{task_id}:{execution_id or 'none'}"
+
+
+def latency_histograms_enabled() -> bool:
+    return float(getattr(settings, "TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS", 10) or 0) > 0
+
+
+@lru_cache(maxsize=4)
+def _shared_redis_client(url: str, timeout_seconds: float) -> Any:
+    """Return one Redis client per URL so summaries reuse its connection pool."""
+    import redis
+
+    return redis.Redis.from_url(
+        url,
+        decode_responses=True,
+        socket_timeout=timeout_seconds,
+        socket_connect_timeout=timeout_seconds,
+    )
+
+
+class LatencyHistogramStore:
+    """Merge per-executor histograms into one Redis hash per execution.
+
+    Fields are ``"<stage>:<bucket>"`` counters, so merging is an ``HINCRBY``
+    per non-empty bucket and concurrent writers never overwrite each other.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: Any | None = None,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        self._redis = redis_client
+        self.ttl_seconds = int(
+            ttl_seconds
+            if ttl_seconds is not None
+            else getattr(settings, "TRADING_LATENCY_HISTOGRAM_TTL_SECONDS", 7 * 24 * 3600)
+        )
+
+    @property
+    def redis(self) -> Any:
+        if self._redis is None:
+            self._redis = _shared_redis_client(
+                settings.MARKET_REDIS_URL,
+                float(
+                    getattr(
+                        settings,
+                        "TRADING_LATENCY_HISTOGRAM_REDIS_TIMEOUT_SECONDS",
+                        DEFAULT_REDIS_TIMEOUT_SECONDS,
+                    )
+                ),
+            )
+        return self._redis
+
+    def merge(
+        self,
+        *,
+        task_id: str | int,
+        execution_id: str | int | None,
+        histograms: Mapping[str, LatencyHistogram],
+    ) -> None:
+        key = build_latency_histogram_key(task_id, execution_id)
+        pipe = self.redis.pipeline(transaction=False)
+        for stage, histogram in histograms.items():
+            for index, count in histogram.counts.items():
+                pipe.hincrby(key, f"{stage}:{index}", count)
+        if self.ttl_seconds > 0:
+            pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+
+    def load(
+        self,
+        *,
+        task_id: str | int,
+        execution_id: str | int | None,
+    ) -> dict[str, LatencyHistogram]:
+        raw = self.redis.hgetall(build_latency_histogram_key(task_id, execution_id)) or {}
+        counts: dict[str, dict[int, int]] = {}
+        for field, value in raw.items():
+            stage, _, index = str(field).rpartition(":")
+            try:
+                counts.setdefault(stage, {})[int(index)] = int(value)
+            except (TypeError, ValueError):
+                continue
+        return {stage: LatencyHistogram(stage_counts) for stage, stage_counts in counts.items()}
+
+    def summary(
+        self,
+        *,
+        task_id: str | int,
+        execution_id: str | int | None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return p50/p90/p99/p999/max (seconds) and counts for every recorded stage."""
+        histograms = self.load(task_id=task_id, execution_id=execution_id)
+        return {
+            stage: histograms[stage].summary() for stage in LATENCY_STAGES if stage in histograms
+        }
+
+
+def load_latency_summary(
+    *,
+    task_id: str | int,
+    execution_id: str | int | None,
+    store: LatencyHistogramStore | None = None,
+) -> dict[str, dict[str, Any]] | None:
+    """Return the merged latency summary, or None when disabled or unreachable."""
+    if not latency_histograms_enabled() or execution_id in (None, ""):
+        return None
+    try:
+        return (store or LatencyHistogramStore()).summary(
+            task_id=task_id,
+            execution_id=execution_id,
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.debug("Failed to load latency histograms for task %s", task_id, exc_info=True)
+        return None
+
+
+class LiveLatencyRecorder:
+    """Per-executor latency histograms, periodically merged into Redis."""
+
+    def __init__(
+        self,
+        *,
+        task_id: str | int,
+        execution_id: str | int | None,
+        store: LatencyHistogramStore | None = None,
+        flush_interval_seconds: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.task_id = task_id
+        self.execution_id = execution_id
+        self.store = store or LatencyHistogramStore()
+        self.flush_interval_seconds = float(
+            flush_interval_seconds
+            if flush_interval_seconds is not None
+            else getattr(settings, "TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS", 10)
+        )
+        self.clock = clock
+        self._pending: dict[str, LatencyHistogram] = {}
+        self._last_flush_at = clock()
+
+    @classmethod
+    def for_task(cls, task: Any) -> LiveLatencyRecorder | None:
+        """Return a recorder for a live task, or None when histograms are disabled."""
+        if not latency_histograms_enabled():
+            return None
+        return cls(task_id=task.pk, execution_id=getattr(task, "execution_id", None))
+
+    def record(self, stage: str, seconds: float) -> None:
+        histogram = self._pending.get(stage)
+        if histogram is None:
+            histogram = self._pending[stage] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def observe(self, stage: str, tick_ts: datetime, observed_at: datetime | None = None) -> None:
+        """Record the time from *tick_ts* to *observed_at* (now by default)."""
+        now = observed_at or datetime.now(tick_ts.tzinfo)
+        self.record(stage, (now - tick_ts).total_seconds())
+
+    def pending(self) -> dict[str, LatencyHistogram]:
+        return {stage: histogram for stage, histogram in self._pending.items() if histogram}
+
+    def maybe_flush(self) -> bool:
+        if self.clock() - self._last_flush_at < self.flush_interval_seconds:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Merge pending counts into Redis; counts are kept for the next try on failure."""
+        self._last_flush_at = self.clock()
+        pending = self.pending()
+        if not pending:
+            return
+        try:
+            self.store.merge(
+                task_id=self.task_id,
+                execution_id=self.execution_id,
+                histograms=pending,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Failed to merge latency histograms for task %s",
+                self.task_id,
+                exc_info=True,
+            )
+            return
+        self._pending = {}
@@ -9,7 +9,7 @@ from typing import Any
 from apps.market.services.live_trading_policy import LiveTradingPolicy, get_live_trading_policy
 from apps.trading.models import TradingTask
 
-_SUPPORTED_DEBUG_OPTIONS = frozenset({"tracemalloc"})
+_SUPPORTED_DEBUG_OPTIONS = frozenset({"profile", "tracemalloc"})
 
 
 class LiveTradingRiskError(ValueError):
@@ -151,9 +151,10 @@ class LiveTradingRiskGuard:
             names = ", ".join(unknown)
             raise LiveTradingRiskError(f"Unsupported debug option(s): {names}.")
 
-        tracemalloc = debug_options.get("tracemalloc")
-        if tracemalloc is not None and not isinstance(tracemalloc, bool):
-            raise LiveTradingRiskError("debug_options.tracemalloc must be a boolean.")
+        for name in sorted(_SUPPORTED_DEBUG_OPTIONS):
+            value = debug_options.get(name)
+            if value is not None and not isinstance(value, bool):
+                raise LiveTradingRiskError(f"debug_options.{name} must be a boolean.")
 
 
 def _estimate_snowball_units(
@@ -234,6 +234,8 @@ class MetricsAggregator:
                     ],
                 )
 
+            self._save_net_chart_buckets(keys_to_flush)
+
         logger.debug(
             "MetricsAggregator flushed %d/%d buckets (final=%s) for task %s",
             count,
@@ -247,6 +249,23 @@ class MetricsAggregator:
 
         return count
 
+    def _save_net_chart_buckets(self, keys: list[datetime]) -> None:
+        """Upsert the SnowballNet chart buckets touched by the flushed minutes."""
+
+        from apps.trading.services.net_chart_buckets import (
+            build_net_chart_bucket_rows,
+            save_net_chart_buckets,
+        )
+
+        save_net_chart_buckets(
+            build_net_chart_bucket_rows(
+                task_type=self.task_type,
+                task_id=self.task_id,
+                execution_id=self.execution_id,
+                snapshots=((key, self._buckets[key]) for key in keys),
+            )
+        )
+
     def _build_rollup_rows(
         self, metrics_rollup_model: type[Any], keys: list[datetime]
     ) -> list[Any]:
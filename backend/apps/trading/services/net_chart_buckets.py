@@ -0,0 +1,197 @@
+"""Precomputed SnowballNet chart buckets.
+
+``MetricsAggregator`` turns each flushed batch of minute snapshots into one
+:class:`~apps.trading.models.metrics.NetChartBucket` row per chart
+granularity, keeping the latest snapshot of every bucket exactly like the
+``DISTINCT ON`` read the chart used to run. The chart then reads complete
+buckets from this table and only scans ``Metrics`` for the partial buckets at
+the edges of its window, or for windows that predate the table.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.trading.models.metrics import NetChartBucket
+
+NET_CHART_GRANULARITIES_SECONDS = {
+    "M1": 60,
+    "M5": 5 * 60,
+    "M15": 15 * 60,
+    "M30": 30 * 60,
+    "H1": 60 * 60,
+    "H4": 4 * 60 * 60,
+    "D": 24 * 60 * 60,
+}
+
+# NetChartBucket column -> metrics snapshot key read by the net chart.
+NET_CHART_METRIC_COLUMNS = {
+    "net_units": "snowball_net_net_units",
+    "average_price": "snowball_net_average_price",
+    "current_price": "snowball_net_current_price",
+    "target_price": "snowball_net_target_price",
+    "next_add_price": "snowball_net_next_add_price",
+    "theoretical_next_add_price": "snowball_net_theoretical_next_add_price",
+    "pips_from_average": "snowball_net_pips_from_average",
+    "loss_cut_threshold_pips": "snowball_net_loss_cut_threshold_pips",
+    "margin_ratio_pct": "snowball_net_margin_ratio_pct",
+    "margin_ratio": "margin_ratio",
+    "add_count": "snowball_net_add_count",
+    "mid_price": "current_price",
+    "realized_pnl": "realized_pnl",
+    "realized_pnl_quote": "realized_pnl_quote",
+    "unrealized_pnl": "unrealized_pnl",
+    "unrealized_pnl_quote": "unrealized_pnl_quote",
+}
+
+_MAX_CHART_VALUE = Decimal("1e20")
+
+
+def has_net_chart_metrics(snapshot: dict[str, Any]) -> bool:
+    return any(key.startswith("snowball_net_") for key in snapshot)
+
+
+def build_net_chart_bucket_rows(
+    *,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    snapshots: Iterable[tuple[datetime, dict[str, Any]]],
+) -> list[NetChartBucket]:
+    """Build the latest-per-bucket rows for a batch of minute snapshots."""
+    now = timezone.now()
+    latest: dict[tuple[str, datetime], tuple[datetime, dict[str, Any]]] = {}
+    for source_timestamp, snapshot in snapshots:
+        if not has_net_chart_metrics(snapshot):
+            continue
+        for granularity, seconds in NET_CHART_GRANULARITIES_SECONDS.items():
+            key = (granularity, bucket_start(source_timestamp, seconds))
+            existing = latest.get(key)
+            if existing is None or source_timestamp >= existing[0]:
+                latest[key] = (source_timestamp, snapshot)
+    return [
+        NetChartBucket(
+            task_type=task_type,
+            task_id=task_id,
+            execution_id=execution_id,
+            granularity=granularity,
+            bucket=bucket,
+            source_timestamp=source_timestamp,
+            created_at=now,
+            updated_at=now,
+            **{
+                column: _chart_value(snapshot.get(metric_key))
+                for column, metric_key in NET_CHART_METRIC_COLUMNS.items()
+            },
+        )
+        for (granularity, bucket), (source_timestamp, snapshot) in latest.items()
+    ]
+
+
+def save_net_chart_buckets(rows: list[NetChartBucket]) -> None:
+    """Upsert *rows*, replacing buckets that earlier flushes already wrote.
+
+    The unique constraint treats NULL execution ids as equal, which only
+    PostgreSQL can enforce; other backends replace the rows explicitly.
+    """
+    if not rows:
+        return
+    if connection.vendor == "postgresql":
+        NetChartBucket.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            update_fields=["source_timestamp", *NET_CHART_METRIC_COLUMNS, "updated_at"],
+            unique_fields=["task_type", "task_id", "execution_id", "granularity", "bucket"],
+        )
+        return
+    first = rows[0]
+    buckets_by_granularity: dict[str, list[datetime]] = defaultdict(list)
+    for row in rows:
+        buckets_by_granularity[row.granularity].append(row.bucket)
+    with transaction.atomic():
+        for granularity, buckets in buckets_by_granularity.items():
+            NetChartBucket.objects.filter(
+                task_type=first.task_type,
+                task_id=first.task_id,
+                execution_id=first.execution_id,
+                granularity=granularity,
+                bucket__in=buckets,
+            ).delete()
+        NetChartBucket.objects.bulk_create(rows)
+
+
+def net_chart_coverage_start(
+    *, task_type: str, task_id: Any, execution_id: Any, granularity: str
+) -> datetime | None:
+    """Return the first minute represented in the table for an execution."""
+    return (
+        NetChartBucket.objects.filter(
+            task_type=task_type,
+            task_id=task_id,
+            execution_id=execution_id,
+            granularity=granularity,
+        )
+        .order_by("bucket")
+        .values_list("source_timestamp", flat=True)
+        .first()
+    )
+
+
+def load_net_chart_metric_rows(
+    *,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    granularity: str,
+    since: datetime,
+    until: datetime,
+) -> list[tuple[datetime, dict[str, Decimal]]]:
+    """Return ``(source_timestamp, metrics)`` for buckets starting in ``[since, until)``.
+
+    The metrics dicts carry the original snapshot keys, so callers can reuse
+    the extraction they apply to raw ``Metrics`` rows.
+    """
+    rows = (
+        NetChartBucket.objects.filter(
+            task_type=task_type,
+            task_id=task_id,
+            execution_id=execution_id,
+            granularity=granularity,
+            bucket__gte=since,
+            bucket__lt=until,
+        )
+        .order_by("bucket")
+        .values_list("source_timestamp", *NET_CHART_METRIC_COLUMNS)
+    )
+    columns = tuple(NET_CHART_METRIC_COLUMNS.values())
+    return [
+        (
+            source_timestamp,
+            {key: value for key, value in zip(columns, values, strict=True) if value is not None},
+        )
+        for source_timestamp, *values in rows
+    ]
+
+
+def bucket_start(value: datetime, seconds: int) -> datetime:
+    aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    return datetime.fromtimestamp(int(aware.timestamp()) // seconds * seconds, tz=UTC)
+
+
+def _chart_value(raw: Any) -> Decimal | None:
+    if raw in (None, "") or isinstance(raw, bool):
+        return None
+    try:
+        value = Decimal(str(raw))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    if not value.is_finite() or abs(value) >= _MAX_CHART_VALUE:
+        return None
+    return value
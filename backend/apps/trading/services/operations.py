@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from apps.market.services.oanda_pool import OANDA_CONTEXT_POOL, OandaContextPool
 from apps.market.services.oanda_retry import OandaRetryMetricRecorder
 from apps.trading.enums import TaskType
-from apps.trading.models import ExecutionState, TradingTask
+from apps.trading.models import CeleryTaskStatus, ExecutionState, TradingTask
 
 
 @dataclass(frozen=True, slots=True)
@@ -107,13 +108,54 @@ class TradingOperationsMetricsService:
         *,
         outage_collector: BrokerReadOutageMetricsCollector | None = None,
         retry_recorder: OandaRetryMetricRecorder | None = None,
+        client_pool: OandaContextPool | None = None,
     ) -> None:
         self.outage_collector = outage_collector or BrokerReadOutageMetricsCollector()
         self.retry_recorder = retry_recorder or OandaRetryMetricRecorder()
+        self.client_pool = client_pool or OANDA_CONTEXT_POOL
 
     def snapshot(self, *, user: Any | None = None) -> dict[str, Any]:
-        """Return broker outage and OANDA retry metrics."""
+        """Return broker outage, OANDA retry and client pool metrics."""
         return {
             "broker_read_outage": self.outage_collector.snapshot(user=user).to_dict(),
             "oanda_retry": self.retry_recorder.snapshot().to_dict(),
+            "oanda_client_pool": self.client_pool.stats().to_dict(),
+        }
+
+
+class ExecutionProfileCollector:
+    """Collect opt-in execution profiles published to task status metadata."""
+
+    meta_key = "execution_profile"
+
+    def __init__(
+        self,
+        *,
+        status_model: type[CeleryTaskStatus] = CeleryTaskStatus,
+        limit: int = 50,
+    ) -> None:
+        self.status_model = status_model
+        self.limit = limit
+
+    def snapshot(self, *, task_id: str | None = None) -> list[dict[str, Any]]:
+        """Return the most recent execution profiles, newest first."""
+        queryset = self.status_model.objects.filter(meta__has_key=self.meta_key)
+        if task_id:
+            queryset = queryset.filter(instance_key__startswith=f"{task_id}:")
+        return [
+            self._record_from_status(status)
+            for status in queryset.order_by("-updated_at")[: self.limit]
+        ]
+
+    def _record_from_status(self, status: CeleryTaskStatus) -> dict[str, Any]:
+        task_id, _, execution_id = str(status.instance_key).partition(":")
+        return {
+            "task_name": status.task_name,
+            "task_id": task_id,
+            "execution_id": execution_id or None,
+            "status": status.status,
+            "last_heartbeat_at": (
+                status.last_heartbeat_at.isoformat() if status.last_heartbeat_at else None
+            ),
+            "profile": status.meta.get(self.meta_key),
         }
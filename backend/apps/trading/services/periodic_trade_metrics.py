@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from logging import Logger, getLogger
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from django.db import transaction
 from django.utils import timezone
 
 from apps.trading.models.events import TradingEvent
+from apps.trading.models.metrics import TradeOutcomeRollup
 from apps.trading.models.positions import Position
 from apps.trading.services.strategy_data_common import StrategyDataQuery, string_or_none
 from apps.trading.utils import Instrument
 
+logger: Logger = getLogger(name=__name__)
+
 PERIODS = ("day", "week", "month", "year")
 TP_CLOSE_REASONS = frozenset(
     {
@@ -29,6 +35,16 @@ SL_CLOSE_REASONS = frozenset({"stop_loss"})
 OPEN_EVENT_TYPE = "open_position"
 REBUILD_EVENT_TYPE = "rebuild_position"
 CLOSE_EVENT_TYPE = "close_position"
+ROLLUP_EVENT_TYPES = (OPEN_EVENT_TYPE, REBUILD_EVENT_TYPE, CLOSE_EVENT_TYPE)
+OUTCOME_KEYS = (
+    "open_positions",
+    "rebuild_opens",
+    "tp_closes",
+    "sl_closes",
+    "tp_profit",
+    "sl_loss",
+)
+ONE_HOUR = timedelta(hours=1)
 
 
 def build_periodic_trade_metrics(
@@ -38,23 +54,219 @@ def build_periodic_trade_metrics(
     query: StrategyDataQuery,
     timezone_name: str | None = None,
 ) -> dict[str, Any]:
-    """Build TP/SL PnL and position activity buckets for one execution."""
+    """Build TP/SL PnL and position activity buckets for one execution.
+
+    Whole UTC hours inside the query window are read from the hourly
+    ``TradeOutcomeRollup`` rows; only the partial hours at the window edges
+    scan trading events.  Timezones whose offset is not a whole number of
+    hours cannot be assembled from hourly rows and scan every event.
+    """
 
     local_tz = _timezone(timezone_name)
     buckets: dict[str, dict[int, dict[str, Any]]] = {period: {} for period in PERIODS}
-    close_event_by_position: dict[str, tuple[datetime, str]] = {}
+    scope = {
+        "task_type": task_type_label,
+        "task_id": task.pk,
+        "execution_id": query.execution_id,
+    }
+
+    if not _accumulate_from_rollups(buckets, scope=scope, query=query, local_tz=local_tz):
+        _accumulate_events(
+            buckets,
+            _events_queryset(scope, since=query.since, until=query.until),
+            scope=scope,
+            local_tz=local_tz,
+        )
+
+    return {
+        "execution_id": string_or_none(query.execution_id),
+        "strategy_type": str(getattr(task.config, "strategy_type", "") or ""),
+        "instrument": getattr(task, "instrument", None),
+        "currency": _quote_currency(task),
+        "timezone": getattr(local_tz, "key", "UTC"),
+        "periods": {
+            period: [_serialize_bucket(bucket) for bucket in sorted(values.values(), key=_bucket_t)]
+            for period, values in buckets.items()
+        },
+    }
+
+
+class TradeOutcomeRollupRefresher:
+    """Collect the hours touched by processed events and refresh each once.
+
+    Refreshing the rollup on every processed event rescanned the event's whole
+    hour each time. Hours are collected as events are marked processed (a
+    close event's position already carries its exit price by then) and each
+    is recomputed once per :meth:`flush`.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, Any, Any], set[datetime]] = {}
+
+    def add(self, trading_event: TradingEvent) -> None:
+        """Mark the hour of an open/rebuild/close event for the next flush."""
+        if str(trading_event.event_type or "") not in ROLLUP_EVENT_TYPES:
+            return
+        event_timestamp = _aware_datetime(trading_event.event_timestamp)
+        if event_timestamp is None or trading_event.execution_id is None:
+            return
+        key = (trading_event.task_type, trading_event.task_id, trading_event.execution_id)
+        self._pending.setdefault(key, set()).add(_floor_hour(event_timestamp))
+
+    def flush(self) -> None:
+        """Refresh every pending hour; each execution runs in its own savepoint."""
+        pending, self._pending = self._pending, {}
+        for (task_type, task_id, execution_id), hours in pending.items():
+            try:
+                with transaction.atomic():
+                    refresh_trade_outcome_rollups(
+                        task_type=task_type,
+                        task_id=task_id,
+                        execution_id=execution_id,
+                        hours=hours,
+                    )
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Failed to refresh trade outcome rollups - task_id=%s, execution_id=%s",
+                    task_id,
+                    execution_id,
+                    exc_info=True,
+                )
+
+
+def refresh_trade_outcome_rollups(
+    *,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    hours: Iterable[datetime],
+) -> None:
+    """Recompute the given UTC hours of an execution.
+
+    An execution without rollups yet is backfilled in full instead.
+    """
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    if not TradeOutcomeRollup.objects.filter(**scope).exists():
+        backfill_trade_outcome_rollups(**scope)
+        return
+    for hour in sorted(hours):
+        refresh_trade_outcome_rollup(**scope, hour=hour)
+
+
+def refresh_trade_outcome_rollup(
+    *,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    hour: datetime,
+) -> None:
+    """Recompute one UTC hour of an execution from its trading events."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    outcomes = _hourly_outcomes(
+        _events_queryset(scope, since=hour, before=hour + ONE_HOUR),
+        scope=scope,
+    ).get(hour)
+    if outcomes is None:
+        TradeOutcomeRollup.objects.filter(**scope, hour=hour).delete()
+        return
+    TradeOutcomeRollup.objects.update_or_create(**scope, hour=hour, defaults=outcomes)
+
+
+def backfill_trade_outcome_rollups(*, task_type: str, task_id: Any, execution_id: Any) -> int:
+    """Rebuild every hourly rollup of an execution; returns the number written."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    hours = _hourly_outcomes(_events_queryset(scope), scope=scope)
+    TradeOutcomeRollup.objects.filter(**scope).delete()
+    TradeOutcomeRollup.objects.bulk_create(
+        [TradeOutcomeRollup(**scope, hour=hour, **outcomes) for hour, outcomes in hours.items()],
+        batch_size=1000,
+    )
+    return len(hours)
+
+
+def ensure_trade_outcome_rollups(*, task_type: str, task_id: Any, execution_id: Any) -> None:
+    """Backfill an execution whose trading events have no rollups yet."""
+    scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+    if TradeOutcomeRollup.objects.filter(**scope).exists():
+        return
+    if not _events_queryset(scope).exists():
+        return
+    backfill_trade_outcome_rollups(**scope)
+
 
+def _accumulate_from_rollups(
+    buckets: dict[str, dict[int, dict[str, Any]]],
+    *,
+    scope: dict[str, Any],
+    query: StrategyDataQuery,
+    local_tz: ZoneInfo,
+) -> bool:
+    """Fill ``buckets`` from hourly rollups; False when the caller must scan."""
+    first_hour = _ceil_hour(query.since) if query.since is not None else None
+    end_hour = _floor_hour(query.until) if query.until is not None else None
+    if first_hour is not None and end_hour is not None and end_hour < first_hour:
+        return False
+
+    ensure_trade_outcome_rollups(**scope)
+    rollups = TradeOutcomeRollup.objects.filter(**scope)
+    if first_hour is not None:
+        rollups = rollups.filter(hour__gte=first_hour)
+    if end_hour is not None:
+        rollups = rollups.filter(hour__lt=end_hour)
+    rows = list(rollups.order_by("hour").values("hour", *OUTCOME_KEYS))
+    if not all(_hour_aligned(row["hour"], local_tz) for row in rows):
+        return False
+
+    for row in rows:
+        for key in OUTCOME_KEYS:
+            if row[key]:
+                _increment_all(buckets, row["hour"], local_tz, key, row[key])
+
+    if query.since is not None and first_hour is not None and query.since < first_hour:
+        _accumulate_events(
+            buckets,
+            _events_queryset(scope, since=query.since, before=first_hour),
+            scope=scope,
+            local_tz=local_tz,
+        )
+    if end_hour is not None:
+        _accumulate_events(
+            buckets,
+            _events_queryset(scope, since=end_hour, until=query.until),
+            scope=scope,
+            local_tz=local_tz,
+        )
+    return True
+
+
+def _events_queryset(
+    scope: dict[str, Any],
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    before: datetime | None = None,
+) -> Any:
     events_qs = TradingEvent.objects.filter(
-        task_type=task_type_label,
-        task_id=task.pk,
-        execution_id=query.execution_id,
+        **scope,
         event_timestamp__isnull=False,
-        event_type__in=(OPEN_EVENT_TYPE, REBUILD_EVENT_TYPE, CLOSE_EVENT_TYPE),
+        event_type__in=ROLLUP_EVENT_TYPES,
     )
-    if query.since is not None:
-        events_qs = events_qs.filter(event_timestamp__gte=query.since)
-    if query.until is not None:
-        events_qs = events_qs.filter(event_timestamp__lte=query.until)
+    if since is not None:
+        events_qs = events_qs.filter(event_timestamp__gte=since)
+    if until is not None:
+        events_qs = events_qs.filter(event_timestamp__lte=until)
+    if before is not None:
+        events_qs = events_qs.filter(event_timestamp__lt=before)
+    return events_qs
+
+
+def _event_outcomes(
+    events_qs: Any,
+    *,
+    scope: dict[str, Any],
+) -> Iterator[tuple[datetime, str, int | Decimal]]:
+    """Yield ``(timestamp, outcome key, amount)`` for each counted event."""
+    close_event_by_position: dict[str, tuple[datetime, str]] = {}
 
     for event in (
         events_qs.order_by("event_timestamp", "sequence_number")
@@ -72,17 +284,17 @@ def build_periodic_trade_metrics(
             continue
 
         if event_type == OPEN_EVENT_TYPE:
-            _increment_all(buckets, event_timestamp, local_tz, "open_positions", 1)
+            yield event_timestamp, "open_positions", 1
             continue
         if event_type == REBUILD_EVENT_TYPE:
-            _increment_all(buckets, event_timestamp, local_tz, "rebuild_opens", 1)
+            yield event_timestamp, "rebuild_opens", 1
             continue
 
         close_reason = str(event["close_reason"] or "").strip().lower()
         if close_reason in TP_CLOSE_REASONS:
-            _increment_all(buckets, event_timestamp, local_tz, "tp_closes", 1)
+            yield event_timestamp, "tp_closes", 1
         elif close_reason in SL_CLOSE_REASONS:
-            _increment_all(buckets, event_timestamp, local_tz, "sl_closes", 1)
+            yield event_timestamp, "sl_closes", 1
         else:
             continue
 
@@ -91,35 +303,103 @@ def build_periodic_trade_metrics(
             close_event_by_position[str(position_id)] = (event_timestamp, close_reason)
 
     if close_event_by_position:
+        final_closes = _final_close_events(scope, close_event_by_position.keys())
         positions = Position.objects.filter(
-            task_type=task_type_label,
-            task_id=task.pk,
-            execution_id=query.execution_id,
+            **scope,
             id__in=close_event_by_position.keys(),
             is_open=False,
             exit_price__isnull=False,
         ).only("id", "direction", "units", "entry_price", "exit_price")
         for position in positions.iterator(chunk_size=5000):
             closed_at, close_reason = close_event_by_position[str(position.id)]
+            if final_closes.get(str(position.id)) != (closed_at, close_reason):
+                continue
             pnl = _realized_pnl(position)
             if pnl is None:
                 continue
             if close_reason in TP_CLOSE_REASONS:
-                _increment_all(buckets, closed_at, local_tz, "tp_profit", pnl)
+                yield closed_at, "tp_profit", pnl
             elif close_reason in SL_CLOSE_REASONS:
-                _increment_all(buckets, closed_at, local_tz, "sl_loss", pnl)
+                yield closed_at, "sl_loss", pnl
+
+
+def _final_close_events(
+    scope: dict[str, Any],
+    position_ids: Iterable[str],
+) -> dict[str, tuple[datetime, str]]:
+    """Return each position's last TP/SL close event across the whole execution.
+
+    A partially closed position has several close events, possibly in
+    different hours. Its PnL is counted once, at the last of them, so a scan
+    of one hour agrees with a scan of the whole execution.
+    """
+    final: dict[str, tuple[datetime, str]] = {}
+    events = (
+        TradingEvent.objects.filter(
+            **scope,
+            event_type=CLOSE_EVENT_TYPE,
+            event_timestamp__isnull=False,
+            position_id__in=list(position_ids),
+        )
+        .order_by("event_timestamp", "sequence_number")
+        .values("position_id", "close_reason", "event_timestamp")
+    )
+    for event in events.iterator(chunk_size=5000):
+        close_reason = str(event["close_reason"] or "").strip().lower()
+        event_timestamp = _aware_datetime(event["event_timestamp"])
+        if event_timestamp is None:
+            continue
+        if close_reason in TP_CLOSE_REASONS or close_reason in SL_CLOSE_REASONS:
+            final[str(event["position_id"])] = (event_timestamp, close_reason)
+    return final
 
-    return {
-        "execution_id": string_or_none(query.execution_id),
-        "strategy_type": str(getattr(task.config, "strategy_type", "") or ""),
-        "instrument": getattr(task, "instrument", None),
-        "currency": _quote_currency(task),
-        "timezone": getattr(local_tz, "key", "UTC"),
-        "periods": {
-            period: [_serialize_bucket(bucket) for bucket in sorted(values.values(), key=_bucket_t)]
-            for period, values in buckets.items()
-        },
-    }
+
+def _accumulate_events(
+    buckets: dict[str, dict[int, dict[str, Any]]],
+    events_qs: Any,
+    *,
+    scope: dict[str, Any],
+    local_tz: ZoneInfo,
+) -> None:
+    for timestamp, key, amount in _event_outcomes(events_qs, scope=scope):
+        _increment_all(buckets, timestamp, local_tz, key, amount)
+
+
+def _hourly_outcomes(
+    events_qs: Any,
+    *,
+    scope: dict[str, Any],
+) -> dict[datetime, dict[str, Any]]:
+    hours: dict[datetime, dict[str, Any]] = {}
+    for timestamp, key, amount in _event_outcomes(events_qs, scope=scope):
+        hour = _floor_hour(timestamp)
+        outcomes = hours.get(hour)
+        if outcomes is None:
+            outcomes = hours[hour] = {
+                "open_positions": 0,
+                "rebuild_opens": 0,
+                "tp_closes": 0,
+                "sl_closes": 0,
+                "tp_profit": Decimal("0"),
+                "sl_loss": Decimal("0"),
+            }
+        outcomes[key] += amount
+    return hours
+
+
+def _floor_hour(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(value: datetime) -> datetime:
+    floor = _floor_hour(value)
+    return floor if floor == value else floor + ONE_HOUR
+
+
+def _hour_aligned(hour: datetime, local_tz: ZoneInfo) -> bool:
+    """Whether a UTC hour falls entirely inside one local calendar hour."""
+    offset = hour.astimezone(local_tz).utcoffset()
+    return offset is not None and offset.total_seconds() % 3600 == 0
 
 
 def _increment_all(
@@ -23,7 +23,10 @@ from apps.market.services.oanda_retry import (
 from apps.trading.enums import Direction, TaskType
 from apps.trading.models import Position, TradingTask
 from apps.trading.models.state import ExecutionState
-from apps.trading.services.broker_snapshot import BrokerSnapshotLoader
+from apps.trading.services.broker_snapshot import (
+    BrokerSnapshotLoader,
+    SharedBrokerSnapshotCache,
+)
 from apps.trading.utils import Instrument
 
 logger: Logger = getLogger(name=__name__)
@@ -158,6 +161,7 @@ class TradingResumeReconciler:
         self.broker_snapshot = BrokerSnapshotLoader(
             broker_service=self.oanda_service,
             request_runner=self._oanda_call,
+            shared_cache=SharedBrokerSnapshotCache.for_account(task.oanda_account),
         )
 
     def _oanda_call(
@@ -187,6 +191,7 @@ class TradingResumeReconciler:
         self.broker_snapshot = BrokerSnapshotLoader(
             broker_service=self.oanda_service,
             request_runner=self._oanda_call,
+            shared_cache=SharedBrokerSnapshotCache.for_account(self.task.oanda_account),
         )
         return self.broker_snapshot
 
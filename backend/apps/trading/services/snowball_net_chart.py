@@ -29,6 +29,12 @@ from apps.market.services.oanda_candles import (
 from apps.trading.models.metrics import Metrics
 from apps.trading.models.positions import Position
 from apps.trading.models.trades import Trade
+from apps.trading.services.net_chart_buckets import (
+    NET_CHART_GRANULARITIES_SECONDS,
+    bucket_start,
+    load_net_chart_metric_rows,
+    net_chart_coverage_start,
+)
 from apps.trading.services.strategy_data_common import (
     granularity_seconds,
     parse_datetime,
@@ -45,6 +51,9 @@ MAX_SIDE_BARS = 2000
 OANDA_CANDLE_MAX_BATCH = 5000
 OANDA_CANDLE_PARSER = OandaCandleParser()
 OANDA_CANDLE_HISTORY = OandaCandleHistoryService(parser=OANDA_CANDLE_PARSER)
+NET_CHART_GRANULARITY_BY_SECONDS = {
+    seconds: granularity for granularity, seconds in NET_CHART_GRANULARITIES_SECONDS.items()
+}
 
 
 class OandaCandleUnavailable(APIException):
@@ -566,7 +575,7 @@ def _load_metric_buckets(
     until: datetime,
     granularity_seconds: int,
 ) -> dict[int, dict[str, Decimal]]:
-    rows = _load_metric_rows_for_buckets(
+    rows = _load_chart_metric_rows(
         task=task,
         task_type_label=task_type_label,
         execution_id=execution_id,
@@ -598,6 +607,63 @@ def _load_metric_buckets(
     return buckets
 
 
+def _load_chart_metric_rows(
+    *,
+    task: Any,
+    task_type_label: str,
+    execution_id: Any,
+    since: datetime,
+    until: datetime,
+    granularity_seconds: int,
+) -> list[tuple[datetime, Any]]:
+    """Load the latest metrics row per bucket, preferring precomputed buckets.
+
+    Buckets lying entirely inside the window come from ``NetChartBucket``;
+    the partial buckets at either edge are scanned from ``Metrics`` so they
+    only reflect rows inside the window. Windows whose metrics predate the
+    precomputed rows fall back to scanning ``Metrics`` entirely.
+    """
+    scan = {
+        "task": task,
+        "task_type_label": task_type_label,
+        "execution_id": execution_id,
+        "granularity_seconds": granularity_seconds,
+    }
+    granularity = NET_CHART_GRANULARITY_BY_SECONDS.get(granularity_seconds)
+    first_full = bucket_start(since, granularity_seconds)
+    if first_full < since:
+        first_full += timedelta(seconds=granularity_seconds)
+    last_start = bucket_start(until, granularity_seconds)
+    if granularity is None or first_full >= last_start:
+        return list(_load_metric_rows_for_buckets(**scan, since=since, until=until))
+
+    scope = {"task_type": task_type_label, "task_id": task.pk, "execution_id": execution_id}
+    coverage_start = net_chart_coverage_start(**scope, granularity="M1")
+    first_metric = (
+        Metrics.objects.filter(**scope, timestamp__gte=first_full, timestamp__lt=last_start)
+        .order_by("timestamp")
+        .values_list("timestamp", flat=True)
+        .first()
+    )
+    if first_metric is not None and (coverage_start is None or coverage_start > first_metric):
+        return list(_load_metric_rows_for_buckets(**scan, since=since, until=until))
+
+    rows: list[tuple[datetime, Any]] = []
+    if since < first_full:
+        rows.extend(
+            _load_metric_rows_for_buckets(
+                **scan, since=since, until=first_full - timedelta(microseconds=1)
+            )
+        )
+    rows.extend(
+        load_net_chart_metric_rows(
+            **scope, granularity=granularity, since=first_full, until=last_start
+        )
+    )
+    rows.extend(_load_metric_rows_for_buckets(**scan, since=last_start, until=until))
+    return rows
+
+
 def _load_metric_rows_for_buckets(
     *,
     task: Any,
@@ -5,7 +5,9 @@ filtering, and sorting.  The service has two modes:
 
 * **List mode** (no ``cycle_id``): returns a page of cycles with lightweight
   per-cycle aggregates (counts, PnL, grid_state) plus an overall ``summary``
-  computed after filters are applied.  Individual trades are **not** included.
+  computed after filters are applied.  Aggregates are read from the
+  materialized ``TradeCycleSummary`` table, so sorting and pagination are
+  indexed queries.  Individual trades are **not** included.
 * **Detail mode** (``cycle_id`` supplied): returns a single cycle aggregate.
   The full trade ledger is only serialised when ``include_trades`` is true;
   ordinary detail screens should use the paginated trades endpoint.
@@ -16,15 +18,21 @@ Heavy full-trade serialisation is therefore avoided on every list render.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import Any
 from uuid import NAMESPACE_URL, UUID, uuid5
 
+from django.db import connection
 from django.db.models import Q
 
-from apps.trading.services.strategy_grid_state import build_cycle_grid_state_map
+from apps.trading.services.strategy_grid_state import (
+    cached_state_projection,
+    load_cycle_grid_state_map,
+    state_projection_cache_key,
+)
 
 # Execution methods we treat as opening a slot in the cycle grid.
 _OPEN_METHODS: frozenset[str] = frozenset({"open_position", "rebuild_position"})
@@ -34,6 +42,31 @@ _PROTECTION_METHODS: frozenset[str] = frozenset(
     {"volatility_lock", "margin_protection", "shrink", "stop_loss"}
 )
 
+# Trade columns folded into list-mode cycle aggregates and cycle summaries.
+_AGGREGATE_TRADE_FIELDS: tuple[str, ...] = (
+    "id",
+    "cycle_id",
+    "direction",
+    "units",
+    "price",
+    "execution_method",
+    "layer_index",
+    "retracement_count",
+    "timestamp",
+    "position_id",
+    "is_rebuild",
+    "is_initial_position_seed",
+)
+
+# Raw ``strategy_state`` cycle fields kept in the cached state-cycle projection.
+_STATE_CYCLE_FIELDS: tuple[str, ...] = (
+    "cycle_id",
+    "trade_cycle_id",
+    "is_initial_position_seed",
+    "direction",
+    "status",
+)
+
 # Minimum number of characters required for substring filters on UUIDs to
 # keep the query cheap while still being useful for search-by-prefix.
 _MIN_ID_FILTER_LENGTH = 3
@@ -77,27 +110,42 @@ class StrategyCyclesService:
             task_id=str(task.pk),
             execution_id=str(execution_id),
         )
-        strategy_state = (
-            execution_state.get("strategy_state")
-            if isinstance(execution_state.get("strategy_state"), dict)
-            else None
+        load_strategy_state = _strategy_state_loader(
+            task_type=task_type,
+            task_id=str(task.pk),
+            execution_id=str(execution_id),
         )
         strategy_type = str(getattr(task.config, "strategy_type", "") or "")
         strategy_capabilities = _load_strategy_capabilities(strategy_type)
         last_tick_ts = _resolve_last_tick_timestamp(execution_state)
-        cycle_status_map = _load_cycle_statuses(
-            strategy_type=strategy_type,
-            strategy_state=strategy_state,
+        cache_scope = {
+            "strategy_type": strategy_type,
+            "task_type": task_type,
+            "task_id": str(task.pk),
+            "execution_id": str(execution_id),
+            "execution_state": execution_state,
+        }
+        cycle_status_map = cached_state_projection(
+            state_projection_cache_key("cycle_status", **cache_scope),
+            lambda: _load_cycle_statuses(
+                strategy_type=strategy_type,
+                strategy_state=load_strategy_state(),
+            ),
         )
-        cycle_grid_state_map = build_cycle_grid_state_map(
+        cycle_grid_state_map = load_cycle_grid_state_map(
             strategy_type=strategy_type,
-            strategy_state=strategy_state,
+            load_strategy_state=load_strategy_state,
+            cache_key=state_projection_cache_key("cycle_grid_state", **cache_scope),
+        )
+        state_cycles = cached_state_projection(
+            state_projection_cache_key("state_cycles", **cache_scope),
+            lambda: _state_cycle_rows(load_strategy_state()),
         )
         state_cycle_meta_by_id = _load_state_initial_cycle_meta(
             task=task,
             task_type=task_type,
             execution_id=str(execution_id),
-            strategy_state=strategy_state,
+            state_cycles=state_cycles,
             cycle_grid_state_map=cycle_grid_state_map,
         )
         if state_cycle_meta_by_id:
@@ -286,15 +334,22 @@ class StrategyCyclesService:
         position_id_filter: str,
         trade_id_filter: str,
     ) -> dict[str, Any]:
-        # Step 1: find all cycle_ids belonging to this execution along with
-        # a started_at anchor (the min timestamp in the cycle).
-        cycle_meta = _load_cycle_started_at_map(
-            task_type=task_type,
-            task_id=str(task.pk),
-            execution_id=execution_id,
+        from apps.trading.services.cycle_summaries import (
+            ensure_cycle_summaries,
+            summary_aggregate,
         )
-        cycle_meta = _merge_state_only_cycle_meta(
-            cycle_meta=cycle_meta,
+
+        task_id = str(task.pk)
+        scope = {"task_type": task_type, "task_id": task_id, "execution_id": execution_id}
+
+        # Step 1: the cycle universe comes from the materialized summary
+        # table (one row per cycle) so ordering and filtering never fold
+        # the execution's trades.  Executions recorded before the table
+        # existed are backfilled once here.
+        ensure_cycle_summaries(**scope)
+        summaries = _cycle_summary_queryset(**scope)
+        state_only = _state_only_cycles(
+            summaries=summaries,
             state_cycle_meta_by_id=state_cycle_meta_by_id,
         )
 
@@ -304,83 +359,75 @@ class StrategyCyclesService:
         # length to avoid accidentally returning every cycle.
         allowed_cycle_ids: set[str] | None = None
         if len(position_id_filter) >= _MIN_ID_FILTER_LENGTH:
-            matched = _cycle_ids_with_position_id_like(
-                task_type=task_type,
-                task_id=str(task.pk),
-                execution_id=execution_id,
-                needle=position_id_filter,
-            )
+            matched = _cycle_ids_with_position_id_like(**scope, needle=position_id_filter)
             allowed_cycle_ids = (
                 matched if allowed_cycle_ids is None else allowed_cycle_ids & matched
             )
         if len(trade_id_filter) >= _MIN_ID_FILTER_LENGTH:
-            matched = _cycle_ids_with_trade_id_like(
-                task_type=task_type,
-                task_id=str(task.pk),
-                execution_id=execution_id,
-                needle=trade_id_filter,
-            )
+            matched = _cycle_ids_with_trade_id_like(**scope, needle=trade_id_filter)
             allowed_cycle_ids = (
                 matched if allowed_cycle_ids is None else allowed_cycle_ids & matched
             )
+        if allowed_cycle_ids is not None:
+            summaries = summaries.filter(cycle_id__in=_uuid_values(allowed_cycle_ids))
+            state_only = [item for item in state_only if item[0] in allowed_cycle_ids]
 
-        # Step 3: build the candidate id list (id filters + ordering only).
-        candidate_cycle_ids: list[str] = []
-        for cid, _started_at in cycle_meta:
-            if allowed_cycle_ids is not None and cid not in allowed_cycle_ids:
-                continue
-            candidate_cycle_ids.append(cid)
-
-        # Step 4: apply status filter.  Status requires aggregated trade
-        # data for cycles lacking an authoritative entry in the strategy
-        # state, so we resolve status lazily per cycle using the aggregate
-        # fallback.  To avoid loading aggregates for every cycle when no
-        # status filter is applied, we only do this work when filtering.
+        # Step 3: apply the status filter.  Authoritative statuses from the
+        # strategy state win; every other cycle uses the trade-derived
+        # status stored on its summary row.
         if status_filter != "all":
-            status_filtered_ids = _filter_cycle_ids_by_status(
-                task_type=task_type,
-                task_id=str(task.pk),
-                execution_id=execution_id,
-                cycle_ids=candidate_cycle_ids,
-                cycle_status_map=cycle_status_map,
-                status_filter=status_filter,
-            )
-        else:
-            status_filtered_ids = candidate_cycle_ids
-
-        if sort == "desc":
-            status_filtered_ids = list(reversed(status_filtered_ids))
-
-        total_count = len(status_filtered_ids)
-        total_pages = (total_count + page_size - 1) // page_size if total_count else 0
+            summaries = summaries.filter(_summary_status_q(status_filter, cycle_status_map))
+            state_only = [
+                item
+                for item in state_only
+                if cycle_status_map.get(item[0], "completed") == status_filter
+            ]
+
+        # Step 4: sort and paginate with indexed queries.
         safe_page = max(1, page)
-        start_index = (safe_page - 1) * page_size
-        end_index = start_index + page_size
-        page_cycle_ids = status_filtered_ids[start_index:end_index]
-
-        # Step 5: load a lightweight trade slice for the cycles on this
-        # page only.  We need trades for PnL/unit counting and grid
-        # reconstruction, not for rendering — so we skip description /
-        # metrics columns to keep the payload small.
-        aggregates = _load_cycle_aggregates(
-            task_type=task_type,
-            task_id=str(task.pk),
-            execution_id=execution_id,
-            cycle_ids=page_cycle_ids,
+        total_count, page_cycle_ids = _paginate_cycle_summaries(
+            summaries=summaries,
+            state_only=state_only,
+            descending=sort == "desc",
+            offset=(safe_page - 1) * page_size,
+            limit=page_size,
         )
+        total_pages = (total_count + page_size - 1) // page_size if total_count else 0
+
+        # Step 5: build the page from its summary rows.  Trades are still
+        # loaded for the page's cycles only, to overlay slot history onto
+        # the grid state.
+        summary_by_id = {
+            str(summary.cycle_id): summary
+            for summary in _cycle_summary_queryset(**scope).filter(
+                cycle_id__in=_uuid_values(page_cycle_ids)
+            )
+        }
+        aggregate_by_id = {
+            cid: (
+                summary_aggregate(summary_by_id[cid])
+                if cid in summary_by_id
+                else _aggregate_cycle(cid, [])
+            )
+            for cid in page_cycle_ids
+        }
+        trades_by_cycle = _load_cycle_trades(**scope, cycle_ids=list(summary_by_id))
+        still_open_position_ids: set[str] = set()
+        for aggregate in aggregate_by_id.values():
+            still_open_position_ids.update(aggregate["still_open_position_ids"])
         unrealized_pnl_by_position = _load_unrealized_pnl_map_for_position_ids(
-            aggregates.still_open_position_ids
+            still_open_position_ids
         )
 
         cycles = [
             _build_list_cycle(
                 cycle_id=cid,
-                aggregate=aggregates.per_cycle[cid],
+                aggregate=aggregate_by_id[cid],
                 authoritative_status=cycle_status_map.get(cid),
                 grid_state=_merge_grid_state_with_trade_history(
                     cycle_id=cid,
                     grid_state=cycle_grid_state_map.get(cid),
-                    trades=aggregates.trades_by_cycle.get(cid, []),
+                    trades=trades_by_cycle.get(cid, []),
                 ),
                 state_meta=state_cycle_meta_by_id.get(cid),
                 unrealized_pnl_by_position=unrealized_pnl_by_position,
@@ -392,12 +439,10 @@ class StrategyCyclesService:
         # Step 6: summary counts over the full filtered universe.  Counts
         # come from the same cycle universe we paginated over so numbers
         # stay self-consistent.
-        summary = _build_filtered_summary(
-            cycle_ids=status_filtered_ids,
+        summary = _summarize_cycle_summaries(
+            summaries=summaries,
+            state_only=state_only,
             cycle_status_map=cycle_status_map,
-            task_type=task_type,
-            task_id=str(task.pk),
-            execution_id=execution_id,
         )
 
         return {
@@ -439,7 +484,11 @@ def _load_execution_state_snapshot(
     task_id: str,
     execution_id: str,
 ) -> dict[str, Any]:
-    """Return the execution-state fields needed for strategy visualization."""
+    """Return the execution-state revision fields needed for strategy visualization.
+
+    ``strategy_state`` is left out; :func:`_strategy_state_loader` reads it
+    only when a cached projection misses.
+    """
     from apps.trading.models.state import ExecutionState as ExecutionStateModel
 
     row = (
@@ -448,12 +497,59 @@ def _load_execution_state_snapshot(
             task_id=task_id,
             execution_id=execution_id,
         )
-        .values("strategy_state", "last_tick_timestamp")
+        .values("last_tick_timestamp", "state_version", "updated_at")
         .first()
     )
     return row or {}
 
 
+def _strategy_state_loader(
+    *,
+    task_type: str,
+    task_id: str,
+    execution_id: str,
+) -> Callable[[], dict[str, Any] | None]:
+    """Return a loader that reads ``strategy_state`` at most once per request."""
+    from apps.trading.models.state import ExecutionState as ExecutionStateModel
+
+    loaded: list[dict[str, Any] | None] = []
+
+    def load() -> dict[str, Any] | None:
+        if not loaded:
+            value = (
+                ExecutionStateModel.objects.filter(
+                    task_type=task_type,
+                    task_id=task_id,
+                    execution_id=execution_id,
+                )
+                .values_list("strategy_state", flat=True)
+                .first()
+            )
+            loaded.append(value if isinstance(value, dict) else None)
+        return loaded[0]
+
+    return load
+
+
+def _state_cycle_rows(strategy_state: dict[str, Any] | None) -> list[dict[str, Any] | None]:
+    """Project the per-cycle fields read by :func:`_load_state_initial_cycle_meta`.
+
+    Non-dict cycles stay as None placeholders so list positions keep matching
+    the state's cycle order.
+    """
+    if not isinstance(strategy_state, dict):
+        return []
+    raw_cycles = strategy_state.get("cycles")
+    if not isinstance(raw_cycles, list):
+        return []
+    return [
+        {field: raw_cycle.get(field) for field in _STATE_CYCLE_FIELDS}
+        if isinstance(raw_cycle, dict)
+        else None
+        for raw_cycle in raw_cycles
+    ]
+
+
 def _public_strategy_state(
     strategy_type: str,
     strategy_state: dict[str, Any] | None,
@@ -480,7 +576,7 @@ def _load_state_initial_cycle_meta(
     task: Any,
     task_type: str,
     execution_id: str,
-    strategy_state: dict[str, Any] | None,
+    state_cycles: list[dict[str, Any] | None],
     cycle_grid_state_map: dict[str, dict[str, Any]],
 ) -> dict[str, _StateCycleMeta]:
     """Return initial-position cycle metadata persisted in Snowball state.
@@ -489,16 +585,12 @@ def _load_state_initial_cycle_meta(
     Snowball state but do not create Trade rows, so the strategy page needs a
     state-derived cycle row to make them visible and identifiable.
     """
-    if not isinstance(strategy_state, dict):
-        return {}
-
-    raw_cycles = strategy_state.get("cycles")
-    if not isinstance(raw_cycles, list):
+    if not state_cycles:
         return {}
 
     legacy_initial_cycle_count = _legacy_initial_cycle_count(task)
     result: dict[str, _StateCycleMeta] = {}
-    for index, raw_cycle in enumerate(raw_cycles):
+    for index, raw_cycle in enumerate(state_cycles):
         if not isinstance(raw_cycle, dict):
             continue
 
@@ -569,30 +661,34 @@ def _initial_state_cycle_started_at(*, task: Any, index: int) -> datetime | None
     return start_time - timedelta(seconds=1) + timedelta(microseconds=index)
 
 
-def _merge_state_only_cycle_meta(
+def _state_cycle_sort_key(item: tuple[str, datetime | None]) -> tuple[bool, str, str]:
+    cycle_id, started_at = item
+    return (started_at is None, started_at.isoformat() if started_at else "", cycle_id)
+
+
+def _state_only_cycles(
     *,
-    cycle_meta: list[tuple[str, Any]],
+    summaries: Any,
     state_cycle_meta_by_id: dict[str, _StateCycleMeta],
-) -> list[tuple[str, Any]]:
+) -> list[tuple[str, datetime | None]]:
+    """Return ``[(cycle_id, started_at)]`` for state cycles that have no trades yet."""
     if not state_cycle_meta_by_id:
-        return cycle_meta
-
-    seen = {cycle_id for cycle_id, _started_at in cycle_meta}
-    state_only = [
-        (meta.public_id, meta.started_at)
-        for meta in state_cycle_meta_by_id.values()
-        if meta.public_id not in seen
-    ]
-    if not state_only:
-        return cycle_meta
+        return []
 
+    public_ids = {meta.public_id for meta in state_cycle_meta_by_id.values()}
+    seen = {
+        str(cid)
+        for cid in summaries.filter(cycle_id__in=_uuid_values(public_ids)).values_list(
+            "cycle_id", flat=True
+        )
+    }
     return sorted(
-        [*state_only, *cycle_meta],
-        key=lambda item: (
-            item[1] is None,
-            item[1].isoformat() if item[1] else "",
-            item[0],
-        ),
+        {
+            meta.public_id: meta.started_at
+            for meta in state_cycle_meta_by_id.values()
+            if meta.public_id not in seen
+        }.items(),
+        key=_state_cycle_sort_key,
     )
 
 
@@ -675,29 +771,25 @@ def _load_metrics_for_trades(
     return result
 
 
-def _load_cycle_started_at_map(
-    *,
-    task_type: str,
-    task_id: str,
-    execution_id: str,
-) -> list[tuple[str, Any]]:
-    """Return [(cycle_id, started_at)] sorted by started_at ascending."""
-    from django.db.models import Min
+def _uuid_values(values: Any) -> list[UUID]:
+    """Parse ``values`` as UUIDs, skipping ids that cannot match a cycle_id column."""
+    parsed: list[UUID] = []
+    for value in values:
+        try:
+            parsed.append(UUID(str(value)))
+        except ValueError:
+            continue
+    return parsed
 
-    from apps.trading.models.trades import Trade
 
-    rows = (
-        Trade.objects.filter(
-            task_type=task_type,
-            task_id=task_id,
-            execution_id=execution_id,
-            cycle_id__isnull=False,
-        )
-        .values("cycle_id")
-        .annotate(started_at=Min("timestamp"))
-        .order_by("started_at")
+def _cycle_summary_queryset(*, task_type: str, task_id: str, execution_id: str) -> Any:
+    from apps.trading.models.trades import TradeCycleSummary
+
+    return TradeCycleSummary.objects.filter(
+        task_type=task_type,
+        task_id=task_id,
+        execution_id=execution_id,
     )
-    return [(str(row["cycle_id"]), row["started_at"]) for row in rows]
 
 
 def _cycle_ids_with_position_id_like(
@@ -721,7 +813,9 @@ def _cycle_ids_with_position_id_like(
         )
         .annotate(position_id_text=Cast("position_id", output_field=TextField()))
         .filter(_position_id_icontains_q(needle))
+        .order_by()
         .values_list("cycle_id", flat=True)
+        .distinct()
     )
     return {str(cid) for cid in rows}
 
@@ -747,51 +841,85 @@ def _cycle_ids_with_trade_id_like(
         )
         .annotate(id_text=Cast("id", output_field=TextField()))
         .filter(_trade_id_icontains_q(needle))
+        .order_by()
         .values_list("cycle_id", flat=True)
+        .distinct()
     )
     return {str(cid) for cid in rows}
 
 
-def _filter_cycle_ids_by_status(
+def _summary_status_q(status_filter: str, cycle_status_map: dict[str, str]) -> Q:
+    """Match summaries whose resolved status equals ``status_filter``.
+
+    Cycles present in the authoritative map are matched on that status;
+    all other cycles fall back to the trade-derived status column.
+    """
+    matching = _uuid_values(
+        cid for cid, status in cycle_status_map.items() if status == status_filter
+    )
+    authoritative = _uuid_values(cycle_status_map)
+    return Q(cycle_id__in=matching) | (Q(status=status_filter) & ~Q(cycle_id__in=authoritative))
+
+
+def _paginate_cycle_summaries(
     *,
-    task_type: str,
-    task_id: str,
-    execution_id: str,
-    cycle_ids: list[str],
-    cycle_status_map: dict[str, str],
-    status_filter: str,
-) -> list[str]:
-    """Return the subset of ``cycle_ids`` whose resolved status matches.
-
-    Cycles present in the authoritative map are resolved with a cheap
-    dict lookup.  Cycles without an authoritative entry have their
-    status derived from trade aggregates; those cycles are loaded in a
-    single follow-up query.
+    summaries: Any,
+    state_only: list[tuple[str, datetime | None]],
+    descending: bool,
+    offset: int,
+    limit: int,
+) -> tuple[int, list[str]]:
+    """Return ``(total_count, page cycle ids)`` ordered by started_at.
+
+    Summary rows are sliced in SQL.  State-only cycles (few, and not in
+    the table) are ranked among them with one count query each and the
+    SQL slice is shifted around the ones that land before or on the page.
     """
-    authoritative_matches: list[str] = []
-    unresolved_cycle_ids: list[str] = []
-    for cid in cycle_ids:
-        if cid in cycle_status_map:
-            if cycle_status_map[cid] == status_filter:
-                authoritative_matches.append(cid)
+    ordering = ("-started_at", "-cycle_id") if descending else ("started_at", "cycle_id")
+    ordered_ids = summaries.order_by(*ordering).values_list("cycle_id", flat=True)
+    summary_count = summaries.count()
+    if not state_only:
+        return summary_count, [str(cid) for cid in ordered_ids[offset : offset + limit]]
+
+    extras = sorted(state_only, key=_state_cycle_sort_key, reverse=descending)
+    extra_by_rank: dict[int, str] = {}
+    for index, (cycle_id, started_at) in enumerate(extras):
+        if started_at is None:
+            before = 0 if descending else summary_count
+        elif descending:
+            before = summaries.filter(started_at__gt=started_at).count()
         else:
-            unresolved_cycle_ids.append(cid)
+            before = summaries.filter(started_at__lte=started_at).count()
+        extra_by_rank[before + index] = cycle_id
+
+    total_count = summary_count + len(extras)
+    page_ranks = range(offset, min(offset + limit, total_count))
+    summary_offset = offset - sum(1 for rank in extra_by_rank if rank < offset)
+    summary_slots = sum(1 for rank in page_ranks if rank not in extra_by_rank)
+    page_summary_ids = iter(
+        [str(cid) for cid in ordered_ids[summary_offset : summary_offset + summary_slots]]
+        if summary_slots
+        else []
+    )
+    return total_count, [
+        extra_by_rank[rank] if rank in extra_by_rank else next(page_summary_ids)
+        for rank in page_ranks
+    ]
 
-    fallback_matches: list[str] = []
-    if unresolved_cycle_ids:
-        aggregates = _load_cycle_aggregates(
-            task_type=task_type,
-            task_id=task_id,
-            execution_id=execution_id,
-            cycle_ids=unresolved_cycle_ids,
-        )
-        for cid in unresolved_cycle_ids:
-            status = _resolve_cycle_status(aggregates.per_cycle[cid], None)
-            if status == status_filter:
-                fallback_matches.append(cid)
 
-    matched = set(authoritative_matches) | set(fallback_matches)
-    return [cid for cid in cycle_ids if cid in matched]
+def _id_text_lookup(needle: str) -> tuple[str, str]:
+    """Return ``(lookup, value)`` for a substring filter on a UUID cast to text.
+
+    On PostgreSQL the ``::text`` casts of ``trades.position_id`` and
+    ``trades.id`` carry ``pg_trgm`` GIN indexes (migration 0075).  UUID text
+    is always lowercase, so a case-sensitive ``LIKE`` on the lowercased
+    needle matches the same rows as ``icontains`` while staying indexable;
+    the ``UPPER(...) LIKE`` that ``icontains`` emits would not match the
+    index expression.  Other backends keep ``icontains``.
+    """
+    if connection.vendor == "postgresql":
+        return "contains", needle.lower()
+    return "icontains", needle
 
 
 def _position_id_icontains_q(needle: str) -> Q:
@@ -801,54 +929,30 @@ def _position_id_icontains_q(needle: str) -> Q:
     ``__icontains`` on it is rejected by Django.  We cast to text via an
     annotation instead (the caller is expected to do the cast).
     """
-    return Q(position_id_text__icontains=needle)
+    lookup, value = _id_text_lookup(needle)
+    return Q(**{f"position_id_text__{lookup}": value})
 
 
 def _trade_id_icontains_q(needle: str) -> Q:
     """Build a Q object that matches Trade IDs containing ``needle``."""
-    return Q(id_text__icontains=needle)
-
+    lookup, value = _id_text_lookup(needle)
+    return Q(**{f"id_text__{lookup}": value})
 
-class _CycleAggregates:
-    """Lightweight container of per-cycle aggregate data for list mode."""
 
-    __slots__ = ("per_cycle", "still_open_position_ids", "trades_by_cycle")
-
-    def __init__(
-        self,
-        per_cycle: dict[str, dict[str, Any]],
-        still_open_position_ids: set[str],
-        trades_by_cycle: dict[str, list[dict[str, Any]]] | None = None,
-    ) -> None:
-        self.per_cycle = per_cycle
-        self.still_open_position_ids = still_open_position_ids
-        self.trades_by_cycle = trades_by_cycle or {}
-
-
-def _load_cycle_aggregates(
+def _load_cycle_trades(
     *,
     task_type: str,
     task_id: str,
     execution_id: str,
     cycle_ids: list[str],
-) -> _CycleAggregates:
-    """Load the trade slice needed for list-mode aggregates.
-
-    Returns a container holding per-cycle aggregate dicts ready for
-    :func:`_build_list_cycle`.  Only the minimum set of columns is loaded
-    since list rendering never displays individual trades.
-    """
+) -> dict[str, list[dict[str, Any]]]:
+    """Load the lightweight trade slice of ``cycle_ids`` grouped by cycle."""
     from apps.trading.models.trades import Trade
 
-    per_cycle: dict[str, dict[str, Any]] = {}
-    still_open_position_ids: set[str] = set()
-
     if not cycle_ids:
-        return _CycleAggregates(
-            per_cycle=per_cycle, still_open_position_ids=still_open_position_ids
-        )
+        return {}
 
-    rows = list(
+    rows = (
         Trade.objects.filter(
             task_type=task_type,
             task_id=task_id,
@@ -856,37 +960,12 @@ def _load_cycle_aggregates(
             cycle_id__in=cycle_ids,
         )
         .order_by("timestamp")
-        .values(
-            "id",
-            "cycle_id",
-            "direction",
-            "units",
-            "price",
-            "execution_method",
-            "layer_index",
-            "retracement_count",
-            "timestamp",
-            "position_id",
-            "is_rebuild",
-            "is_initial_position_seed",
-        )
+        .values(*_AGGREGATE_TRADE_FIELDS)
     )
-
     by_cycle: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for row in rows:
         by_cycle[str(row["cycle_id"])].append(row)
-
-    for cid in cycle_ids:
-        trades = by_cycle.get(cid, [])
-        aggregate = _aggregate_cycle(cid, trades)
-        per_cycle[cid] = aggregate
-        still_open_position_ids.update(aggregate["still_open_position_ids"])
-
-    return _CycleAggregates(
-        per_cycle=per_cycle,
-        still_open_position_ids=still_open_position_ids,
-        trades_by_cycle=dict(by_cycle),
-    )
+    return dict(by_cycle)
 
 
 def _aggregate_cycle(cycle_id: str, trades: list[dict[str, Any]]) -> dict[str, Any]:
@@ -1495,76 +1574,58 @@ def _build_summary(cycles: list[dict[str, Any]]) -> dict[str, int]:
     }
 
 
-def _build_filtered_summary(
+def _summarize_cycle_summaries(
     *,
-    cycle_ids: list[str],
+    summaries: Any,
+    state_only: list[tuple[str, datetime | None]],
     cycle_status_map: dict[str, str],
-    task_type: str,
-    task_id: str,
-    execution_id: str,
 ) -> dict[str, int]:
     """Summary counts over the filtered cycle universe.
 
     Authoritative statuses from ``cycle_status_map`` are used where
-    available; cycles without an entry fall back to the aggregate-based
-    resolution used for list rendering.
+    available; every other cycle is counted by its summary status.
     """
-    from django.db.models import Count
+    from django.db.models import Count, Sum
 
-    from apps.trading.models.trades import Trade
+    counts = {"active": 0, "pending": 0, "completed": 0}
+    cycle_count = len(state_only)
+    authoritative = _uuid_values(cycle_status_map)
+
+    derived_rows = (
+        summaries.exclude(cycle_id__in=authoritative)
+        .order_by()
+        .values("status")
+        .annotate(count=Count("id"))
+    )
+    for row in derived_rows:
+        cycle_count += row["count"]
+        status = row["status"] if row["status"] in counts else "completed"
+        counts[status] += row["count"]
+
+    authoritative_ids = [
+        str(cid)
+        for cid in summaries.filter(cycle_id__in=authoritative).values_list("cycle_id", flat=True)
+    ]
+    cycle_count += len(authoritative_ids)
+    for cid in authoritative_ids:
+        status = cycle_status_map.get(cid)
+        if status in counts:
+            counts[status] += 1
+    for cid, _started_at in state_only:
+        status = cycle_status_map.get(cid, "completed")
+        if status in counts:
+            counts[status] += 1
 
-    cycle_count = len(cycle_ids)
     if cycle_count == 0:
         return _empty_summary()
 
-    active_count = 0
-    pending_count = 0
-    completed_count = 0
-    unresolved_cycle_ids: list[str] = []
-    for cid in cycle_ids:
-        status = cycle_status_map.get(cid)
-        if status == "active":
-            active_count += 1
-        elif status == "pending":
-            pending_count += 1
-        elif status == "completed":
-            completed_count += 1
-        elif status is None:
-            unresolved_cycle_ids.append(cid)
-
-    if unresolved_cycle_ids:
-        aggregates = _load_cycle_aggregates(
-            task_type=task_type,
-            task_id=task_id,
-            execution_id=execution_id,
-            cycle_ids=unresolved_cycle_ids,
-        )
-        for cid in unresolved_cycle_ids:
-            status = _resolve_cycle_status(aggregates.per_cycle[cid], None)
-            if status == "active":
-                active_count += 1
-            elif status == "pending":
-                pending_count += 1
-            else:
-                completed_count += 1
-
-    total_trades = (
-        Trade.objects.filter(
-            task_type=task_type,
-            task_id=task_id,
-            execution_id=execution_id,
-            cycle_id__in=cycle_ids,
-        )
-        .aggregate(total=Count("id"))
-        .get("total")
-        or 0
-    )
+    total_trades = summaries.aggregate(total=Sum("trade_count")).get("total") or 0
 
     return {
         "cycle_count": cycle_count,
-        "active_count": active_count,
-        "pending_count": pending_count,
-        "completed_count": completed_count,
+        "active_count": counts["active"],
+        "pending_count": counts["pending"],
+        "completed_count": counts["completed"],
         "total_trades": total_trades,
     }
 
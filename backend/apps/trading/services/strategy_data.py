@@ -12,15 +12,15 @@ from apps.trading.services.strategy_data_common import (
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
     StrategyDataQuery,
+    cursor_envelope,
     normalise_granularity,
-    page_rows,
     pagination_envelope,
     pagination_envelope_from_page,
     parse_datetime,
     positive_int,
     string_or_none,
 )
-from apps.trading.services.strategy_history import apply_history_filters, load_history_rows
+from apps.trading.services.strategy_history import load_history_page
 from apps.trading.services.strategy_metrics import (
     build_ohlc_layers,
     load_latest_metric_point,
@@ -50,21 +50,29 @@ class StrategyDataService:
     def history(self, *, request: Request, task: Any, task_type_label: str) -> dict[str, Any]:
         query = _query_from_request(request, default_execution_id=task.execution_id)
         context = _load_context(task=task, task_type_label=task_type_label, query=query)
-        rows = load_history_rows(
-            task=task,
-            task_type_label=task_type_label,
-            query=query,
-            strategy_type=context["strategy_type"],
-            strategy_state=context["strategy_state"],
-        )
-        rows = apply_history_filters(rows, query)
-        rows, pagination = page_rows(request=request, rows=rows, query=query)
+        page = load_history_page(task=task, task_type_label=task_type_label, query=query)
+        if query.cursor is not None:
+            pagination = cursor_envelope(
+                request=request,
+                query=query,
+                next_cursor=page.next_cursor,
+                previous_cursor=page.previous_cursor,
+            )
+        elif page.count is not None:
+            pagination = pagination_envelope(request=request, total=page.count, query=query)
+        else:
+            pagination = pagination_envelope_from_page(
+                request=request,
+                query=query,
+                rows_returned=len(page.rows),
+                has_next=page.has_next,
+            )
         return {
             "execution_id": string_or_none(query.execution_id),
             "strategy_type": context["strategy_type"],
             "instrument": getattr(task, "instrument", None),
             **pagination,
-            "results": rows,
+            "results": page.rows,
         }
 
     def metrics(self, *, request: Request, task: Any, task_type_label: str) -> dict[str, Any]:
@@ -211,6 +219,7 @@ def _query_from_request(request: Request, *, default_execution_id: Any) -> Strat
         granularity=granularity,
         category=category,
         metric_keys=metric_keys,
+        cursor=params.get("cursor"),
     )
 
 
@@ -29,17 +29,7 @@ class StrategyDataQuery:
     granularity: str
     category: str
     metric_keys: tuple[str, ...]
-
-
-def page_rows(
-    *, request: Request, rows: list[dict[str, Any]], query: StrategyDataQuery
-) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Paginate an in-memory ``rows`` list and build the response envelope."""
-
-    total = len(rows)
-    start = (query.page - 1) * query.page_size
-    results = rows[start : start + query.page_size]
-    return results, pagination_envelope(request=request, total=total, query=query)
+    cursor: str | None = None
 
 
 def pagination_envelope(
@@ -81,6 +71,24 @@ def pagination_envelope_from_page(
     }
 
 
+def cursor_envelope(
+    *,
+    request: Request,
+    query: StrategyDataQuery,
+    next_cursor: str | None,
+    previous_cursor: str | None,
+) -> dict[str, Any]:
+    """Build a keyset pagination envelope; cursor pages carry no count."""
+
+    return {
+        "next": _cursor_url(request, next_cursor, query.page_size),
+        "previous": _cursor_url(request, previous_cursor, query.page_size),
+        "page_size": query.page_size,
+        "ordering": query.ordering,
+        "granularity": query.granularity,
+    }
+
+
 def parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -182,3 +190,13 @@ def _page_url_unbounded(request: Request, page: int, query: StrategyDataQuery) -
     params["page"] = str(page)
     params["page_size"] = str(query.page_size)
     return f"{request.build_absolute_uri(request.path)}?{urlencode(params, doseq=True)}"
+
+
+def _cursor_url(request: Request, cursor: str | None, page_size: int) -> str | None:
+    if cursor is None:
+        return None
+    params = request.query_params.copy()
+    params.pop("page", None)
+    params["cursor"] = cursor
+    params["page_size"] = str(page_size)
+    return f"{request.build_absolute_uri(request.path)}?{urlencode(params, doseq=True)}"
@@ -1,8 +1,84 @@
-"""Grid-state helpers for strategy visualization."""
+"""Grid-state helpers for strategy visualization.
+
+Deriving cycle maps means loading and parsing the whole ``strategy_state``
+document, so the results are cached per execution state revision and shared
+by every viewer of the same execution; the document is only read on a miss.
+The revision is ``state_version`` plus ``updated_at``: a few maintenance
+paths save ``strategy_state`` without bumping the version.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable, Mapping
+from logging import Logger, getLogger
+from typing import Any, TypeVar
+
+from django.conf import settings
+
+from apps.common.singleflight import CacheSingleFlight
+
+logger: Logger = getLogger(name=__name__)
+
+T = TypeVar("T")
+
+STATE_PROJECTION_CACHE_PREFIX = "trading:state_projection"
+DEFAULT_STATE_PROJECTION_CACHE_TTL_SECONDS = 600
+
+
+def state_projection_cache_key(
+    kind: str,
+    *,
+    strategy_type: str,
+    task_type: str,
+    task_id: Any,
+    execution_id: Any,
+    execution_state: Mapping[str, Any],
+) -> str | None:
+    """Return the cache key of *kind* for one execution state revision.
+
+    Returns None when the row carries no revision, which disables caching.
+    """
+    state_version = execution_state.get("state_version")
+    updated_at = execution_state.get("updated_at")
+    if state_version is None or updated_at is None or not execution_id:
+        return None
+    return (
+        f"{STATE_PROJECTION_CACHE_PREFIX}:{kind}:{strategy_type}:{task_type}:{task_id}:"
+        f"{execution_id}:{state_version}:{updated_at.isoformat()}"
+    )
+
+
+def cached_state_projection(cache_key: str | None, loader: Callable[[], T]) -> T:
+    """Load a strategy-state projection once per revision across workers.
+
+    Cache backend errors fall back to calling *loader* directly; errors
+    raised by *loader* itself propagate without a second attempt.
+    """
+    if cache_key is None:
+        return loader()
+    ttl = float(
+        getattr(
+            settings,
+            "STRATEGY_STATE_PROJECTION_CACHE_TTL_SECONDS",
+            DEFAULT_STATE_PROJECTION_CACHE_TTL_SECONDS,
+        )
+    )
+    attempted = False
+    loaded: list[T] = []
+
+    def load() -> T:
+        nonlocal attempted
+        attempted = True
+        loaded.append(loader())
+        return loaded[0]
+
+    try:
+        return CacheSingleFlight().get_or_load(cache_key, load, ttl_seconds=ttl)
+    except Exception:  # pylint: disable=broad-exception-caught
+        if attempted and not loaded:
+            raise
+        logger.warning("State projection cache unavailable for %s", cache_key, exc_info=True)
+        return loaded[0] if loaded else loader()
 
 
 def build_cycle_grid_state_map(
@@ -22,3 +98,22 @@ def build_cycle_grid_state_map(
         identifier=strategy_type,
         strategy_state=strategy_state,
     )
+
+
+def load_cycle_grid_state_map(
+    *,
+    strategy_type: str,
+    load_strategy_state: Callable[[], dict[str, Any] | None],
+    cache_key: str | None,
+) -> dict[str, dict[str, Any]]:
+    """Return :func:`build_cycle_grid_state_map`, cached under *cache_key*.
+
+    ``load_strategy_state`` is only called on a cache miss.
+    """
+    return cached_state_projection(
+        cache_key,
+        lambda: build_cycle_grid_state_map(
+            strategy_type=strategy_type,
+            strategy_state=load_strategy_state(),
+        ),
+    )
@@ -1,8 +1,26 @@
-"""History-row projection for strategy data endpoints."""
+"""History-row projection for strategy data endpoints.
+
+Trades, trading events and strategy events are each read in timestamp order
+with keyset queries and merged lazily, so a page costs roughly ``page_size``
+rows per source however long the execution is. Merge order is
+``(timestamp, source, sequence_number, id)``; that tuple is also the
+position encoded in history cursors.
+"""
 
 from __future__ import annotations
 
+import base64
+import heapq
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import dropwhile, islice
 from typing import Any
+from uuid import UUID
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
 
 from apps.trading.models.events import StrategyEventRecord, TradingEvent
 from apps.trading.models.trades import Trade
@@ -12,140 +30,336 @@ from apps.trading.services.strategy_data_common import (
     json_value,
 )
 
+HISTORY_BATCH_SIZE = 1000
 
-def load_history_rows(
-    *,
-    task: Any,
-    task_type_label: str,
-    query: StrategyDataQuery,
-    strategy_type: str,
-    strategy_state: dict[str, Any],
-) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    rows.extend(_trade_history_rows(task=task, task_type_label=task_type_label, query=query))
-    rows.extend(
-        _event_history_rows(TradingEvent, task=task, task_type_label=task_type_label, query=query)
-    )
-    rows.extend(
-        _event_history_rows(
-            StrategyEventRecord,
-            task=task,
-            task_type_label=task_type_label,
-            query=query,
+_TRADE_FIELDS = (
+    "id",
+    "timestamp",
+    "direction",
+    "units",
+    "price",
+    "execution_method",
+    "cycle_id",
+    "position_id",
+    "description",
+)
+_EVENT_FIELDS = (
+    "id",
+    "event_type",
+    "severity",
+    "description",
+    "event_timestamp",
+    "details",
+    "sequence_number",
+    "visual_group_id",
+    "root_entry_id",
+    "position_id",
+)
+
+HistoryKey = tuple[datetime, int, int, Any]
+
+
+@dataclass(frozen=True)
+class _HistorySource:
+    name: str
+    rank: int
+    category: str
+    model: Any
+    timestamp_field: str
+    fields: tuple[str, ...]
+
+    @property
+    def sequenced(self) -> bool:
+        return "sequence_number" in self.fields
+
+    def order_by(self, descending: bool) -> tuple[str, ...]:
+        columns = [self.timestamp_field, "sequence_number", "id"]
+        if not self.sequenced:
+            columns.remove("sequence_number")
+        return tuple(f"-{column}" if descending else column for column in columns)
+
+    def position(self, row: dict[str, Any]) -> HistoryKey:
+        return (
+            row[self.timestamp_field],
+            self.rank,
+            int(row.get("sequence_number") or 0),
+            row["id"],
         )
-    )
-    return rows
 
+    def parse_id(self, value: Any) -> Any:
+        return UUID(str(value)) if self.model is Trade else int(value)
 
-def apply_history_filters(
-    rows: list[dict[str, Any]], query: StrategyDataQuery
-) -> list[dict[str, Any]]:
-    filtered = []
-    for row in rows:
-        if row.get("t") is None:
-            continue
-        if (
-            query.category != "all"
-            and row.get("category") != query.category
-            and row.get("source") != query.category
-        ):
-            continue
-        filtered.append(row)
-    filtered = _aggregate_history_rows(filtered, query.granularity)
-    reverse = query.ordering.startswith("-")
-    filtered.sort(key=lambda row: int(row.get("t") or 0), reverse=reverse)
-    return filtered
 
+HISTORY_SOURCES: tuple[_HistorySource, ...] = (
+    _HistorySource("trade", 0, "trade", Trade, "timestamp", _TRADE_FIELDS),
+    _HistorySource("trading_event", 1, "event", TradingEvent, "event_timestamp", _EVENT_FIELDS),
+    _HistorySource(
+        "strategy_event", 2, "event", StrategyEventRecord, "event_timestamp", _EVENT_FIELDS
+    ),
+)
+_SOURCES_BY_NAME = {source.name: source for source in HISTORY_SOURCES}
 
-def _trade_history_rows(
-    *, task: Any, task_type_label: str, query: StrategyDataQuery
-) -> list[dict[str, Any]]:
-    qs = Trade.objects.filter(
-        task_type=task_type_label,
-        task_id=task.pk,
-        execution_id=query.execution_id,
-    )
-    if query.since:
-        qs = qs.filter(timestamp__gte=query.since)
-    if query.until:
-        qs = qs.filter(timestamp__lte=query.until)
-    rows = []
-    for trade in qs.order_by("timestamp").values(
-        "id",
-        "timestamp",
-        "direction",
-        "units",
-        "price",
-        "execution_method",
-        "cycle_id",
-        "position_id",
-        "description",
-    ):
-        ts = trade["timestamp"]
-        rows.append(
-            {
-                "id": f"trade:{trade['id']}",
-                "timestamp": ts.isoformat() if ts else None,
-                "t": int(ts.timestamp()) if ts else None,
-                "source": "trade",
-                "category": "trade",
-                "action": trade["execution_method"],
-                "label": trade["execution_method"],
-                "details": {k: json_value(v) for k, v in trade.items()},
-            }
+
+@dataclass(frozen=True)
+class HistoryPage:
+    rows: list[dict[str, Any]]
+    count: int | None
+    has_next: bool
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+def load_history_page(*, task: Any, task_type_label: str, query: StrategyDataQuery) -> HistoryPage:
+    """Load one page of history rows.
+
+    With ``query.cursor`` set (an empty string selects the first page) the
+    page starts after the encoded position and carries next/previous
+    cursors. Otherwise ``page``/``page_size`` select the page; the merge
+    skips earlier rows without holding them, and the total is counted in SQL
+    for raw granularity only.
+    """
+    sources = _selected_sources(query.category)
+    querysets = {
+        source.name: _source_queryset(
+            source, task=task, task_type_label=task_type_label, query=query
         )
-    return rows
+        for source in sources
+    }
+    descending = query.ordering.startswith("-")
+    seconds = granularity_seconds(query.granularity)
 
+    if query.cursor is None:
+        offset = (query.page - 1) * query.page_size
+        window = list(
+            islice(
+                _merged_rows(
+                    sources,
+                    querysets,
+                    descending=descending,
+                    seconds=seconds,
+                    position=None,
+                    batch_size=min(offset + query.page_size + 1, HISTORY_BATCH_SIZE),
+                ),
+                offset,
+                offset + query.page_size + 1,
+            )
+        )
+        count = sum(qs.count() for qs in querysets.values()) if seconds is None else None
+        return HistoryPage(
+            rows=[_serialize(source, row) for _key, source, row in window[: query.page_size]],
+            count=count,
+            has_next=len(window) > query.page_size,
+        )
 
-def _event_history_rows(
-    model: Any, *, task: Any, task_type_label: str, query: StrategyDataQuery
-) -> list[dict[str, Any]]:
-    qs = model.objects.filter(
+    position, backwards = decode_history_cursor(query.cursor)
+    window = list(
+        islice(
+            _merged_rows(
+                sources,
+                querysets,
+                descending=descending != backwards,
+                seconds=seconds,
+                position=position,
+                batch_size=min(query.page_size + 1, HISTORY_BATCH_SIZE),
+            ),
+            query.page_size + 1,
+        )
+    )
+    has_more = len(window) > query.page_size
+    window = window[: query.page_size]
+    if backwards:
+        window.reverse()
+    has_next = has_more if not backwards else position is not None
+    has_previous = has_more if backwards else position is not None
+    return HistoryPage(
+        rows=[_serialize(source, row) for _key, source, row in window],
+        count=None,
+        has_next=has_next,
+        next_cursor=encode_history_cursor(window[-1][0]) if has_next and window else None,
+        previous_cursor=(
+            encode_history_cursor(window[0][0], backwards=True) if has_previous and window else None
+        ),
+    )
+
+
+def encode_history_cursor(position: HistoryKey, *, backwards: bool = False) -> str:
+    timestamp, rank, sequence, pk = position
+    payload = {
+        "t": timestamp.isoformat(),
+        "s": HISTORY_SOURCES[rank].name,
+        "q": sequence,
+        "i": str(pk),
+        "r": 1 if backwards else 0,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_history_cursor(value: str) -> tuple[HistoryKey | None, bool]:
+    """Return ``(position, backwards)``; an empty cursor is the first page."""
+    if not value:
+        return None, False
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        payload = json.loads(raw)
+        source = _SOURCES_BY_NAME[payload["s"]]
+        timestamp = datetime.fromisoformat(payload["t"])
+        if timestamp.tzinfo is None:
+            raise ValueError("naive cursor timestamp")
+        position = (timestamp, source.rank, int(payload["q"]), source.parse_id(payload["i"]))
+        return position, bool(payload.get("r"))
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise ValidationError("Invalid cursor.") from exc
+
+
+def _selected_sources(category: str) -> list[_HistorySource]:
+    if category == "all":
+        return list(HISTORY_SOURCES)
+    return [source for source in HISTORY_SOURCES if category in (source.name, source.category)]
+
+
+def _source_queryset(
+    source: _HistorySource, *, task: Any, task_type_label: str, query: StrategyDataQuery
+) -> QuerySet[Any]:
+    field = source.timestamp_field
+    qs = source.model.objects.filter(
         task_type=task_type_label,
         task_id=task.pk,
         execution_id=query.execution_id,
+        **{f"{field}__isnull": False},
     )
     if query.since:
-        qs = qs.filter(event_timestamp__gte=query.since)
+        qs = qs.filter(**{f"{field}__gte": query.since})
     if query.until:
-        qs = qs.filter(event_timestamp__lte=query.until)
-    source = "strategy_event" if model is StrategyEventRecord else "trading_event"
-    rows = []
-    for event in qs.order_by("event_timestamp", "sequence_number").values(
-        "id",
-        "event_type",
-        "severity",
-        "description",
-        "event_timestamp",
-        "details",
-        "sequence_number",
-        "visual_group_id",
-        "root_entry_id",
-        "position_id",
-    ):
-        ts = event["event_timestamp"]
-        rows.append(
-            {
-                "id": f"{source}:{event['id']}",
-                "timestamp": ts.isoformat() if ts else None,
-                "t": int(ts.timestamp()) if ts else None,
-                "source": source,
-                "category": "event",
-                "action": event["event_type"],
-                "label": event["event_type"],
-                "severity": event["severity"],
-                "details": {k: json_value(v) for k, v in event.items() if k != "description"},
-            }
-        )
-    return rows
+        qs = qs.filter(**{f"{field}__lte": query.until})
+    return qs.values(*source.fields)
+
+
+def _merged_rows(
+    sources: list[_HistorySource],
+    querysets: dict[str, QuerySet[Any]],
+    *,
+    descending: bool,
+    seconds: int | None,
+    position: HistoryKey | None,
+    batch_size: int,
+) -> Iterator[tuple[HistoryKey, _HistorySource, dict[str, Any]]]:
+    streams = []
+    for source in sources:
+        qs = querysets[source.name]
+        if position is not None:
+            qs = qs.filter(
+                _after_q(source, position, descending)
+                if seconds is None
+                else _bucket_bound_q(source, position[0], seconds, descending)
+            )
+        rows = _keyset_rows(source, qs, descending=descending, batch_size=batch_size)
+        if seconds is not None:
+            rows = _latest_per_bucket(source, rows, seconds, descending=descending)
+        streams.append(_keyed(source, rows))
+    merged = heapq.merge(*streams, key=lambda item: item[0], reverse=descending)
+    if position is None:
+        return merged
+    # Bucketed streams restart at the cursor's bucket boundary, so buckets
+    # already emitted on earlier pages are dropped here.
+    if descending:
+        return dropwhile(lambda item: item[0] >= position, merged)
+    return dropwhile(lambda item: item[0] <= position, merged)
+
+
+def _keyed(
+    source: _HistorySource, rows: Iterator[dict[str, Any]]
+) -> Iterator[tuple[HistoryKey, _HistorySource, dict[str, Any]]]:
+    for row in rows:
+        yield source.position(row), source, row
+
+
+def _keyset_rows(
+    source: _HistorySource, qs: QuerySet[Any], *, descending: bool, batch_size: int
+) -> Iterator[dict[str, Any]]:
+    ordered = qs.order_by(*source.order_by(descending))
+    batch = list(ordered[:batch_size])
+    while batch:
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        after = _after_q(source, source.position(batch[-1]), descending)
+        batch = list(ordered.filter(after)[:batch_size])
+
 
+def _after_q(source: _HistorySource, position: HistoryKey, descending: bool) -> Q:
+    """Match rows of *source* that merge strictly after *position*."""
+    timestamp, rank, sequence, pk = position
+    field = source.timestamp_field
+    past = "lt" if descending else "gt"
+    if source.rank != rank:
+        # At an equal timestamp, rows of a source merged later still follow.
+        follows_on_tie = (source.rank > rank) != descending
+        return Q(**{f"{field}__{past}e" if follows_on_tie else f"{field}__{past}": timestamp})
+    condition = Q(**{f"{field}__{past}": timestamp})
+    if source.sequenced:
+        condition |= Q(**{field: timestamp, f"sequence_number__{past}": sequence})
+        condition |= Q(**{field: timestamp, "sequence_number": sequence, f"id__{past}": pk})
+    else:
+        condition |= Q(**{field: timestamp, f"id__{past}": pk})
+    return condition
 
-def _aggregate_history_rows(rows: list[dict[str, Any]], granularity: str) -> list[dict[str, Any]]:
-    seconds = granularity_seconds(granularity)
-    if seconds is None:
-        return rows
-    bucketed: dict[tuple[int, str], dict[str, Any]] = {}
+
+def _bucket_bound_q(
+    source: _HistorySource, timestamp: datetime, seconds: int, descending: bool
+) -> Q:
+    start = int(timestamp.timestamp()) // seconds * seconds
+    if descending:
+        return Q(**{f"{source.timestamp_field}__lt": datetime.fromtimestamp(start + seconds, UTC)})
+    return Q(**{f"{source.timestamp_field}__gte": datetime.fromtimestamp(start, UTC)})
+
+
+def _latest_per_bucket(
+    source: _HistorySource,
+    rows: Iterator[dict[str, Any]],
+    seconds: int,
+    *,
+    descending: bool,
+) -> Iterator[dict[str, Any]]:
+    """Keep the latest row of every ``seconds`` bucket from an ordered stream."""
+    current: int | None = None
+    latest: dict[str, Any] | None = None
     for row in rows:
-        bucket = int(row["t"]) // seconds * seconds
-        bucketed[(bucket, str(row.get("source") or ""))] = row
-    return list(bucketed.values())
+        bucket = int(row[source.timestamp_field].timestamp()) // seconds
+        if bucket == current:
+            if not descending:
+                latest = row
+            continue
+        if latest is not None and not descending:
+            yield latest
+        current, latest = bucket, row
+        if descending:
+            yield row
+    if latest is not None and not descending:
+        yield latest
+
+
+def _serialize(source: _HistorySource, row: dict[str, Any]) -> dict[str, Any]:
+    ts = row[source.timestamp_field]
+    if source.model is Trade:
+        return {
+            "id": f"trade:{row['id']}",
+            "timestamp": ts.isoformat(),
+            "t": int(ts.timestamp()),
+            "source": "trade",
+            "category": "trade",
+            "action": row["execution_method"],
+            "label": row["execution_method"],
+            "details": {k: json_value(v) for k, v in row.items()},
+        }
+    return {
+        "id": f"{source.name}:{row['id']}",
+        "timestamp": ts.isoformat(),
+        "t": int(ts.timestamp()),
+        "source": source.name,
+        "category": "event",
+        "action": row["event_type"],
+        "label": row["event_type"],
+        "severity": row["severity"],
+        "details": {k: json_value(v) for k, v in row.items() if k != "description"},
+    }
@@ -25,6 +25,7 @@ from apps.trading.models.trades import Trade
 from apps.trading.services.conversion_context import CurrencyConversionContext
 from apps.trading.services.display_money import DISPLAY_MONEY
 from apps.trading.services.fx_rates import FX_CONVERSION, FxConversionService
+from apps.trading.services.latency_histogram import load_latency_summary
 from apps.trading.services.public_errors import (
     task_public_error_code,
     task_public_error_message,
@@ -61,6 +62,8 @@ class TickDeliveryInfo:
     age_seconds: float | None
     max_age_seconds: int | None
     message: str | None
+    conflated_ticks: int | None = None
+    batch_size: int | None = None
 
     def to_dict(self) -> dict[str, object]:
         """Return serializer-ready delivery diagnostics."""
@@ -71,6 +74,8 @@ class TickDeliveryInfo:
             "age_seconds": self.age_seconds,
             "max_age_seconds": self.max_age_seconds,
             "message": self.message,
+            "conflated_ticks": self.conflated_ticks,
+            "batch_size": self.batch_size,
         }
 
 
@@ -155,6 +160,7 @@ class ExecutionInfo:
     reconciled_at: str | None
     tick_delivery: TickDeliveryInfo | None
     current_balance_display_conversion_context: dict[str, object] | None = None
+    latency: dict[str, dict[str, object]] | None = None
 
     def to_dict(self) -> dict[str, object]:
         """Return serializer-ready execution data."""
@@ -180,6 +186,7 @@ class ExecutionInfo:
             "tick_delivery": (
                 self.tick_delivery.to_dict() if self.tick_delivery is not None else None
             ),
+            "latency": self.latency,
         }
 
 
@@ -676,6 +683,14 @@ def compute_task_summary(
             recovery_blockers=recovery_blockers,
             reconciled_at=reconciled_at,
             tick_delivery=tick_delivery,
+            latency=(
+                load_latency_summary(
+                    task_id=task_id,
+                    execution_id=getattr(state, "execution_id", None) or execution_id,
+                )
+                if task_type == "trading"
+                else None
+            ),
         ),
         tick=TickInfo(
             timestamp=tick_timestamp,
@@ -826,6 +841,8 @@ def _tick_delivery_info(raw: object) -> TickDeliveryInfo | None:
         age_seconds=_float_or_none(raw_map.get("age_seconds")),
         max_age_seconds=_int_or_none(raw_map.get("max_age_seconds")),
         message=_str_or_none(raw_map.get("message")),
+        conflated_ticks=_int_or_none(raw_map.get("conflated_ticks")),
+        batch_size=_int_or_none(raw_map.get("batch_size")),
     )
 
 
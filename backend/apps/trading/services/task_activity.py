@@ -404,6 +404,26 @@ class TaskActivityQueryService:
     def trades(
         self, *, request: Request, task, task_type_label: str
     ) -> tuple[list[dict], int, int, int]:
+        queryset, query = self.trades_queryset(
+            request=request,
+            task=task,
+            task_type_label=task_type_label,
+        )
+        total_count = queryset.count()
+        page = query.execution.pagination.page
+        page_size = query.execution.pagination.page_size
+        start = (page - 1) * page_size
+        rows = self.trade_rows(
+            list(queryset[start : start + page_size]),
+            task=task,
+            task_type_label=task_type_label,
+            execution_id=query.execution.execution_id,
+        )
+        return rows, total_count, page, page_size
+
+    @staticmethod
+    def trades_queryset(*, request: Request, task, task_type_label: str):
+        """Return the filtered, ordered trade values queryset and its query."""
         query = TradesQueryParams.from_request(
             request,
             default_execution_id=task.execution_id,
@@ -439,12 +459,7 @@ class TaskActivityQueryService:
             queryset = queryset.exclude(execution_method__in=ORDER_TRADE_METHODS)
 
         queryset = TRADE_ORDERING.apply_to_queryset(queryset, query.ordering)
-
-        total_count = queryset.count()
-        page = query.execution.pagination.page
-        page_size = query.execution.pagination.page_size
-        start = (page - 1) * page_size
-        rows = list(
+        return (
             queryset.values(
                 "id",
                 "direction",
@@ -457,6 +472,7 @@ class TaskActivityQueryService:
                 "retracement_count",
                 "description",
                 "timestamp",
+                "sequence_number",
                 "position_id",
                 "order_id",
                 "oanda_trade_id",
@@ -467,20 +483,25 @@ class TaskActivityQueryService:
                 "is_initial_position_seed",
                 stop_loss_price=models.F("position__stop_loss_price"),
                 entry_price=models.F("position__entry_price"),
-            )[start : start + page_size]
+            ),
+            query,
         )
+
+    def trade_rows(
+        self, rows: list[dict], *, task, task_type_label: str, execution_id
+    ) -> list[dict]:
+        """Normalize and money-enrich one page of trade value rows."""
         close_snapshots = self._close_snapshots_by_order_id(
             rows=rows,
             task=task,
             task_type_label=task_type_label,
-            execution_id=query.execution.execution_id,
+            execution_id=execution_id,
         )
         normalized_rows = self._normalize_trade_rows(rows, close_snapshots)
-        enriched_rows = TradeMoneyEnricher.for_task(
+        return TradeMoneyEnricher.for_task(
             task=task,
             task_type_label=task_type_label,
         ).enrich_rows(normalized_rows)
-        return enriched_rows, total_count, page, page_size
 
     @staticmethod
     def _close_snapshots_by_order_id(
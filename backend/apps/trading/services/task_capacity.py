@@ -5,15 +5,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import timedelta
 
-from celery import current_app
 from django.conf import settings
 from django.utils import timezone
 
 from apps.market.models import CeleryTaskStatus as MarketCeleryTaskStatus
+from apps.market.tasks.multiplexer import MULTIPLEXED_PUBLISHER_TASK_NAME
+from apps.market.tasks.publisher import multiplexed_publisher_enabled
 from apps.trading.models import BacktestTask, TradingTask
 from apps.trading.services.task_policy import (
     CAPACITY_ACTIVE_STATUSES as ACTIVE_TASK_STATUSES,
 )
+from apps.trading.services.worker_capacity import load_queue_usage
 
 ACTIVE_MARKET_STATUSES = (
     MarketCeleryTaskStatus.Status.RUNNING,
@@ -47,32 +49,16 @@ class TaskAdmissionDecision:
 class TaskCapacityService:
     """Evaluate whether the system has capacity to start a task."""
 
-    def _queue_inspector(self):
-        return current_app.control.inspect(timeout=2.0)
-
     def _queue_usage(self, queue: str) -> int | None:
         """Return active task count for a dedicated queue.
 
-        Returns ``None`` when inspection is unavailable so callers can fall
-        back to persisted liveness data.
+        Reads the worker capacity registry, which workers keep current on
+        task start/finish and which is reconciled against ``inspect``
+        periodically. Returns ``None`` when the registry is disabled or no
+        worker has reported so callers can fall back to persisted liveness
+        data.
         """
-        try:
-            inspector = self._queue_inspector()
-            active_queues = inspector.active_queues() or {}
-            active = inspector.active() or {}
-        except Exception:
-            return None
-
-        workers = [
-            worker_name
-            for worker_name, queue_entries in active_queues.items()
-            if any(str(entry.get("name") or "") == queue for entry in (queue_entries or []))
-        ]
-        if not workers:
-            return 0
-
-        active_count = sum(len(active.get(worker_name) or []) for worker_name in workers)
-        return active_count
+        return load_queue_usage(queue)
 
     @staticmethod
     def _required_stop(queue: str, count: int) -> dict[str, object]:
@@ -169,21 +155,31 @@ class TaskCapacityService:
 
         market_limit = int(getattr(settings, "CELERY_MARKET_WORKER_CONCURRENCY", 1))
         market_usage = self._queue_usage("market")
+        multiplexed = multiplexed_publisher_enabled()
         active_publishers = self._fresh_market_tasks(
-            task_name="market.tasks.publish_oanda_ticks"
+            task_name=(
+                MULTIPLEXED_PUBLISHER_TASK_NAME
+                if multiplexed
+                else "market.tasks.publish_oanda_ticks"
+            )
         ).count()
         subscriber_running = self._fresh_market_tasks(
             task_name="market.tasks.subscribe_ticks_to_db"
         ).exists()
-        account_id = getattr(task, "oanda_account_id", None)
-        account_key = str(account_id) if account_id else ""
-        publisher_exists_for_account = (
-            self._fresh_market_tasks(task_name="market.tasks.publish_oanda_ticks")
-            .filter(instance_key=account_key)
-            .exists()
-            if account_key
-            else False
-        )
+        if multiplexed:
+            # One multiplexed publisher streams every account, so a new
+            # account only needs a slot when that publisher is not running.
+            publisher_exists_for_account = active_publishers > 0
+        else:
+            account_id = getattr(task, "oanda_account_id", None)
+            account_key = str(account_id) if account_id else ""
+            publisher_exists_for_account = (
+                self._fresh_market_tasks(task_name="market.tasks.publish_oanda_ticks")
+                .filter(instance_key=account_key)
+                .exists()
+                if account_key
+                else False
+            )
         if market_usage is None:
             projected_market_usage = active_publishers
             if not publisher_exists_for_account:
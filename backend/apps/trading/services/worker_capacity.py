@@ -0,0 +1,233 @@
+"""Redis registry of active Celery tasks per worker queue.
+
+Workers record each task they start and finish, and heartbeat their hostname
+together with the queues they consume, so admission can read current queue
+usage with one Redis round trip instead of broadcasting ``inspect`` to every
+worker. The
+inspect broadcast is kept as a periodic reconciliation that rewrites the
+registry from what workers actually report, repairing entries lost to crashes
+or killed processes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from logging import Logger, getLogger
+from time import time
+from typing import Any
+
+from django.conf import settings
+
+logger: Logger = getLogger(name=__name__)
+
+WORKER_CAPACITY_KEY_PREFIX = "trading:worker_capacity"
+WORKER_CAPACITY_HEARTBEATS_KEY = f"{WORKER_CAPACITY_KEY_PREFIX}:heartbeats"
+WORKER_CAPACITY_TASKS_KEY = f"{WORKER_CAPACITY_KEY_PREFIX}:tasks"
+WORKER_CAPACITY_QUEUES_KEY = f"{WORKER_CAPACITY_KEY_PREFIX}:worker_queues"
+DEFAULT_TRACKED_QUEUES: tuple[str, ...] = ("trading", "market", "backtest", "backtest_publisher")
+DEFAULT_REDIS_TIMEOUT_SECONDS = 1.0
+
+
+def worker_capacity_registry_enabled() -> bool:
+    return bool(getattr(settings, "CELERY_WORKER_CAPACITY_REGISTRY_ENABLED", True))
+
+
+def tracked_queues() -> tuple[str, ...]:
+    return tuple(getattr(settings, "CELERY_WORKER_CAPACITY_QUEUES", DEFAULT_TRACKED_QUEUES))
+
+
+def queue_names(entries: Iterable[Any] | None) -> list[str]:
+    """Return queue names from kombu queues or ``inspect().active_queues()`` entries."""
+    names = []
+    for entry in entries or []:
+        name = entry.get("name") if isinstance(entry, Mapping) else getattr(entry, "name", "")
+        if name:
+            names.append(str(name))
+    return names
+
+
+def usage_from_inspect(
+    *,
+    active_queues: Mapping[str, Any],
+    active: Mapping[str, Any],
+    queues: Iterable[str],
+) -> dict[str, dict[str, str]]:
+    """Map each queue to ``{task_id: worker}`` from ``inspect`` replies.
+
+    Every active task on a worker that consumes a queue counts against that
+    queue, since dedicated workers share one concurrency pool.
+    """
+    usage: dict[str, dict[str, str]] = {}
+    for queue in queues:
+        tasks: dict[str, str] = {}
+        for worker_name, queue_entries in active_queues.items():
+            if not any(str(entry.get("name") or "") == queue for entry in (queue_entries or [])):
+                continue
+            for index, entry in enumerate(active.get(worker_name) or []):
+                task_id = str(entry.get("id") or f"{worker_name}:{index}")
+                tasks[task_id] = worker_name
+        usage[queue] = tasks
+    return usage
+
+
+@lru_cache(maxsize=4)
+def _shared_redis_client(url: str, timeout_seconds: float) -> Any:
+    """Return one Redis client per URL so admission checks reuse its connection pool."""
+    import redis
+
+    return redis.Redis.from_url(
+        url,
+        decode_responses=True,
+        socket_timeout=timeout_seconds,
+        socket_connect_timeout=timeout_seconds,
+    )
+
+
+class WorkerCapacityRegistry:
+    """Active task ids, worker queues and worker heartbeats, stored in Redis.
+
+    Active tasks are one hash of ``task_id -> worker`` and each worker
+    advertises the queues it consumes. A queue's usage is every active task on
+    a worker consuming it, matching ``usage_from_inspect``. Tasks owned by a
+    worker whose heartbeat is older than ``stale_after_seconds`` are ignored,
+    so a crashed worker stops counting against capacity without waiting for
+    the next reconciliation.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: Any | None = None,
+        stale_after_seconds: float | None = None,
+    ) -> None:
+        self._redis = redis_client
+        self.stale_after_seconds = float(
+            stale_after_seconds
+            if stale_after_seconds is not None
+            else getattr(settings, "CELERY_WORKER_CAPACITY_STALE_SECONDS", 90)
+        )
+
+    @property
+    def redis(self) -> Any:
+        if self._redis is None:
+            self._redis = _shared_redis_client(
+                settings.MARKET_REDIS_URL,
+                float(
+                    getattr(
+                        settings,
+                        "CELERY_WORKER_CAPACITY_REDIS_TIMEOUT_SECONDS",
+                        DEFAULT_REDIS_TIMEOUT_SECONDS,
+                    )
+                ),
+            )
+        return self._redis
+
+    def task_started(self, *, task_id: str, worker: str) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(WORKER_CAPACITY_TASKS_KEY, task_id, worker)
+        pipe.hset(WORKER_CAPACITY_HEARTBEATS_KEY, worker, time())
+        pipe.execute()
+
+    def task_finished(self, *, task_id: str) -> None:
+        self.redis.hdel(WORKER_CAPACITY_TASKS_KEY, task_id)
+
+    def heartbeat(self, worker: str, *, queues: Iterable[str] | None = None) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(WORKER_CAPACITY_HEARTBEATS_KEY, worker, time())
+        if queues is not None:
+            pipe.hset(WORKER_CAPACITY_QUEUES_KEY, worker, ",".join(sorted(queues)))
+        pipe.execute()
+
+    def remove_worker(self, worker: str) -> None:
+        """Drop a worker's heartbeat, queues and every task it owns."""
+        owned = [
+            task_id
+            for task_id, owner in (self.redis.hgetall(WORKER_CAPACITY_TASKS_KEY) or {}).items()
+            if owner == worker
+        ]
+        pipe = self.redis.pipeline(transaction=False)
+        if owned:
+            pipe.hdel(WORKER_CAPACITY_TASKS_KEY, *owned)
+        pipe.hdel(WORKER_CAPACITY_HEARTBEATS_KEY, worker)
+        pipe.hdel(WORKER_CAPACITY_QUEUES_KEY, worker)
+        pipe.execute()
+
+    def _fresh_workers(self, heartbeats: Mapping[str, Any], now: float) -> set[str]:
+        fresh: set[str] = set()
+        for worker, raw in heartbeats.items():
+            try:
+                if now - float(raw) <= self.stale_after_seconds:
+                    fresh.add(worker)
+            except (TypeError, ValueError):
+                continue
+        return fresh
+
+    def queue_usage(self, queue: str) -> int | None:
+        """Return active tasks on workers consuming *queue*.
+
+        Returns None when no worker has reported.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(WORKER_CAPACITY_TASKS_KEY)
+        pipe.hgetall(WORKER_CAPACITY_HEARTBEATS_KEY)
+        pipe.hgetall(WORKER_CAPACITY_QUEUES_KEY)
+        tasks, heartbeats, worker_queues = pipe.execute()
+        fresh = self._fresh_workers(heartbeats or {}, time())
+        if not fresh:
+            return None
+        consumers = {
+            worker
+            for worker, queues in (worker_queues or {}).items()
+            if worker in fresh and queue in str(queues).split(",")
+        }
+        return sum(1 for worker in (tasks or {}).values() if worker in consumers)
+
+    def replace(
+        self,
+        *,
+        tasks: Mapping[str, str],
+        worker_queues: Mapping[str, Iterable[str]],
+    ) -> None:
+        """Rewrite the registry from a reconciliation snapshot.
+
+        ``worker_queues`` covers the hosts that replied; heartbeats and queues
+        of any other worker are dropped so their leftover tasks stop counting.
+        """
+        now = time()
+        replied = set(worker_queues)
+        stale = [
+            worker
+            for worker in (self.redis.hgetall(WORKER_CAPACITY_HEARTBEATS_KEY) or {})
+            if worker not in replied
+        ]
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(WORKER_CAPACITY_TASKS_KEY, WORKER_CAPACITY_QUEUES_KEY)
+        if tasks:
+            pipe.hset(WORKER_CAPACITY_TASKS_KEY, mapping=dict(tasks))
+        if stale:
+            pipe.hdel(WORKER_CAPACITY_HEARTBEATS_KEY, *stale)
+        if replied:
+            pipe.hset(WORKER_CAPACITY_HEARTBEATS_KEY, mapping={worker: now for worker in replied})
+            pipe.hset(
+                WORKER_CAPACITY_QUEUES_KEY,
+                mapping={
+                    worker: ",".join(sorted(queues)) for worker, queues in worker_queues.items()
+                },
+            )
+        pipe.execute()
+
+
+def load_queue_usage(queue: str, registry: WorkerCapacityRegistry | None = None) -> int | None:
+    """Return registry usage for *queue*, or None when disabled or unreachable.
+
+    Redis timeouts also read as unknown usage, so a hung Redis cannot block
+    admission for longer than the client's socket timeout.
+    """
+    if not worker_capacity_registry_enabled():
+        return None
+    try:
+        return (registry or WorkerCapacityRegistry()).queue_usage(queue)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.debug("Worker capacity registry unavailable for queue %s", queue, exc_info=True)
+        return None
@@ -81,14 +81,14 @@ class Strategy(ABC):
             raise ValueError("Parameters must be a JSON object")
 
         if config_schema:
-            from jsonschema import ValidationError as JsonSchemaValidationError
-            from jsonschema import validate
+            from jsonschema.exceptions import best_match
+
+            from apps.trading.strategies.config_cache import compiled_schema_validator
 
             payload = cls._to_schema_primitives(parameters)
-            try:
-                validate(instance=payload, schema=config_schema)
-            except JsonSchemaValidationError as exc:
-                raise ValueError(exc.message) from exc
+            error = best_match(compiled_schema_validator(config_schema).iter_errors(payload))
+            if error is not None:
+                raise ValueError(error.message)
 
     @classmethod
     def _to_schema_primitives(cls, value: Any) -> Any:
@@ -169,6 +169,15 @@ class Strategy(ABC):
         """Return whether broker resume reconciliation can repair this strategy state."""
         return False
 
+    @classmethod
+    def supports_tick_conflation(cls) -> bool:
+        """Return whether live trading may skip intermediate ticks for this strategy.
+
+        Strategies that only act on the latest price can opt in; the live tick
+        source then delivers just the newest tick of each batch.
+        """
+        return False
+
     @classmethod
     def capabilities(cls) -> dict[str, Any]:
         """Return strategy capabilities consumed by generic services and clients."""
@@ -0,0 +1,100 @@
+"""Process-local caches for strategy schema validation and parsed configs.
+
+Strategy schemas are fixed for the life of a process, so their jsonschema
+validators are compiled once. Parsed config dataclasses are frozen and are
+shared between executors and API requests for the same configuration
+revision, keyed by ``(strategy_type, id, updated_at)``; saving a
+configuration bumps ``updated_at`` and therefore misses the cache.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+SCHEMA_VALIDATOR_CACHE_SIZE = 32
+STRATEGY_CONFIG_CACHE_SIZE = 256
+
+_validators: OrderedDict[int, tuple[Mapping[str, Any], Any]] = OrderedDict()
+_validators_lock = threading.Lock()
+
+
+def compiled_schema_validator(schema: Mapping[str, Any]) -> Any:
+    """Return a checked jsonschema validator for *schema*, compiled once.
+
+    Entries are keyed by object identity and hold a reference to the schema,
+    so the cached validator always belongs to the very dict passed in.
+    """
+    key = id(schema)
+    with _validators_lock:
+        entry = _validators.get(key)
+        if entry is not None and entry[0] is schema:
+            _validators.move_to_end(key)
+            return entry[1]
+
+    from jsonschema.validators import validator_for
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    with _validators_lock:
+        _validators[key] = (schema, validator)
+        _validators.move_to_end(key)
+        while len(_validators) > SCHEMA_VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    return validator
+
+
+def strategy_config_cache_key(strategy_config: Any) -> tuple[str, str, str] | None:
+    """Return the revision key for a saved configuration, or None if uncacheable."""
+    pk = getattr(strategy_config, "pk", None)
+    updated_at = getattr(strategy_config, "updated_at", None)
+    if pk is None or not isinstance(updated_at, datetime):
+        return None
+    strategy_type = str(getattr(strategy_config, "strategy_type", "") or "")
+    return (strategy_type, str(pk), updated_at.isoformat())
+
+
+class StrategyConfigCache:
+    """Bounded LRU of values derived from one configuration revision."""
+
+    def __init__(self, *, maxsize: int = STRATEGY_CONFIG_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, strategy_config: Any, factory: Callable[[], T]) -> T:
+        """Return the cached value for *strategy_config*, computing it on a miss.
+
+        Exceptions from *factory* propagate and are not cached.
+        """
+        key = strategy_config_cache_key(strategy_config)
+        if key is None:
+            return factory()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+PARSED_STRATEGY_CONFIGS = StrategyConfigCache()
+STRATEGY_CONFIG_VALIDATIONS = StrategyConfigCache()
@@ -37,6 +37,10 @@ class CustomStrategy(Strategy):
     def normalize_parameters(cls, parameters: dict[str, Any]) -> dict[str, Any]:
         return dict(parameters)
 
+    @classmethod
+    def supports_tick_conflation(cls) -> bool:
+        return True
+
     @property
     def strategy_type(self) -> StrategyType:
         return StrategyType.CUSTOM
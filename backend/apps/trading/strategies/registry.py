@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from apps.trading.strategies.base import Strategy
+from apps.trading.strategies.config_cache import PARSED_STRATEGY_CONFIGS
 
 if TYPE_CHECKING:
     from apps.trading.models import StrategyConfiguration
@@ -191,8 +192,12 @@ class StrategyRegistry:
         strategy_info = self.get(str(strategy_config.strategy_type))
         strategy_cls = strategy_info.strategy_cls
 
-        # Parse StrategyConfig to strategy-specific config object
-        parsed_config = strategy_cls.parse_config(strategy_config)
+        # Parse StrategyConfig to strategy-specific config object; parsed
+        # configs are frozen and shared per saved configuration revision.
+        parsed_config = PARSED_STRATEGY_CONFIGS.get_or_create(
+            strategy_config,
+            lambda: strategy_cls.parse_config(strategy_config),
+        )
 
         # Instantiate strategy with parsed config
         return strategy_cls(instrument, pip_size, parsed_config)
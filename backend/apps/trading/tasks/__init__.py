@@ -17,6 +17,7 @@ from apps.trading.tasks.source import (
     TickDataSource,
 )
 from apps.trading.tasks.trading import run_trading_task, stop_trading_task
+from apps.trading.tasks.worker_capacity import reconcile_worker_capacity_beat
 
 __all__: List[str] = [
     "run_backtest_task",
@@ -25,6 +26,7 @@ __all__: List[str] = [
     "stop_trading_task",
     "recover_orphaned_tasks_beat",
     "recover_orphaned_tasks_startup",
+    "reconcile_worker_capacity_beat",
     "TaskExecutor",
     "BacktestExecutor",
     "TradingExecutor",
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any, TypeVar
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class ExecutionDiagnostics:
     """Own opt-in memory profiling for task execution."""
@@ -80,3 +86,181 @@ class ExecutionDiagnostics:
         )
         for i, stat in enumerate(stats[:20]):
             logger.warning("[TRACEMALLOC:%s] #%d %s", label, i + 1, stat)
+
+
+class _PhaseStats:
+    """Accumulated wall time and SQL traffic for one execution phase."""
+
+    __slots__ = ("calls", "wall_seconds", "sql_queries", "sql_bytes", "sql_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.sql_queries = 0
+        self.sql_bytes = 0
+        self.sql_seconds = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "sql_queries": self.sql_queries,
+            "sql_bytes": self.sql_bytes,
+            "sql_seconds": round(self.sql_seconds, 6),
+        }
+
+
+class _PhaseTimer:
+    """Context manager that charges elapsed wall time to one phase."""
+
+    __slots__ = ("profiler", "name", "started_at")
+
+    def __init__(self, profiler: ExecutionProfiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.started_at = 0.0
+
+    def __enter__(self) -> None:
+        self.profiler._active_phases.append(self.name)
+        self.started_at = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = perf_counter() - self.started_at
+        self.profiler._active_phases.pop()
+        stats = self.profiler._stats_for(self.name)
+        stats.calls += 1
+        stats.wall_seconds += elapsed
+
+
+class ExecutionProfiler:
+    """Own opt-in per-phase latency and SQL accounting for task execution.
+
+    Wall time is charged to the phase that is active when it elapses; SQL
+    statements are captured through a connection ``execute_wrapper`` and
+    charged to the innermost active phase (or ``other`` outside any phase).
+    """
+
+    OTHER_PHASE = "other"
+
+    def __init__(self, *, enabled: bool, recent_batch_limit: int = 20) -> None:
+        self.enabled = enabled
+        self.started = False
+        self._started_at: float | None = None
+        self._stopped_at: float | None = None
+        self._active_phases: list[str] = []
+        self._phases: dict[str, _PhaseStats] = {}
+        self.batch_count = 0
+        self.batch_ticks = 0
+        self.batch_seconds = 0.0
+        self._recent_batches: deque[dict[str, Any]] = deque(maxlen=recent_batch_limit)
+
+    def start(self) -> None:
+        """Install the SQL wrapper on the current thread's connection."""
+        from django.db import connection
+
+        if self.started:
+            return
+        connection.execute_wrappers.append(self._record_query)
+        self._started_at = perf_counter()
+        self._stopped_at = None
+        self.started = True
+        logger.warning("[PROFILE] Enabled - expect per-query overhead")
+
+    def stop(self) -> None:
+        """Remove the SQL wrapper installed by :meth:`start`."""
+        from django.db import connection
+
+        if not self.started:
+            return
+        try:
+            connection.execute_wrappers.remove(self._record_query)
+        except ValueError:
+            pass
+        self._stopped_at = perf_counter()
+        self.started = False
+
+    def phase(self, name: str) -> _PhaseTimer | nullcontext[None]:
+        """Return a context manager timing ``name`` (no-op when disabled)."""
+        if not self.started:
+            return _NULL_PHASE
+        return _PhaseTimer(self, name)
+
+    def timed_iter(self, name: str, iterable: Iterable[_T]) -> Iterator[_T]:
+        """Iterate ``iterable`` charging each ``next()`` call to ``name``."""
+        if not self.started:
+            yield from iterable
+            return
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def record_batch(self, *, tick_count: int, elapsed_seconds: float) -> None:
+        """Record throughput for one processed tick batch."""
+        if not self.started:
+            return
+        self.batch_count += 1
+        self.batch_ticks += tick_count
+        self.batch_seconds += elapsed_seconds
+        self._recent_batches.append(
+            {
+                "ticks": tick_count,
+                "seconds": round(elapsed_seconds, 6),
+                "ticks_per_second": _rate(tick_count, elapsed_seconds),
+            }
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable view of the collected measurements."""
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._stopped_at or perf_counter()) - self._started_at
+        phases = {name: stats.to_dict() for name, stats in self._phases.items()}
+        return {
+            "elapsed_seconds": round(elapsed, 6),
+            "phases": phases,
+            "sql_queries": sum(stats.sql_queries for stats in self._phases.values()),
+            "sql_bytes": sum(stats.sql_bytes for stats in self._phases.values()),
+            "batches": self.batch_count,
+            "ticks": self.batch_ticks,
+            "ticks_per_second": _rate(self.batch_ticks, self.batch_seconds),
+            "recent_batches": list(self._recent_batches),
+        }
+
+    def _stats_for(self, name: str) -> _PhaseStats:
+        stats = self._phases.get(name)
+        if stats is None:
+            stats = self._phases[name] = _PhaseStats()
+        return stats
+
+    def _record_query(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        started_at = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            phase = self._active_phases[-1] if self._active_phases else self.OTHER_PHASE
+            stats = self._stats_for(phase)
+            stats.sql_queries += 1
+            stats.sql_bytes += len(str(sql).encode())
+            stats.sql_seconds += perf_counter() - started_at
+
+
+_NULL_PHASE: nullcontext[None] = nullcontext()
+
+
+def _rate(count: int, seconds: float) -> float | None:
+    if seconds <= 0:
+        return None
+    return round(count / seconds, 2)
@@ -2,14 +2,104 @@
 
 from __future__ import annotations
 
+from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any
 
+from django.conf import settings
+from django.db import connection, transaction
+
 from apps.trading.dataclasses import EventContext
 from apps.trading.enums import EventScope, EventType
 from apps.trading.events import StrategyEvent
 
 if TYPE_CHECKING:
-    from apps.trading.models import TradingEvent
+    from apps.trading.models import StrategyEventRecord, TradingEvent
+
+logger: Logger = getLogger(name=__name__)
+
+
+class StrategyEventWriteBuffer:
+    """Accumulate strategy-scope event rows across ticks for batched writes.
+
+    Strategy-scope events are informational (visualization/diagnostics) and
+    never reach the event handler, so they can be written lazily.  The owning
+    executor flushes the buffer on its progress-flush boundary; the buffer also
+    flushes itself once ``max_records`` rows are pending so a long batch cannot
+    grow it without bound.
+    """
+
+    def __init__(self, *, max_records: int | None = None) -> None:
+        if max_records is None:
+            max_records = int(getattr(settings, "TRADING_STRATEGY_EVENT_BUFFER_MAX_RECORDS", 5000))
+        self.max_records = max(int(max_records), 1)
+        self._records: list["StrategyEventRecord"] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def extend(self, records: list["StrategyEventRecord"]) -> None:
+        """Queue records and flush when the buffer reaches its size limit."""
+        if not records:
+            return
+        self._records.extend(records)
+        if len(self._records) >= self.max_records:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending records and return how many rows were written."""
+        if not self._records:
+            return 0
+        records, self._records = self._records, []
+        write_strategy_event_records(records)
+        return len(records)
+
+
+def write_strategy_event_records(records: list["StrategyEventRecord"]) -> None:
+    """Insert strategy-event rows, using ``COPY`` on PostgreSQL.
+
+    Rows written through ``COPY`` do not get primary keys assigned back on the
+    model instances; strategy-scope records are never referenced after being
+    written, so callers must not rely on ``pk`` being set.
+    """
+    if not records:
+        return
+
+    from apps.trading import models as trading_models
+
+    if connection.vendor != "postgresql":
+        trading_models.StrategyEventRecord.objects.bulk_create(records)
+        return
+
+    # A failed COPY aborts the surrounding transaction on PostgreSQL; the
+    # savepoint lets the bulk_create fallback run in a usable transaction.
+    try:
+        with transaction.atomic():
+            _copy_records(trading_models.StrategyEventRecord, records)
+    except Exception:
+        logger.warning(
+            "COPY into strategy_events failed; falling back to bulk_create (rows=%d)",
+            len(records),
+            exc_info=True,
+        )
+        trading_models.StrategyEventRecord.objects.bulk_create(records)
+
+
+def _copy_records(model: type[Any], records: list[Any]) -> None:
+    """Stream model instances into their table with PostgreSQL ``COPY``."""
+    fields = [field for field in model._meta.local_concrete_fields if not field.primary_key]
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    sql = f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(sql) as copy:
+            for record in records:
+                copy.write_row(
+                    [
+                        field.get_db_prep_save(field.pre_save(record, True), connection=connection)
+                        for field in fields
+                    ]
+                )
 
 
 def persist_strategy_events(
@@ -18,8 +108,16 @@ def persist_strategy_events(
     context: EventContext,
     execution_id: Any,
     strategy_type: str,
+    strategy_event_buffer: StrategyEventWriteBuffer | None = None,
 ) -> list["TradingEvent"]:
-    """Persist strategy events into execution and strategy-event tables."""
+    """Persist strategy events into execution and strategy-event tables.
+
+    When ``strategy_event_buffer`` is given, strategy-scope rows are queued in
+    it instead of being inserted immediately.  Execution rows are always
+    written right away because the event handler needs their primary keys; in
+    that case the buffer is flushed in the same call so the two tables stay in
+    step whenever an order is about to be placed.
+    """
     if not events:
         return []
 
@@ -68,9 +166,15 @@ def persist_strategy_events(
 
     if trading_records:
         trading_models.TradingEvent.objects.bulk_create(trading_records)
-    if strategy_records:
-        trading_models.StrategyEventRecord.objects.bulk_create(strategy_records)
 
+    if strategy_event_buffer is None:
+        if strategy_records:
+            trading_models.StrategyEventRecord.objects.bulk_create(strategy_records)
+        return trading_records
+
+    strategy_event_buffer.extend(strategy_records)
+    if trading_records:
+        strategy_event_buffer.flush()
     return trading_records
 
 
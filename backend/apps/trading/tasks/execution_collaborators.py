@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from apps.trading.events import StrategyEvent
 from apps.trading.models import BacktestTask, TradingEvent
 from apps.trading.models.state import ExecutionState
 from apps.trading.tasks.event_persistence import (
+    StrategyEventWriteBuffer,
     materialize_execution_events,
     persist_strategy_events,
 )
@@ -22,6 +24,7 @@ class ExecutionEventDispatcher:
     def __init__(self, executor: "TaskExecutor") -> None:
         """Bind event persistence/dispatch to an executor instance."""
         self.executor = executor
+        self.strategy_event_buffer = StrategyEventWriteBuffer()
 
     def process(
         self,
@@ -49,8 +52,13 @@ class ExecutionEventDispatcher:
             context=executor.event_context,
             execution_id=executor.task.execution_id,
             strategy_type=strategy_type,
+            strategy_event_buffer=self.strategy_event_buffer,
         )
 
+    def flush(self) -> int:
+        """Write buffered strategy-event rows; return how many were written."""
+        return self.strategy_event_buffer.flush()
+
 
 class ExecutionStateRepository:
     """Load and save execution state for a task executor."""
@@ -162,7 +170,8 @@ class ExecutionTickLoop:
         executor.logger.info("Starting tick processing loop")
         executor._flush_task_logs()
 
-        for tick_batch in executor.data_source:
+        profiler = executor._profiler
+        for tick_batch in profiler.timed_iter("data", executor.data_source):
             if executor._should_stop_before_batch(loop):
                 break
 
@@ -175,7 +184,16 @@ class ExecutionTickLoop:
 
             loop.no_tick_batches = 0
             loop.market_closed_empty_batch_logged = False
+            ticks_before = loop.state.ticks_processed
+            batch_started_at = perf_counter()
             executor._process_tick_batch(loop, tick_batch)
+            tick_count = loop.state.ticks_processed - ticks_before
+            elapsed_seconds = perf_counter() - batch_started_at
+            profiler.record_batch(tick_count=tick_count, elapsed_seconds=elapsed_seconds)
+            # Live sources size their next batches from this measurement.
+            record_processing = getattr(executor.data_source, "record_batch_processing", None)
+            if callable(record_processing):
+                record_processing(tick_count=tick_count, elapsed_seconds=elapsed_seconds)
             loop.batch_count += 1
             executor._persist_batch_progress(loop)
             executor._after_batch_processed(loop)
@@ -19,6 +19,8 @@ class LiveTickDeliveryState:
     age_seconds: float | None
     max_age_seconds: int
     message: str
+    conflated_ticks: int = 0
+    batch_size: int | None = None
 
     @classmethod
     def from_observation(
@@ -30,6 +32,8 @@ class LiveTickDeliveryState:
         age_seconds: float | None,
         max_age_seconds: int,
         message: str,
+        conflated_ticks: int = 0,
+        batch_size: int | None = None,
     ) -> "LiveTickDeliveryState":
         """Build delivery diagnostics from a live tick observation."""
         return cls(
@@ -39,6 +43,8 @@ class LiveTickDeliveryState:
             age_seconds=round(age_seconds, 3) if age_seconds is not None else None,
             max_age_seconds=max_age_seconds,
             message=message,
+            conflated_ticks=conflated_ticks,
+            batch_size=batch_size,
         )
 
     @classmethod
@@ -56,6 +62,8 @@ class LiveTickDeliveryState:
             age_seconds=cls._optional_float(raw.get("age_seconds")),
             max_age_seconds=cls._optional_int(raw.get("max_age_seconds")) or 0,
             message=str(raw.get("message") or ""),
+            conflated_ticks=cls._optional_int(raw.get("conflated_ticks")) or 0,
+            batch_size=cls._optional_int(raw.get("batch_size")),
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -67,6 +75,8 @@ class LiveTickDeliveryState:
             "age_seconds": self.age_seconds,
             "max_age_seconds": self.max_age_seconds,
             "message": self.message,
+            "conflated_ticks": self.conflated_ticks,
+            "batch_size": self.batch_size,
         }
 
     def apply_to(self, state: ExecutionState) -> None:
@@ -12,6 +12,11 @@ from typing import TYPE_CHECKING
 from apps.trading.dataclasses import StrategyResult
 from apps.trading.enums import TaskStatus, TaskType
 from apps.trading.models import TradingEvent
+from apps.trading.services.latency_histogram import (
+    LATENCY_STAGE_DECISION,
+    LATENCY_STAGE_PUBLISH,
+    LATENCY_STAGE_RECEIVE,
+)
 from apps.trading.tasks.execution_dtos import LiveTickDeliveryState
 
 if TYPE_CHECKING:
@@ -64,25 +69,34 @@ class ExecutionTickProcessor:
         if executor._backtest_gap_guard.stop_for_gap(loop=loop, tick_ts=tick_ts):
             return True
 
-        executor._runtime_metric_recorder.materialize_if_tick_enters_new_bucket(
-            loop.state,
-            tick_ts,
-        )
+        profiler = executor._profiler
+        with profiler.phase("metrics"):
+            executor._runtime_metric_recorder.materialize_if_tick_enters_new_bucket(
+                loop.state,
+                tick_ts,
+            )
         if executor._backtest_idle_policy.handle_if_idle(loop=loop, tick=tick, tick_ts=tick_ts):
             return False
 
+        latency_recorder = executor._latency_recorder
+        if latency_recorder is not None:
+            self._record_delivery_latency(latency_recorder, tick=tick, tick_ts=tick_ts)
         live_tick_delivery = executor._current_live_tick_delivery_state(loop.state)
-        result: StrategyResult = executor.engine.on_tick(tick=tick, state=loop.state)
+        with profiler.phase("strategy"):
+            result: StrategyResult = executor.engine.on_tick(tick=tick, state=loop.state)
+        if latency_recorder is not None:
+            latency_recorder.observe(LATENCY_STAGE_DECISION, tick_ts)
         loop.state = result.state
         if live_tick_delivery is not None:
             executor._merge_live_tick_delivery_state(loop.state, live_tick_delivery)
-        events: list[TradingEvent] = executor.save_events(result.events)
+        with profiler.phase("events"):
+            events: list[TradingEvent] = executor.save_events(result.events)
 
-        if executor.task_type == TaskType.TRADING and events:
-            executor.save_state(loop.state)
+            if executor.task_type == TaskType.TRADING and events:
+                executor.save_state(loop.state)
 
-        if events:
-            executor.handle_events(loop.state, events)
+            if events:
+                executor.handle_events(loop.state, events)
 
         if result.should_stop:
             logger.warning(
@@ -90,15 +104,27 @@ class ExecutionTickProcessor:
                 result.stop_reason,
                 loop.state.ticks_processed,
             )
-            executor._record_processed_tick(loop, tick)
+            with profiler.phase("metrics"):
+                executor._record_processed_tick(loop, tick)
             loop.stopped_early = True
             loop.stop_reason = result.stop_reason
             loop.is_error = result.is_error
             return True
 
-        executor._record_processed_tick(loop, tick)
+        with profiler.phase("metrics"):
+            executor._record_processed_tick(loop, tick)
         return False
 
+    @staticmethod
+    def _record_delivery_latency(recorder, *, tick, tick_ts: datetime) -> None:
+        """Record the publish and receive hops carried on a live tick."""
+        publish_latency = getattr(tick, "oanda_tick_publish_latency_seconds", None)
+        if publish_latency is not None:
+            recorder.record(LATENCY_STAGE_PUBLISH, float(publish_latency))
+        received_at = getattr(tick, "trading_tick_received_at", None)
+        if isinstance(received_at, datetime):
+            recorder.observe(LATENCY_STAGE_RECEIVE, tick_ts, received_at)
+
     def _skip_resume_duplicate_tick(
         self,
         *,
@@ -496,6 +522,8 @@ class LiveTickDeliveryStateRepository:
         age_seconds: float | None,
         max_age_seconds: int,
         message: str,
+        conflated_ticks: int = 0,
+        batch_size: int | None = None,
     ) -> None:
         """Persist live tick delivery diagnostics."""
         LiveTickDeliveryState.from_observation(
@@ -505,6 +533,8 @@ class LiveTickDeliveryStateRepository:
             age_seconds=age_seconds,
             max_age_seconds=max_age_seconds,
             message=message,
+            conflated_ticks=conflated_ticks,
+            batch_size=batch_size,
         ).apply_to(loop.state)
 
     def current(self, state: "ExecutionState") -> dict[str, object] | None:
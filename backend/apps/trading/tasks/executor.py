@@ -22,14 +22,16 @@ from apps.trading.logging import flush_task_log_handlers
 from apps.trading.models import BacktestTask, TradingEvent, TradingTask
 from apps.trading.models.state import ExecutionState
 from apps.trading.order import OrderService
+from apps.trading.services.latency_histogram import LiveLatencyRecorder
 from apps.trading.services.runtime_metrics import (
     RuntimeMetricsTracker,
     config_decimal,
     config_int,
 )
+from apps.trading.services.periodic_trade_metrics import TradeOutcomeRollupRefresher
 from apps.trading.services.unrealized_pnl import update_unrealized_pnl
 from apps.trading.tasks.broker_read_outage import BrokerReadOutageCoordinator
-from apps.trading.tasks.diagnostics import ExecutionDiagnostics
+from apps.trading.tasks.diagnostics import ExecutionDiagnostics, ExecutionProfiler
 from apps.trading.tasks.drain import TaskDrainCoordinator, record_final_stop_metrics
 from apps.trading.tasks.event_processor import TaskEventProcessor
 from apps.trading.tasks.event_replay import (
@@ -174,6 +176,7 @@ class TaskExecutor:
             task_id=str(task.pk),
             execution_id=str(task.execution_id) if task.execution_id else None,
         )
+        self._trade_outcome_rollups = TradeOutcomeRollupRefresher()
         self._runtime_metrics = self._create_runtime_metrics_tracker()
         self._live_tick_delivery_state_repository = LiveTickDeliveryStateRepository()
         self._live_tick_delivery_guard = LiveTickDeliveryGuard(self)
@@ -181,6 +184,10 @@ class TaskExecutor:
         self._backtest_idle_policy = BacktestIdleTickPolicy(self)
         self._trading_idle_tick_policy = TradingIdleTickPolicy(self)
         self._runtime_metric_recorder = RuntimeMetricsRecorder(self)
+        self._latency_recorder = (
+            LiveLatencyRecorder.for_task(task) if self.task_type == TaskType.TRADING else None
+        )
+        order_service.latency_recorder = self._latency_recorder
         self._tick_processor = ExecutionTickProcessor(self)
         self._broker_read_outage = BrokerReadOutageCoordinator(
             task=task,
@@ -196,6 +203,7 @@ class TaskExecutor:
             task=task,
             tracemalloc_enabled=self._tracemalloc_enabled,
         )
+        self._profiler = ExecutionProfiler(enabled=bool(debug_opts.get("profile")))
         self._market_idle = MarketIdleCoordinator(task=task, task_type=self.task_type)
         self._drain = TaskDrainCoordinator(self)
         self._metric_resume = RuntimeMetricResumeCoordinator(self)
@@ -428,10 +436,24 @@ class TaskExecutor:
         """
         return self._event_dispatcher.persist(events)
 
+    def _flush_buffered_events(self) -> None:
+        """Write strategy events buffered since the last progress flush."""
+        self._event_dispatcher.flush()
+
+    def _flush_cycle_summaries(self) -> None:
+        """Refresh cycle summaries for trades written since the last progress flush."""
+        self.event_handler.flush_cycle_summaries()
+
+    def _flush_trade_outcome_rollups(self) -> None:
+        """Refresh the hourly outcome rollups of events processed since the last flush."""
+        self._trade_outcome_rollups.flush()
+
     def execute(self) -> None:
         """Execute the task."""
         if self._tracemalloc_enabled:
             self._start_tracemalloc()
+        if self._profiler.enabled:
+            self._profiler.start()
         try:
             state, resumed = self._start_execution()
             loop = ExecutionLoopState(
@@ -452,6 +474,8 @@ class TaskExecutor:
         finally:
             if self._diagnostics.tracemalloc_started:
                 self._stop_tracemalloc()
+            if self._profiler.started:
+                self._stop_profiler()
             self._cleanup_execution()
 
     def _maybe_enter_market_idle_at_start(self, loop: ExecutionLoopState) -> None:
@@ -802,6 +826,10 @@ class TaskExecutor:
         max_age_seconds: int,
         message: str,
     ) -> None:
+        batching_stats = getattr(self.data_source, "batching_stats", None)
+        stats = batching_stats() if callable(batching_stats) else None
+        if not isinstance(stats, dict):
+            stats = {}
         self._live_tick_delivery_state_repository.write(
             loop=loop,
             status=status,
@@ -810,6 +838,8 @@ class TaskExecutor:
             age_seconds=age_seconds,
             max_age_seconds=max_age_seconds,
             message=message,
+            conflated_ticks=int(stats.get("conflated_ticks") or 0),
+            batch_size=stats.get("batch_size") or None,
         )
 
     def _current_live_tick_delivery_state(self, state: ExecutionState) -> dict[str, object] | None:
@@ -998,8 +1028,7 @@ class TaskExecutor:
             state=state,
         )
 
-    @staticmethod
-    def _mark_event_processed(trading_event: TradingEvent) -> None:
+    def _mark_event_processed(self, trading_event: TradingEvent) -> None:
         if getattr(trading_event, "_in_memory", False):
             from django.utils import timezone as dj_timezone
 
@@ -1008,6 +1037,7 @@ class TaskExecutor:
             trading_event.processing_error = ""
             return
         mark_event_processed(trading_event)
+        self._trade_outcome_rollups.add(trading_event)
 
     @staticmethod
     def _mark_event_processing_error(trading_event: TradingEvent, message: str) -> None:
@@ -1038,11 +1068,21 @@ class TaskExecutor:
 
     def _persist_batch_progress(self, loop: ExecutionLoopState) -> None:
         """Persist state/metrics and emit periodic telemetry."""
+        if self._latency_recorder is not None:
+            self._latency_recorder.maybe_flush()
         if not self._progress_flush_policy.should_flush(batch_count=loop.batch_count):
             self._emit_batch_telemetry(loop)
             if self._tracemalloc_enabled:
                 self._check_memory(loop)
             return
+        with self._profiler.phase("persistence"):
+            self._persist_batch_checkpoint(loop)
+        self._emit_batch_telemetry(loop)
+        if self._tracemalloc_enabled:
+            self._check_memory(loop)
+
+    def _persist_batch_checkpoint(self, loop: ExecutionLoopState) -> None:
+        """Write state, buffered events and metrics for a flushed batch."""
         self._runtime_metric_recorder.materialize_latest(loop.state)
         logger.debug(
             "Saving state after batch - task_id=%s, batch_count=%d, ticks_processed=%d",
@@ -1051,11 +1091,11 @@ class TaskExecutor:
             loop.state.ticks_processed,
         )
         self.save_state(loop.state)
+        self._flush_buffered_events()
+        self._flush_cycle_summaries()
+        self._flush_trade_outcome_rollups()
         self._flush_metrics(loop.state)
         self._update_unrealized_pnl(loop.state)
-        self._emit_batch_telemetry(loop)
-        if self._tracemalloc_enabled:
-            self._check_memory(loop)
 
     def _update_unrealized_pnl(self, state: ExecutionState) -> None:
         """Recalculate unrealized pnl for open positions from latest tick."""
@@ -1093,7 +1133,8 @@ class TaskExecutor:
                 loop.state.ticks_processed,
             )
             self.state_manager.heartbeat(
-                status_message=f"Processed {loop.state.ticks_processed} ticks"
+                status_message=f"Processed {loop.state.ticks_processed} ticks",
+                meta_update=self._profile_meta(),
             )
 
     # ------------------------------------------------------------------
@@ -1115,6 +1156,29 @@ class TaskExecutor:
     def _log_tracemalloc_snapshot(self, label: str) -> None:
         self._diagnostics.log_tracemalloc_snapshot(label)
 
+    # ------------------------------------------------------------------
+    # Debug: phase/SQL profiling (opt-in via task.debug_options.profile)
+    # ------------------------------------------------------------------
+
+    def _profile_meta(self) -> dict[str, Any] | None:
+        """Return the status-metadata update carrying the current profile."""
+        if not self._profiler.started:
+            return None
+        return {"execution_profile": self._profiler.snapshot()}
+
+    def _stop_profiler(self) -> None:
+        """Stop SQL capture and publish the final profile to task status."""
+        self._profiler.stop()
+        profile = self._profiler.snapshot()
+        logger.info("[PROFILE] task=%s profile=%s", self.task.pk, profile)
+        try:
+            self.state_manager.heartbeat(
+                meta_update={"execution_profile": profile},
+                force=True,
+            )
+        except Exception:
+            logger.warning("Failed to publish execution profile", exc_info=True)
+
     def _finalize_execution(self, loop: ExecutionLoopState) -> None:
         """Run stop hook and persist final stop state."""
         # If the user asked for "Close All Positions" at stop time, close
@@ -1127,10 +1191,15 @@ class TaskExecutor:
         result = self.engine.on_stop(state=loop.state)
         loop.state = result.state
         self.save_events(result.events)
+        self._flush_buffered_events()
+        self._flush_cycle_summaries()
+        self._flush_trade_outcome_rollups()
         self._runtime_metric_recorder.materialize_latest(loop.state)
         self.save_state(loop.state)
         # Flush any remaining metrics (including the last partial minute)
         self._metrics_aggregator.flush(final=True)
+        if self._latency_recorder is not None:
+            self._latency_recorder.flush()
         logger.info("Engine stopped, events_count=%d", len(result.events))
 
         self._raise_if_failed_stop(loop)
@@ -1240,6 +1309,15 @@ class TaskExecutor:
 
     def _cleanup_execution(self) -> None:
         """Release runtime resources."""
+        try:
+            self._flush_buffered_events()
+        except Exception:
+            logger.warning("Failed to flush buffered strategy events", exc_info=True)
+        try:
+            self._flush_cycle_summaries()
+            self._flush_trade_outcome_rollups()
+        except Exception:
+            logger.warning("Failed to flush cycle summaries and outcome rollups", exc_info=True)
         if self.uses_in_memory_mode:
             try:
                 self.event_handler.clear_positions()
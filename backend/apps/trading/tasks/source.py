@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from logging import Logger, getLogger
 from typing import Any, Callable, Iterator
@@ -1263,6 +1263,85 @@ class RedisStreamTickDataSource(TickDataSource):
     _is_valid_backtest_tick = staticmethod(RedisTickDataSource._is_valid_backtest_tick)
 
 
+class AdaptiveTickBatchController:
+    """Decide when a live tick batch is complete.
+
+    The executor reports how long each batch took, and the smoothed per-tick
+    cost bounds how many ticks fit in the latency budget. Ticks already queued
+    on the subscription (the backlog) are always drained up to
+    ``max_batch_size`` so a burst is caught up in a few large batches, while a
+    quiet market flushes as soon as the next tick is unlikely to arrive within
+    the remaining budget. With ``adaptive=False`` batches close at
+    ``batch_size`` ticks or after ``max_latency_seconds``.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        max_batch_size: int,
+        max_latency_seconds: float,
+        adaptive: bool = True,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.batch_size = max(int(batch_size), 1)
+        self.max_batch_size = max(int(max_batch_size), self.batch_size)
+        self.max_latency_seconds = max(float(max_latency_seconds), 0.0)
+        self.adaptive = adaptive
+        self.smoothing = min(max(float(smoothing), 0.01), 1.0)
+        self.per_tick_seconds: float | None = None
+        self.arrival_interval_seconds: float | None = None
+        self._last_arrival_at: float | None = None
+
+    def _smooth(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    def record_arrival(self, at: float) -> None:
+        """Track the smoothed interval between tick timestamps (epoch seconds)."""
+        if self._last_arrival_at is not None:
+            self.arrival_interval_seconds = self._smooth(
+                self.arrival_interval_seconds, max(at - self._last_arrival_at, 0.0)
+            )
+        self._last_arrival_at = at
+
+    def record_processing(self, *, tick_count: int, elapsed_seconds: float) -> None:
+        """Feed back the time the executor spent on a batch."""
+        if tick_count <= 0 or elapsed_seconds < 0:
+            return
+        self.per_tick_seconds = self._smooth(self.per_tick_seconds, elapsed_seconds / tick_count)
+
+    def ticks_within_budget(self) -> int:
+        """Return how many ticks can be processed inside the latency budget."""
+        if not self.per_tick_seconds:
+            return self.batch_size
+        return int(self.max_latency_seconds / self.per_tick_seconds)
+
+    def batch_limit(self, *, backlog: int = 0) -> int:
+        """Return the size at which the current batch is released.
+
+        ``backlog`` counts ticks in the batch that were already queued when
+        read; they are late regardless, so they extend the batch rather than
+        use up the budget reserved for ticks the source waits for.
+        """
+        if not self.adaptive:
+            return self.batch_size
+        return min(max(self.ticks_within_budget(), 1) + backlog, self.max_batch_size)
+
+    def wait_seconds(self, *, pending: int, batch_age: float) -> float:
+        """Return how long to wait for another tick before releasing the batch."""
+        remaining = self.max_latency_seconds - batch_age
+        if not self.adaptive:
+            return max(min(remaining, 1.0), 0.0)
+        remaining -= (self.per_tick_seconds or 0.0) * pending
+        if remaining <= 0:
+            return 0.0
+        if self.arrival_interval_seconds is not None and self.arrival_interval_seconds > remaining:
+            return 0.0
+        return min(remaining, 1.0)
+
+
 class LiveTickDataSource(TickDataSource):
     """Live tick data source for real-time trading.
 
@@ -1278,12 +1357,17 @@ class LiveTickDataSource(TickDataSource):
         *,
         batch_size: int | None = None,
         batch_max_latency_seconds: float | None = None,
+        max_batch_size: int | None = None,
+        adaptive_batching: bool | None = None,
+        conflate: bool = False,
     ) -> None:
         """Initialize the live tick data source.
 
         Args:
             channel: Redis channel name to subscribe to
             instrument: Trading instrument to filter for
+            conflate: Deliver only the latest tick of each batch, for
+                strategies that only need the current price
         """
         self.channel = channel
         self.instrument = instrument
@@ -1299,9 +1383,57 @@ class LiveTickDataSource(TickDataSource):
             ),
             0.0,
         )
+        self.batching = AdaptiveTickBatchController(
+            batch_size=self.batch_size,
+            max_batch_size=int(
+                max_batch_size or getattr(settings, "LIVE_TICK_BATCH_MAX_SIZE", 200)
+            ),
+            max_latency_seconds=self.batch_max_latency_seconds,
+            adaptive=(
+                adaptive_batching
+                if adaptive_batching is not None
+                else bool(getattr(settings, "LIVE_TICK_ADAPTIVE_BATCHING", True))
+            ),
+        )
+        self.conflate = conflate
+        self.conflated_ticks = 0
+        self.last_batch_size = 0
+        self.last_backlog = 0
         self.client = None
         self.pubsub = None
 
+    def record_batch_processing(self, *, tick_count: int, elapsed_seconds: float) -> None:
+        """Feed the executor's measured batch processing time to the batcher."""
+        self.batching.record_processing(tick_count=tick_count, elapsed_seconds=elapsed_seconds)
+
+    def batching_stats(self) -> dict[str, Any]:
+        """Return batching and conflation counters for delivery diagnostics."""
+        return {
+            "conflated_ticks": self.conflated_ticks,
+            "batch_size": self.last_batch_size,
+            "backlog": self.last_backlog,
+        }
+
+    def _next_message(self, *, pending: int, batch_age: float) -> tuple[Any, bool]:
+        """Return the next pub/sub message and whether it was already queued."""
+        if not pending:
+            return self.pubsub.get_message(timeout=1.0), False
+        message = self.pubsub.get_message(timeout=0.0)
+        if message:
+            return message, True
+        wait = self.batching.wait_seconds(pending=pending, batch_age=batch_age)
+        if wait <= 0:
+            return None, False
+        return self.pubsub.get_message(timeout=wait), False
+
+    def _release_batch(self, ticks: list[Tick], *, backlog: int) -> list[Tick]:
+        self.last_batch_size = len(ticks)
+        self.last_backlog = backlog
+        if self.conflate and len(ticks) > 1:
+            self.conflated_ticks += len(ticks) - 1
+            return ticks[-1:]
+        return ticks
+
     def __iter__(self) -> Iterator[list[Tick]]:
         """Iterate over ticks from real-time market data.
 
@@ -1332,16 +1464,17 @@ class LiveTickDataSource(TickDataSource):
             ticks_received = 0
             pending_ticks: list[Tick] = []
             batch_started_at: float | None = None
+            backlog = 0
             while True:
                 try:
-                    timeout = 1.0
-                    if pending_ticks and batch_started_at is not None:
-                        elapsed = time.monotonic() - batch_started_at
-                        timeout = max(
-                            min(self.batch_max_latency_seconds - elapsed, 1.0),
-                            0.0,
-                        )
-                    message = self.pubsub.get_message(timeout=timeout)
+                    message, queued = self._next_message(
+                        pending=len(pending_ticks),
+                        batch_age=(
+                            time.monotonic() - batch_started_at
+                            if batch_started_at is not None
+                            else 0.0
+                        ),
+                    )
                     reconnect_attempts = 0
                 except (redis.ConnectionError, ConnectionError) as exc:
                     reconnect_attempts += 1
@@ -1374,12 +1507,11 @@ class LiveTickDataSource(TickDataSource):
                     self.pubsub.subscribe(self.channel)
                     continue
                 if not message:
-                    if pending_ticks and batch_started_at is not None:
-                        elapsed = time.monotonic() - batch_started_at
-                        if elapsed >= self.batch_max_latency_seconds:
-                            yield pending_ticks
-                            pending_ticks = []
-                            batch_started_at = None
+                    if pending_ticks:
+                        yield self._release_batch(pending_ticks, backlog=backlog)
+                        pending_ticks = []
+                        batch_started_at = None
+                        backlog = 0
                         continue
                     idle_seconds += 1
                     # Yield empty batch every 5 seconds so the executor can
@@ -1390,6 +1522,7 @@ class LiveTickDataSource(TickDataSource):
                     continue
 
                 idle_seconds = 0
+                received_at = datetime.now(UTC)
                 ticks_received += 1
                 if ticks_received == 1:
                     logger.info(
@@ -1420,8 +1553,6 @@ class LiveTickDataSource(TickDataSource):
 
                 # Parse timestamp
                 try:
-                    from datetime import UTC, datetime
-
                     timestamp_str = timestamp_raw.strip()
                     if timestamp_str.endswith("Z"):
                         timestamp_str = timestamp_str[:-1] + "+00:00"
@@ -1460,6 +1591,7 @@ class LiveTickDataSource(TickDataSource):
                                 "oanda_tick_publish_latency_seconds"
                             ),
                             "oanda_tick_published_at": payload.get("oanda_tick_published_at"),
+                            "trading_tick_received_at": received_at,
                         }
                     )
                 except (ValueError, InvalidOperation):
@@ -1467,17 +1599,21 @@ class LiveTickDataSource(TickDataSource):
 
                 if not pending_ticks:
                     batch_started_at = time.monotonic()
+                elif queued:
+                    backlog += 1
                 pending_ticks.append(tick)
+                self.batching.record_arrival(timestamp.timestamp())
                 batch_age = (
                     time.monotonic() - batch_started_at if batch_started_at is not None else 0.0
                 )
-                if len(pending_ticks) >= self.batch_size or (
+                if len(pending_ticks) >= self.batching.batch_limit(backlog=backlog) or (
                     self.batch_max_latency_seconds == 0
                     or batch_age >= self.batch_max_latency_seconds
                 ):
-                    yield pending_ticks
+                    yield self._release_batch(pending_ticks, backlog=backlog)
                     pending_ticks = []
                     batch_started_at = None
+                    backlog = 0
 
         finally:
             self.close()
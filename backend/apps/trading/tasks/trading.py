@@ -153,6 +153,7 @@ def execute_trading(task: TradingTask) -> None:
     data_source = LiveTickDataSource(
         channel=channel,
         instrument=task.instrument,
+        conflate=engine.strategy.supports_tick_conflation(),
     )
 
     executor = TradingExecutor(
@@ -0,0 +1,121 @@
+"""Worker-side hooks and reconciliation for the worker capacity registry."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from logging import Logger, getLogger
+from typing import Any
+
+from celery import current_app, shared_task
+from django.conf import settings
+
+from apps.trading.services.worker_capacity import (
+    WorkerCapacityRegistry,
+    queue_names,
+    tracked_queues,
+    usage_from_inspect,
+    worker_capacity_registry_enabled,
+)
+
+logger: Logger = getLogger(name=__name__)
+
+_registry: WorkerCapacityRegistry | None = None
+_heartbeat_stop = threading.Event()
+
+
+def _get_registry() -> WorkerCapacityRegistry:
+    global _registry
+    if _registry is None:
+        _registry = WorkerCapacityRegistry()
+    return _registry
+
+
+def record_task_started(*, task_id: str, task: Any) -> None:
+    """Register a task against its worker when the worker starts running it."""
+    if not worker_capacity_registry_enabled():
+        return
+    worker = str(getattr(getattr(task, "request", None), "hostname", "") or "")
+    if not worker or not task_id:
+        return
+    try:
+        _get_registry().task_started(task_id=task_id, worker=worker)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to record task start in capacity registry", exc_info=True)
+
+
+def record_task_finished(*, task_id: str, task: Any) -> None:
+    """Remove a finished task from the registry."""
+    _ = task
+    if not worker_capacity_registry_enabled() or not task_id:
+        return
+    try:
+        _get_registry().task_finished(task_id=task_id)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to record task finish in capacity registry", exc_info=True)
+
+
+def start_worker_heartbeat(worker: str, queues: Iterable[str] = ()) -> threading.Thread | None:
+    """Heartbeat *worker* and its *queues* from a daemon thread in the worker main process."""
+    if not worker_capacity_registry_enabled() or not worker:
+        return None
+    interval = float(getattr(settings, "CELERY_WORKER_CAPACITY_HEARTBEAT_SECONDS", 15))
+    consumed = tuple(queues)
+    _heartbeat_stop.clear()
+
+    def beat() -> None:
+        while not _heartbeat_stop.is_set():
+            try:
+                _get_registry().heartbeat(worker, queues=consumed)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug("Worker capacity heartbeat failed", exc_info=True)
+            _heartbeat_stop.wait(interval)
+
+    thread = threading.Thread(target=beat, name="worker-capacity-heartbeat", daemon=True)
+    thread.start()
+    return thread
+
+
+def stop_worker_heartbeat(worker: str) -> None:
+    """Stop heartbeating and drop the worker's registry entries."""
+    _heartbeat_stop.set()
+    if not worker_capacity_registry_enabled() or not worker:
+        return
+    try:
+        _get_registry().remove_worker(worker)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to remove worker %s from capacity registry", worker, exc_info=True)
+
+
+def reconcile_worker_capacity(
+    *,
+    inspector: Any | None = None,
+    registry: WorkerCapacityRegistry | None = None,
+) -> dict[str, int] | None:
+    """Rewrite the registry from an ``inspect`` broadcast.
+
+    Returns per-queue task counts, or None when no worker replied (the
+    registry is left untouched so a broker hiccup cannot zero it).
+    """
+    inspector = inspector or current_app.control.inspect(timeout=2.0)
+    active_queues = inspector.active_queues() or {}
+    if not active_queues:
+        return None
+    active = inspector.active() or {}
+    usage = usage_from_inspect(active_queues=active_queues, active=active, queues=tracked_queues())
+    tasks = {
+        str(entry.get("id") or f"{worker}:{index}"): worker
+        for worker in active_queues
+        for index, entry in enumerate(active.get(worker) or [])
+    }
+    worker_queues = {worker: queue_names(entries) for worker, entries in active_queues.items()}
+    (registry or _get_registry()).replace(tasks=tasks, worker_queues=worker_queues)
+    return {queue: len(tasks) for queue, tasks in usage.items()}
+
+
+@shared_task(name="trading.tasks.reconcile_worker_capacity")
+def reconcile_worker_capacity_beat() -> dict[str, int] | None:
+    """Periodic Celery Beat task to repair the worker capacity registry."""
+    if not worker_capacity_registry_enabled():
+        return None
+    return reconcile_worker_capacity()
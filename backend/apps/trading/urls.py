@@ -20,7 +20,7 @@ from apps.trading.views.initial_positions import (
     InitialPositionImportFromTaskView,
     InitialPositionImportSourcesView,
 )
-from apps.trading.views.operations import TradingOperationsMetricsView
+from apps.trading.views.operations import ExecutionProfileView, TradingOperationsMetricsView
 from apps.trading.views.recovery import RecoveryAttemptListView
 from apps.trading.views.strategies import StrategyDefaultsView, StrategyView
 from apps.trading.views.stream import TaskEventStreamView
@@ -63,6 +63,11 @@ urlpatterns = [
         TradingOperationsMetricsView.as_view(),
         name="operations_metrics",
     ),
+    path(
+        "operations/execution-profiles/",
+        ExecutionProfileView.as_view(),
+        name="operations_execution_profiles",
+    ),
     # Strategy endpoints
     path("strategies/", StrategyView.as_view(), name="strategy_list"),
     path(
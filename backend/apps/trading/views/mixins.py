@@ -10,6 +10,7 @@ from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -50,11 +51,22 @@ from apps.trading.views.query_params import (
     TradesQueryParamsSchemaSerializer,
 )
 from apps.trading.views.pagination import (
+    ActivityKeysetPagination,
     ActivityPagination,
+    TradePositionKeysetPagination,
     TradePositionPagination,
 )
 
 
+def _paginator(
+    request: Request,
+    page_class: type[PageNumberPagination],
+    keyset_class: type[ActivityKeysetPagination],
+) -> PageNumberPagination | ActivityKeysetPagination:
+    """Return the keyset paginator when the request passes ``cursor``."""
+    return keyset_class() if keyset_class.is_requested(request) else page_class()
+
+
 class TaskSubResourceMixin(TaskStrategyDataMixin):
     """Mixin providing paginated logs / events / trades actions."""
 
@@ -67,14 +79,18 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             200: inline_serializer(
                 "TaskLogPaginatedResponse",
                 fields={
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
+                    "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": TaskLogSerializer(many=True),
                 },
             )
         },
-        description="Retrieve paginated task logs.",
+        description=(
+            "Retrieve paginated task logs. "
+            "Passing ``cursor`` switches to keyset pagination without a count."
+        ),
     )
     @action(detail=True, methods=["get"], throttle_classes=[TaskDataRateThrottle])
     def logs(self, request: Request, pk: int | None = None) -> Response:
@@ -84,7 +100,7 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             task=task,
             task_type_label=self.task_type_label,
         )
-        paginator = ActivityPagination()
+        paginator = _paginator(request, ActivityPagination, ActivityKeysetPagination)
         page = paginator.paginate_queryset(queryset, request)
         serializer = TaskLogSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -123,14 +139,18 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             200: inline_serializer(
                 "TaskEventPaginatedResponse",
                 fields={
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
+                    "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": TradingEventSerializer(many=True),
                 },
             )
         },
-        description="Retrieve paginated task events.",
+        description=(
+            "Retrieve paginated task events. "
+            "Passing ``cursor`` switches to keyset pagination without a count."
+        ),
     )
     @action(detail=True, methods=["get"], throttle_classes=[TaskDataRateThrottle])
     def events(self, request: Request, pk: int | None = None) -> Response:
@@ -140,7 +160,7 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             task=task,
             task_type_label=self.task_type_label,
         )
-        paginator = ActivityPagination()
+        paginator = _paginator(request, ActivityPagination, ActivityKeysetPagination)
         page = paginator.paginate_queryset(queryset, request)
         serializer = TradingEventSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -207,19 +227,38 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             200: inline_serializer(
                 "TaskTradePaginatedResponse",
                 fields={
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
+                    "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": TradeSerializer(many=True),
                 },
             )
         },
-        description="Retrieve paginated task trades.",
+        description=(
+            "Retrieve paginated task trades. "
+            "Passing ``cursor`` switches to keyset pagination without a count."
+        ),
     )
     @action(detail=True, methods=["get"], throttle_classes=[TaskDataRateThrottle])
     def trades(self, request: Request, pk: str | None = None) -> Response:
         task = self.get_object()  # type: ignore[attr-defined]
-        rows, total_count, page, page_size = TaskActivityQueryService().trades(
+        service = TaskActivityQueryService()
+        if TradePositionKeysetPagination.is_requested(request):
+            queryset, query = service.trades_queryset(
+                request=request,
+                task=task,
+                task_type_label=self.task_type_label,
+            )
+            paginator = TradePositionKeysetPagination()
+            rows = service.trade_rows(
+                paginator.paginate_queryset(queryset, request),
+                task=task,
+                task_type_label=self.task_type_label,
+                execution_id=query.execution.execution_id,
+            )
+            return paginator.get_paginated_response(TradeSerializer(rows, many=True).data)
+        rows, total_count, page, page_size = service.trades(
             request=request,
             task=task,
             task_type_label=self.task_type_label,
@@ -234,14 +273,18 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             200: inline_serializer(
                 "TaskPositionPaginatedResponse",
                 fields={
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
+                    "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": PositionSerializer(many=True),
                 },
             )
         },
-        description="Retrieve paginated task positions.",
+        description=(
+            "Retrieve paginated task positions. "
+            "Passing ``cursor`` switches to keyset pagination without a count."
+        ),
     )
     @action(detail=True, methods=["get"], throttle_classes=[TaskDataRateThrottle])
     def positions(self, request: Request, pk: str | None = None) -> Response:
@@ -251,7 +294,7 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             task=task,
             task_type_label=self.task_type_label,
         )
-        paginator = TradePositionPagination()
+        paginator = _paginator(request, TradePositionPagination, TradePositionKeysetPagination)
         page = paginator.paginate_queryset(queryset, request)
         if page is not None:
             page = PositionMoneyEnricher.for_task(
@@ -316,14 +359,18 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             200: inline_serializer(
                 "TaskOrderPaginatedResponse",
                 fields={
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
+                    "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
                     "results": OrderSerializer(many=True),
                 },
             )
         },
-        description="Retrieve paginated task orders.",
+        description=(
+            "Retrieve paginated task orders. "
+            "Passing ``cursor`` switches to keyset pagination without a count."
+        ),
     )
     @action(detail=True, methods=["get"], throttle_classes=[TaskDataRateThrottle])
     def orders(self, request: Request, pk: str | None = None) -> Response:
@@ -333,7 +380,7 @@ class TaskSubResourceMixin(TaskStrategyDataMixin):
             task=task,
             task_type_label=self.task_type_label,
         )
-        paginator = TradePositionPagination()
+        paginator = _paginator(request, TradePositionPagination, TradePositionKeysetPagination)
         page = paginator.paginate_queryset(queryset, request)
         serializer = OrderSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
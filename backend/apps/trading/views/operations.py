@@ -1,13 +1,16 @@
 """Trading operations health views."""
 
-from drf_spectacular.utils import extend_schema, inline_serializer
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
 from rest_framework import serializers, status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.trading.services.operations import TradingOperationsMetricsService
+from apps.trading.services.operations import (
+    ExecutionProfileCollector,
+    TradingOperationsMetricsService,
+)
 
 
 class TradingOperationsMetricsView(APIView):
@@ -24,10 +27,14 @@ class TradingOperationsMetricsView(APIView):
                 fields={
                     "broker_read_outage": serializers.DictField(),
                     "oanda_retry": serializers.DictField(),
+                    "oanda_client_pool": serializers.DictField(),
                 },
             )
         },
-        description="Get broker-read outage parking and OANDA retry counters.",
+        description=(
+            "Get broker-read outage parking, OANDA retry counters and this "
+            "process's pooled OANDA client hit/miss and connection-reuse stats."
+        ),
     )
     def get(self, request: Request) -> Response:
         """Return operational metrics visible to the current user."""
@@ -35,3 +42,39 @@ class TradingOperationsMetricsView(APIView):
             TradingOperationsMetricsService().snapshot(user=request.user),
             status=status.HTTP_200_OK,
         )
+
+
+class ExecutionProfileView(APIView):
+    """Return opt-in execution profiles for comparing task runs."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        operation_id="trading_operations_execution_profiles",
+        tags=["Trading"],
+        parameters=[
+            OpenApiParameter(
+                name="task_id",
+                type=str,
+                required=False,
+                description="Only return profiles for this task.",
+            )
+        ],
+        responses={
+            200: inline_serializer(
+                "ExecutionProfileListResponse",
+                fields={"results": serializers.ListField(child=serializers.DictField())},
+            )
+        },
+        description=(
+            "Get per-phase wall time, SQL counts and tick throughput recorded by "
+            'tasks started with debug_options {"profile": true}.'
+        ),
+    )
+    def get(self, request: Request) -> Response:
+        """Return recent execution profiles (staff only)."""
+        task_id = request.query_params.get("task_id") or None
+        return Response(
+            {"results": ExecutionProfileCollector().snapshot(task_id=task_id)},
+            status=status.HTTP_200_OK,
+        )
@@ -2,10 +2,34 @@
 
 Provides reusable DRF pagination classes for all list endpoints.
 All paginated endpoints use page/page_size query parameters and return
-the standard DRF envelope: {count, next, previous, results}.
+the standard DRF envelope: {count, next, previous, results}. Endpoints backed
+by append-only history tables and the task activity lists also accept an
+opaque ``cursor`` parameter and return {next, previous, results} without a
+count.
 """
 
-from rest_framework.pagination import PageNumberPagination
+from __future__ import annotations
+
+import base64
+import json
+import operator
+from datetime import datetime
+from functools import reduce
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Field, Model, Q, QuerySet
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.common.querying import estimated_count, invalid_query_param
 
 
 class StandardPagination(PageNumberPagination):
@@ -30,3 +54,187 @@ class TradePositionPagination(PageNumberPagination):
     page_size = 100
     page_size_query_param = "page_size"
     max_page_size = 1000
+
+
+class HistoryCursorPagination(CursorPagination):
+    """Keyset pagination for append-only history tables.
+
+    Callers set ``ordering`` per request; the first field must be a concrete
+    column on the model so the cursor position can be read from each row.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "-pk"
+
+
+class ActivityKeysetPagination(BasePagination):
+    """Composite keyset pagination for task activity lists.
+
+    The queryset's own ``order_by`` terms form the key, e.g.
+    ``(-timestamp, -id)``. The cursor carries the boundary row's value for
+    every term, so deep pages cost an index range scan instead of ``COUNT(*)``
+    plus ``OFFSET``. Only non-null concrete columns can be keyed. Pages carry
+    no count unless ``count=estimate`` (planner statistics) or ``count=exact``
+    is passed.
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    @classmethod
+    def is_requested(cls, request: Request) -> bool:
+        """Return True when the request opts into cursor pagination."""
+        return cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list[Any]:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        terms = self._ordering_terms(queryset)
+        fields = [_key_field(queryset.model, term) for term in terms]
+        position, backwards = self._decode_cursor(
+            request.query_params.get(self.cursor_query_param, ""), terms, fields
+        )
+
+        page_qs = queryset.reverse() if backwards else queryset
+        if position is not None:
+            page_qs = page_qs.filter(_after_q(terms, position, backwards=backwards))
+        rows = list(page_qs[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+
+        self.terms = terms
+        self.has_next = has_more if not backwards else position is not None
+        self.has_previous = has_more if backwards else position is not None
+        self.next_position = _row_values(rows[-1], terms) if self.has_next and rows else None
+        self.previous_position = _row_values(rows[0], terms) if self.has_previous and rows else None
+        self.count, self.count_is_exact = self._count(queryset, request)
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        payload: dict[str, Any] = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            payload["count"] = self.count
+            payload["count_is_exact"] = self.count_is_exact
+        return Response(payload)
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            value = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+        if value < 1:
+            return self.page_size
+        return min(value, self.max_page_size) if self.max_page_size else value
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, backwards=False)
+
+    def get_previous_link(self) -> str | None:
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, backwards=True)
+
+    def _link(self, values: list[Any], *, backwards: bool) -> str:
+        payload = {"o": self.terms, "v": [_json_value(value) for value in values]}
+        if backwards:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        encoded = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _count(self, queryset: QuerySet, request: Request) -> tuple[int | None, bool]:
+        mode = request.query_params.get(self.count_query_param, "")
+        if mode == "estimate":
+            return estimated_count(queryset)
+        if mode == "exact":
+            return queryset.count(), True
+        if mode:
+            raise invalid_query_param("count must be one of: estimate, exact")
+        return None, False
+
+    @staticmethod
+    def _ordering_terms(queryset: QuerySet) -> list[str]:
+        terms = list(queryset.query.order_by)
+        if not terms or not all(isinstance(term, str) for term in terms):
+            raise invalid_query_param(
+                "ordering by this field is not supported with cursor pagination"
+            )
+        pk_name = queryset.model._meta.pk.name
+        return [term.replace("pk", pk_name) if term.lstrip("-") == "pk" else term for term in terms]
+
+    @staticmethod
+    def _decode_cursor(
+        value: str, terms: list[str], fields: list[Field]
+    ) -> tuple[list[Any] | None, bool]:
+        if not value:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+            payload = json.loads(raw)
+            if payload["o"] != terms or len(payload["v"]) != len(fields):
+                raise ValueError("cursor ordering mismatch")
+            position = [
+                field.to_python(item) for field, item in zip(fields, payload["v"], strict=True)
+            ]
+            return position, bool(payload.get("r"))
+        except (ValueError, TypeError, KeyError, DjangoValidationError) as exc:
+            raise invalid_query_param("Invalid cursor.") from exc
+
+
+class TradePositionKeysetPagination(ActivityKeysetPagination):
+    """Keyset pagination for trade, order, and position lists."""
+
+    page_size = 100
+    max_page_size = 1000
+
+
+def _key_field(model: type[Model], term: str) -> Field:
+    name = term.lstrip("-")
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        field = None
+    if field is None or not field.concrete or field.null or "__" in name:
+        raise invalid_query_param("ordering by this field is not supported with cursor pagination")
+    return field
+
+
+def _row_values(row: Any, terms: list[str]) -> list[Any]:
+    names = [term.lstrip("-") for term in terms]
+    if isinstance(row, dict):
+        return [row[name] for name in names]
+    return [getattr(row, name) for name in names]
+
+
+def _after_q(terms: list[str], values: list[Any], *, backwards: bool) -> Q:
+    """Match rows that sort strictly after *values* under *terms*."""
+    clauses = []
+    for index, term in enumerate(terms):
+        lookup = "lt" if term.startswith("-") != backwards else "gt"
+        equal = {prior.lstrip("-"): value for prior, value in zip(terms[:index], values)}
+        clauses.append(Q(**equal, **{f"{term.lstrip('-')}__{lookup}": values[index]}))
+    return reduce(operator.or_, clauses)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool | int | str):
+        return value
+    return str(value)
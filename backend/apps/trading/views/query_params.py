@@ -401,6 +401,23 @@ TRADE_POSITION_PAGE_SIZE_SPEC = _page_size_spec(
     default=TradePositionPagination.page_size,
     max_value=TradePositionPagination.max_page_size,
 )
+ACTIVITY_CURSOR_SPEC = QueryFieldSpec(
+    name="cursor",
+    kind="string",
+    allow_blank=True,
+    help_text=(
+        "Opaque keyset cursor. Passing it (empty for the first page) switches "
+        "from page numbers to cursor pagination."
+    ),
+)
+ACTIVITY_COUNT_SPEC = QueryFieldSpec(
+    name="count",
+    kind="choice",
+    choices=("exact", "estimate"),
+    help_text=(
+        "Cursor mode only: include an exact count, or an estimate from database planner statistics."
+    ),
+)
 TRADES_DIRECTION_SPEC = QueryFieldSpec(
     name="direction",
     kind="string",
@@ -439,6 +456,7 @@ POSITIONS_RANGE_TO_SPEC = QueryFieldSpec(
 )
 
 ACTIVITY_PAGINATION_GROUP = _query_spec_group(PAGE_SPEC, ACTIVITY_PAGE_SIZE_SPEC)
+ACTIVITY_CURSOR_GROUP = _query_spec_group(ACTIVITY_CURSOR_SPEC, ACTIVITY_COUNT_SPEC)
 TRADE_POSITION_PAGINATION_GROUP = _query_spec_group(
     PAGE_SPEC,
     TRADE_POSITION_PAGE_SIZE_SPEC,
@@ -551,6 +569,7 @@ QUERY_GROUP_SPECS = {
         name="LogsQueryParamsSchemaSerializer",
         specs=(
             *EXECUTION_SCOPED_ACTIVITY_GROUP,
+            *ACTIVITY_CURSOR_GROUP,
             LEVEL_SPEC,
             COMPONENT_SPEC,
             MESSAGE_SPEC,
@@ -572,6 +591,7 @@ QUERY_GROUP_SPECS = {
         name="EventsQueryParamsSchemaSerializer",
         specs=(
             *EXECUTION_SCOPED_ACTIVITY_GROUP,
+            *ACTIVITY_CURSOR_GROUP,
             EVENT_TYPE_SPEC,
             SEVERITY_SPEC,
             SCOPE_SPEC,
@@ -601,6 +621,7 @@ QUERY_GROUP_SPECS = {
         name="TradesQueryParamsSchemaSerializer",
         specs=(
             *EXECUTION_SCOPED_TRADE_POSITION_GROUP,
+            *ACTIVITY_CURSOR_GROUP,
             CYCLE_ID_SPEC,
             TRADES_DIRECTION_SPEC,
             TRADES_ORDERING_SPEC,
@@ -615,6 +636,7 @@ QUERY_GROUP_SPECS = {
         name="PositionsQueryParamsSchemaSerializer",
         specs=(
             *EXECUTION_SCOPED_TRADE_POSITION_GROUP,
+            *ACTIVITY_CURSOR_GROUP,
             CYCLE_ID_SPEC,
             POSITION_STATUS_SPEC,
             INITIAL_POSITION_FILTER_SPEC,
@@ -637,6 +659,7 @@ QUERY_GROUP_SPECS = {
         name="OrdersQueryParamsSchemaSerializer",
         specs=(
             *EXECUTION_SCOPED_TRADE_POSITION_GROUP,
+            *ACTIVITY_CURSOR_GROUP,
             ORDER_STATUS_SPEC,
             ORDER_TYPE_SPEC,
             DIRECTION_SPEC,
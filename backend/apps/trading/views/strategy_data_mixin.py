@@ -8,8 +8,11 @@ from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.common.renderers import ColumnarJSONRenderer, TimedJSONRenderer
 from apps.trading.views.throttles import TaskDataRateThrottle
 
+BULK_RENDERER_CLASSES = [TimedJSONRenderer, ColumnarJSONRenderer]
+
 
 class TaskStrategyDataMixin:
     """Mixin providing strategy snapshot, history, and metric endpoints."""
@@ -64,6 +67,12 @@ class TaskStrategyDataMixin:
             OpenApiParameter("ordering", str, required=False),
             OpenApiParameter("granularity", str, required=False),
             OpenApiParameter("category", str, required=False),
+            OpenApiParameter(
+                "cursor",
+                str,
+                required=False,
+                description="Keyset cursor; pass it empty for the first page.",
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -72,7 +81,7 @@ class TaskStrategyDataMixin:
                     "execution_id": serializers.CharField(allow_null=True),
                     "strategy_type": serializers.CharField(),
                     "instrument": serializers.CharField(allow_null=True),
-                    "count": serializers.IntegerField(),
+                    "count": serializers.IntegerField(required=False),
                     "count_is_exact": serializers.BooleanField(required=False),
                     "next": serializers.CharField(allow_null=True),
                     "previous": serializers.CharField(allow_null=True),
@@ -80,13 +89,18 @@ class TaskStrategyDataMixin:
                 },
             )
         },
-        description="Retrieve paginated strategy calculations, actions, and operation history.",
+        description=(
+            "Retrieve paginated strategy calculations, actions, and operation history. "
+            "Passing ``cursor`` switches to keyset pagination without a count. "
+            "``format=columnar`` returns ``results`` as one array per field."
+        ),
     )
     @action(
         detail=True,
         methods=["get"],
         url_path="strategy/history",
         throttle_classes=[TaskDataRateThrottle],
+        renderer_classes=BULK_RENDERER_CLASSES,
     )
     def strategy_history(self, request: Request, pk: int | None = None) -> Response:
         from apps.trading.services.strategy_data import StrategyDataService
@@ -132,13 +146,17 @@ class TaskStrategyDataMixin:
                 },
             )
         },
-        description="Retrieve paginated strategy metrics aligned to OHLC chart granularity.",
+        description=(
+            "Retrieve paginated strategy metrics aligned to OHLC chart granularity. "
+            "``format=columnar`` returns ``results`` as one array per field."
+        ),
     )
     @action(
         detail=True,
         methods=["get"],
         url_path="strategy/metrics",
         throttle_classes=[TaskDataRateThrottle],
+        renderer_classes=BULK_RENDERER_CLASSES,
     )
     def strategy_metrics(self, request: Request, pk: int | None = None) -> Response:
         from apps.trading.services.strategy_data import StrategyDataService
@@ -12,8 +12,10 @@ from drf_spectacular.utils import (
     inline_serializer,
 )
 from rest_framework import serializers, status
+from rest_framework.decorators import action
 from rest_framework.exceptions import APIException
 from rest_framework.request import Request
+from rest_framework.response import Response
 
 from apps.trading.models import TradingTask
 from apps.trading.serializers.trading import (
@@ -21,11 +23,21 @@ from apps.trading.serializers.trading import (
     TradingTaskListSerializer,
     TradingTaskSerializer,
 )
+from apps.trading.services.latency_histogram import (
+    LATENCY_STAGES,
+    latency_histograms_enabled,
+    load_latency_summary,
+)
+from apps.trading.views.query_params import (
+    SummaryQueryParams,
+    SummaryQueryParamsSchemaSerializer,
+)
 from apps.trading.views.task_base import (
     TASK_LIST_PARAMETERS,
     TaskViewSetBase,
     task_stop_response_fields,
 )
+from apps.trading.views.throttles import TaskDataRateThrottle
 
 logger: Logger = logging.getLogger(name=__name__)
 
@@ -181,3 +193,44 @@ class TradingTaskViewSet(TaskViewSetBase):
     def get_stop_response_extras(self, request: Request) -> dict[str, Any]:
         """Include the stop mode in the response."""
         return {"mode": self.get_stop_mode(request)}
+
+    @extend_schema(
+        operation_id="trading_task_latency",
+        tags=["Trading"],
+        parameters=[SummaryQueryParamsSchemaSerializer],
+        responses={
+            200: inline_serializer(
+                "TradingTaskLatencyResponse",
+                fields={
+                    "execution_id": serializers.CharField(allow_null=True),
+                    "enabled": serializers.BooleanField(),
+                    "stages": serializers.ListField(child=serializers.CharField()),
+                    "latency": serializers.DictField(child=serializers.DictField()),
+                },
+            )
+        },
+        description=(
+            "Retrieve tick-to-order latency histograms for a live execution: "
+            "count, p50/p90/p99/p999 and max in seconds from the OANDA tick time "
+            "to publish, receive, strategy decision, order submit and fill."
+        ),
+    )
+    @action(
+        detail=True, methods=["get"], url_path="latency", throttle_classes=[TaskDataRateThrottle]
+    )
+    def latency(self, request: Request, pk: str | None = None) -> Response:
+        """Retrieve merged latency percentiles for a task execution."""
+        task = self.get_object()
+        query = SummaryQueryParams.from_request(
+            request,
+            default_execution_id=task.execution_id,
+        )
+        execution_id = str(query.execution_id) if query.execution_id else None
+        return Response(
+            {
+                "execution_id": execution_id,
+                "enabled": latency_histograms_enabled(),
+                "stages": list(LATENCY_STAGES),
+                "latency": load_latency_summary(task_id=task.pk, execution_id=execution_id) or {},
+            }
+        )
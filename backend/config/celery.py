@@ -12,6 +12,8 @@ from celery.signals import (
     worker_shutting_down,
     worker_process_shutdown,
     task_failure,
+    task_postrun,
+    task_prerun,
     task_revoked,
 )
 from django.apps import apps
@@ -84,6 +86,45 @@ def _start_market_tick_supervisor(**_kwargs: object) -> None:
         return
 
 
+@worker_ready.connect
+def _start_worker_capacity_heartbeat(sender: object = None, **_kwargs: object) -> None:
+    """Advertise this worker in the capacity registry used for admission."""
+    from apps.trading.services.worker_capacity import queue_names
+    from apps.trading.tasks.worker_capacity import start_worker_heartbeat
+
+    try:
+        start_worker_heartbeat(
+            str(getattr(sender, "hostname", "") or ""),
+            queue_names(getattr(getattr(sender, "task_consumer", None), "queues", None)),
+        )
+    except Exception:
+        logger.exception("Failed to start worker capacity heartbeat")
+
+
+@worker_shutting_down.connect
+def _stop_worker_capacity_heartbeat(sender: object = None, **_kwargs: object) -> None:
+    """Stop heartbeating and drop this worker from the capacity registry."""
+    from apps.trading.tasks.worker_capacity import stop_worker_heartbeat
+
+    stop_worker_heartbeat(str(sender or ""))
+
+
+@task_prerun.connect
+def _record_task_started(task_id: str = "", task: object = None, **_kwargs: object) -> None:
+    """Count a starting task against its worker's queues."""
+    from apps.trading.tasks.worker_capacity import record_task_started
+
+    record_task_started(task_id=task_id, task=task)
+
+
+@task_postrun.connect
+def _record_task_finished(task_id: str = "", task: object = None, **_kwargs: object) -> None:
+    """Stop counting a finished task against its worker's queues."""
+    from apps.trading.tasks.worker_capacity import record_task_finished
+
+    record_task_finished(task_id=task_id, task=task)
+
+
 @worker_shutting_down.connect
 def _log_worker_shutdown(sig: str = "unknown", how: str = "unknown", **kwargs: object) -> None:
     """Log when the Celery worker main process begins shutting down."""
@@ -234,8 +234,22 @@ MARKET_TICK_SUPERVISOR_LOCK_KEY = os.getenv(
     "MARKET_TICK_SUPERVISOR_LOCK_KEY", "market:tick_supervisor:lock"
 )
 MARKET_TICK_SUPERVISOR_INTERVAL = int(os.getenv("MARKET_TICK_SUPERVISOR_INTERVAL", "30"))
+# "per_account" runs one publish_oanda_ticks task (and worker slot) per
+# account; "multiplexed" streams every account from one asyncio task.
+MARKET_TICK_PUBLISHER_MODE = os.getenv("MARKET_TICK_PUBLISHER_MODE", "per_account")
+MARKET_TICK_MULTIPLEXER_BACKOFF_MAX_SECONDS = float(
+    os.getenv("MARKET_TICK_MULTIPLEXER_BACKOFF_MAX_SECONDS", "60")
+)
 MARKET_TICK_SUBSCRIBER_BATCH_SIZE = int(os.getenv("MARKET_TICK_SUBSCRIBER_BATCH_SIZE", "200"))
 MARKET_TICK_SUBSCRIBER_FLUSH_INTERVAL = int(os.getenv("MARKET_TICK_SUBSCRIBER_FLUSH_INTERVAL", "2"))
+# Instrument pricing snapshots are reused for this long. Running tick
+# publishers refresh them from the live stream; otherwise the first request
+# after expiry fetches from OANDA while concurrent requests wait for it.
+MARKET_PRICING_CACHE_TTL_SECONDS = float(os.getenv("MARKET_PRICING_CACHE_TTL_SECONDS", "2"))
+# On PostgreSQL tick_data is partitioned by month; the create_tick_partitions
+# task keeps partitions ready from the current month through this many months
+# ahead so live ticks never land in the DEFAULT partition.
+TICK_DATA_PARTITION_MONTHS_AHEAD = int(os.getenv("TICK_DATA_PARTITION_MONTHS_AHEAD", "3"))
 
 
 # =============================================================================
@@ -300,6 +314,14 @@ MARKET_BACKTEST_STREAM_READ_COUNT = int(os.getenv("MARKET_BACKTEST_STREAM_READ_C
 # flush decisions.  The executor still checks stop signals inside each batch.
 TRADING_BACKTEST_TICK_BATCH_SIZE = int(os.getenv("TRADING_BACKTEST_TICK_BATCH_SIZE", "1000"))
 
+# Strategy-scope events (visualization/diagnostics rows) are buffered per
+# executor and written on the progress-flush boundary, or earlier when a tick
+# emits an event that needs execution.  This caps how many rows may be pending
+# before the buffer flushes on its own.
+TRADING_STRATEGY_EVENT_BUFFER_MAX_RECORDS = int(
+    os.getenv("TRADING_STRATEGY_EVENT_BUFFER_MAX_RECORDS", "5000")
+)
+
 # Subscriber gives up after this many consecutive empty reads *while* it is
 # caught up with the publisher (comparing its ``last_seen_id`` against the
 # stream's ``last-generated-id``).  Empty reads that happen while the
@@ -463,6 +485,76 @@ OANDA_ACCOUNT_SNAPSHOT_STALE_SECONDS = int(os.getenv("OANDA_ACCOUNT_SNAPSHOT_STA
 OANDA_ACCOUNT_SNAPSHOT_REFRESH_ACTIVE_TTL_SECONDS = int(
     os.getenv("OANDA_ACCOUNT_SNAPSHOT_REFRESH_ACTIVE_TTL_SECONDS", "900")
 )
+# Per-process pool of v20 contexts so OandaService instances reuse keep-alive
+# HTTP connections per account. Idle contexts are closed after the timeout.
+OANDA_CLIENT_POOL_ENABLED = os.getenv("OANDA_CLIENT_POOL_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+OANDA_CLIENT_POOL_IDLE_SECONDS = float(os.getenv("OANDA_CLIENT_POOL_IDLE_SECONDS", "300"))
+OANDA_CLIENT_POOL_MAX_ENTRIES = int(os.getenv("OANDA_CLIENT_POOL_MAX_ENTRIES", "64"))
+# Local mirror of account transactions. Order/position history endpoints read
+# from it once an account's mirror is caught up and synced within the
+# staleness window; otherwise they fall back to live OANDA calls.
+OANDA_TRANSACTION_MIRROR_ENABLED = os.getenv(
+    "OANDA_TRANSACTION_MIRROR_ENABLED", "true"
+).strip().lower() in {"1", "true", "yes", "on"}
+OANDA_TRANSACTION_MIRROR_MAX_STALENESS_SECONDS = int(
+    os.getenv("OANDA_TRANSACTION_MIRROR_MAX_STALENESS_SECONDS", "300")
+)
+OANDA_TRANSACTION_SYNC_MAX_PAGES = int(os.getenv("OANDA_TRANSACTION_SYNC_MAX_PAGES", "10"))
+
+# Broker reads (account details, open trades, pending orders) shared by live
+# tasks on the same account during drift checks and reconciliation. Entries
+# expire after the TTL and whenever the account places or closes an order;
+# set the TTL to 0 to read OANDA directly on every check.
+TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS = float(
+    os.getenv("TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS", "5")
+)
+TRADING_BROKER_SNAPSHOT_CACHE_WAIT_SECONDS = float(
+    os.getenv("TRADING_BROKER_SNAPSHOT_CACHE_WAIT_SECONDS", "10")
+)
+
+# Strategy-cycle views cache projections of an execution's strategy_state
+# (cycle statuses, grid states, seed cycles) per state revision; a new
+# state_version or save time always misses, so the TTL only bounds how long
+# unused revisions linger in the cache.
+STRATEGY_STATE_PROJECTION_CACHE_TTL_SECONDS = float(
+    os.getenv("STRATEGY_STATE_PROJECTION_CACHE_TTL_SECONDS", "600")
+)
+
+# Live tasks keep tick->publish->receive->decision->submit->fill latency
+# histograms in memory and merge them into Redis on this interval; 0 disables
+# the histograms. Merged histograms expire after the TTL. Reads and merges
+# share one Redis client whose socket operations give up after the timeout.
+TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS = float(
+    os.getenv("TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS", "10")
+)
+TRADING_LATENCY_HISTOGRAM_TTL_SECONDS = int(
+    os.getenv("TRADING_LATENCY_HISTOGRAM_TTL_SECONDS", str(7 * 24 * 3600))
+)
+TRADING_LATENCY_HISTOGRAM_REDIS_TIMEOUT_SECONDS = float(
+    os.getenv("TRADING_LATENCY_HISTOGRAM_REDIS_TIMEOUT_SECONDS", "1")
+)
+
+# Live tick batching. With adaptive batching the live source drains ticks
+# already queued on the subscription (up to LIVE_TICK_BATCH_MAX_SIZE) and
+# otherwise waits only as long as the measured per-tick processing time leaves
+# room within LIVE_TICK_BATCH_MAX_LATENCY_SECONDS. Disabled, batches close at
+# LIVE_TICK_BATCH_SIZE ticks or the latency bound, whichever comes first.
+LIVE_TICK_ADAPTIVE_BATCHING = os.getenv("LIVE_TICK_ADAPTIVE_BATCHING", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+LIVE_TICK_BATCH_SIZE = int(os.getenv("LIVE_TICK_BATCH_SIZE", "10"))
+LIVE_TICK_BATCH_MAX_SIZE = int(os.getenv("LIVE_TICK_BATCH_MAX_SIZE", "200"))
+LIVE_TICK_BATCH_MAX_LATENCY_SECONDS = float(
+    os.getenv("LIVE_TICK_BATCH_MAX_LATENCY_SECONDS", "0.25")
+)
 
 # Live-trading safety guardrails. These are enforced when a TradingTask is
 # submitted, before the worker can place any broker orders.
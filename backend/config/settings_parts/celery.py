@@ -19,6 +19,8 @@ def build_celery_settings(redis_url: str, redis_db: int) -> dict[str, object]:
     account_snapshot_refresh_seconds = int(
         os.getenv("OANDA_ACCOUNT_SNAPSHOT_REFRESH_SECONDS", "60")
     )
+    transaction_sync_seconds = int(os.getenv("OANDA_TRANSACTION_SYNC_SECONDS", "30"))
+    capacity_reconcile_seconds = int(os.getenv("CELERY_WORKER_CAPACITY_RECONCILE_SECONDS", "60"))
     return {
         "CELERY_BROKER_URL": broker_url,
         "CELERY_RESULT_BACKEND": broker_url,
@@ -43,16 +45,39 @@ def build_celery_settings(redis_url: str, redis_db: int) -> dict[str, object]:
         "CELERY_BACKTEST_WORKER_CONCURRENCY": backtest_concurrency,
         "CELERY_BACKTEST_PUBLISHER_CONCURRENCY": backtest_publisher_concurrency,
         "CELERY_TRADING_WORKER_CONCURRENCY": trading_concurrency,
+        # Workers publish active tasks per queue to Redis for admission
+        # control; an inspect broadcast reconciles the registry periodically.
+        "CELERY_WORKER_CAPACITY_REGISTRY_ENABLED": os.getenv(
+            "CELERY_WORKER_CAPACITY_REGISTRY_ENABLED", "true"
+        )
+        .strip()
+        .lower()
+        in {"1", "true", "yes", "on"},
+        "CELERY_WORKER_CAPACITY_HEARTBEAT_SECONDS": float(
+            os.getenv("CELERY_WORKER_CAPACITY_HEARTBEAT_SECONDS", "15")
+        ),
+        "CELERY_WORKER_CAPACITY_STALE_SECONDS": float(
+            os.getenv("CELERY_WORKER_CAPACITY_STALE_SECONDS", "90")
+        ),
+        # Registry reads and writes share one Redis client whose socket
+        # operations give up after this many seconds.
+        "CELERY_WORKER_CAPACITY_REDIS_TIMEOUT_SECONDS": float(
+            os.getenv("CELERY_WORKER_CAPACITY_REDIS_TIMEOUT_SECONDS", "1")
+        ),
         "CELERY_TASK_ROUTES": {
             # System queue: control-plane tasks (supervisors, recovery, health)
             "market.tasks.ensure_tick_pubsub_running": {"queue": "system"},
+            "market.tasks.create_tick_partitions": {"queue": "system"},
             "trading.tasks.recover_orphaned_tasks": {"queue": "system"},
+            "trading.tasks.reconcile_worker_capacity": {"queue": "system"},
             "trading.tasks.stop_backtest_task": {"queue": "system"},
             "trading.tasks.stop_trading_task": {"queue": "system"},
             # Market queue: data ingestion and streaming
             "market.tasks.publish_oanda_ticks": {"queue": "market"},
+            "market.tasks.publish_oanda_ticks_multiplexed": {"queue": "market"},
             "market.tasks.refresh_oanda_account_snapshots": {"queue": "market"},
             "market.tasks.subscribe_ticks_to_db": {"queue": "market"},
+            "market.tasks.sync_oanda_transactions": {"queue": "market"},
             # Backtest queue: execution and historical data replay
             "market.tasks.publish_ticks_for_backtest": {"queue": "backtest_publisher"},
             "trading.tasks.run_backtest_task": {"queue": "backtest"},
@@ -70,6 +95,11 @@ def build_celery_settings(redis_url: str, redis_db: int) -> dict[str, object]:
                 "schedule": 60,
                 "options": {"queue": "system"},
             },
+            "reconcile-worker-capacity": {
+                "task": "trading.tasks.reconcile_worker_capacity",
+                "schedule": capacity_reconcile_seconds,
+                "options": {"queue": "system"},
+            },
             "cleanup-expired-refresh-tokens": {
                 "task": "accounts.tasks.cleanup_expired_refresh_tokens",
                 "schedule": 3600,
@@ -80,6 +110,16 @@ def build_celery_settings(redis_url: str, redis_db: int) -> dict[str, object]:
                 "schedule": account_snapshot_refresh_seconds,
                 "options": {"queue": "market"},
             },
+            "sync-oanda-transactions": {
+                "task": "market.tasks.sync_oanda_transactions",
+                "schedule": transaction_sync_seconds,
+                "options": {"queue": "market"},
+            },
+            "create-tick-partitions": {
+                "task": "market.tasks.create_tick_partitions",
+                "schedule": crontab(hour=0, minute=30),
+                "options": {"queue": "system"},
+            },
             "load-daily-tick-data": {
                 "task": "market.tasks.load_daily_tick_data",
                 "schedule": crontab(hour=17, minute=0),  # 10:00 AM UTC-07:00
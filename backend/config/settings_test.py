@@ -145,6 +145,15 @@ OANDA_LIVE_API = "https://api-fxtrade.oanda.com"
 OANDA_STREAM_TIMEOUT = 5  # Shorter timeout for tests
 OANDA_REST_TIMEOUT = 5
 OANDA_REST_MAX_RETRIES = 0
+# Reconciliation tests assert on individual broker reads; share nothing
+# between them through the process-wide test cache.
+TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS = 0
+# Latency histograms merge into the market Redis; keep them off unless a test
+# enables them with an injected client.
+TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS = 0
+# Admission falls back to database counts instead of the Redis worker
+# capacity registry.
+CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = False
 
 # =============================================================================
 # Rate Limiting — disabled for tests
@@ -0,0 +1,82 @@
+"""JSON result files and baseline comparison for benchmarks."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from django.db import connection
+
+RESULTS_DIR_ENV = "BENCHMARK_RESULTS_DIR"
+BASELINE_DIR_ENV = "BENCHMARK_BASELINE_DIR"
+MAX_REGRESSION_ENV = "BENCHMARK_MAX_REGRESSION"
+DEFAULT_RESULTS_DIR = Path(__file__).resolve().parents[2] / ".benchmarks"
+
+
+def env_int(name: str, default: int) -> int:
+    """Read a positive integer benchmark knob from the environment."""
+    try:
+        value = int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def write_results(name: str, results: dict[str, Any]) -> Path:
+    """Write one benchmark's results to ``<results dir>/<name>.json``."""
+    directory = Path(os.environ.get(RESULTS_DIR_ENV) or DEFAULT_RESULTS_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.json"
+    payload = {
+        "benchmark": name,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": connection.vendor,
+        },
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True, default=str), encoding="utf-8")
+    return path
+
+
+def load_baseline(name: str) -> dict[str, Any] | None:
+    """Return the baseline results for ``name`` when a baseline dir is set."""
+    directory = os.environ.get(BASELINE_DIR_ENV)
+    if not directory:
+        return None
+    path = Path(directory) / f"{name}.json"
+    if not path.exists():
+        return None
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    results = payload.get("results")
+    return results if isinstance(results, dict) else None
+
+
+def throughput_regressions(
+    *,
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+) -> list[str]:
+    """Describe cases whose throughput or query count regressed past the limit."""
+    max_regression = float(os.environ.get(MAX_REGRESSION_ENV, "0.2"))
+    problems: list[str] = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if not previous:
+            continue
+        previous_rate = previous.get("ticks_per_second") or 0
+        current_rate = current.get("ticks_per_second") or 0
+        if previous_rate and current_rate < previous_rate * (1 - max_regression):
+            problems.append(f"{case}: ticks_per_second {current_rate:.1f} < {previous_rate:.1f}")
+        previous_queries = previous.get("sql_queries")
+        current_queries = current.get("sql_queries")
+        if previous_queries is not None and current_queries is not None:
+            if current_queries > previous_queries * (1 + max_regression):
+                problems.append(f"{case}: sql_queries {current_queries} > {previous_queries}")
+    return problems
@@ -0,0 +1,69 @@
+"""Deterministic synthetic market data for benchmarks."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from apps.trading.dataclasses import Tick
+from apps.trading.tasks.source import TickDataSource
+
+DEFAULT_START = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def synthetic_ticks(
+    *,
+    instrument: str = "USD_JPY",
+    count: int,
+    start_price: Decimal = Decimal("150.000"),
+    pip_size: Decimal = Decimal("0.01"),
+    spread_pips: Decimal = Decimal("0.8"),
+    volatility_pips: float = 0.6,
+    swing_pips: float = 60.0,
+    swing_period: int = 20_000,
+    interval: timedelta = timedelta(seconds=1),
+    start: datetime = DEFAULT_START,
+    seed: int = 42,
+) -> list[Tick]:
+    """Return ``count`` ticks of a seeded random walk around a slow swing.
+
+    The swing keeps price crossing the same levels so grid strategies keep
+    opening, adding and closing positions instead of trending away.
+    """
+    rng = random.Random(seed)
+    places = Decimal(1).scaleb(pip_size.as_tuple().exponent - 1)
+    half_spread = spread_pips * pip_size / 2
+    noise = 0.0
+    ticks: list[Tick] = []
+    for index in range(count):
+        noise = noise * 0.995 + rng.gauss(0.0, volatility_pips)
+        swing = swing_pips * math.sin(2 * math.pi * index / swing_period)
+        mid = (start_price + Decimal(str(round(swing + noise, 1))) * pip_size).quantize(places)
+        ticks.append(
+            Tick.create(
+                instrument=instrument,
+                timestamp=start + interval * index,
+                bid=mid - half_spread,
+                ask=mid + half_spread,
+                mid=mid,
+            )
+        )
+    return ticks
+
+
+class SyntheticTickDataSource(TickDataSource):
+    """Yield pre-generated ticks in fixed-size batches."""
+
+    def __init__(self, ticks: list[Tick], *, batch_size: int = 1000) -> None:
+        self._ticks = ticks
+        self._batch_size = max(1, batch_size)
+
+    def __iter__(self) -> Iterator[list[Tick]]:
+        for offset in range(0, len(self._ticks), self._batch_size):
+            yield self._ticks[offset : offset + self._batch_size]
+
+    def close(self) -> None:
+        """Release resources."""
@@ -0,0 +1,152 @@
+"""End-to-end backtest throughput benchmarks.
+
+Runs ``BacktestExecutor`` in in-memory mode over synthetic ticks for the
+Snowball and SnowballNet strategies and writes ticks/sec, peak RSS, SQL
+query counts and allocation counters to ``.benchmarks/backtest_throughput.json``.
+
+Benchmarks are deselected unless ``-m benchmark`` is passed. The default
+size is a smoke run; scale it up and compare against a previous run with::
+
+    cd backend
+    BENCHMARK_TICKS=200000 BENCHMARK_BASELINE_DIR=/path/to/previous \\
+        uv run pytest tests/benchmarks -m benchmark -n 0 --timeout 0
+
+Against a local PostgreSQL instead of SQLite, point
+``DJANGO_SETTINGS_MODULE=config.settings`` at the database via the usual
+``DB_*`` variables.
+"""
+
+from __future__ import annotations
+
+import gc
+import resource
+import sys
+from decimal import Decimal
+from time import perf_counter
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from apps.trading.engine import TradingEngine
+from apps.trading.strategies.snowball.config import SnowballStrategyConfig
+from apps.trading.strategies.snowball_net.config import SnowballNetConfig
+from apps.trading.tasks.executor import BacktestExecutor
+from tests.benchmarks.reporting import (
+    env_int,
+    load_baseline,
+    throughput_regressions,
+    write_results,
+)
+from tests.benchmarks.synthetic import SyntheticTickDataSource, synthetic_ticks
+from tests.integration.factories import (
+    BacktestTaskFactory,
+    StrategyConfigurationFactory,
+    UserFactory,
+)
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow, pytest.mark.timeout(0)]
+
+BENCHMARK_NAME = "backtest_throughput"
+
+STRATEGY_PARAMETERS: dict[str, dict[str, Any]] = {
+    "snowball": {
+        **SnowballStrategyConfig.from_dict({}).to_dict(),
+        "base_units": 1000,
+        "m_pips": "30",
+        "r_max": 7,
+        "f_max": 3,
+        "n_pips_head": "20",
+        "n_pips_tail": "10",
+        "interval_mode": "constant",
+    },
+    "snowball_net": {
+        **SnowballNetConfig.from_dict({}).to_dict(),
+        "base_units": 1000,
+        "max_add_count": 10,
+        "take_profit_pips": "15",
+    },
+}
+
+
+def _run_backtest(*, strategy_type: str, tick_count: int, batch_size: int) -> dict[str, Any]:
+    user = UserFactory()
+    config = StrategyConfigurationFactory(
+        user=user,
+        strategy_type=strategy_type,
+        parameters=STRATEGY_PARAMETERS[strategy_type],
+    )
+    task = BacktestTaskFactory(
+        user=user,
+        config=config,
+        instrument="USD_JPY",
+        initial_balance=Decimal("1000000"),
+        status="running",
+        in_memory_mode=True,
+        debug_options={"profile": True},
+    )
+    task.execution_id = uuid4()
+    task.save(update_fields=["execution_id"])
+    ticks = synthetic_ticks(instrument=task.instrument, count=tick_count)
+
+    engine = TradingEngine(task.instrument, task.pip_size, task.config)
+    with patch("apps.trading.tasks.executor.StateManager") as state_manager_cls:
+        state_manager = MagicMock()
+        state_manager.check_control.return_value = MagicMock(should_stop=False)
+        state_manager_cls.return_value = state_manager
+        executor = BacktestExecutor(
+            task=task,
+            engine=engine,
+            data_source=SyntheticTickDataSource(ticks, batch_size=batch_size),
+        )
+
+        gc.collect()
+        gc_before = [generation["collections"] for generation in gc.get_stats()]
+        blocks_before = sys.getallocatedblocks()
+        started_at = perf_counter()
+        executor.execute()
+        elapsed = perf_counter() - started_at
+        blocks_after = sys.getallocatedblocks()
+        gc_after = [generation["collections"] for generation in gc.get_stats()]
+
+    profile = executor._profiler.snapshot()
+    return {
+        "ticks": tick_count,
+        "batch_size": batch_size,
+        "elapsed_seconds": round(elapsed, 3),
+        "ticks_per_second": round(tick_count / elapsed, 1) if elapsed > 0 else None,
+        # ru_maxrss is reported in KiB on Linux.
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "sql_queries": profile["sql_queries"],
+        "sql_bytes": profile["sql_bytes"],
+        "phases": profile["phases"],
+        "allocated_blocks_delta": blocks_after - blocks_before,
+        "gc_collections": [after - before for before, after in zip(gc_before, gc_after)],
+    }
+
+
+@pytest.mark.django_db
+def test_in_memory_backtest_throughput() -> None:
+    tick_count = env_int("BENCHMARK_TICKS", 2_000)
+    batch_size = env_int("BENCHMARK_BATCH_SIZE", 1_000)
+
+    results = {
+        strategy_type: _run_backtest(
+            strategy_type=strategy_type,
+            tick_count=tick_count,
+            batch_size=batch_size,
+        )
+        for strategy_type in STRATEGY_PARAMETERS
+    }
+    write_results(BENCHMARK_NAME, results)
+
+    for strategy_type, result in results.items():
+        assert result["ticks_per_second"], strategy_type
+        # In-memory backtests must not touch the database per tick.
+        assert result["phases"].get("strategy", {}).get("sql_queries", 0) == 0, strategy_type
+
+    baseline = load_baseline(BENCHMARK_NAME)
+    if baseline is not None:
+        regressions = throughput_regressions(results=results, baseline=baseline)
+        assert not regressions, regressions
@@ -0,0 +1,230 @@
+"""Per-tick cost of the Snowball grid at increasing depth.
+
+Drives ``SnowballStrategy.on_tick`` directly (no executor, no database)
+over an oscillating synthetic price path sized so the grid fills
+``f_max`` layers of ``r_max`` slots. For each depth it reports per-tick
+latency percentiles, the deepest grid reached and the cumulative time spent
+in the grid hot spots (``PositionGrid``/``Layer``/``Slot``,
+``CounterCloseCandidateFinder.next_candidate`` and
+``SnowballCounterAddProcessor.process``). A cProfile dump is written next
+to the JSON results for each depth.
+
+Use it to size ``f_max`` before raising it in production configs::
+
+    cd backend
+    BENCHMARK_GRID_DEPTHS=3x7,6x7,10x10 BENCHMARK_GRID_TICKS=20000 \\
+        uv run pytest tests/benchmarks/test_snowball_grid.py -m benchmark -n 0
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import math
+import os
+import pstats
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+import pytest
+
+from apps.trading.dataclasses import Tick
+from apps.trading.strategies.snowball.config import SnowballStrategyConfig
+from apps.trading.strategies.snowball.counter_flow import (
+    CounterCloseCandidateFinder,
+    SnowballCounterAddProcessor,
+    SnowballCounterCloseProcessor,
+)
+from apps.trading.strategies.snowball.cycle_state import SnowballStrategyState
+from apps.trading.strategies.snowball.grid_models import Layer, PositionGrid
+from apps.trading.strategies.snowball.strategy import SnowballStrategy
+from apps.trading.strategies.snowball.tick_phases import SnowballExecutionStateBoundary
+from tests.benchmarks.reporting import DEFAULT_RESULTS_DIR, env_int, write_results
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow, pytest.mark.timeout(0)]
+
+BENCHMARK_NAME = "snowball_grid"
+PIP = Decimal("0.01")
+SPREAD = Decimal("0.008")
+INTERVAL_PIPS = 10
+LAYER_PIPS = 20
+
+# Functions reported from the cProfile stats. Rows are matched on each
+# function's code location and labelled with its qualified name, since
+# cProfile only records the bare name and several classes share one.
+HOT_FUNCTIONS: tuple[Callable[..., Any], ...] = (
+    SnowballStrategy.on_tick,
+    CounterCloseCandidateFinder.next_candidate,
+    SnowballCounterCloseProcessor.process,
+    SnowballCounterAddProcessor.process,
+    Layer.all_entries,
+    Layer.next_available_counter_slot,
+    PositionGrid.all_entries,
+    PositionGrid.slot_for_entry,
+    PositionGrid.back_entry_for_tp,
+    SnowballExecutionStateBoundary._hot_strategy_state,
+)
+
+
+@dataclass
+class _BenchmarkState:
+    strategy_state: dict[str, Any] = field(default_factory=dict)
+    current_balance: Decimal = Decimal("10000000")
+    ticks_processed: int = 0
+    # Match BacktestExecutor.prepare_state_for_execution so the grid stays
+    # cached between ticks instead of round-tripping through JSON.
+    _defer_snowball_state_serialization: bool = True
+    _defer_snowball_runtime_view_updates: bool = True
+
+
+def _depths() -> list[tuple[int, int]]:
+    raw = os.environ.get("BENCHMARK_GRID_DEPTHS", "2x4,3x7")
+    depths: list[tuple[int, int]] = []
+    for item in raw.split(","):
+        layers, _, slots = item.strip().partition("x")
+        depths.append((int(layers), int(slots)))
+    return depths
+
+
+def _strategy(layers: int, slots: int) -> SnowballStrategy:
+    config = SnowballStrategyConfig.from_dict(
+        {
+            "base_units": 1000,
+            "m_pips": str(LAYER_PIPS),
+            "r_max": slots,
+            "f_max": layers,
+            "n_pips_head": str(INTERVAL_PIPS),
+            "n_pips_tail": str(INTERVAL_PIPS),
+            "n_pips_flat_steps": 1,
+            "interval_mode": "constant",
+            "counter_tp_mode": "fixed",
+            "counter_tp_pips": "8",
+            "shrink_enabled": False,
+            "refill_up_to": 0,
+            "pip_size": str(PIP),
+        }
+    )
+    return SnowballStrategy("USD_JPY", PIP, config)
+
+
+def _price_path(*, layers: int, slots: int, count: int, seed: int = 7) -> list[Tick]:
+    """Oscillate deep enough against the initial entry to fill the grid."""
+    amplitude = layers * (slots * INTERVAL_PIPS + LAYER_PIPS) * 1.2
+    period = max(200, int(amplitude * 4))
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 5, tzinfo=UTC)
+    ticks: list[Tick] = []
+    for index in range(count):
+        wave = amplitude * (2 / math.pi) * math.asin(math.sin(2 * math.pi * index / period))
+        offset = round(wave + rng.gauss(0.0, 0.3), 1)
+        mid = (Decimal("150.000") - Decimal(str(offset)) * PIP).quantize(Decimal("0.001"))
+        ticks.append(
+            Tick.create(
+                instrument="USD_JPY",
+                timestamp=start + timedelta(seconds=index),
+                bid=mid - SPREAD / 2,
+                ask=mid + SPREAD / 2,
+                mid=mid,
+            )
+        )
+    return ticks
+
+
+def _run(strategy: SnowballStrategy, ticks: list[Tick]) -> tuple[list[int], int]:
+    state = _BenchmarkState()
+    durations: list[int] = []
+    deepest = 0
+    for tick in ticks:
+        state.ticks_processed += 1
+        started_at = perf_counter_ns()
+        strategy.on_tick(tick=tick, state=state)  # type: ignore[arg-type]
+        durations.append(perf_counter_ns() - started_at)
+        if state.ticks_processed % 100 == 0:
+            deepest = max(deepest, _deepest_layer_count(state))
+    return durations, max(deepest, _deepest_layer_count(state))
+
+
+def _deepest_layer_count(state: _BenchmarkState) -> int:
+    snowball_state = getattr(state, "_snowball_strategy_state_cache", None)
+    if not isinstance(snowball_state, SnowballStrategyState):
+        snowball_state = SnowballStrategyState.from_strategy_state(state.strategy_state)
+    return max((cycle.grid.layer_count for cycle in snowball_state.cycles), default=0)
+
+
+def _percentiles(durations_ns: list[int]) -> dict[str, float]:
+    ordered = sorted(durations_ns)
+
+    def at(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(math.ceil(fraction * len(ordered))) - 1)
+        return round(ordered[max(index, 0)] / 1000, 1)
+
+    return {
+        "p50_us": at(0.50),
+        "p90_us": at(0.90),
+        "p99_us": at(0.99),
+        "max_us": round(ordered[-1] / 1000, 1),
+        "mean_us": round(sum(ordered) / len(ordered) / 1000, 1),
+    }
+
+
+def _profile(strategy: SnowballStrategy, ticks: list[Tick], dump_path: Path) -> dict[str, Any]:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _run(strategy, ticks)
+    profiler.disable()
+
+    dump_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(str(dump_path.with_suffix(".prof")))
+    text = io.StringIO()
+    stats = pstats.Stats(profiler, stream=text)
+    stats.sort_stats("cumulative").print_stats(40)
+    dump_path.write_text(text.getvalue(), encoding="utf-8")
+
+    labels = {
+        (func.__code__.co_filename, func.__code__.co_firstlineno, func.__code__.co_name): (
+            f"{Path(func.__code__.co_filename).name}:{func.__qualname__}"
+        )
+        for func in HOT_FUNCTIONS
+    }
+    hot: dict[str, dict[str, float]] = {}
+    for location, row in stats.stats.items():  # type: ignore[attr-defined]
+        key = labels.get(location)
+        if key is None:
+            continue
+        calls, _primitive, _total, cumulative = row[1], row[0], row[2], row[3]
+        hot[key] = {"calls": calls, "cumulative_seconds": round(cumulative, 6)}
+    return hot
+
+
+def test_snowball_grid_tick_cost_by_depth() -> None:
+    tick_count = env_int("BENCHMARK_GRID_TICKS", 2_000)
+    results_dir = Path(os.environ.get("BENCHMARK_RESULTS_DIR") or DEFAULT_RESULTS_DIR)
+
+    results: dict[str, dict[str, Any]] = {}
+    for layers, slots in _depths():
+        case = f"{layers}x{slots}"
+        ticks = _price_path(layers=layers, slots=slots, count=tick_count)
+        durations, deepest = _run(_strategy(layers, slots), ticks)
+        dump_path = results_dir / f"{BENCHMARK_NAME}_{case}.pstats.txt"
+        hot = _profile(_strategy(layers, slots), ticks, dump_path)
+        results[case] = {
+            "f_max": layers,
+            "r_max": slots,
+            "ticks": tick_count,
+            "deepest_layer_count": deepest,
+            **_percentiles(durations),
+            "hot_functions": hot,
+            "profile": str(dump_path),
+        }
+
+    write_results(BENCHMARK_NAME, results)
+
+    for case, result in results.items():
+        assert result["deepest_layer_count"] >= 1, case
+        assert result["hot_functions"], case
@@ -12,6 +12,19 @@ from rest_framework.test import APIRequestFactory
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings_test")
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Deselect ``benchmark`` tests unless the marker expression asks for them."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    selected = [item for item in items if item.get_closest_marker("benchmark") is None]
+    if len(selected) == len(items):
+        return
+    config.hook.pytest_deselected(
+        items=[item for item in items if item.get_closest_marker("benchmark") is not None]
+    )
+    items[:] = selected
+
+
 @pytest.fixture(scope="session", autouse=True)
 def deterministic_test_seed() -> None:
     """Reduce flaky ordering/seed-dependent failures across CI retries."""
@@ -116,7 +116,8 @@ class TestTickDataModel:
         # Cleanup with 90 day retention
         deleted_count = TickData.cleanup_old_data(retention_days=90)
 
-        # Old data should be deleted
-        assert deleted_count >= 0
+        # Old data should be deleted by tick timestamp
+        assert deleted_count == 1
+        assert not TickData.objects.filter(timestamp=old_timestamp).exists()
         # Recent data should remain
         assert TickData.objects.filter(timestamp=recent_timestamp).exists()
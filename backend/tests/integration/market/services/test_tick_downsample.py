@@ -0,0 +1,83 @@
+"""PostgreSQL integration tests for SQL tick downsampling."""
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+
+from apps.market.models import TickData
+from apps.market.services import tick_downsample
+from apps.market.services.tick_downsample import downsample_ticks
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="buckets are only aggregated in SQL on PostgreSQL",
+    ),
+]
+
+BASE = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def ticks():
+    # Few distinct prices, so lows and highs tie within most buckets.
+    rng = random.Random(7)
+    TickData.objects.bulk_create(
+        TickData(
+            instrument="USD_JPY",
+            timestamp=BASE + timedelta(seconds=index),
+            bid=Decimal(rng.randint(1, 9)),
+            ask=Decimal(rng.randint(1, 9)),
+            mid=Decimal(rng.randint(1, 9)),
+        )
+        for index in range(500)
+    )
+    TickData.objects.create(
+        instrument="EUR_USD",
+        timestamp=BASE,
+        bid=Decimal("100"),
+        ask=Decimal("100"),
+        mid=Decimal("100"),
+    )
+
+
+def _shape(buckets) -> list[tuple]:
+    return [
+        (bucket.first, bucket.low, bucket.high, bucket.last, bucket.count) for bucket in buckets
+    ]
+
+
+@pytest.mark.parametrize("price", ["mid", "bid"])
+def test_sql_buckets_match_the_streamed_range(ticks, price):
+    window = {
+        "instrument": "USD_JPY",
+        "since": BASE,
+        "until": BASE + timedelta(seconds=499),
+        "width": 499 / 37,
+        "bucket_count": 37,
+        "price": price,
+    }
+
+    sql = tick_downsample._sql_buckets(**window)
+
+    assert len(sql) == 37
+    assert _shape(sql) == _shape(tick_downsample._scanned_buckets(**window))
+
+
+def test_downsample_ticks_uses_sql_buckets(ticks):
+    sampled = downsample_ticks(
+        instrument="USD_JPY",
+        since=BASE,
+        until=BASE + timedelta(seconds=499),
+        points=40,
+    )
+
+    assert sampled.source_count == 500
+    assert len(sampled.points) <= 40
+    assert sampled.points == sorted(sampled.points)
+    assert sampled.points[0][0] == BASE
@@ -0,0 +1,98 @@
+"""PostgreSQL integration tests for tick_data partition DDL."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+
+from apps.market.models import TickData
+from apps.market.services import tick_partitions
+from apps.market.services.tick_partitions import (
+    DEFAULT_PARTITION,
+    ensure_tick_partitions,
+    list_tick_partitions,
+    partition_for,
+)
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="tick_data is only partitioned on PostgreSQL",
+    ),
+]
+
+# Far enough ahead that no migration or scheduled run has created it.
+FUTURE_MONTH = datetime(2099, 1, 1, tzinfo=UTC)
+
+
+def _tick(timestamp: datetime) -> TickData:
+    return TickData.objects.create(
+        instrument="USD_JPY",
+        timestamp=timestamp,
+        bid=Decimal("150.00000"),
+        ask=Decimal("150.02000"),
+        mid=Decimal("150.01000"),
+    )
+
+
+def _count(table: str) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+        return cursor.fetchone()[0]
+
+
+def _attached_bounds(name: str) -> str | None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = %s AND child.relname = %s
+            """,
+            [tick_partitions.TICK_TABLE, name],
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+
+def test_migrated_table_is_partitioned():
+    assert tick_partitions.is_partitioned()
+    assert _attached_bounds(DEFAULT_PARTITION) == "DEFAULT"
+
+
+def test_new_month_without_parked_rows_is_created_attached():
+    partition = partition_for(FUTURE_MONTH)
+
+    assert ensure_tick_partitions(FUTURE_MONTH, FUTURE_MONTH) == [partition.name]
+
+    assert partition in list_tick_partitions()
+    assert "2099-01-01" in _attached_bounds(partition.name)
+    assert ensure_tick_partitions(FUTURE_MONTH, FUTURE_MONTH) == []
+
+
+def test_parked_rows_move_out_of_default_before_attach():
+    partition = partition_for(FUTURE_MONTH)
+    parked = FUTURE_MONTH.replace(day=15)
+    _tick(parked)
+    _tick(FUTURE_MONTH.replace(year=2099, month=2))
+    assert _count(DEFAULT_PARTITION) >= 2
+
+    tick_partitions._create_partition(partition)
+
+    assert _count(partition.name) == 1
+    assert _attached_bounds(partition.name) is not None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT COUNT(*) FROM "{DEFAULT_PARTITION}" '
+            'WHERE "timestamp" >= %s AND "timestamp" < %s',
+            [partition.start, partition.end],
+        )
+        assert cursor.fetchone()[0] == 0
+    # The next month stays parked in DEFAULT until its own partition exists.
+    assert TickData.objects.filter(timestamp__gte=partition.end).count() == 1
+    assert TickData.objects.get(instrument="USD_JPY", timestamp=parked).mid == Decimal("150.01000")
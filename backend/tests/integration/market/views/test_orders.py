@@ -1,15 +1,17 @@
 """Unit tests for order views."""
 
 from decimal import Decimal
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from rest_framework import status
+from django.utils import timezone
 from rest_framework.test import APIClient
 
 from apps.market.enums import ApiType
-from apps.market.models import OandaAccounts
+from apps.market.models import OandaAccounts, OandaOrderRecord, OandaTransactionSyncState
 from apps.market.services.broker_order_guard import BrokerOrderGuardError
 from apps.market.services.compliance import ComplianceViolationError
 from apps.market.services.oanda import OandaAPIError
@@ -250,6 +252,85 @@ class TestOrderView:
         }
 
 
+@pytest.mark.django_db
+class TestOrderViewMirroredHistory:
+    """Order history served from the local transaction mirror."""
+
+    def _account(self, user: Any) -> OandaAccounts:
+        account = OandaAccounts.objects.create(
+            user=user,
+            account_id="101-001-1234567-001",
+            api_type=ApiType.PRACTICE,
+            is_active=True,
+        )
+        OandaTransactionSyncState.objects.create(
+            account=account,
+            last_transaction_id=100,
+            caught_up=True,
+            last_synced_at=timezone.now(),
+        )
+        start = datetime(2026, 5, 1, tzinfo=UTC)
+        OandaOrderRecord.objects.bulk_create(
+            [
+                OandaOrderRecord(
+                    account=account,
+                    order_id=order_id,
+                    instrument="USD_JPY",
+                    order_type="LIMIT",
+                    units=Decimal("-1000") if order_id % 2 else Decimal("1000"),
+                    price=Decimal("150.000"),
+                    state="FILLED",
+                    create_time=start + timedelta(minutes=order_id),
+                )
+                for order_id in range(1, 6)
+            ]
+        )
+        return account
+
+    @patch("apps.market.views.orders.OandaService")
+    def test_history_is_paginated_from_the_mirror(self, mock_service: Any, user: Any) -> None:
+        account = self._account(user)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(f"/api/market/orders/?account_id={account.id}&page_size=2&page=2")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 5
+        assert [row["id"] for row in response.data["results"]] == ["3", "2"]
+        assert response.data["results"][0]["direction"] == "short"
+        assert response.data["results"][0]["account_db_id"] == account.pk
+        mock_service.assert_not_called()
+
+    @patch("apps.market.views.orders.OandaService")
+    def test_history_supports_keyset_cursors(self, mock_service: Any, user: Any) -> None:
+        account = self._account(user)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        first = client.get(f"/api/market/orders/?account_id={account.id}&page_size=2&cursor=")
+        second = client.get(first.data["next"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert "count" not in first.data
+        assert [row["id"] for row in first.data["results"]] == ["5", "4"]
+        assert [row["id"] for row in second.data["results"]] == ["3", "2"]
+        mock_service.assert_not_called()
+
+    @patch("apps.market.views.orders.OandaService")
+    def test_pending_orders_still_come_from_oanda(self, mock_service: Any, user: Any) -> None:
+        account = self._account(user)
+        mock_service.return_value.get_pending_orders.return_value = []
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(f"/api/market/orders/?account_id={account.id}&status=pending")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 0
+        mock_service.return_value.get_pending_orders.assert_called_once()
+
+
 @pytest.mark.django_db
 class TestOrderDetailView:
     """Test OrderDetailView."""
@@ -1,15 +1,17 @@
 """Unit tests for position views."""
 
 from decimal import Decimal
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from rest_framework import status
+from django.utils import timezone
 from rest_framework.test import APIClient
 
 from apps.market.enums import ApiType
-from apps.market.models import OandaAccounts
+from apps.market.models import OandaAccounts, OandaTradeRecord, OandaTransactionSyncState
 from apps.market.services.broker_order_guard import BrokerOrderGuardError
 from apps.market.services.compliance import ComplianceViolationError
 from apps.market.services.oanda import OandaAPIError
@@ -97,6 +99,49 @@ class TestPositionView:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 1
         assert response.data["results"][0]["status"] == "closed"
+        assert response.data["results"][0]["realized_pnl"] == "155"
+
+    @patch("apps.market.views.positions.OandaService")
+    def test_get_closed_positions_from_mirror(self, mock_service: Any, user: Any) -> None:
+        """Closed positions are read from the transaction mirror when it is fresh."""
+        account = OandaAccounts.objects.create(
+            user=user,
+            account_id="101-001-1234567-001",
+            api_type=ApiType.PRACTICE,
+            is_active=True,
+        )
+        OandaTransactionSyncState.objects.create(
+            account=account,
+            caught_up=True,
+            last_synced_at=timezone.now(),
+        )
+        opened = datetime(2026, 5, 1, tzinfo=UTC)
+        OandaTradeRecord.objects.create(
+            account=account,
+            trade_id=124,
+            instrument="USD_JPY",
+            initial_units=Decimal("-1000"),
+            current_units=Decimal("0"),
+            entry_price=Decimal("159.552"),
+            realized_pl=Decimal("155"),
+            state="CLOSED",
+            open_time=opened,
+            close_time=opened + timedelta(hours=1),
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(f"/api/market/positions/?account_id={account.id}&status=closed")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        row = response.data["results"][0]
+        assert (row["id"], row["direction"], row["units"]) == ("124", "short", "1000")
+        assert row["realized_pnl"] == "155"
+        assert row["unrealized_pnl"] == "0"
+        assert row["status"] == "closed"
+        mock_service.assert_not_called()
 
     def test_get_positions_no_accounts(self, user: Any) -> None:
         """Test getting positions when no accounts exist."""
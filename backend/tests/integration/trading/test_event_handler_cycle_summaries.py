@@ -0,0 +1,90 @@
+"""Integration tests for cycle summaries written by EventHandler flushes."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from apps.trading.enums import Direction, EventType, TaskType
+from apps.trading.events import OpenPositionEvent, RebuildPositionEvent
+from apps.trading.events.handler import EventHandler
+from apps.trading.models.trades import TradeCycleSummary
+from apps.trading.order import OrderService
+from tests.integration.factories import BacktestTaskFactory
+
+TIMESTAMP = datetime(2026, 1, 5, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def task():
+    return BacktestTaskFactory(execution_id=uuid4())
+
+
+@pytest.fixture
+def handler(task):
+    order_service = OrderService(account=None, task=task, dry_run=True)
+    return EventHandler(order_service=order_service, instrument="USD_JPY")
+
+
+def _summaries(task) -> dict[str, int]:
+    rows = TradeCycleSummary.objects.filter(
+        task_type=TaskType.BACKTEST.value,
+        task_id=task.pk,
+        execution_id=task.execution_id,
+    ).values_list("cycle_id", "trade_count")
+    return {str(cycle_id): trade_count for cycle_id, trade_count in rows}
+
+
+def _open(handler, *, entry_id: int, price: str):
+    return handler.handle_open_position(
+        OpenPositionEvent(
+            event_type=EventType.OPEN_POSITION,
+            timestamp=TIMESTAMP,
+            layer_number=1,
+            direction=Direction.LONG.value,
+            price=Decimal(price),
+            units=1000,
+            entry_id=entry_id,
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestEventHandlerCycleSummaries:
+    def test_new_cycle_opening_trade_gets_a_summary(self, task, handler):
+        _open(handler, entry_id=1, price="150.00")
+        handler.flush_cycle_summaries()
+
+        assert _summaries(task) == {handler._entry_id_to_cycle_id[1]: 1}
+
+        _open(handler, entry_id=10, price="151.00")
+        handler.flush_cycle_summaries()
+
+        assert _summaries(task) == {
+            handler._entry_id_to_cycle_id[1]: 1,
+            handler._entry_id_to_cycle_id[10]: 1,
+        }
+
+    def test_rebuild_refreshes_the_cycle_its_trade_is_moved_to(self, task, handler):
+        first = _open(handler, entry_id=1, price="150.00")
+        handler.flush_cycle_summaries()
+        cycle_id = handler._entry_id_to_cycle_id[1]
+
+        # R0 rebuilds carry no parent, so the open first files the trade
+        # under a cycle of its own before it is moved to the original cycle.
+        rebuild = RebuildPositionEvent(
+            event_type=EventType.REBUILD_POSITION,
+            timestamp=TIMESTAMP,
+            layer_number=1,
+            direction=Direction.LONG.value,
+            price=Decimal("149.00"),
+            units=1000,
+            entry_id=3,
+            original_position_id=str(first.id),
+        )
+        rebuild.root_entry_id = 1
+        handler.handle_rebuild_position(rebuild)
+        handler.flush_cycle_summaries()
+
+        assert _summaries(task) == {cycle_id: 2}
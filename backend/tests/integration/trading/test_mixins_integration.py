@@ -4,6 +4,7 @@ Tests the paginated sub-resource actions (metrics, logs, events,
 trades, positions, orders) using real DB records and authenticated API calls.
 """
 
+import json
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import cast
@@ -85,6 +86,29 @@ class TestMetrics:
         assert response.data["data_source"] == "strategy_metrics"
         assert len(response.data["results"]) == 3
 
+    def test_columnar_format_matches_row_payload(self):
+        task = _make_task()
+        client = _auth_client(task.user)
+        now = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        for i in range(3):
+            Metrics.objects.create(
+                task_type=TaskType.BACKTEST,
+                task_id=task.pk,
+                execution_id=task.execution_id,
+                timestamp=now + timedelta(minutes=i),
+                metrics={"margin_ratio": str(Decimal("0.05") + Decimal(str(i)) / 100)},
+            )
+        url = f"/api/trading/tasks/backtest/{task.pk}/strategy/metrics/"
+        rows = client.get(url).json()["results"]
+
+        response = client.get(url, {"format": "columnar"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "serialize;dur=" in response["Server-Timing"]
+        payload = json.loads(response.content)
+        assert payload["count"] == 3
+        assert payload["results"] == {key: [row[key] for row in rows] for key in rows[0]}
+
     def test_without_data(self):
         task = _make_task()
         client = _auth_client(task.user)
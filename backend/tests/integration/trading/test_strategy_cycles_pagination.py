@@ -18,6 +18,7 @@ from apps.trading.models import (
     Position,
     Trade,
 )
+from apps.trading.services.cycle_summaries import record_cycle_trade
 from tests.integration.factories import (
     BacktestTaskFactory,
     StrategyConfigurationFactory,
@@ -779,6 +780,70 @@ class TestStrategyEventsPagination:
         assert detail_response.data["cycles"][0]["is_initial_position_seed"] is True
         assert detail_response.data["cycles"][0]["trades"] == []
 
+    def test_state_only_cycle_is_paginated_among_trade_cycles(self):
+        task = _make_task()
+        task.initial_positions_enabled = True
+        task.initial_position_cycles = [
+            {
+                "direction": "long",
+                "positions": [
+                    {
+                        "layer_number": 1,
+                        "retracement_count": 0,
+                        "status": "closed_slot",
+                    }
+                ],
+            }
+        ]
+        task.save(update_fields=["initial_positions_enabled", "initial_position_cycles"])
+        ExecutionState.objects.create(
+            task_type=TaskType.BACKTEST,
+            task_id=task.pk,
+            execution_id=task.execution_id,
+            strategy_state=_snowball_state_with_closed_slot_initial_cycle(),
+            current_balance=Decimal("100000"),
+            last_tick_timestamp=task.start_time,
+        )
+        cycle_ids = [
+            str(cid)
+            for cid in _seed_cycles(task, count=3, start=task.start_time + timedelta(days=1))
+        ]
+        client = _auth_client(task.user)
+        url = f"/api/trading/tasks/backtest/{task.pk}/strategy-events/"
+
+        first_page = client.get(url, {"cycle_page_size": 2})
+        second_page = client.get(url, {"cycle_page_size": 2, "cycle_page": 2})
+        desc_page = client.get(url, {"cycle_page_size": 2, "cycle_page": 2, "cycle_sort": "desc"})
+
+        assert first_page.data["pagination"]["total_count"] == 4
+        assert first_page.data["summary"]["cycle_count"] == 4
+        assert first_page.data["summary"]["total_trades"] == 6
+        state_cycle_id = first_page.data["cycles"][0]["cycle_id"]
+        assert state_cycle_id not in cycle_ids
+        assert first_page.data["cycles"][1]["cycle_id"] == cycle_ids[0]
+        assert [c["cycle_id"] for c in second_page.data["cycles"]] == cycle_ids[1:]
+        assert [c["cycle_id"] for c in desc_page.data["cycles"]] == [cycle_ids[0], state_cycle_id]
+
+    def test_list_reflects_trades_recorded_after_the_first_read(self):
+        task = _make_task()
+        client = _auth_client(task.user)
+        url = f"/api/trading/tasks/backtest/{task.pk}/strategy-events/"
+        _seed_cycles(task, count=2, start=datetime(2024, 6, 1, tzinfo=timezone.utc))
+        assert client.get(url).data["pagination"]["total_count"] == 2
+
+        later = _seed_cycles(task, count=1, start=datetime(2024, 6, 2, tzinfo=timezone.utc))[0]
+        record_cycle_trade(
+            task_type=TaskType.BACKTEST.value,
+            task_id=task.pk,
+            execution_id=task.execution_id,
+            cycle_id=later,
+        )
+
+        response = client.get(url, {"cycle_sort": "desc"})
+        assert response.data["pagination"]["total_count"] == 3
+        assert response.data["cycles"][0]["cycle_id"] == str(later)
+        assert response.data["cycles"][0]["status"] == "completed"
+
     def test_summary_reflects_filtered_universe(self):
         task = _make_task()
         client = _auth_client(task.user)
@@ -1,5 +1,7 @@
 """Integration tests for trading API views."""
 
+from uuid import uuid4
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -251,3 +253,31 @@ class TestTradingTaskAPI:
         response = client.get("/api/trading/tasks/trading/")
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 0
+
+    def test_latency_returns_merged_percentiles(self, settings, monkeypatch):
+        import fakeredis
+
+        from apps.trading.services import latency_histogram
+        from apps.trading.services.latency_histogram import LatencyHistogram
+
+        settings.TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS = 10
+        task = TradingTaskFactory()
+        task.execution_id = uuid4()
+        task.save(update_fields=["execution_id"])
+        store = latency_histogram.LatencyHistogramStore(
+            redis_client=fakeredis.FakeRedis(decode_responses=True)
+        )
+        fill = LatencyHistogram()
+        fill.record(0.25)
+        store.merge(task_id=task.pk, execution_id=str(task.execution_id), histograms={"fill": fill})
+        monkeypatch.setattr(latency_histogram, "LatencyHistogramStore", lambda: store)
+
+        response = self._auth_client(task.user).get(
+            f"/api/trading/tasks/trading/{task.pk}/latency/"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["enabled"] is True
+        assert response.data["execution_id"] == str(task.execution_id)
+        assert response.data["latency"]["fill"]["count"] == 1
+        assert response.data["latency"]["fill"]["p99"] == pytest.approx(0.25, rel=0.035)
@@ -0,0 +1,166 @@
+"""Tests for the OANDA instrument catalog caches."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.common.singleflight import CacheSingleFlight
+from apps.market.services.cache import (
+    build_pricing_cache_key,
+    build_supported_instruments_cache_key,
+    invalidate_market_metadata_cache,
+)
+from apps.market.services.instruments import (
+    LivePricingCacheWriter,
+    OandaInstrumentCache,
+    OandaInstrumentCatalogService,
+    pricing_snapshot,
+)
+
+HOSTNAME = "api-fxpractice.oanda.com"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _account() -> SimpleNamespace:
+    return SimpleNamespace(
+        api_hostname=HOSTNAME,
+        account_id="001-001-1-001",
+        get_api_token=lambda: "token",
+    )
+
+
+def _service(executor: MagicMock, **cache_kwargs) -> OandaInstrumentCatalogService:
+    selector = MagicMock()
+    selector.active_for_user.return_value = _account()
+    return OandaInstrumentCatalogService(
+        account_selector=selector,
+        instrument_cache=OandaInstrumentCache(
+            cache_backend=cache,
+            instruments_ttl_seconds=60,
+            detail_ttl_seconds=60,
+            pricing_ttl_seconds=30,
+            **cache_kwargs,
+        ),
+        v20_module=MagicMock(),
+        request_executor=executor,
+    )
+
+
+def _instruments_response(*names: str) -> SimpleNamespace:
+    return SimpleNamespace(body={"instruments": [SimpleNamespace(name=name) for name in names]})
+
+
+def _pricing_response(bid: str, ask: str) -> SimpleNamespace:
+    price = SimpleNamespace(
+        bids=[SimpleNamespace(price=bid)],
+        asks=[SimpleNamespace(price=ask)],
+        tradeable=True,
+        time="2026-01-05T00:00:00Z",
+    )
+    return SimpleNamespace(body={"prices": [price]})
+
+
+class TestOandaInstrumentCatalogSingleFlight:
+    def test_supported_instruments_load_once_after_invalidation(self):
+        executor = MagicMock()
+        executor.request.return_value = _instruments_response("USD_JPY", "EUR_USD", "XAU_USD_X")
+        service = _service(executor)
+
+        assert service.supported_instruments_for_user(1) == ["EUR_USD", "USD_JPY"]
+        assert service.supported_instruments_for_user(1) == ["EUR_USD", "USD_JPY"]
+        assert executor.request.call_count == 1
+
+        invalidate_market_metadata_cache([HOSTNAME])
+        service.supported_instruments_for_user(1)
+        assert executor.request.call_count == 2
+
+    def test_waiting_caller_reuses_the_leaders_instrument_list(self):
+        key = build_supported_instruments_cache_key(HOSTNAME)
+        cache.add(CacheSingleFlight.lock_key(key), "leader", timeout=30)
+
+        def leader_finishes(_seconds: float) -> None:
+            cache.set(key, ["USD_JPY"], timeout=30)
+
+        executor = MagicMock()
+        service = _service(
+            executor,
+            single_flight=CacheSingleFlight(cache=cache, sleep=leader_finishes),
+        )
+
+        assert service.supported_instruments_for_user(1) == ["USD_JPY"]
+        executor.request.assert_not_called()
+
+    def test_pricing_is_reused_within_ttl(self):
+        executor = MagicMock()
+        executor.request.return_value = _pricing_response("150.100", "150.108")
+        service = _service(executor)
+
+        first = service.current_pricing(
+            api=MagicMock(), account_id="001", instrument="USD_JPY", hostname=HOSTNAME
+        )
+        second = service.current_pricing(
+            api=MagicMock(), account_id="001", instrument="USD_JPY", hostname=HOSTNAME
+        )
+
+        assert first == second
+        assert first["bid"] == "150.1"
+        executor.request.assert_called_once()
+
+    def test_pricing_failures_are_not_cached(self):
+        executor = MagicMock()
+        executor.request.side_effect = [
+            RuntimeError("timeout"),
+            _pricing_response("1.1000", "1.1002"),
+        ]
+        service = _service(executor)
+
+        kwargs = {"api": MagicMock(), "account_id": "001", "instrument": "EUR_USD"}
+        assert service.current_pricing(**kwargs, hostname=HOSTNAME) is None
+        assert service.current_pricing(**kwargs, hostname=HOSTNAME)["ask"] == "1.1002"
+
+
+class TestLivePricingCacheWriter:
+    def test_live_quotes_serve_pricing_reads_without_upstream_calls(self):
+        writer = LivePricingCacheWriter(hostname=HOSTNAME, cache_backend=cache, ttl_seconds=30)
+        writer.write(instrument="USD_JPY", bid="150.100", ask="150.110", time="t1")
+        executor = MagicMock()
+
+        pricing = _service(executor).current_pricing(
+            api=MagicMock(), account_id="001", instrument="USD_JPY", hostname=HOSTNAME
+        )
+
+        assert pricing == pricing_snapshot(bid="150.100", ask="150.110", tradeable=True, time="t1")
+        executor.request.assert_not_called()
+
+    def test_writes_are_throttled_per_instrument(self):
+        now = [0.0]
+        writer = LivePricingCacheWriter(
+            hostname=HOSTNAME,
+            cache_backend=cache,
+            ttl_seconds=30,
+            min_interval_seconds=1.0,
+            clock=lambda: now[0],
+        )
+
+        assert writer.write(instrument="USD_JPY", bid="1", ask="2", time="t1")
+        assert not writer.write(instrument="USD_JPY", bid="1", ask="3", time="t2")
+        assert writer.write(instrument="EUR_USD", bid="1", ask="2", time="t2")
+        now[0] = 1.5
+        assert writer.write(instrument="USD_JPY", bid="1", ask="4", time="t3")
+
+        assert cache.get(build_pricing_cache_key(HOSTNAME, "USD_JPY"))["time"] == "t3"
+
+    @override_settings(MARKET_PRICING_CACHE_TTL_SECONDS=0)
+    def test_disabled_by_zero_ttl(self):
+        assert LivePricingCacheWriter.for_account(_account(), cache_backend=cache) is None
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import gc
 from datetime import UTC, datetime
 from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+import requests
+import v20
+
 from apps.market.models import TickData
 from apps.market.services.oanda_clients import (
     OandaAccountClient,
@@ -17,6 +22,8 @@ from apps.market.services.oanda_clients import (
     OandaTradeClient,
     OandaTransactionClient,
 )
+from apps.market.services.oanda_pool import OandaContextPool
+from apps.market.services.oanda_stream import PriceTick
 from apps.market.services.oanda_types import (
     AccountDetails,
     LimitOrderRequest,
@@ -45,6 +52,45 @@ class TestOandaContextFactory:
         )
         assert factory.stream_hostname("") == ""
 
+    def test_contexts_are_reused_per_account_until_credentials_change(self):
+        v20_module = SimpleNamespace(Context=MagicMock(side_effect=lambda **_: MagicMock()))
+        factory = OandaContextFactory(v20_module=v20_module, pool=OandaContextPool())
+        account = SimpleNamespace(
+            account_id="101-001",
+            api_hostname="api-fxpractice.oanda.com",
+            get_api_token=lambda: "token-a",
+        )
+
+        rest = factory.create_rest_context(account)
+        assert factory.create_rest_context(account) is rest
+        assert factory.create_stream_context(account) is not rest
+
+        account.get_api_token = lambda: "token-b"
+        assert factory.create_rest_context(account) is not rest
+        assert v20_module.Context.call_count == 3
+
+    def test_owned_context_is_released_when_owner_is_collected(self):
+        clock = SimpleNamespace(now=0.0)
+        pool = OandaContextPool(idle_seconds=30, clock=lambda: clock.now)
+        v20_module = SimpleNamespace(Context=MagicMock(side_effect=lambda **_: MagicMock()))
+        factory = OandaContextFactory(v20_module=v20_module, pool=pool)
+        account = SimpleNamespace(
+            account_id="101-001",
+            api_hostname="api-fxpractice.oanda.com",
+            get_api_token=lambda: "token-a",
+        )
+        owner = MagicMock()
+
+        stream = factory.create_stream_context(account, owner=owner)
+        clock.now = 60
+        assert pool.evict_idle() == 0
+
+        del owner
+        gc.collect()
+        clock.now = 100
+        assert pool.evict_idle() == 1
+        stream._session.close.assert_called_once()
+
 
 class TestOandaAccountClient:
     """Tests for account-resource caching and parsing."""
@@ -237,6 +283,30 @@ class TestOandaTransactionClient:
         service.api.transaction.list.assert_called_once_with("101-001", pageSize=10)
         service._parse_transaction.assert_called_once_with(raw_transaction)
 
+    def test_transaction_history_since_id_uses_sinceid_endpoint(self):
+        raw_transaction = {"id": "43", "type": "ORDER_FILL"}
+        v20_transaction = SimpleNamespace(dict=MagicMock(return_value=raw_transaction))
+        response = SimpleNamespace(status=200, body={"transactions": [v20_transaction]})
+        service = SimpleNamespace(
+            api=SimpleNamespace(
+                transaction=SimpleNamespace(
+                    since=MagicMock(return_value=response),
+                    list=MagicMock(),
+                )
+            ),
+            account=SimpleNamespace(account_id="101-001"),
+            _parse_transaction=MagicMock(return_value="parsed"),
+        )
+
+        transactions = OandaTransactionClient(service).get_transaction_history(
+            since_transaction_id=42
+        )
+
+        assert transactions == ["parsed"]
+        service.api.transaction.since.assert_called_once_with("101-001", id="42")
+        service.api.transaction.list.assert_not_called()
+        service._parse_transaction.assert_called_once_with(raw_transaction)
+
 
 class TestOandaPricingStreamClient:
     """Tests for pricing stream client behavior."""
@@ -278,3 +348,48 @@ class TestOandaPricingStreamClient:
             snapshot=True,
             instruments="EUR_USD",
         )
+
+    @staticmethod
+    def _stream_service(response) -> SimpleNamespace:
+        return SimpleNamespace(
+            stream_api=SimpleNamespace(
+                pricing=SimpleNamespace(stream=MagicMock(return_value=response))
+            ),
+            account=SimpleNamespace(account_id="101-001"),
+            _parse_iso_datetime=MagicMock(return_value=datetime(2026, 1, 1, tzinfo=UTC)),
+        )
+
+    def test_stream_raw_pricing_ticks_parses_raw_lines(self):
+        lines = [
+            b'{"type":"HEARTBEAT","time":"2026-01-01T00:00:00.000000000Z"}',
+            b"",
+            b'{"type":"PRICE","time":"2026-01-01T00:00:01.000000000Z",'
+            b'"bids":[{"price":"1.10000","liquidity":1}],'
+            b'"asks":[{"price":"1.10020","liquidity":1}],"instrument":"EUR_USD"}',
+        ]
+        response = SimpleNamespace(status=200, lines=iter(lines), parts=MagicMock())
+        service = self._stream_service(response)
+
+        ticks = list(OandaPricingStreamClient(service).stream_raw_pricing_ticks(["EUR_USD"]))
+
+        assert ticks == [
+            PriceTick(
+                instrument="EUR_USD",
+                time="2026-01-01T00:00:01.000000000Z",
+                bid="1.10000",
+                ask="1.10020",
+            )
+        ]
+        assert ticks[0].timestamp == datetime(2026, 1, 1, 0, 0, 1, tzinfo=UTC)
+        response.parts.assert_not_called()
+
+    def test_stream_raw_pricing_ticks_maps_dropped_connection(self):
+        def lines():
+            yield b'{"type":"HEARTBEAT","time":"2026-01-01T00:00:00Z"}'
+            raise requests.exceptions.ChunkedEncodingError("connection broken")
+
+        response = SimpleNamespace(status=200, lines=lines(), path="/pricing/stream")
+        service = self._stream_service(response)
+
+        with pytest.raises(v20.errors.V20ConnectionError):
+            list(OandaPricingStreamClient(service).stream_raw_pricing_ticks("EUR_USD"))
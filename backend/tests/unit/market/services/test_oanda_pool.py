@@ -0,0 +1,146 @@
+"""Unit tests for the pooled OANDA v20 context registry."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from apps.market.services.oanda_pool import OandaContextPool, credentials_fingerprint
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _context(*, connections: int = 0, requests: int = 0) -> SimpleNamespace:
+    pool = SimpleNamespace(num_connections=connections, num_requests=requests)
+    adapter = SimpleNamespace(poolmanager=SimpleNamespace(pools={"key": pool}))
+    return SimpleNamespace(
+        _session=SimpleNamespace(adapters={"https://": adapter}, close=MagicMock())
+    )
+
+
+def _acquire(pool: OandaContextPool, factory, *, account_id: str = "101-001", token: str = "t"):
+    return pool.acquire(
+        account_id=account_id,
+        fingerprint=credentials_fingerprint(hostname="api-fxpractice.oanda.com", token=token),
+        kind="rest",
+        factory=factory,
+    )
+
+
+class TestOandaContextPool:
+    """Tests for pooling, eviction and reuse counters."""
+
+    def test_acquire_counts_hits_and_misses_per_key(self):
+        pool = OandaContextPool(idle_seconds=60)
+        factory = MagicMock(side_effect=lambda: _context())
+
+        first = _acquire(pool, factory)
+        assert _acquire(pool, factory) is first
+        assert _acquire(pool, factory, account_id="101-002") is not first
+        assert _acquire(pool, factory, token="rotated") is not first
+
+        stats = pool.stats()
+        assert (stats.size, stats.hits, stats.misses) == (3, 1, 3)
+        assert factory.call_count == 3
+
+    def test_idle_contexts_are_closed_and_rebuilt(self):
+        clock = _Clock()
+        pool = OandaContextPool(idle_seconds=30, clock=clock)
+        first = _acquire(pool, lambda: _context(connections=1, requests=5))
+
+        clock.now = 31
+        second = _acquire(pool, lambda: _context())
+
+        assert second is not first
+        first._session.close.assert_called_once()
+        stats = pool.stats()
+        assert stats.evictions == 1
+        assert stats.size == 1
+        # Counters from evicted sessions are retained.
+        assert (stats.connections_opened, stats.requests_sent, stats.connections_reused) == (
+            1,
+            5,
+            4,
+        )
+
+    def test_held_context_survives_idle_timeout_until_released(self):
+        clock = _Clock()
+        pool = OandaContextPool(idle_seconds=30, clock=clock)
+        held = pool.acquire(
+            account_id="101-001",
+            fingerprint="fp",
+            kind="stream:30",
+            factory=_context,
+            hold=True,
+        )
+
+        clock.now = 120
+        assert pool.evict_idle() == 0
+        held._session.close.assert_not_called()
+
+        pool.release(held)
+        clock.now = 149
+        assert pool.evict_idle() == 0
+        clock.now = 151
+        assert pool.evict_idle() == 1
+        held._session.close.assert_called_once()
+
+    def test_max_entries_skips_held_contexts(self):
+        pool = OandaContextPool(idle_seconds=0, max_entries=1)
+        held = pool.acquire(
+            account_id="a", fingerprint="fp", kind="rest", factory=_context, hold=True
+        )
+        _acquire(pool, _context, account_id="b")
+
+        held._session.close.assert_not_called()
+        assert pool.stats().size == 2
+        _acquire(pool, _context, account_id="c")
+        assert pool.stats().size == 2
+
+    def test_max_entries_evicts_least_recently_used(self):
+        pool = OandaContextPool(idle_seconds=0, max_entries=2)
+        a = _acquire(pool, _context, account_id="a")
+        _acquire(pool, _context, account_id="b")
+        _acquire(pool, _context, account_id="a")
+        _acquire(pool, _context, account_id="c")
+
+        assert pool.stats().size == 2
+        assert _acquire(pool, _context, account_id="a") is a
+        assert pool.stats().evictions == 1
+
+    def test_concurrent_misses_share_one_context(self):
+        pool = OandaContextPool(idle_seconds=60)
+        barrier = threading.Barrier(4)
+        results: list[object] = []
+
+        def build():
+            return _context()
+
+        def worker():
+            barrier.wait()
+            results.append(_acquire(pool, build))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(result) for result in results}) == 1
+        assert pool.stats().size == 1
+
+    def test_reset_after_fork_drops_entries_without_closing(self):
+        pool = OandaContextPool(idle_seconds=60)
+        context = _acquire(pool, _context)
+
+        pool.reset_after_fork()
+
+        assert pool.stats().size == 0
+        context._session.close.assert_not_called()
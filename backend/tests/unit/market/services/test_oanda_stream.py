@@ -0,0 +1,114 @@
+"""Tests for raw OANDA pricing stream parsing and transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from apps.market.services.oanda_stream import (
+    OandaStreamHTTPError,
+    PriceTick,
+    PricingStreamEndpoint,
+    open_pricing_stream,
+    parse_price_line,
+)
+
+PRICE_LINE = (
+    b'{"type":"PRICE","time":"2026-01-05T00:00:01.123456789Z",'
+    b'"bids":[{"price":"150.100","liquidity":1000000},{"price":"150.099","liquidity":5000000}],'
+    b'"asks":[{"price":"150.108","liquidity":1000000}],'
+    b'"closeoutBid":"150.096","closeoutAsk":"150.112","status":"tradeable",'
+    b'"tradeable":true,"instrument":"USD_JPY"}'
+)
+
+
+class TestParsePriceLine:
+    def test_extracts_best_bid_and_ask(self):
+        tick = parse_price_line(PRICE_LINE)
+
+        assert tick == PriceTick(
+            instrument="USD_JPY",
+            time="2026-01-05T00:00:01.123456789Z",
+            bid="150.100",
+            ask="150.108",
+        )
+        assert tick.mid == Decimal("150.104")
+
+    def test_heartbeats_are_skipped(self):
+        assert parse_price_line(b'{"type":"HEARTBEAT","time":"2026-01-05T00:00:05Z"}') is None
+
+    def test_non_compact_json_falls_back_to_full_parse(self):
+        line = json.dumps(json.loads(PRICE_LINE), indent=1)
+
+        assert parse_price_line(line) == parse_price_line(PRICE_LINE)
+
+    def test_empty_book_is_skipped(self):
+        line = b'{"type":"PRICE","time":"t","bids":[],"asks":[],"instrument":"USD_JPY"}'
+
+        assert parse_price_line(line) is None
+
+
+async def _serve_once(response: bytes) -> tuple[asyncio.Server, int]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(response)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _chunk(data: bytes) -> bytes:
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+
+def _endpoint(port: int) -> PricingStreamEndpoint:
+    return PricingStreamEndpoint(
+        hostname="127.0.0.1",
+        account_id="001",
+        token="token",
+        instruments=("USD_JPY",),
+        port=port,
+        tls=False,
+    )
+
+
+class TestOpenPricingStream:
+    def test_reassembles_lines_split_across_chunks(self):
+        heartbeat = b'{"type":"HEARTBEAT","time":"2026-01-05T00:00:05Z"}'
+        body = PRICE_LINE + b"\n" + heartbeat + b"\n"
+        response = (
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + _chunk(body[:40])
+            + _chunk(body[40:])
+            + b"0\r\n\r\n"
+        )
+
+        async def collect() -> list[bytes]:
+            server, port = await _serve_once(response)
+            async with server:
+                return [line async for line in open_pricing_stream(_endpoint(port))]
+
+        assert asyncio.run(collect()) == [PRICE_LINE, heartbeat]
+
+    def test_error_status_raises(self):
+        body = b'{"errorMessage":"Invalid token"}'
+        response = (
+            b"HTTP/1.1 401 Unauthorized\r\nContent-Length: "
+            + str(len(body)).encode()
+            + b"\r\n\r\n"
+            + body
+        )
+
+        async def collect() -> list[bytes]:
+            server, port = await _serve_once(response)
+            async with server:
+                return [line async for line in open_pricing_stream(_endpoint(port))]
+
+        with pytest.raises(OandaStreamHTTPError) as exc_info:
+            asyncio.run(collect())
+        assert exc_info.value.status == 401
@@ -0,0 +1,96 @@
+"""Tests for server-side tick downsampling."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from apps.market.models import TickData
+from apps.market.services.tick_downsample import downsample_ticks, lttb
+
+BASE = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _seed(mids: list[str], *, instrument: str = "USD_JPY") -> None:
+    TickData.objects.bulk_create(
+        TickData(
+            instrument=instrument,
+            timestamp=BASE + timedelta(seconds=index),
+            bid=Decimal(mid) - Decimal("0.01"),
+            ask=Decimal(mid) + Decimal("0.01"),
+            mid=Decimal(mid),
+        )
+        for index, mid in enumerate(mids)
+    )
+
+
+@pytest.mark.django_db
+def test_minmax_keeps_first_low_high_last_per_bucket():
+    _seed(["1.0", "3.0", "0.5", "2.0", "1.5", "9.0", "1.2", "1.1"])
+    _seed(["100.0"], instrument="EUR_USD")
+
+    sampled = downsample_ticks(
+        instrument="USD_JPY",
+        since=BASE,
+        until=BASE + timedelta(seconds=8),
+        points=8,
+    )
+
+    assert sampled.bucket_seconds == 4
+    assert sampled.source_count == 8
+    assert [(ts - BASE).seconds for ts, _ in sampled.points] == [0, 1, 2, 3, 4, 5, 7]
+    assert [value for _, value in sampled.points][-3:] == [
+        Decimal("1.5"),
+        Decimal("9.0"),
+        Decimal("1.1"),
+    ]
+
+
+@pytest.mark.django_db
+def test_minmax_caps_output_and_clamps_window_end():
+    _seed([str(index % 7) for index in range(101)])
+
+    sampled = downsample_ticks(
+        instrument="USD_JPY",
+        since=BASE,
+        until=BASE + timedelta(seconds=100),
+        points=20,
+        price="bid",
+    )
+
+    assert sampled.source_count == 101
+    assert len(sampled.points) <= 20
+    assert sampled.points[-1][0] == BASE + timedelta(seconds=100)
+    assert sampled.points == sorted(sampled.points)
+
+
+@pytest.mark.django_db
+def test_lttb_returns_requested_points_including_endpoints():
+    _seed([str(index % 11) for index in range(200)])
+
+    sampled = downsample_ticks(
+        instrument="USD_JPY",
+        since=BASE,
+        until=BASE + timedelta(seconds=199),
+        points=12,
+        method="lttb",
+    )
+
+    assert len(sampled.points) == 12
+    assert sampled.points[0][0] == BASE
+    assert sampled.points[-1][0] == BASE + timedelta(seconds=199)
+
+
+def test_lttb_keeps_the_spike():
+    points = [(BASE + timedelta(seconds=index), Decimal("1")) for index in range(10)]
+    points[5] = (points[5][0], Decimal("50"))
+
+    assert points[5] in lttb(points, 4)
+    assert lttb(points[:3], 4) == points[:3]
+
+
+def test_rejects_unknown_method_and_price():
+    with pytest.raises(ValueError):
+        downsample_ticks(instrument="USD_JPY", since=BASE, until=BASE, points=4, method="avg")
+    with pytest.raises(ValueError):
+        downsample_ticks(instrument="USD_JPY", since=BASE, until=BASE, points=4, price="spread")
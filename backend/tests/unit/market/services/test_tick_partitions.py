@@ -0,0 +1,101 @@
+"""Tests for tick_data monthly partition helpers."""
+
+from datetime import UTC, datetime
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+
+from apps.market.services import tick_partitions
+from apps.market.services.tick_partitions import (
+    add_months,
+    drop_tick_partitions_before,
+    ensure_tick_partitions,
+    months_between,
+    partition_for,
+)
+
+
+def _postgres(fetchone=(), fetchall=()):
+    connection = MagicMock(vendor="postgresql")
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.side_effect = list(fetchone)
+    cursor.fetchall.side_effect = list(fetchall)
+    connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+    return connection, cursor
+
+
+def test_partition_bounds_are_utc_months():
+    partition = partition_for(datetime(2026, 12, 31, 23, 59, tzinfo=UTC))
+
+    assert partition.name == "tick_data_p202612"
+    assert partition.start == datetime(2026, 12, 1, tzinfo=UTC)
+    assert partition.end == datetime(2027, 1, 1, tzinfo=UTC)
+    assert add_months(partition.start, -12) == datetime(2025, 12, 1, tzinfo=UTC)
+
+
+def test_months_between_includes_both_ends():
+    names = [
+        partition.name
+        for partition in months_between(
+            datetime(2025, 11, 15, tzinfo=UTC), datetime(2026, 2, 1, tzinfo=UTC)
+        )
+    ]
+
+    assert names == [
+        "tick_data_p202511",
+        "tick_data_p202512",
+        "tick_data_p202601",
+        "tick_data_p202602",
+    ]
+
+
+def test_helpers_are_noops_without_partitioning():
+    since = datetime(2026, 1, 1, tzinfo=UTC)
+
+    assert ensure_tick_partitions(since, since) == []
+    assert drop_tick_partitions_before(since) == ([], 0)
+
+
+@pytest.mark.django_db
+def test_ensure_moves_parked_default_rows_into_new_partition():
+    connection, cursor = _postgres(
+        # is_partitioned (x2), default partition exists, parked rows found
+        fetchone=[(1,), (1,), (1,), (1,)],
+        fetchall=[[("tick_data_default",)]],
+    )
+    with patch.object(tick_partitions, "connection", connection):
+        created = ensure_tick_partitions(
+            datetime(2026, 3, 5, tzinfo=UTC), datetime(2026, 3, 20, tzinfo=UTC)
+        )
+
+    assert created == ["tick_data_p202603"]
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert statements[-1] == (
+        'ALTER TABLE "tick_data" ATTACH PARTITION "tick_data_p202603" '
+        "FOR VALUES FROM ('2026-03-01T00:00:00+00:00') TO ('2026-04-01T00:00:00+00:00')"
+    )
+    assert any(statement.startswith('DELETE FROM "tick_data_default"') for statement in statements)
+
+
+@pytest.mark.django_db
+def test_drop_removes_only_fully_expired_months():
+    connection, cursor = _postgres(
+        fetchone=[(1,), (1200,)],
+        fetchall=[[("tick_data_p202601",), ("tick_data_p202602",), ("tick_data_default",)]],
+    )
+    with patch.object(tick_partitions, "connection", connection):
+        dropped, rows = drop_tick_partitions_before(datetime(2026, 2, 20, tzinfo=UTC))
+
+    assert dropped == ["tick_data_p202601"]
+    assert rows == 1200
+    assert cursor.execute.call_args_list[-1].args[0] == 'DROP TABLE "tick_data_p202601"'
+
+
+def test_command_reports_unpartitioned_database():
+    out = StringIO()
+
+    call_command("create_tick_partitions", "--drop-expired", stdout=out)
+
+    assert "not partitioned" in out.getvalue()
@@ -0,0 +1,267 @@
+"""Tests for the local OANDA transaction mirror."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.utils import timezone
+
+from apps.market.enums import ApiType
+from apps.market.models import (
+    OandaAccounts,
+    OandaOrderRecord,
+    OandaTradeRecord,
+    OandaTransaction,
+    OandaTransactionSyncState,
+)
+from apps.market.services import oanda_parsing
+from apps.market.services.oanda_types import OandaAPIError, Transaction
+from apps.market.tasks.transactions import sync_oanda_transactions
+from apps.market.services.transaction_mirror import (
+    OandaTransactionMirror,
+    mirror_ready,
+    mirrored_closed_trades,
+    mirrored_orders,
+)
+
+
+class FakeTransactionFeed:
+    """In-memory ``sinceid`` feed returning at most ``page_size`` transactions."""
+
+    def __init__(self, transactions: list[dict[str, Any]], *, page_size: int = 1000) -> None:
+        self.transactions = transactions
+        self.page_size = page_size
+        self.calls: list[int] = []
+        self.error: Exception | None = None
+
+    def fetch_since(self, account: OandaAccounts, since_transaction_id: int) -> list[Transaction]:
+        self.calls.append(since_transaction_id)
+        if self.error is not None:
+            raise self.error
+        newer = [txn for txn in self.transactions if int(txn["id"]) > since_transaction_id]
+        return [oanda_parsing.parse_transaction(txn) for txn in newer[: self.page_size]]
+
+
+def _time(minutes: int) -> str:
+    return f"2026-05-01T00:{minutes:02d}:00.000000000Z"
+
+
+def _limit_order_lifecycle() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": "10",
+            "type": "LIMIT_ORDER",
+            "time": _time(0),
+            "instrument": "USD_JPY",
+            "units": "1000",
+            "price": "150.000",
+            "timeInForce": "GTC",
+            "takeProfitOnFill": {"price": "150.500"},
+        },
+        {
+            "id": "11",
+            "type": "ORDER_FILL",
+            "time": _time(1),
+            "orderID": "10",
+            "instrument": "USD_JPY",
+            "units": "1000",
+            "price": "150.000",
+            "tradeOpened": {"tradeID": "11", "units": "1000", "price": "150.000"},
+        },
+        {
+            "id": "12",
+            "type": "TAKE_PROFIT_ORDER",
+            "time": _time(1),
+            "tradeID": "11",
+            "price": "150.500",
+            "timeInForce": "GTC",
+        },
+        {
+            "id": "13",
+            "type": "ORDER_FILL",
+            "time": _time(2),
+            "orderID": "12",
+            "instrument": "USD_JPY",
+            "units": "-400",
+            "price": "150.500",
+            "tradeReduced": {"tradeID": "11", "units": "-400", "realizedPL": "200"},
+        },
+        {
+            "id": "14",
+            "type": "MARKET_ORDER",
+            "time": _time(3),
+            "instrument": "USD_JPY",
+            "units": "-600",
+        },
+        {
+            "id": "15",
+            "type": "ORDER_FILL",
+            "time": _time(3),
+            "orderID": "14",
+            "instrument": "USD_JPY",
+            "units": "-600",
+            "price": "150.200",
+            "tradesClosed": [
+                {"tradeID": "11", "units": "-600", "realizedPL": "120", "price": "150.200"}
+            ],
+        },
+        {
+            "id": "16",
+            "type": "STOP_ORDER",
+            "time": _time(4),
+            "instrument": "EUR_USD",
+            "units": "-5",
+        },
+        {"id": "17", "type": "ORDER_CANCEL", "time": _time(5), "orderID": "16"},
+    ]
+
+
+@pytest.fixture
+def account(user) -> OandaAccounts:
+    return OandaAccounts.objects.create(
+        user=user,
+        account_id="101-001-1234567-001",
+        api_type=ApiType.PRACTICE,
+        is_active=True,
+    )
+
+
+@pytest.mark.django_db
+class TestOandaTransactionMirror:
+    def test_sync_mirrors_transactions_and_projects_orders_and_trades(self, account) -> None:
+        feed = FakeTransactionFeed(_limit_order_lifecycle())
+
+        result = OandaTransactionMirror(feed=feed).sync(account)
+
+        assert result.applied == 8
+        assert result.last_transaction_id == 17
+        assert result.caught_up is True
+        assert OandaTransaction.objects.filter(account=account).count() == 8
+
+        orders = {record.order_id: record for record in OandaOrderRecord.objects.all()}
+        assert orders[10].state == "FILLED"
+        assert orders[10].trade_id == 11
+        assert orders[10].take_profit == Decimal("150.500")
+        assert orders[12].order_type == "TAKE_PROFIT"
+        assert orders[12].instrument == "USD_JPY"
+        assert orders[12].state == "FILLED"
+        assert orders[16].state == "CANCELLED"
+        assert orders[16].cancel_time is not None
+
+        trade = OandaTradeRecord.objects.get(account=account, trade_id=11)
+        assert trade.state == "CLOSED"
+        assert trade.initial_units == Decimal("1000")
+        assert trade.current_units == Decimal("0")
+        assert trade.realized_pl == Decimal("320")
+        assert trade.close_price == Decimal("150.200")
+
+    def test_sync_is_incremental_from_the_stored_cursor(self, account) -> None:
+        transactions = _limit_order_lifecycle()
+        feed = FakeTransactionFeed(transactions[:2])
+        mirror = OandaTransactionMirror(feed=feed)
+        mirror.sync(account)
+
+        feed.transactions = transactions
+        feed.calls.clear()
+        result = mirror.sync(account)
+
+        assert feed.calls[0] == 11
+        assert result.applied == 6
+        assert OandaTransaction.objects.filter(account=account).count() == 8
+        assert OandaTradeRecord.objects.get(account=account, trade_id=11).state == "CLOSED"
+
+    def test_sync_pages_until_caught_up_or_page_budget(self, account) -> None:
+        feed = FakeTransactionFeed(_limit_order_lifecycle(), page_size=3)
+
+        partial = OandaTransactionMirror(feed=feed, max_pages=2).sync(account)
+        assert partial.caught_up is False
+        assert partial.last_transaction_id == 15
+        assert not mirror_ready([account])
+
+        rest = OandaTransactionMirror(feed=feed, max_pages=5).sync(account)
+        assert rest.caught_up is True
+        assert rest.last_transaction_id == 17
+        assert mirror_ready([account])
+
+    def test_sync_records_feed_errors(self, account) -> None:
+        feed = FakeTransactionFeed([])
+        feed.error = OandaAPIError("Error fetching transactions")
+
+        with pytest.raises(OandaAPIError):
+            OandaTransactionMirror(feed=feed).sync(account)
+
+        state = OandaTransactionSyncState.objects.get(account=account)
+        assert state.caught_up is False
+        assert state.last_error == "Error fetching transactions"
+
+    def test_mirror_ready_requires_fresh_sync_for_every_account(self, account, user) -> None:
+        other = OandaAccounts.objects.create(
+            user=user,
+            account_id="101-001-1234567-002",
+            api_type=ApiType.PRACTICE,
+            is_active=True,
+        )
+        OandaTransactionMirror(feed=FakeTransactionFeed([])).sync(account)
+
+        assert mirror_ready([account])
+        assert not mirror_ready([account, other])
+
+        OandaTransactionSyncState.objects.filter(account=account).update(
+            last_synced_at=timezone.now() - timedelta(hours=1)
+        )
+        assert not mirror_ready([account])
+
+    def test_history_queries_filter_by_instrument_and_range(self, account) -> None:
+        OandaTransactionMirror(feed=FakeTransactionFeed(_limit_order_lifecycle())).sync(account)
+
+        assert [r.order_id for r in mirrored_orders([account])] == [16, 14, 12, 10]
+        assert [r.order_id for r in mirrored_orders([account], instrument="EUR_USD")] == [16]
+        assert list(mirrored_closed_trades([account]).values_list("trade_id", flat=True)) == [11]
+        late = datetime(2026, 5, 1, 0, 10, tzinfo=UTC)
+        assert not mirrored_closed_trades([account], range_from=late).exists()
+
+    @pytest.mark.parametrize(
+        ("order_id", "upstream_type"),
+        [(12, "TAKE_PROFIT"), (14, "MARKET"), (16, "STOP"), (10, "LIMIT")],
+    )
+    def test_mirrored_orders_format_like_upstream_orders(
+        self, account, order_id, upstream_type
+    ) -> None:
+        from apps.market.views.orders import _format_order_dict, _format_order_record
+
+        OandaTransactionMirror(feed=FakeTransactionFeed(_limit_order_lifecycle())).sync(account)
+        record = OandaOrderRecord.objects.select_related("account").get(order_id=order_id)
+        upstream = oanda_parsing.parse_order(
+            {
+                "id": str(order_id),
+                "type": upstream_type,
+                "instrument": record.instrument,
+                "units": str(record.units or 0),
+                "state": record.state,
+            }
+        )
+
+        mirrored = _format_order_record(record)
+        expected = _format_order_dict(upstream, account)
+        assert {key: mirrored[key] for key in ("type", "direction", "state")} == {
+            key: expected[key] for key in ("type", "direction", "state")
+        }
+        assert mirrored["type"] in {"market", "limit", "stop"}
+
+
+@pytest.mark.django_db
+class TestSyncOandaTransactionsTask:
+    def test_syncs_active_accounts_and_counts_failures(self, account, monkeypatch) -> None:
+        calls: list[int] = []
+
+        def fake_sync(self, target):
+            calls.append(target.pk)
+            raise OandaAPIError("boom")
+
+        monkeypatch.setattr(OandaTransactionMirror, "sync", fake_sync)
+
+        assert sync_oanda_transactions() == {"synced": 0, "failed": 1, "applied": 0}
+        assert calls == [account.pk]
@@ -0,0 +1,223 @@
+"""Tests for the multiplexed OANDA pricing publisher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+
+from apps.market.services.oanda_stream import PricingStreamEndpoint
+from apps.market.tasks.base import RELEASE_LOCK_IF_OWNER_SCRIPT, REFRESH_LOCK_IF_OWNER_SCRIPT
+from apps.market.tasks.multiplexer import AccountStream, PricingStreamMultiplexer
+from apps.market.tasks.publisher import publisher_lock_key_for_account
+
+
+def _price(instrument: str, bid: str, ask: str) -> bytes:
+    return (
+        f'{{"type":"PRICE","time":"2026-01-05T00:00:01.000000000Z",'
+        f'"bids":[{{"price":"{bid}","liquidity":1}}],"asks":[{{"price":"{ask}","liquidity":1}}],'
+        f'"instrument":"{instrument}"}}'
+    ).encode()
+
+
+class _Pipeline:
+    def __init__(self, redis: _AsyncRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, str]] = []
+
+    def publish(self, channel: str, payload: str) -> None:
+        self.commands.append((channel, payload))
+
+    async def execute(self) -> list[int]:
+        self.redis.published.extend(self.commands)
+        return [1] * len(self.commands)
+
+
+class _AsyncRedis:
+    """Just the commands the multiplexer issues, including its two lock scripts."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+
+    async def set(self, key: str, value: str, *, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def eval(self, script: str, _numkeys: int, key: str, owner: str, *args: Any) -> int:
+        if self.values.get(key) != owner:
+            return 0
+        if script == RELEASE_LOCK_IF_OWNER_SCRIPT:
+            del self.values[key]
+        assert script in (RELEASE_LOCK_IF_OWNER_SCRIPT, REFRESH_LOCK_IF_OWNER_SCRIPT)
+        return 1
+
+    def pipeline(self, *, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+
+class _SlowPricingWriter:
+    """Pricing writer whose cache write blocks until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls: list[str] = []
+
+    def write(self, *, instrument: str, bid: Any, ask: Any, time: Any) -> bool:
+        self.calls.append(instrument)
+        self.release.wait(timeout=5)
+        return True
+
+
+def _stream(account_pk: int, oanda_id: str, pricing_writer: Any = None) -> AccountStream:
+    return AccountStream(
+        account_pk=account_pk,
+        oanda_account_id=oanda_id,
+        endpoint=PricingStreamEndpoint(
+            hostname="stream-fxpractice.oanda.com",
+            account_id=oanda_id,
+            token="token",
+            instruments=("USD_JPY",),
+        ),
+        pricing_writer=pricing_writer,
+    )
+
+
+def _run(multiplexer: PricingStreamMultiplexer, streams: list[AccountStream], until) -> None:
+    async def main() -> None:
+        stop = asyncio.Event()
+
+        async def watch() -> None:
+            while not until():
+                await asyncio.sleep(0.001)
+            stop.set()
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.wait_for(multiplexer.run(streams, stop), timeout=5)
+        await watcher
+
+    asyncio.run(main())
+
+
+class TestPricingStreamMultiplexer:
+    def test_streams_every_account_on_one_loop(self):
+        redis = _AsyncRedis()
+
+        async def connector(endpoint: PricingStreamEndpoint) -> AsyncIterator[bytes]:
+            yield b'{"type":"HEARTBEAT","time":"2026-01-05T00:00:00Z"}'
+            yield _price("USD_JPY", "150.100", "150.108")
+            await asyncio.Event().wait()
+
+        multiplexer = PricingStreamMultiplexer(
+            redis=redis, shared_channel="market:ticks", connector=connector
+        )
+        _run(
+            multiplexer,
+            [_stream(1, "001-A"), _stream(2, "001-B")],
+            lambda: len(redis.published) >= 4,
+        )
+
+        channels = sorted(channel for channel, _payload in redis.published)
+        assert channels == [
+            "live:001-A:USD_JPY",
+            "live:001-B:USD_JPY",
+            "market:ticks",
+            "market:ticks",
+        ]
+        payload = json.loads(redis.published[0][1])
+        assert payload["timestamp"] == "2026-01-05T00:00:01Z"
+        assert payload["mid"] == "150.104"
+        assert "oanda_tick_publish_latency_seconds" in payload
+        # Locks are released on shutdown.
+        assert redis.values == {}
+
+    def test_account_locked_by_another_publisher_is_not_streamed(self):
+        redis = _AsyncRedis()
+        redis.values[publisher_lock_key_for_account(1)] = "other-worker"
+        opened: list[str] = []
+
+        async def connector(endpoint: PricingStreamEndpoint) -> AsyncIterator[bytes]:
+            opened.append(endpoint.account_id)
+            yield _price("USD_JPY", "150.100", "150.108")
+            await asyncio.Event().wait()
+
+        multiplexer = PricingStreamMultiplexer(
+            redis=redis, shared_channel="market:ticks", connector=connector
+        )
+        _run(
+            multiplexer,
+            [_stream(1, "001-A"), _stream(2, "001-B")],
+            lambda: len(redis.published) >= 2 and multiplexer.states[1].status == "locked",
+        )
+
+        assert opened == ["001-B"]
+        assert redis.values == {publisher_lock_key_for_account(1): "other-worker"}
+
+    def test_failed_account_reconnects_with_backoff_independently(self):
+        redis = _AsyncRedis()
+        attempts: dict[str, int] = {}
+
+        async def connector(endpoint: PricingStreamEndpoint) -> AsyncIterator[bytes]:
+            attempts[endpoint.account_id] = attempts.get(endpoint.account_id, 0) + 1
+            if endpoint.account_id == "001-A" and attempts["001-A"] < 3:
+                raise ConnectionError("reset by peer")
+            yield _price("USD_JPY", "150.100", "150.108")
+            await asyncio.Event().wait()
+
+        multiplexer = PricingStreamMultiplexer(
+            redis=redis,
+            shared_channel="market:ticks",
+            connector=connector,
+            backoff_base_seconds=0.001,
+            backoff_max_seconds=0.01,
+        )
+        _run(
+            multiplexer,
+            [_stream(1, "001-A"), _stream(2, "001-B")],
+            lambda: len(redis.published) >= 4,
+        )
+
+        assert attempts == {"001-A": 3, "001-B": 1}
+        assert multiplexer.states[1].reconnects == 2
+        assert multiplexer.states[1].last_error == "reset by peer"
+        assert multiplexer.states[2].reconnects == 0
+
+    def test_publishing_continues_while_pricing_writer_is_slow(self):
+        redis = _AsyncRedis()
+        writer = _SlowPricingWriter()
+
+        async def connector(endpoint: PricingStreamEndpoint) -> AsyncIterator[bytes]:
+            for index in range(5):
+                yield _price("USD_JPY", f"150.10{index}", f"150.11{index}")
+                await asyncio.sleep(0)
+            await asyncio.Event().wait()
+
+        def published_all() -> bool:
+            if len(redis.published) < 10:
+                return False
+            writer.release.set()
+            return True
+
+        multiplexer = PricingStreamMultiplexer(
+            redis=redis, shared_channel="market:ticks", connector=connector
+        )
+        _run(multiplexer, [_stream(1, "001-A", writer)], published_all)
+
+        assert multiplexer.states[1].published == 5
+        # The blocked write is never queued behind: later ticks skip the cache.
+        assert writer.calls == ["USD_JPY"]
+
+    def test_backoff_is_capped(self):
+        multiplexer = PricingStreamMultiplexer(
+            redis=_AsyncRedis(),
+            shared_channel="market:ticks",
+            backoff_base_seconds=1.0,
+            backoff_max_seconds=8.0,
+        )
+
+        assert 0.5 <= multiplexer.backoff_seconds(1) <= 1.0
+        assert 4.0 <= multiplexer.backoff_seconds(10) <= 8.0
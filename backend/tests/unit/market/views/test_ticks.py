@@ -1,12 +1,18 @@
 """Unit tests for market views ticks."""
 
+import json
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import pytest
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
-from rest_framework.test import APIRequestFactory
+from rest_framework.test import APIClient, APIRequestFactory
 
+from apps.common.renderers import ColumnarJSONRenderer, TimedJSONRenderer, columnar_rows
+from apps.market.models import TickData
 from apps.market.views.ticks import TickDataRangeView, TickDataView
 
 factory = APIRequestFactory()
@@ -88,3 +94,124 @@ class TestTickDataRangeView:
         response = view.get(request)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["has_data"] is False
+
+
+@pytest.mark.django_db
+class TestTickDataRendering:
+    @pytest.fixture
+    def client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        start = datetime(2026, 4, 6, 9, 0, tzinfo=UTC)
+        TickData.objects.bulk_create(
+            TickData(
+                instrument="USD_JPY",
+                timestamp=start + timedelta(seconds=index),
+                bid=Decimal("150.000") + index,
+                ask=Decimal("150.010") + index,
+                mid=Decimal("150.005") + index,
+            )
+            for index in range(3)
+        )
+        return client
+
+    def test_default_json_reports_serialization_time(self, client):
+        response = client.get("/api/market/ticks/?instrument=USD_JPY")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Server-Timing"].startswith("serialize;dur=")
+        assert response.json()["ticks"][0]["bid"] == "150.00000"
+
+    def test_columnar_format_returns_one_array_per_field(self, client):
+        rows = client.get("/api/market/ticks/?instrument=USD_JPY").json()["ticks"]
+
+        response = client.get("/api/market/ticks/?instrument=USD_JPY&format=columnar")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith(ColumnarJSONRenderer.media_type)
+        assert response["Server-Timing"].startswith("serialize;dur=")
+        payload = json.loads(response.content)
+        assert payload["count"] == 3
+        assert payload["ticks"] == {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def test_columnar_rows_fill_missing_fields_with_none():
+    assert columnar_rows([{"t": 1}, {"t": 2, "v": "a"}, {"v": "b"}]) == {
+        "t": [1, 2, None],
+        "v": [None, "a", "b"],
+    }
+
+
+def test_columnar_values_encode_like_the_default_renderer():
+    row = {
+        "timestamp": datetime(2026, 4, 11, 12, 0, 0, 123456, tzinfo=UTC),
+        "bid": Decimal("150.10000"),
+        "note": "é",
+    }
+
+    columnar = json.loads(ColumnarJSONRenderer().render({"results": [row]}))
+    default = json.loads(TimedJSONRenderer().render({"results": [row]}))
+
+    assert columnar["results"] == {key: [value] for key, value in default["results"][0].items()}
+
+
+@pytest.mark.django_db
+class TestTickDataDownsampling:
+    @pytest.fixture
+    def client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        start = datetime(2026, 4, 6, 9, 0, tzinfo=UTC)
+        TickData.objects.bulk_create(
+            TickData(
+                instrument="USD_JPY",
+                timestamp=start + timedelta(seconds=index),
+                bid=Decimal("150.000") + index % 5,
+                ask=Decimal("150.010") + index % 5,
+                mid=Decimal("150.005") + index % 5,
+            )
+            for index in range(100)
+        )
+        return client
+
+    def test_points_returns_one_unpaginated_series(self, client):
+        response = client.get(
+            "/api/market/ticks/?instrument=USD_JPY&points=20"
+            "&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:39Z"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        payload = response.json()
+        assert payload["downsampled"] is True
+        assert payload["method"] == "minmax"
+        assert payload["next_cursor"] is None
+        assert payload["source_count"] == 100
+        assert 0 < payload["count"] <= 20
+        assert set(payload["ticks"][0]) == {"timestamp", "mid"}
+        assert payload["ticks"][-1]["timestamp"] == "2026-04-06T09:01:39Z"
+
+    def test_lttb_price_series(self, client):
+        response = client.get(
+            "/api/market/ticks/?instrument=USD_JPY&points=10&method=lttb&price=ask"
+            "&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:39Z"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] == 10
+        assert "ask" in response.json()["ticks"][0]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "points=20",
+            "points=2&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:00Z",
+            "points=abc&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:00Z",
+            "points=20&method=avg&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:00Z",
+            "points=20&price=spread&from_time=2026-04-06T09:00:00Z&to_time=2026-04-06T09:01:00Z",
+            "points=20&from_time=2026-04-06T09:01:00Z&to_time=2026-04-06T09:00:00Z",
+        ],
+    )
+    def test_invalid_downsample_params(self, client, query):
+        response = client.get(f"/api/market/ticks/?instrument=USD_JPY&{query}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -582,6 +582,55 @@ class TestGetOpenPositions:
         assert handler.get_open_positions() == []
 
 
+class TestFlushCycleSummaries:
+    """Tests for deferred cycle summary refreshes."""
+
+    def test_refreshes_each_touched_cycle_once_per_flush(self):
+        handler = EventHandler(order_service=_make_order_service(), instrument="EUR_USD")
+        long_cycle, short_cycle = str(uuid4()), str(uuid4())
+
+        with (
+            patch("apps.trading.events.handler.Trade") as trade_model,
+            patch("apps.trading.events.handler.transaction"),
+            patch("apps.trading.services.cycle_summaries.record_cycle_trade") as record,
+        ):
+            for cycle_id in (long_cycle, long_cycle, long_cycle, short_cycle, None):
+                handler._record_trade(
+                    direction=None,
+                    units=1000,
+                    instrument="EUR_USD",
+                    price=Decimal("1.1"),
+                    execution_method="open_position",
+                    timestamp=timezone.now(),
+                    cycle_id=cycle_id,
+                )
+            record.assert_not_called()
+
+            handler.flush_cycle_summaries()
+            handler.flush_cycle_summaries()
+
+        assert trade_model.objects.create.call_count == 5
+        assert sorted(call.kwargs["cycle_id"] for call in record.call_args_list) == sorted(
+            [long_cycle, short_cycle]
+        )
+
+    def test_failed_refresh_does_not_stop_other_cycles(self):
+        handler = EventHandler(order_service=_make_order_service(), instrument="EUR_USD")
+        handler._dirty_cycle_ids = {"a", "b"}
+
+        with (
+            patch("apps.trading.events.handler.transaction"),
+            patch(
+                "apps.trading.services.cycle_summaries.record_cycle_trade",
+                side_effect=[RuntimeError("boom"), None],
+            ) as record,
+        ):
+            handler.flush_cycle_summaries()
+
+        assert record.call_count == 2
+        assert handler._dirty_cycle_ids == set()
+
+
 class TestClearPositions:
     """Tests for clear_positions."""
 
@@ -4,7 +4,19 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-from apps.trading.services.broker_snapshot import BrokerSnapshotLoader
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.common.singleflight import CacheSingleFlight
+from apps.market.services.cache import (
+    build_broker_snapshot_cache_key,
+    invalidate_broker_snapshot_cache,
+)
+from apps.trading.services.broker_snapshot import (
+    BrokerSnapshotLoader,
+    SharedBrokerSnapshotCache,
+)
 
 
 class TestBrokerSnapshotLoader:
@@ -24,3 +36,115 @@ class TestBrokerSnapshotLoader:
         assert first == ["order-1"]
         assert second == ["order-1"]
         broker.get_pending_orders.assert_called_once_with(instrument="EUR_USD")
+
+
+def _runner(fn, **kwargs):
+    return fn(**{k: v for k, v in kwargs.items() if k != "label"})
+
+
+class TestSharedBrokerSnapshotCache:
+    """Verify broker reads are shared across loaders for one account."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def _loader(self, broker: MagicMock, *, account_key: int = 7) -> BrokerSnapshotLoader:
+        return BrokerSnapshotLoader(
+            broker_service=broker,
+            request_runner=_runner,
+            shared_cache=SharedBrokerSnapshotCache(account_key=account_key, ttl_seconds=30),
+        )
+
+    def test_loaders_for_same_account_share_one_upstream_read(self):
+        broker = MagicMock()
+        broker.get_open_trades.return_value = ["trade-1"]
+
+        first = self._loader(broker).open_trades_for(instrument="USD_JPY", label="drift")
+        second = self._loader(broker).open_trades_for(instrument="USD_JPY", label="sync")
+
+        assert first == second == ["trade-1"]
+        broker.get_open_trades.assert_called_once_with(instrument="USD_JPY")
+
+    def test_accounts_and_instruments_are_cached_separately(self):
+        broker = MagicMock()
+        broker.get_open_trades.return_value = []
+
+        self._loader(broker, account_key=1).open_trades_for(instrument="USD_JPY", label="x")
+        self._loader(broker, account_key=2).open_trades_for(instrument="USD_JPY", label="x")
+        self._loader(broker, account_key=1).open_trades_for(instrument="EUR_USD", label="x")
+
+        assert broker.get_open_trades.call_count == 3
+
+    def test_invalidation_forces_a_fresh_read(self):
+        broker = MagicMock()
+        broker.get_account_details.side_effect = ["before", "after"]
+
+        assert self._loader(broker).account_details() == "before"
+        invalidate_broker_snapshot_cache(7)
+
+        assert self._loader(broker).account_details() == "after"
+
+    def test_failed_reads_are_not_cached(self):
+        broker = MagicMock()
+        broker.get_pending_orders.side_effect = [RuntimeError("boom"), ["order-1"]]
+
+        with pytest.raises(RuntimeError):
+            self._loader(broker).pending_orders_for(instrument="USD_JPY")
+
+        assert self._loader(broker).pending_orders_for(instrument="USD_JPY") == ["order-1"]
+        assert cache.get(CacheSingleFlight.lock_key(self._key("pending_orders"))) is None
+
+    def test_follower_waits_for_leader_result(self):
+        key = self._key("open_trades")
+        cache.add(CacheSingleFlight.lock_key(key), "leader", timeout=30)
+        broker = MagicMock()
+
+        def leader_finishes(_seconds: float) -> None:
+            cache.set(key, ["from-leader"], timeout=30)
+
+        single_flight = CacheSingleFlight(wait_seconds=5, sleep=leader_finishes)
+        loader = BrokerSnapshotLoader(
+            broker_service=broker,
+            request_runner=_runner,
+            shared_cache=SharedBrokerSnapshotCache(
+                account_key=7, ttl_seconds=30, single_flight=single_flight
+            ),
+        )
+
+        assert loader.open_trades_for(instrument="USD_JPY", label="x") == ["from-leader"]
+        broker.get_open_trades.assert_not_called()
+
+    def test_follower_loads_itself_when_leader_gives_up(self):
+        key = self._key("open_trades")
+        cache.add(CacheSingleFlight.lock_key(key), "leader", timeout=30)
+        broker = MagicMock()
+        broker.get_open_trades.return_value = ["direct"]
+
+        def leader_fails(_seconds: float) -> None:
+            cache.delete(CacheSingleFlight.lock_key(key))
+
+        loader = BrokerSnapshotLoader(
+            broker_service=broker,
+            request_runner=_runner,
+            shared_cache=SharedBrokerSnapshotCache(
+                account_key=7,
+                ttl_seconds=30,
+                single_flight=CacheSingleFlight(wait_seconds=5, sleep=leader_fails),
+            ),
+        )
+
+        assert loader.open_trades_for(instrument="USD_JPY", label="x") == ["direct"]
+        broker.get_open_trades.assert_called_once_with(instrument="USD_JPY")
+
+    @override_settings(TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS=0)
+    def test_for_account_disabled_by_zero_ttl(self):
+        assert SharedBrokerSnapshotCache.for_account(MagicMock(pk=7)) is None
+
+    @override_settings(TRADING_BROKER_SNAPSHOT_CACHE_TTL_SECONDS=5)
+    def test_for_account_requires_saved_account(self):
+        assert SharedBrokerSnapshotCache.for_account(MagicMock(pk=None)) is None
+        assert SharedBrokerSnapshotCache.for_account(MagicMock(pk=7)).ttl_seconds == 5
+
+    @staticmethod
+    def _key(kind: str) -> str:
+        return build_broker_snapshot_cache_key(7, kind, "USD_JPY")
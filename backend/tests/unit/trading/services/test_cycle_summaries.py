@@ -0,0 +1,104 @@
+"""Unit tests for materialized cycle summaries."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from apps.trading.enums import TaskType
+from apps.trading.models.trades import Trade, TradeCycleSummary
+from apps.trading.services.cycle_summaries import (
+    backfill_cycle_summaries,
+    ensure_cycle_summaries,
+    record_cycle_trade,
+    summary_aggregate,
+)
+from apps.trading.services.strategy_cycles import (
+    _AGGREGATE_TRADE_FIELDS,
+    _aggregate_cycle,
+)
+from tests.integration.factories import BacktestTaskFactory
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def _scope(task) -> dict:
+    return {
+        "task_type": TaskType.BACKTEST.value,
+        "task_id": task.pk,
+        "execution_id": task.execution_id,
+    }
+
+
+def _trade(task, *, cycle_id, method, price, minutes) -> Trade:
+    return Trade.objects.create(
+        **_scope(task),
+        timestamp=START + timedelta(minutes=minutes),
+        direction="long",
+        units=1000,
+        instrument="USD_JPY",
+        price=Decimal(price),
+        execution_method=method,
+        cycle_id=cycle_id,
+    )
+
+
+@pytest.mark.django_db
+def test_summary_aggregate_matches_folding_the_trades():
+    task = BacktestTaskFactory(execution_id=uuid4())
+    cycle_id = uuid4()
+    first = _trade(task, cycle_id=cycle_id, method="open_position", price="150", minutes=0)
+    _trade(task, cycle_id=cycle_id, method="stop_loss", price="149.5", minutes=5)
+    _trade(
+        task,
+        cycle_id=cycle_id,
+        method="rebuild_position",
+        price="149.6",
+        minutes=6,
+    )
+
+    backfill_cycle_summaries(**_scope(task))
+
+    summary = TradeCycleSummary.objects.get(**_scope(task), cycle_id=cycle_id)
+    rows = list(
+        Trade.objects.filter(cycle_id=cycle_id)
+        .order_by("timestamp")
+        .values(*_AGGREGATE_TRADE_FIELDS)
+    )
+    assert summary.started_at == first.timestamp
+    assert summary.trade_count == 3
+    assert summary.protection_count == 1
+    assert summary_aggregate(summary) == _aggregate_cycle(str(cycle_id), rows)
+
+
+@pytest.mark.django_db
+def test_record_cycle_trade_backfills_then_refreshes_one_cycle():
+    task = BacktestTaskFactory(execution_id=uuid4())
+    old_cycle, new_cycle = uuid4(), uuid4()
+    _trade(task, cycle_id=old_cycle, method="open_position", price="150", minutes=0)
+    _trade(task, cycle_id=new_cycle, method="open_position", price="151", minutes=10)
+
+    record_cycle_trade(**_scope(task), cycle_id=new_cycle)
+    assert TradeCycleSummary.objects.filter(**_scope(task)).count() == 2
+
+    _trade(task, cycle_id=new_cycle, method="close_position", price="152", minutes=11)
+    record_cycle_trade(**_scope(task), cycle_id=new_cycle)
+
+    summary = TradeCycleSummary.objects.get(**_scope(task), cycle_id=new_cycle)
+    assert summary.trade_count == 2
+    assert summary.close_count == 1
+    assert summary.last_trade_at == START + timedelta(minutes=11)
+
+
+@pytest.mark.django_db
+def test_ensure_cycle_summaries_skips_executions_that_already_have_rows():
+    task = BacktestTaskFactory(execution_id=uuid4())
+    cycle_id = uuid4()
+    _trade(task, cycle_id=cycle_id, method="open_position", price="150", minutes=0)
+    ensure_cycle_summaries(**_scope(task))
+    TradeCycleSummary.objects.filter(**_scope(task)).update(trade_count=99)
+
+    ensure_cycle_summaries(**_scope(task))
+
+    assert TradeCycleSummary.objects.get(**_scope(task), cycle_id=cycle_id).trade_count == 99
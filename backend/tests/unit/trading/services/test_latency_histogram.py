@@ -0,0 +1,130 @@
+"""Tests for live tick-to-order latency histograms."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from apps.trading.services.latency_histogram import (
+    LATENCY_STAGE_DECISION,
+    LATENCY_STAGE_RECEIVE,
+    LatencyHistogram,
+    LatencyHistogramStore,
+    LiveLatencyRecorder,
+    bucket_index,
+    bucket_upper_micros,
+    build_latency_histogram_key,
+    load_latency_summary,
+)
+
+
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("micros", [0, 1, 31, 32, 33, 1_000, 123_456, 2_500_000, 59_999_999])
+    def test_bucket_bounds_stay_within_relative_error(self, micros):
+        upper = bucket_upper_micros(bucket_index(micros))
+
+        assert upper >= micros
+        assert upper - micros <= micros / 32
+
+    def test_percentiles_over_uniform_samples(self):
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 1000
+        assert summary["p50"] == pytest.approx(0.5, rel=0.035)
+        assert summary["p99"] == pytest.approx(0.99, rel=0.035)
+        assert summary["p999"] == pytest.approx(0.999, rel=0.035)
+        assert summary["max"] == pytest.approx(1.0)
+
+    def test_empty_histogram_has_no_percentiles(self):
+        summary = LatencyHistogram().summary()
+
+        assert summary == {
+            "count": 0,
+            "p50": None,
+            "p90": None,
+            "p99": None,
+            "p999": None,
+            "max": None,
+        }
+
+
+class TestLatencyHistogramStore:
+    def test_merges_counts_from_several_executors(self):
+        redis = fakeredis.FakeRedis(decode_responses=True)
+        store = LatencyHistogramStore(redis_client=redis, ttl_seconds=60)
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for _ in range(99):
+            first.record(0.010)
+        second.record(2.0)
+
+        store.merge(task_id=7, execution_id="exec", histograms={LATENCY_STAGE_RECEIVE: first})
+        store.merge(task_id=7, execution_id="exec", histograms={LATENCY_STAGE_RECEIVE: second})
+
+        summary = store.summary(task_id=7, execution_id="exec")[LATENCY_STAGE_RECEIVE]
+        assert summary["count"] == 100
+        assert summary["p50"] == pytest.approx(0.010, rel=0.035)
+        assert summary["p999"] == pytest.approx(2.0, rel=0.035)
+        assert 0 < redis.ttl(build_latency_histogram_key(7, "exec")) <= 60
+
+    def test_stores_share_one_redis_client_with_timeout(self, settings):
+        settings.MARKET_REDIS_URL = "redis://histograms.invalid:6379/0"
+        settings.TRADING_LATENCY_HISTOGRAM_REDIS_TIMEOUT_SECONDS = 0.5
+
+        client = LatencyHistogramStore().redis
+
+        assert LatencyHistogramStore().redis is client
+        connection_kwargs = client.connection_pool.connection_kwargs
+        assert connection_kwargs["socket_timeout"] == 0.5
+        assert connection_kwargs["socket_connect_timeout"] == 0.5
+
+    def test_load_summary_is_disabled_by_setting(self, settings):
+        settings.TRADING_LATENCY_HISTOGRAM_FLUSH_SECONDS = 0
+        store = MagicMock()
+
+        assert load_latency_summary(task_id=1, execution_id="exec", store=store) is None
+        store.summary.assert_not_called()
+
+
+class TestLiveLatencyRecorder:
+    def test_flushes_on_interval_and_clears_pending(self):
+        now = [0.0]
+        store = MagicMock()
+        recorder = LiveLatencyRecorder(
+            task_id=1,
+            execution_id="exec",
+            store=store,
+            flush_interval_seconds=10,
+            clock=lambda: now[0],
+        )
+        tick_ts = datetime(2026, 1, 5, tzinfo=UTC)
+        recorder.observe(LATENCY_STAGE_DECISION, tick_ts, tick_ts + timedelta(milliseconds=40))
+
+        assert recorder.maybe_flush() is False
+        now[0] = 10.0
+        assert recorder.maybe_flush() is True
+
+        histograms = store.merge.call_args.kwargs["histograms"]
+        assert histograms[LATENCY_STAGE_DECISION].total_count == 1
+        assert recorder.pending() == {}
+
+    def test_failed_flush_keeps_counts_for_the_next_attempt(self):
+        store = MagicMock()
+        store.merge.side_effect = [ConnectionError("redis down"), None]
+        recorder = LiveLatencyRecorder(
+            task_id=1, execution_id="exec", store=store, flush_interval_seconds=10
+        )
+        recorder.record(LATENCY_STAGE_RECEIVE, 0.02)
+
+        recorder.flush()
+        recorder.record(LATENCY_STAGE_RECEIVE, 0.03)
+        recorder.flush()
+
+        histograms = store.merge.call_args.kwargs["histograms"]
+        assert histograms[LATENCY_STAGE_RECEIVE].total_count == 2
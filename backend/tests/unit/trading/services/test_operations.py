@@ -9,8 +9,11 @@ import pytest
 
 from apps.market.services.oanda_retry import OandaRetryMetricRecorder
 from apps.trading.enums import TaskType
-from apps.trading.models import ExecutionState
-from apps.trading.services.operations import TradingOperationsMetricsService
+from apps.trading.models import CeleryTaskStatus, ExecutionState
+from apps.trading.services.operations import (
+    ExecutionProfileCollector,
+    TradingOperationsMetricsService,
+)
 from tests.integration.factories import TradingTaskFactory, UserFactory
 
 
@@ -53,6 +56,7 @@ class TestTradingOperationsMetricsService:
         assert "reason" not in outage["recent"][0]
         assert snapshot["oanda_retry"]["retry_scheduled"] == 1
         assert snapshot["oanda_retry"]["recovered"] == 1
+        assert {"hits", "misses", "connections_reused"} <= set(snapshot["oanda_client_pool"])
 
     def _create_state(self, *, task_id, execution_id, observed_at: str) -> None:
         ExecutionState.objects.create(
@@ -67,3 +71,35 @@ class TestTradingOperationsMetricsService:
             },
             current_balance=Decimal("10000"),
         )
+
+
+@pytest.mark.django_db
+class TestExecutionProfileCollector:
+    """Validate execution profile collection from task status metadata."""
+
+    def test_snapshot_returns_profiles_filtered_by_task(self):
+        task_id = uuid4()
+        execution_id = uuid4()
+        CeleryTaskStatus.objects.create(
+            task_name="trading.tasks.run_backtest_task",
+            instance_key=f"{task_id}:{execution_id}",
+            meta={"execution_profile": {"ticks": 10}},
+        )
+        CeleryTaskStatus.objects.create(
+            task_name="trading.tasks.run_backtest_task",
+            instance_key=f"{uuid4()}:{uuid4()}",
+            meta={"execution_profile": {"ticks": 20}},
+        )
+        CeleryTaskStatus.objects.create(
+            task_name="trading.tasks.run_backtest_task",
+            instance_key=f"{task_id}:{uuid4()}",
+            meta={"execution_id": "unprofiled"},
+        )
+
+        records = ExecutionProfileCollector().snapshot(task_id=str(task_id))
+
+        assert len(records) == 1
+        assert records[0]["task_id"] == str(task_id)
+        assert records[0]["execution_id"] == str(execution_id)
+        assert records[0]["profile"] == {"ticks": 10}
+        assert len(ExecutionProfileCollector().snapshot()) == 2
@@ -0,0 +1,203 @@
+"""Unit tests for hourly trade outcome rollups behind periodic metrics."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from apps.trading.enums import Direction, TaskType
+from apps.trading.models import Position, TradeOutcomeRollup, TradingEvent
+from apps.trading.services import periodic_trade_metrics
+from apps.trading.services.periodic_trade_metrics import (
+    TradeOutcomeRollupRefresher,
+    build_periodic_trade_metrics,
+)
+from apps.trading.services.strategy_data_common import StrategyDataQuery
+from tests.integration.factories import BacktestTaskFactory
+
+START = datetime(2026, 3, 2, 14, 0, tzinfo=UTC)
+
+
+def _query(task, *, since=None, until=None) -> StrategyDataQuery:
+    return StrategyDataQuery(
+        execution_id=task.execution_id,
+        since=since,
+        until=until,
+        page=1,
+        page_size=100,
+        ordering="asc",
+        granularity="",
+        category="",
+        metric_keys=(),
+    )
+
+
+def _close(
+    task,
+    *,
+    at: datetime,
+    reason: str,
+    exit_price: str,
+    position: Position | None = None,
+) -> TradingEvent:
+    position = position or Position.objects.create(
+        task_type=TaskType.BACKTEST,
+        task_id=task.pk,
+        execution_id=task.execution_id,
+        instrument="USD_JPY",
+        direction=Direction.LONG,
+        units=1000,
+        entry_price=Decimal("150"),
+        entry_time=at - timedelta(minutes=5),
+        exit_price=Decimal(exit_price),
+        exit_time=at,
+        is_open=False,
+    )
+    return TradingEvent.objects.create(
+        task_type=TaskType.BACKTEST,
+        task_id=task.pk,
+        execution_id=task.execution_id,
+        event_type="close_position",
+        event_timestamp=at,
+        close_reason=reason,
+        position_id=position.id,
+        description="close",
+    )
+
+
+def _open(task, *, at: datetime) -> TradingEvent:
+    return TradingEvent.objects.create(
+        task_type=TaskType.BACKTEST,
+        task_id=task.pk,
+        execution_id=task.execution_id,
+        event_type="open_position",
+        event_timestamp=at,
+        description="open",
+    )
+
+
+def _build(task, **kwargs):
+    return build_periodic_trade_metrics(
+        task=task,
+        task_type_label=TaskType.BACKTEST.value,
+        query=_query(task, since=kwargs.pop("since", None), until=kwargs.pop("until", None)),
+        **kwargs,
+    )
+
+
+def _scan(task, **kwargs):
+    with patch.object(periodic_trade_metrics, "_accumulate_from_rollups", return_value=False):
+        return _build(task, **kwargs)
+
+
+@pytest.fixture
+def task():
+    task = BacktestTaskFactory(execution_id=uuid4(), instrument="USD_JPY")
+    for minutes in (0, 50, 70, 600, 601):
+        _open(task, at=START + timedelta(minutes=minutes))
+    _close(task, at=START + timedelta(minutes=20), reason="take_profit", exit_price="151")
+    _close(task, at=START + timedelta(hours=10, minutes=15), reason="stop_loss", exit_price="149")
+    return task
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("timezone_name", ["UTC", "Asia/Tokyo", "America/New_York"])
+def test_rollup_periods_match_the_event_scan(task, timezone_name):
+    result = _build(task, timezone_name=timezone_name)
+
+    assert TradeOutcomeRollup.objects.filter(execution_id=task.execution_id).count() == 3
+    assert result == _scan(task, timezone_name=timezone_name)
+
+
+@pytest.mark.django_db
+def test_partial_hours_at_window_edges_are_scanned(task):
+    since = START + timedelta(minutes=30)
+    until = START + timedelta(hours=10, minutes=10)
+
+    result = _build(task, since=since, until=until, timezone_name="Asia/Tokyo")
+
+    assert result == _scan(task, since=since, until=until, timezone_name="Asia/Tokyo")
+    day = result["periods"]["day"]
+    assert sum(row["open_positions"] for row in day) == 4
+    assert sum(row["tp_closes"] + row["sl_closes"] for row in day) == 0
+
+
+@pytest.mark.django_db
+def test_half_hour_timezones_fall_back_to_the_event_scan(task):
+    result = _build(task, timezone_name="Asia/Kolkata")
+
+    assert result == _scan(task, timezone_name="Asia/Kolkata")
+    labels = [row["label"] for row in result["periods"]["day"]]
+    assert labels == ["2026-03-02", "2026-03-03"]
+
+
+@pytest.mark.django_db
+def test_processed_close_refreshes_its_hour(task):
+    _build(task, timezone_name="UTC")
+    event = _close(task, at=START + timedelta(minutes=40), reason="take_profit", exit_price="152")
+    refresher = TradeOutcomeRollupRefresher()
+
+    refresher.add(event)
+    assert TradeOutcomeRollup.objects.get(execution_id=task.execution_id, hour=START).tp_closes == 1
+    refresher.flush()
+
+    rollup = TradeOutcomeRollup.objects.get(execution_id=task.execution_id, hour=START)
+    assert rollup.tp_closes == 2
+    assert rollup.tp_profit == Decimal("3000")
+    assert rollup.open_positions == 2
+
+
+@pytest.mark.django_db
+def test_partial_close_across_hours_matches_the_event_scan(task):
+    _build(task, timezone_name="UTC")
+    refresher = TradeOutcomeRollupRefresher()
+    position = Position.objects.create(
+        task_type=TaskType.BACKTEST,
+        task_id=task.pk,
+        execution_id=task.execution_id,
+        instrument="USD_JPY",
+        direction=Direction.LONG,
+        units=1000,
+        entry_price=Decimal("150"),
+        entry_time=START,
+        is_open=True,
+    )
+    partial = _close(
+        task,
+        at=START + timedelta(hours=2, minutes=10),
+        reason="take_profit",
+        exit_price="151",
+        position=position,
+    )
+    refresher.add(partial)
+    refresher.flush()
+
+    Position.objects.filter(pk=position.pk).update(
+        is_open=False,
+        exit_price=Decimal("152"),
+        exit_time=START + timedelta(hours=3, minutes=5),
+    )
+    final = _close(
+        task,
+        at=START + timedelta(hours=3, minutes=5),
+        reason="take_profit",
+        exit_price="152",
+        position=position,
+    )
+    # Refreshing the partial close's hour again must not count the PnL twice.
+    refresher.add(partial)
+    refresher.add(final)
+    refresher.flush()
+
+    result = _build(task, timezone_name="UTC")
+    assert result == _scan(task, timezone_name="UTC")
+    hours = {
+        row.hour: row for row in TradeOutcomeRollup.objects.filter(execution_id=task.execution_id)
+    }
+    assert hours[START + timedelta(hours=2)].tp_closes == 1
+    assert hours[START + timedelta(hours=2)].tp_profit == Decimal("0")
+    assert hours[START + timedelta(hours=3)].tp_profit == Decimal("2000")
+    day = result["periods"]["day"]
+    assert sum(Decimal(row["tp_profit"]) for row in day) == Decimal("3000")
@@ -3,6 +3,7 @@
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from types import SimpleNamespace
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -11,7 +12,9 @@ from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
 from apps.market.models import MarketCandle
-from apps.trading.models.metrics import Metrics
+from apps.trading.models.metrics import Metrics, NetChartBucket
+from apps.trading.services import snowball_net_chart
+from apps.trading.services.metrics_aggregator import MetricsAggregator
 from apps.trading.services.snowball_net_chart import (
     NetChartWindow,
     _current_state,
@@ -347,3 +350,66 @@ def test_margin_threshold_lines_include_emergency_and_reduce_when_enabled():
         {"time": int(since.timestamp()), "value": 93.0},
         {"time": int(until.timestamp()), "value": 93.0},
     ]
+
+
+def _flush_net_metrics(task_id, execution_id, start: datetime, minutes: int) -> None:
+    aggregator = MetricsAggregator(task_type="backtest", task_id=task_id, execution_id=execution_id)
+    for minute in range(minutes):
+        aggregator.record(
+            start + timedelta(minutes=minute, seconds=30),
+            {
+                "snowball_net_net_units": 1000 + minute,
+                "snowball_net_current_price": Decimal("150") + Decimal(minute) / 100,
+                "realized_pnl_quote": minute * 10,
+            },
+        )
+    aggregator.flush(final=True)
+
+
+@pytest.mark.django_db
+def test_metrics_flush_writes_net_chart_buckets_per_granularity():
+    task_id = uuid4()
+    execution_id = uuid4()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    _flush_net_metrics(task_id, execution_id, start, minutes=20)
+
+    rows = NetChartBucket.objects.filter(execution_id=execution_id)
+    assert rows.filter(granularity="M1").count() == 20
+    m15 = list(rows.filter(granularity="M15").order_by("bucket"))
+    assert [row.bucket for row in m15] == [start, start + timedelta(minutes=15)]
+    assert m15[0].source_timestamp == start + timedelta(minutes=14)
+    assert m15[0].net_units == Decimal("1014")
+    assert rows.filter(granularity="D").get().net_units == Decimal("1019")
+
+
+@pytest.mark.django_db
+def test_net_chart_reads_complete_buckets_from_precomputed_rows():
+    task_id = uuid4()
+    execution_id = uuid4()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    _flush_net_metrics(task_id, execution_id, start, minutes=40)
+    task = SimpleNamespace(
+        pk=task_id,
+        instrument="USD_JPY",
+        account_currency="JPY",
+        config=SimpleNamespace(config_dict={}),
+    )
+    window = {
+        "task": task,
+        "task_type_label": "backtest",
+        "execution_id": execution_id,
+        "since": start + timedelta(minutes=3),
+        "until": start + timedelta(minutes=32),
+        "granularity_seconds": 5 * 60,
+    }
+
+    with patch.object(snowball_net_chart, "net_chart_coverage_start", return_value=None):
+        scanned = _load_oscillator_lines(**window)
+    assert _load_oscillator_lines(**window) == scanned
+
+    NetChartBucket.objects.filter(execution_id=execution_id, granularity="M5").update(
+        net_units=Decimal("1")
+    )
+    lines = _load_oscillator_lines(**window)
+    net_units = next(line for line in lines if line["id"] == "net_units")["points"]
+    assert [point["value"] for point in net_units] == [1004.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1032.0]
@@ -1,8 +1,15 @@
 """Unit tests for strategy visualization response shaping."""
 
+from types import SimpleNamespace
+
+from django.db.models import Q
+
+from apps.trading.services import strategy_cycles
 from apps.trading.services.strategy_cycles import (
     _merge_grid_state_with_trade_history,
+    _position_id_icontains_q,
     _public_strategy_state,
+    _trade_id_icontains_q,
 )
 
 
@@ -78,3 +85,17 @@ def test_grid_state_can_be_derived_from_trade_history_without_hot_state():
             "slot_count_per_layer": 1,
         },
     }
+
+
+def test_id_filters_use_trigram_indexable_like_on_postgresql(monkeypatch):
+    monkeypatch.setattr(strategy_cycles, "connection", SimpleNamespace(vendor="postgresql"))
+
+    assert _position_id_icontains_q("AB12") == Q(position_id_text__contains="ab12")
+    assert _trade_id_icontains_q("Cd3") == Q(id_text__contains="cd3")
+
+
+def test_id_filters_fall_back_to_icontains_on_other_backends(monkeypatch):
+    monkeypatch.setattr(strategy_cycles, "connection", SimpleNamespace(vendor="sqlite"))
+
+    assert _position_id_icontains_q("AB12") == Q(position_id_text__icontains="AB12")
+    assert _trade_id_icontains_q("Cd3") == Q(id_text__icontains="Cd3")
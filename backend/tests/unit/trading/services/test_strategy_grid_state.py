@@ -4,10 +4,20 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
 
 from apps.trading.enums import Direction
+from apps.trading.services import strategy_grid_state
 from apps.trading.services.strategy_cycles import _load_cycle_statuses
-from apps.trading.services.strategy_grid_state import build_cycle_grid_state_map
+from apps.trading.services.strategy_grid_state import (
+    build_cycle_grid_state_map,
+    cached_state_projection,
+    load_cycle_grid_state_map,
+    state_projection_cache_key,
+)
 from apps.trading.strategies.snowball.cycle_state import SnowballCycle, SnowballStrategyState
 from apps.trading.strategies.snowball.entries import Entry, StopLossClosedEntry
 from apps.trading.strategies.snowball.grid_models import Layer, PositionGrid, Slot
@@ -83,6 +93,149 @@ class TestBuildCycleGridStateMap:
         assert grid_state["layers"][0]["slots"][1]["build_count"] == 1
 
 
+def _cache_key(**execution_state) -> str | None:
+    return state_projection_cache_key(
+        "cycle_grid_state",
+        strategy_type="snowball",
+        task_type="backtest",
+        task_id=1,
+        execution_id="exec-1",
+        execution_state=execution_state,
+    )
+
+
+class TestLoadCycleGridStateMap:
+    UPDATED_AT = datetime(2026, 4, 11, 12, 0, tzinfo=UTC)
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _load(self, cache_key):
+        state = SnowballStrategyState(
+            cycles=[SnowballCycle(cycle_id=11, direction=Direction.LONG, trade_cycle_id="c-1")]
+        )
+        return load_cycle_grid_state_map(
+            strategy_type="snowball",
+            load_strategy_state=state.to_dict,
+            cache_key=cache_key,
+        )
+
+    def test_parses_state_once_per_revision(self):
+        key = _cache_key(state_version=3, updated_at=self.UPDATED_AT)
+        with patch.object(
+            strategy_grid_state,
+            "build_cycle_grid_state_map",
+            wraps=build_cycle_grid_state_map,
+        ) as build:
+            first = self._load(key)
+            second = self._load(key)
+
+        assert build.call_count == 1
+        assert second == first
+        assert "c-1" in first
+
+    def test_new_version_or_save_time_misses_the_cache(self):
+        keys = {
+            _cache_key(state_version=3, updated_at=self.UPDATED_AT),
+            _cache_key(state_version=4, updated_at=self.UPDATED_AT),
+            _cache_key(state_version=3, updated_at=self.UPDATED_AT.replace(second=1)),
+        }
+        with patch.object(
+            strategy_grid_state,
+            "build_cycle_grid_state_map",
+            wraps=build_cycle_grid_state_map,
+        ) as build:
+            for key in keys:
+                self._load(key)
+
+        assert len(keys) == 3
+        assert build.call_count == 3
+
+    def test_rows_without_a_revision_are_not_cached(self):
+        assert _cache_key(state_version=None, updated_at=self.UPDATED_AT) is None
+        with patch.object(
+            strategy_grid_state,
+            "build_cycle_grid_state_map",
+            wraps=build_cycle_grid_state_map,
+        ) as build:
+            self._load(None)
+            self._load(None)
+
+        assert build.call_count == 2
+
+    def test_strategy_state_is_only_loaded_on_a_miss(self):
+        key = _cache_key(state_version=3, updated_at=self.UPDATED_AT)
+        state = SnowballStrategyState(
+            cycles=[SnowballCycle(cycle_id=11, direction=Direction.LONG, trade_cycle_id="c-1")]
+        )
+        calls: list[int] = []
+
+        def load_strategy_state():
+            calls.append(1)
+            return state.to_dict()
+
+        for _ in range(2):
+            load_cycle_grid_state_map(
+                strategy_type="snowball",
+                load_strategy_state=load_strategy_state,
+                cache_key=key,
+            )
+
+        assert len(calls) == 1
+
+
+class TestCachedStateProjection:
+    KEY = "strategy-state-projection:test"
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_loader_errors_propagate_without_a_retry(self):
+        calls: list[int] = []
+
+        def loader():
+            calls.append(1)
+            raise ValueError("corrupt strategy_state")
+
+        with pytest.raises(ValueError, match="corrupt strategy_state"):
+            cached_state_projection(self.KEY, loader)
+
+        assert len(calls) == 1
+
+    def test_cache_errors_fall_back_to_the_loader(self):
+        with patch.object(
+            strategy_grid_state.CacheSingleFlight,
+            "get_or_load",
+            side_effect=ConnectionError("cache down"),
+        ):
+            assert cached_state_projection(self.KEY, lambda: {"c-1": "active"}) == {"c-1": "active"}
+
+    def test_cache_write_errors_keep_the_loaded_value(self):
+        calls: list[int] = []
+
+        def get_or_load(_key, loader, *, ttl_seconds):
+            _ = ttl_seconds
+            loader()
+            raise ConnectionError("cache down")
+
+        def loader():
+            calls.append(1)
+            return {"c-1": "active"}
+
+        with patch.object(
+            strategy_grid_state.CacheSingleFlight, "get_or_load", side_effect=get_or_load
+        ):
+            assert cached_state_projection(self.KEY, loader) == {"c-1": "active"}
+
+        assert len(calls) == 1
+
+
 class TestBuildCycleStatusMap:
     def test_returns_empty_for_unsupported_strategy(self):
         assert (
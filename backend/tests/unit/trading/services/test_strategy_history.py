@@ -0,0 +1,181 @@
+"""Unit tests for merged, keyset-paginated strategy history."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+
+from apps.trading.enums import TaskType
+from apps.trading.models import StrategyEventRecord, Trade, TradingEvent
+from apps.trading.services.strategy_data_common import StrategyDataQuery
+from apps.trading.services.strategy_history import load_history_page
+from tests.integration.factories import BacktestTaskFactory
+
+START = datetime(2026, 4, 6, 9, 0, tzinfo=UTC)
+
+
+def _query(task, **overrides) -> StrategyDataQuery:
+    query = StrategyDataQuery(
+        execution_id=task.execution_id,
+        since=None,
+        until=None,
+        page=1,
+        page_size=4,
+        ordering="timestamp",
+        granularity="raw",
+        category="all",
+        metric_keys=(),
+    )
+    return replace(query, **overrides)
+
+
+def _scope(task) -> dict:
+    return {
+        "task_type": TaskType.BACKTEST.value,
+        "task_id": task.pk,
+        "execution_id": task.execution_id,
+    }
+
+
+@pytest.fixture
+def task():
+    task = BacktestTaskFactory(execution_id=uuid4())
+    for minute in (0, 3, 3, 7, 12):
+        Trade.objects.create(
+            **_scope(task),
+            timestamp=START + timedelta(minutes=minute),
+            direction="long",
+            units=1000,
+            instrument="USD_JPY",
+            price=Decimal("150"),
+            execution_method="open_position",
+        )
+    for sequence, minute in enumerate((1, 3, 3, 8, 12)):
+        TradingEvent.objects.create(
+            **_scope(task),
+            event_type="tick",
+            description="tick",
+            event_timestamp=START + timedelta(minutes=minute),
+            sequence_number=sequence % 2,
+        )
+    for minute in (2, 3, 9):
+        StrategyEventRecord.objects.create(
+            **_scope(task),
+            event_type="grid",
+            description="grid",
+            event_timestamp=START + timedelta(minutes=minute),
+        )
+    return task
+
+
+def _page_mode_rows(task, **overrides) -> list[dict]:
+    page = load_history_page(
+        task=task,
+        task_type_label=TaskType.BACKTEST.value,
+        query=_query(task, page_size=100, **overrides),
+    )
+    return page.rows
+
+
+def _walk(task, **overrides) -> list[dict]:
+    rows: list[dict] = []
+    cursor = ""
+    while cursor is not None:
+        page = load_history_page(
+            task=task,
+            task_type_label=TaskType.BACKTEST.value,
+            query=_query(task, cursor=cursor, **overrides),
+        )
+        assert len(page.rows) <= 4
+        rows.extend(page.rows)
+        cursor = page.next_cursor
+    return rows
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["timestamp", "-timestamp"])
+def test_merge_interleaves_sources_in_timestamp_order(task, ordering):
+    rows = _page_mode_rows(task, ordering=ordering)
+
+    timestamps = [row["timestamp"] for row in rows]
+    assert len(rows) == 13
+    assert timestamps == sorted(timestamps, reverse=ordering == "-timestamp")
+    at_three = [row["source"] for row in rows if row["timestamp"].startswith("2026-04-06T09:03")]
+    expected = ["trade", "trade", "trading_event", "trading_event", "strategy_event"]
+    assert at_three == (expected if ordering == "timestamp" else expected[::-1])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["timestamp", "-timestamp"])
+@pytest.mark.parametrize("granularity", ["raw", "M5"])
+def test_cursor_walk_matches_page_mode(task, ordering, granularity):
+    expected = _page_mode_rows(task, ordering=ordering, granularity=granularity)
+
+    assert _walk(task, ordering=ordering, granularity=granularity) == expected
+
+
+@pytest.mark.django_db
+def test_bucketed_history_keeps_the_latest_row_per_source_bucket(task):
+    rows = _page_mode_rows(task, granularity="M5")
+
+    assert [(row["source"], row["timestamp"][11:16]) for row in rows] == [
+        ("trade", "09:03"),
+        ("trading_event", "09:03"),
+        ("strategy_event", "09:03"),
+        ("trade", "09:07"),
+        ("trading_event", "09:08"),
+        ("strategy_event", "09:09"),
+        ("trade", "09:12"),
+        ("trading_event", "09:12"),
+    ]
+
+
+@pytest.mark.django_db
+def test_previous_cursor_returns_the_prior_page(task):
+    first = load_history_page(
+        task=task, task_type_label=TaskType.BACKTEST.value, query=_query(task, cursor="")
+    )
+    second = load_history_page(
+        task=task,
+        task_type_label=TaskType.BACKTEST.value,
+        query=_query(task, cursor=first.next_cursor),
+    )
+    back = load_history_page(
+        task=task,
+        task_type_label=TaskType.BACKTEST.value,
+        query=_query(task, cursor=second.previous_cursor),
+    )
+
+    assert first.previous_cursor is None
+    assert back.rows == first.rows
+    assert back.previous_cursor is None
+
+
+@pytest.mark.django_db
+def test_page_mode_counts_in_sql_and_skips_unselected_sources(task):
+    with CaptureQueriesContext(connection) as queries:
+        page = load_history_page(
+            task=task,
+            task_type_label=TaskType.BACKTEST.value,
+            query=_query(task, category="trade", page=2, page_size=2),
+        )
+
+    assert page.count == 5
+    assert page.has_next is True
+    assert {row["source"] for row in page.rows} == {"trade"}
+    assert not any("trading_events" in query["sql"] for query in queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_is_rejected(task):
+    with pytest.raises(ValidationError):
+        load_history_page(
+            task=task,
+            task_type_label=TaskType.BACKTEST.value,
+            query=_query(task, cursor="not-a-cursor"),
+        )
@@ -14,6 +14,7 @@ from apps.trading.models.orders import Order, OrderStatus, OrderType
 from apps.trading.models.positions import Position
 from apps.trading.models.trades import Trade
 from apps.trading.services.task_activity import TaskActivityQueryService
+from apps.trading.views.pagination import TradePositionKeysetPagination
 from tests.integration.factories import BacktestTaskFactory
 
 
@@ -591,3 +592,48 @@ def test_logs_ordering_is_applied_to_queryset():
     )
 
     assert list(queryset.values_list("component", flat=True)) == ["alpha", "zeta"]
+
+
+@pytest.mark.django_db
+def test_trade_cursor_pages_match_page_number_rows():
+    task = BacktestTaskFactory()
+    for index in range(5):
+        Trade.objects.create(
+            task_type=TaskType.BACKTEST,
+            task_id=task.pk,
+            execution_id=task.execution_id,
+            timestamp=datetime(2026, 1, 1, 0, index // 2, tzinfo=UTC),
+            direction=Direction.LONG,
+            units=1000,
+            instrument="USD_JPY",
+            price=Decimal("150.000"),
+            execution_method="open_position",
+            sequence_number=index,
+        )
+    service = TaskActivityQueryService()
+    expected, _total, _page, _page_size = service.trades(
+        request=_request("/tasks/1/trades/?page_size=10"),
+        task=task,
+        task_type_label=TaskType.BACKTEST,
+    )
+
+    walked: list[dict] = []
+    path = "/tasks/1/trades/?page_size=2&cursor="
+    while path:
+        request = _request(path)
+        queryset, query = service.trades_queryset(
+            request=request, task=task, task_type_label=TaskType.BACKTEST
+        )
+        paginator = TradePositionKeysetPagination()
+        walked.extend(
+            service.trade_rows(
+                paginator.paginate_queryset(queryset, request),
+                task=task,
+                task_type_label=TaskType.BACKTEST,
+                execution_id=query.execution.execution_id,
+            )
+        )
+        path = paginator.get_next_link()
+
+    assert [row["id"] for row in walked] == [row["id"] for row in expected]
+    assert len(walked) == 5
@@ -158,21 +158,22 @@ def test_backtest_capacity_ignores_stale_publishers(settings) -> None:
     assert decision.allowed is True
 
 
-def test_queue_usage_counts_only_active_tasks_for_dedicated_queue() -> None:
-    inspector = MagicMock()
-    inspector.active_queues.return_value = {
-        "worker-market@host": [{"name": "market"}],
-        "worker-trading@host": [{"name": "trading"}],
-    }
-    inspector.active.return_value = {
-        "worker-market@host": [{"name": "market.tasks.subscribe_ticks_to_db"}],
-        "worker-trading@host": [{"name": "trading.tasks.run_trading_task"}],
-    }
-    inspector.reserved.return_value = {
-        "worker-market@host": [{"name": "market.tasks.publish_oanda_ticks"}],
-        "worker-trading@host": [],
-    }
-
-    with patch("apps.trading.services.task_capacity.current_app.control.inspect") as mock_inspect:
-        mock_inspect.return_value = inspector
+def test_queue_usage_reads_the_worker_capacity_registry(settings) -> None:
+    settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = True
+
+    with patch(
+        "apps.trading.services.worker_capacity.WorkerCapacityRegistry.queue_usage",
+        return_value=1,
+    ) as mock_usage:
         assert TaskCapacityService()._queue_usage("market") == 1
+
+    mock_usage.assert_called_once_with("market")
+
+
+def test_queue_usage_falls_back_when_registry_is_disabled(settings) -> None:
+    settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = False
+
+    with patch("apps.trading.services.worker_capacity.WorkerCapacityRegistry") as mock_registry:
+        assert TaskCapacityService()._queue_usage("market") is None
+
+    mock_registry.assert_not_called()
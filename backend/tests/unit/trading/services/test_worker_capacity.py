@@ -0,0 +1,126 @@
+"""Tests for the Redis worker capacity registry."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import fakeredis
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from apps.trading.services.worker_capacity import (
+    WORKER_CAPACITY_HEARTBEATS_KEY,
+    WorkerCapacityRegistry,
+    load_queue_usage,
+    queue_names,
+    usage_from_inspect,
+)
+
+
+def _registry(**worker_queues: list[str]) -> WorkerCapacityRegistry:
+    registry = WorkerCapacityRegistry(
+        redis_client=fakeredis.FakeRedis(decode_responses=True),
+        stale_after_seconds=60,
+    )
+    for worker, queues in worker_queues.items():
+        registry.heartbeat(f"{worker}@host", queues=queues)
+    return registry
+
+
+class TestWorkerCapacityRegistry:
+    def test_counts_started_tasks_until_they_finish(self):
+        registry = _registry(w1=["trading"], w2=["market"])
+        registry.task_started(task_id="t1", worker="w1@host")
+        registry.task_started(task_id="t2", worker="w1@host")
+        registry.task_started(task_id="m1", worker="w2@host")
+
+        assert registry.queue_usage("trading") == 2
+        registry.task_finished(task_id="t1")
+        assert registry.queue_usage("trading") == 1
+        assert registry.queue_usage("market") == 1
+
+    def test_every_task_on_a_worker_counts_against_each_queue_it_consumes(self):
+        registry = _registry(shared=["market", "trading"], other=["backtest"])
+        # A task routed through another queue still occupies the shared pool.
+        registry.task_started(task_id="t1", worker="shared@host")
+        registry.task_started(task_id="d1", worker="shared@host")
+        registry.task_started(task_id="b1", worker="other@host")
+
+        assert registry.queue_usage("trading") == 2
+        assert registry.queue_usage("market") == 2
+        assert registry.queue_usage("backtest") == 1
+
+    def test_unknown_until_a_worker_reports(self):
+        assert _registry().queue_usage("trading") is None
+
+    def test_tasks_of_stale_workers_are_ignored(self):
+        registry = _registry(dead=["trading"], live=["trading"])
+        registry.task_started(task_id="t1", worker="dead@host")
+        registry.task_started(task_id="t2", worker="live@host")
+        registry.redis.hset(WORKER_CAPACITY_HEARTBEATS_KEY, "dead@host", 0)
+
+        assert registry.queue_usage("trading") == 1
+
+    def test_replace_rewrites_tasks_and_drops_silent_workers(self):
+        registry = _registry(gone=["trading"], w1=["trading"])
+        registry.task_started(task_id="lost", worker="gone@host")
+        registry.task_started(task_id="t1", worker="w1@host")
+
+        registry.replace(
+            tasks={"t1": "w1@host", "t9": "w1@host"},
+            worker_queues={"w1@host": ["trading"]},
+        )
+
+        assert registry.redis.hkeys(WORKER_CAPACITY_HEARTBEATS_KEY) == ["w1@host"]
+        assert registry.queue_usage("trading") == 2
+
+    def test_remove_worker_drops_its_tasks(self):
+        registry = _registry(w1=["backtest"], w2=["backtest"])
+        registry.task_started(task_id="b1", worker="w1@host")
+        registry.task_started(task_id="b2", worker="w2@host")
+
+        registry.remove_worker("w1@host")
+
+        assert registry.queue_usage("backtest") == 1
+
+    def test_registries_share_one_redis_client_with_timeout(self, settings):
+        settings.MARKET_REDIS_URL = "redis://capacity.invalid:6379/0"
+        settings.CELERY_WORKER_CAPACITY_REDIS_TIMEOUT_SECONDS = 0.5
+
+        client = WorkerCapacityRegistry().redis
+
+        assert WorkerCapacityRegistry().redis is client
+        connection_kwargs = client.connection_pool.connection_kwargs
+        assert connection_kwargs["socket_timeout"] == 0.5
+        assert connection_kwargs["socket_connect_timeout"] == 0.5
+
+
+def test_load_queue_usage_reads_redis_timeouts_as_unknown(settings):
+    settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = True
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value.execute.side_effect = RedisTimeoutError("timed out")
+
+    assert load_queue_usage("trading", WorkerCapacityRegistry(redis_client=redis_client)) is None
+
+
+def test_usage_from_inspect_counts_active_tasks_on_queue_workers():
+    usage = usage_from_inspect(
+        active_queues={
+            "worker-market@host": [{"name": "market"}],
+            "worker-trading@host": [{"name": "trading"}],
+        },
+        active={
+            "worker-market@host": [{"id": "m1", "name": "market.tasks.subscribe_ticks_to_db"}],
+            "worker-trading@host": [{"id": "t1", "name": "trading.tasks.run_trading_task"}],
+        },
+        queues=("market", "backtest"),
+    )
+
+    assert usage == {"market": {"m1": "worker-market@host"}, "backtest": {}}
+
+
+def test_queue_names_reads_kombu_queues_and_inspect_entries():
+    class _Queue:
+        name = "trading"
+
+    assert queue_names([_Queue(), {"name": "market"}, {"name": ""}]) == ["trading", "market"]
+    assert queue_names(None) == []
@@ -0,0 +1,83 @@
+"""Unit tests for strategy schema and parsed config caches."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.trading.strategies.base import Strategy
+from apps.trading.strategies.config_cache import (
+    StrategyConfigCache,
+    compiled_schema_validator,
+    strategy_config_cache_key,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"base_units": {"type": "integer", "minimum": 1}},
+}
+
+
+def _config(*, pk="cfg-1", updated_at=None):
+    return SimpleNamespace(
+        pk=pk,
+        strategy_type="snowball",
+        updated_at=updated_at or datetime(2026, 1, 5, tzinfo=UTC),
+    )
+
+
+class TestCompiledSchemaValidator:
+    def test_validator_is_compiled_once_per_schema(self):
+        schema = dict(SCHEMA)
+
+        assert compiled_schema_validator(schema) is compiled_schema_validator(schema)
+
+    def test_equal_but_distinct_schema_gets_its_own_validator(self):
+        assert compiled_schema_validator(dict(SCHEMA)) is not compiled_schema_validator(
+            dict(SCHEMA)
+        )
+
+    def test_strategy_validation_reports_the_best_schema_error(self):
+        with pytest.raises(ValueError, match="less than the minimum"):
+            Strategy.validate_parameters(parameters={"base_units": 0}, config_schema=SCHEMA)
+
+
+class TestStrategyConfigCache:
+    def test_same_revision_is_parsed_once(self):
+        cache = StrategyConfigCache()
+        factory = MagicMock(return_value="parsed")
+
+        assert cache.get_or_create(_config(), factory) == "parsed"
+        assert cache.get_or_create(_config(), factory) == "parsed"
+
+        factory.assert_called_once()
+
+    def test_saved_revision_misses_the_cache(self):
+        cache = StrategyConfigCache()
+        saved = datetime(2026, 1, 5, tzinfo=UTC)
+
+        cache.get_or_create(_config(updated_at=saved), lambda: "old")
+        value = cache.get_or_create(_config(updated_at=saved + timedelta(seconds=1)), lambda: "new")
+
+        assert value == "new"
+
+    def test_unsaved_config_is_not_cached(self):
+        unsaved = SimpleNamespace(pk=None, strategy_type="snowball", updated_at=None)
+        cache = StrategyConfigCache()
+
+        assert strategy_config_cache_key(unsaved) is None
+        cache.get_or_create(unsaved, lambda: "parsed")
+        assert len(cache) == 0
+
+    def test_failures_are_not_cached_and_size_is_bounded(self):
+        cache = StrategyConfigCache(maxsize=2)
+
+        with pytest.raises(ValueError):
+            cache.get_or_create(_config(), MagicMock(side_effect=ValueError("bad")))
+        for index in range(3):
+            cache.get_or_create(_config(pk=f"cfg-{index}"), lambda: "parsed")
+
+        assert len(cache) == 2
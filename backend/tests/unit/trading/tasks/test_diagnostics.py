@@ -0,0 +1,62 @@
+"""Unit tests for opt-in execution diagnostics."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+
+from apps.trading.tasks.diagnostics import ExecutionProfiler
+
+
+def _run_query() -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+@pytest.mark.django_db
+def test_profiler_charges_queries_to_active_phase() -> None:
+    profiler = ExecutionProfiler(enabled=True)
+    profiler.start()
+    try:
+        with profiler.phase("strategy"):
+            _run_query()
+            _run_query()
+        _run_query()
+    finally:
+        profiler.stop()
+    _run_query()
+
+    snapshot = profiler.snapshot()
+    assert snapshot["phases"]["strategy"]["calls"] == 1
+    assert snapshot["phases"]["strategy"]["sql_queries"] == 2
+    assert snapshot["phases"]["strategy"]["sql_bytes"] == 2 * len("SELECT 1")
+    assert snapshot["phases"]["other"]["sql_queries"] == 1
+    assert snapshot["sql_queries"] == 3
+    assert profiler._record_query not in connection.execute_wrappers
+
+
+def test_disabled_profiler_is_inert() -> None:
+    profiler = ExecutionProfiler(enabled=False)
+
+    with profiler.phase("strategy"):
+        pass
+    profiler.record_batch(tick_count=10, elapsed_seconds=1.0)
+
+    snapshot = profiler.snapshot()
+    assert snapshot["phases"] == {}
+    assert snapshot["batches"] == 0
+    assert snapshot["ticks_per_second"] is None
+
+
+def test_record_batch_reports_ticks_per_second() -> None:
+    profiler = ExecutionProfiler(enabled=True, recent_batch_limit=2)
+    profiler.started = True
+
+    for _ in range(3):
+        profiler.record_batch(tick_count=100, elapsed_seconds=0.5)
+
+    snapshot = profiler.snapshot()
+    assert snapshot["batches"] == 3
+    assert snapshot["ticks"] == 300
+    assert snapshot["ticks_per_second"] == 200.0
+    assert len(snapshot["recent_batches"]) == 2
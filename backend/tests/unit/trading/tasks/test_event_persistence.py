@@ -0,0 +1,139 @@
+"""Unit tests for strategy event persistence helpers."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from apps.trading.dataclasses import EventContext
+from apps.trading.enums import Direction, EventType, TaskType
+from apps.trading.events import GenericStrategyEvent, OpenPositionEvent
+from apps.trading.models import StrategyEventRecord, TradingEvent
+from apps.trading.tasks.event_persistence import (
+    StrategyEventWriteBuffer,
+    persist_strategy_events,
+)
+from tests.integration.factories import UserFactory
+
+
+def _context() -> EventContext:
+    return EventContext(
+        user=UserFactory(),
+        account=None,
+        instrument="USD_JPY",
+        task_id=uuid4(),
+        execution_id=uuid4(),
+        task_type=TaskType.BACKTEST,
+    )
+
+
+def _persist(context: EventContext, events: list, buffer: StrategyEventWriteBuffer):
+    return persist_strategy_events(
+        events=events,
+        context=context,
+        execution_id=context.execution_id,
+        strategy_type="snowball",
+        strategy_event_buffer=buffer,
+    )
+
+
+@pytest.mark.django_db
+def test_buffer_accumulates_strategy_events_across_ticks_until_flush() -> None:
+    context = _context()
+    buffer = StrategyEventWriteBuffer(max_records=100)
+
+    for _ in range(3):
+        _persist(context, [GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)], buffer)
+
+    assert len(buffer) == 3
+    assert not StrategyEventRecord.objects.filter(execution_id=context.execution_id).exists()
+
+    assert buffer.flush() == 3
+    assert len(buffer) == 0
+    assert StrategyEventRecord.objects.filter(execution_id=context.execution_id).count() == 3
+
+
+@pytest.mark.django_db
+def test_execution_event_flushes_pending_strategy_events() -> None:
+    context = _context()
+    buffer = StrategyEventWriteBuffer(max_records=100)
+    _persist(context, [GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)], buffer)
+
+    records = _persist(
+        context,
+        [
+            GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL),
+            OpenPositionEvent(
+                event_type=EventType.OPEN_POSITION,
+                direction=Direction.LONG.value,
+                price=Decimal("150.00"),
+                units=1000,
+                entry_id=1,
+            ),
+        ],
+        buffer,
+    )
+
+    assert [record.event_type for record in records] == ["open_position"]
+    assert records[0].pk is not None
+    assert len(buffer) == 0
+    assert StrategyEventRecord.objects.filter(execution_id=context.execution_id).count() == 2
+    assert TradingEvent.objects.filter(execution_id=context.execution_id).count() == 1
+
+
+@pytest.mark.django_db
+def test_buffer_flushes_itself_at_size_limit() -> None:
+    context = _context()
+    buffer = StrategyEventWriteBuffer(max_records=2)
+
+    _persist(context, [GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)], buffer)
+    assert len(buffer) == 1
+
+    _persist(context, [GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)], buffer)
+    assert len(buffer) == 0
+    assert StrategyEventRecord.objects.filter(execution_id=context.execution_id).count() == 2
+
+
+@pytest.mark.django_db
+def test_persist_without_buffer_writes_strategy_events_immediately() -> None:
+    context = _context()
+
+    persist_strategy_events(
+        events=[GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)],
+        context=context,
+        execution_id=context.execution_id,
+        strategy_type="snowball",
+    )
+
+    assert StrategyEventRecord.objects.filter(execution_id=context.execution_id).count() == 1
+
+
+@pytest.mark.django_db
+def test_failed_copy_falls_back_inside_outer_transaction() -> None:
+    from unittest.mock import patch
+
+    from django.db import DatabaseError, connection, transaction
+
+    from apps.trading.tasks import event_persistence
+
+    context = _context()
+    buffer = StrategyEventWriteBuffer(max_records=100)
+    _persist(context, [GenericStrategyEvent(event_type=EventType.STRATEGY_SIGNAL)], buffer)
+    copy_savepoints: list[int] = []
+
+    def _failing_copy(model, records):
+        copy_savepoints.append(len(connection.savepoint_ids))
+        raise DatabaseError("COPY failed")
+
+    with (
+        patch.object(event_persistence.connection, "vendor", "postgresql"),
+        patch.object(event_persistence, "_copy_records", side_effect=_failing_copy),
+        transaction.atomic(),
+    ):
+        outer_savepoints = len(connection.savepoint_ids)
+        assert buffer.flush() == 1
+
+    assert copy_savepoints == [outer_savepoints + 1]
+    assert StrategyEventRecord.objects.filter(execution_id=context.execution_id).count() == 1
@@ -3,6 +3,7 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+from apps.trading.tasks.diagnostics import ExecutionProfiler
 from apps.trading.tasks.execution_collaborators import (
     ExecutionStateRepository,
     ExecutionTickLoop,
@@ -51,6 +52,7 @@ class TestExecutionTickLoop:
             _process_tick_batch=MagicMock(),
             _persist_batch_progress=MagicMock(),
             _after_batch_processed=MagicMock(),
+            _profiler=ExecutionProfiler(enabled=False),
         )
 
         ExecutionTickLoop(executor).run(loop)
@@ -59,3 +61,41 @@ class TestExecutionTickLoop:
         executor._persist_batch_progress.assert_called_once_with(loop)
         executor._after_batch_processed.assert_called_once_with(loop)
         assert loop.batch_count == 1
+
+    def test_run_records_batch_throughput_when_profiling(self):
+        state = SimpleNamespace(ticks_processed=0)
+        loop = SimpleNamespace(
+            state=state,
+            no_tick_batches=0,
+            batch_count=0,
+            stopped_early=False,
+        )
+
+        def process_batch(loop, tick_batch):
+            loop.state.ticks_processed += len(tick_batch)
+
+        profiler = ExecutionProfiler(enabled=True)
+        profiler.start()
+        executor = SimpleNamespace(
+            logger=MagicMock(),
+            task=SimpleNamespace(pk="task-1"),
+            data_source=[[object(), object()], [object()]],
+            _flush_task_logs=MagicMock(),
+            _should_stop_before_batch=MagicMock(return_value=False),
+            _handle_empty_batch=MagicMock(return_value=False),
+            _process_tick_batch=process_batch,
+            _persist_batch_progress=MagicMock(),
+            _after_batch_processed=MagicMock(),
+            _profiler=profiler,
+        )
+
+        try:
+            ExecutionTickLoop(executor).run(loop)
+        finally:
+            profiler.stop()
+
+        snapshot = profiler.snapshot()
+        assert snapshot["batches"] == 2
+        assert snapshot["ticks"] == 3
+        assert [batch["ticks"] for batch in snapshot["recent_batches"]] == [2, 1]
+        assert snapshot["phases"]["data"]["calls"] == 3
@@ -57,3 +57,26 @@ class TestLiveTickDeliveryStateRepository:
 
         assert target.strategy_state["metrics"] == {"x": "1"}
         assert target.strategy_state["live_tick_delivery"] == current
+
+    def test_write_records_conflation_counts(self):
+        repository = LiveTickDeliveryStateRepository()
+        loop = SimpleNamespace(state=SimpleNamespace(strategy_state={}))
+        observed_at = datetime(2026, 5, 8, 12, tzinfo=UTC)
+
+        repository.write(
+            loop=loop,
+            status="ok",
+            tick_ts=observed_at,
+            observed_at=observed_at,
+            age_seconds=0.0,
+            max_age_seconds=30,
+            message="Live tick delivery is current.",
+            conflated_ticks=12,
+            batch_size=4,
+        )
+
+        current = repository.current(loop.state)
+
+        assert current is not None
+        assert current["conflated_ticks"] == 12
+        assert current["batch_size"] == 4
@@ -513,9 +513,13 @@ class TestSaveEvents:
                 execution_id=task.execution_id,
                 strategy_type="snowball",
             )
-            mock_se.objects.bulk_create.assert_called_once_with([strategy_record])
+            mock_se.objects.bulk_create.assert_not_called()
             assert result == []
 
+            executor._flush_buffered_events()
+
+            mock_se.objects.bulk_create.assert_called_once_with([strategy_record])
+
     @patch("apps.trading.tasks.executor.EventHandler")
     def test_save_events_creates_generic_trading_event_and_strategy_event_for_floor_open(
         self, mock_handler
@@ -6,6 +6,8 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from apps.trading.dataclasses.tick import Tick
 
 
@@ -238,3 +240,121 @@ class TestLiveTickDataSourceClose:
 
         # Should not raise
         source.close()
+
+
+class TestAdaptiveTickBatchController:
+    """Tests for live tick batch sizing."""
+
+    def _controller(self, **kwargs):
+        from apps.trading.tasks.source import AdaptiveTickBatchController
+
+        options = {"batch_size": 10, "max_batch_size": 200, "max_latency_seconds": 0.25}
+        options.update(kwargs)
+        return AdaptiveTickBatchController(**options)
+
+    def test_batch_limit_follows_measured_processing_time(self):
+        controller = self._controller()
+        assert controller.batch_limit() == 10
+
+        controller.record_processing(tick_count=10, elapsed_seconds=0.5)
+
+        assert controller.batch_limit() == 5
+
+    def test_backlog_extends_the_batch_up_to_the_cap(self):
+        controller = self._controller()
+        controller.record_processing(tick_count=1, elapsed_seconds=0.05)
+
+        assert controller.batch_limit(backlog=20) == 25
+        assert controller.batch_limit(backlog=500) == 200
+
+    def test_quiet_market_does_not_wait_for_the_next_tick(self):
+        controller = self._controller()
+        controller.record_arrival(0.0)
+        controller.record_arrival(2.0)
+
+        assert controller.wait_seconds(pending=1, batch_age=0.0) == 0.0
+
+    def test_busy_market_waits_for_the_remaining_budget(self):
+        controller = self._controller()
+        controller.record_arrival(0.0)
+        controller.record_arrival(0.01)
+        controller.record_processing(tick_count=1, elapsed_seconds=0.02)
+
+        assert controller.wait_seconds(pending=5, batch_age=0.05) == pytest.approx(0.1)
+
+    def test_static_mode_keeps_fixed_size_and_latency(self):
+        controller = self._controller(adaptive=False)
+        controller.record_processing(tick_count=1, elapsed_seconds=0.2)
+
+        assert controller.batch_limit(backlog=50) == 10
+        assert controller.wait_seconds(pending=3, batch_age=0.1) == pytest.approx(0.15)
+
+
+class _QueuedPubSub:
+    def __init__(self, messages: list[dict]) -> None:
+        self.messages = list(messages)
+
+    def subscribe(self, channel: str) -> None:
+        pass
+
+    def get_message(self, timeout: float = 0.0):
+        return self.messages.pop(0) if self.messages else None
+
+    def close(self) -> None:
+        pass
+
+
+def _tick_message(second: int, mid: str) -> dict:
+    import json
+
+    return {
+        "type": "message",
+        "data": json.dumps(
+            {
+                "instrument": "USD_JPY",
+                "timestamp": f"2026-01-05T00:00:{second:02d}Z",
+                "bid": mid,
+                "ask": mid,
+                "mid": mid,
+            }
+        ),
+    }
+
+
+class TestLiveTickDataSourceBatching:
+    """Tests for LiveTickDataSource backlog draining and conflation."""
+
+    def _first_batch(self, source, messages):
+        client = MagicMock()
+        client.pubsub.return_value = _QueuedPubSub(messages)
+        with (
+            patch("redis.Redis.from_url", return_value=client),
+            patch("time.sleep"),
+        ):
+            iterator = iter(source)
+            batch = next(iterator)
+            iterator.close()
+        return batch
+
+    def test_queued_backlog_is_drained_into_one_batch(self):
+        from apps.trading.tasks.source import LiveTickDataSource
+
+        source = LiveTickDataSource(channel="live:1:USD_JPY", instrument="USD_JPY", batch_size=2)
+        messages = [_tick_message(second, f"150.{second:03d}") for second in range(6)]
+
+        batch = self._first_batch(source, messages)
+
+        assert len(batch) == 6
+        assert source.batching_stats() == {"conflated_ticks": 0, "batch_size": 6, "backlog": 5}
+
+    def test_conflation_delivers_only_the_latest_tick(self):
+        from apps.trading.tasks.source import LiveTickDataSource
+
+        source = LiveTickDataSource(channel="live:1:USD_JPY", instrument="USD_JPY", conflate=True)
+        messages = [_tick_message(second, f"150.{second:03d}") for second in range(5)]
+
+        batch = self._first_batch(source, messages)
+
+        assert [tick.mid for tick in batch] == [Decimal("150.004")]
+        assert source.conflated_ticks == 4
+        assert source.batching_stats()["batch_size"] == 5
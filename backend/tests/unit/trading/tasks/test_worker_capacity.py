@@ -0,0 +1,76 @@
+"""Tests for worker capacity hooks and reconciliation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+
+from apps.trading.services.worker_capacity import WorkerCapacityRegistry
+from apps.trading.tasks.worker_capacity import (
+    reconcile_worker_capacity,
+    record_task_finished,
+    record_task_started,
+)
+
+
+def _task(queue: str, hostname: str = "w1@host") -> SimpleNamespace:
+    return SimpleNamespace(
+        request=SimpleNamespace(delivery_info={"routing_key": queue}, hostname=hostname)
+    )
+
+
+class TestTaskHooks:
+    def test_start_and_finish_update_the_registry(self, settings):
+        settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = True
+        registry = WorkerCapacityRegistry(redis_client=fakeredis.FakeRedis(decode_responses=True))
+        registry.heartbeat("w1@host", queues=["trading"])
+
+        with patch("apps.trading.tasks.worker_capacity._get_registry", return_value=registry):
+            record_task_started(task_id="t1", task=_task("trading"))
+            assert registry.queue_usage("trading") == 1
+            record_task_finished(task_id="t1", task=_task("trading"))
+
+        assert registry.queue_usage("trading") == 0
+
+    def test_task_from_another_queue_counts_against_its_worker(self, settings):
+        settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = True
+        registry = WorkerCapacityRegistry(redis_client=fakeredis.FakeRedis(decode_responses=True))
+        registry.heartbeat("w1@host", queues=["trading", "default"])
+
+        with patch("apps.trading.tasks.worker_capacity._get_registry", return_value=registry):
+            record_task_started(task_id="d1", task=_task("default"))
+
+        assert registry.queue_usage("trading") == 1
+
+    def test_registry_errors_do_not_fail_the_task(self, settings):
+        settings.CELERY_WORKER_CAPACITY_REGISTRY_ENABLED = True
+        registry = MagicMock()
+        registry.task_started.side_effect = ConnectionError("redis down")
+
+        with patch("apps.trading.tasks.worker_capacity._get_registry", return_value=registry):
+            record_task_started(task_id="t1", task=_task("trading"))
+
+
+class TestReconcileWorkerCapacity:
+    def test_rewrites_registry_from_inspect(self):
+        registry = WorkerCapacityRegistry(redis_client=fakeredis.FakeRedis(decode_responses=True))
+        registry.task_started(task_id="finished-long-ago", worker="w1@host")
+        inspector = MagicMock()
+        inspector.active_queues.return_value = {"w1@host": [{"name": "trading"}]}
+        inspector.active.return_value = {"w1@host": [{"id": "t1"}, {"id": "t2"}]}
+
+        counts = reconcile_worker_capacity(inspector=inspector, registry=registry)
+
+        assert counts is not None
+        assert counts["trading"] == 2
+        assert registry.queue_usage("trading") == 2
+
+    def test_no_reply_leaves_registry_untouched(self):
+        registry = MagicMock()
+        inspector = MagicMock()
+        inspector.active_queues.return_value = None
+
+        assert reconcile_worker_capacity(inspector=inspector, registry=registry) is None
+        registry.replace.assert_not_called()
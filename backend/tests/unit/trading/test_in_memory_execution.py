@@ -239,3 +239,105 @@ def test_materialize_execution_events_keeps_only_transient_execution_events() ->
     assert record.execution_id == execution_id
     assert record.entry_id == 10
     assert TradingEvent.objects.count() == 0
+
+
+class _BacktestTaskStub(SimpleNamespace):
+    """Task double classified as a backtest by OrderService."""
+
+
+@pytest.mark.django_db
+def test_event_lifecycle_runs_without_sql_queries() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from apps.trading.in_memory_execution import InMemoryOrderService
+
+    task = _BacktestTaskStub(id=uuid4(), execution_id=uuid4(), account_currency="JPY")
+    order_service = InMemoryOrderService(account=None, task=task, dry_run=True)
+    handler = InMemoryEventHandler(order_service, "USD_JPY")
+    timestamp = datetime(2026, 1, 1, tzinfo=UTC)
+
+    with CaptureQueriesContext(connection) as queries:
+        first = handler.handle_open_position(
+            OpenPositionEvent(
+                event_type=EventType.OPEN_POSITION,
+                timestamp=timestamp,
+                layer_number=1,
+                direction=Direction.LONG.value,
+                price=Decimal("150.00"),
+                units=1000,
+                entry_id=1,
+            )
+        )
+        cycle_id = handler._position_id_to_cycle_id[str(first.id)]
+        child_event = OpenPositionEvent(
+            event_type=EventType.OPEN_POSITION,
+            timestamp=timestamp,
+            layer_number=1,
+            direction=Direction.LONG.value,
+            price=Decimal("149.50"),
+            units=1000,
+            entry_id=2,
+            retracement_count=1,
+        )
+        child_event.parent_entry_id = 1
+        child_event.root_entry_id = 1
+        child = handler.handle_open_position(child_event)
+
+        stop_event = ClosePositionEvent(
+            event_type=EventType.CLOSE_POSITION,
+            timestamp=timestamp,
+            layer_number=1,
+            direction=Direction.LONG.value,
+            exit_price=Decimal("149.00"),
+            units=1000,
+            entry_id=2,
+            position_id=str(child.id),
+        )
+        stop_event.close_reason = "stop_loss"
+        handler.handle_close_position(stop_event)
+
+        rebuild_event = RebuildPositionEvent(
+            event_type=EventType.REBUILD_POSITION,
+            timestamp=timestamp,
+            layer_number=1,
+            direction=Direction.LONG.value,
+            price=Decimal("149.00"),
+            units=1000,
+            entry_id=3,
+            original_position_id=str(child.id),
+        )
+        rebuild_event.root_entry_id = 1
+        rebuilt = handler.handle_rebuild_position(rebuild_event)
+
+        handler.handle_close_position(
+            ClosePositionEvent(
+                event_type=EventType.CLOSE_POSITION,
+                timestamp=timestamp,
+                layer_number=1,
+                direction=Direction.LONG.value,
+                exit_price=Decimal("150.50"),
+                units=1000,
+                entry_id=1,
+                position_id=str(first.id),
+            )
+        )
+        handler.handle_close_position(
+            ClosePositionEvent(
+                event_type=EventType.CLOSE_POSITION,
+                timestamp=timestamp,
+                layer_number=1,
+                direction=Direction.LONG.value,
+                exit_price=Decimal("150.00"),
+                units=1000,
+                entry_id=3,
+                position_id=str(rebuilt.id),
+            )
+        )
+
+    assert len(queries) == 0, [query["sql"] for query in queries.captured_queries]
+    assert handler._position_id_to_cycle_id == {}
+    assert handler._pending_rebuild_position_ids == {}
+    assert not rebuilt.is_open
+    assert handler._last_recorded_trade.cycle_id == cycle_id
+    assert order_service.get_open_positions(instrument="USD_JPY") == []
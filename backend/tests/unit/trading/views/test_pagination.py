@@ -1,10 +1,22 @@
 """Unit tests for trading views pagination."""
 
+from datetime import UTC, datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.trading.enums import TaskType
+from apps.trading.models.logs import TaskLog
 from apps.trading.views.pagination import (
+    ActivityKeysetPagination,
     ActivityPagination,
     StandardPagination,
     TradePositionPagination,
 )
+from tests.integration.factories import BacktestTaskFactory
 
 
 class TestStandardPagination:
@@ -34,3 +46,89 @@ class TestTradePositionPagination:
 
     def test_max_page_size(self):
         assert TradePositionPagination.max_page_size == 1000
+
+
+def _keyset_request(query: str = "") -> Request:
+    return Request(APIRequestFactory().get(f"/tasks/1/logs/?{query}"))
+
+
+def _cursor(link: str | None) -> str | None:
+    if link is None:
+        return None
+    return parse_qs(urlparse(link).query)["cursor"][0]
+
+
+@pytest.fixture
+def logs():
+    task = BacktestTaskFactory()
+    start = datetime(2026, 4, 6, 9, 0, tzinfo=UTC)
+    for index, minute in enumerate((0, 1, 1, 1, 2, 3, 3)):
+        log = TaskLog.objects.create(
+            task_type=TaskType.BACKTEST,
+            task_id=task.pk,
+            execution_id=task.execution_id,
+            component="strategy",
+            message=f"log-{index}",
+        )
+        TaskLog.objects.filter(pk=log.pk).update(timestamp=start + timedelta(minutes=minute))
+    return TaskLog.objects.filter(task_id=task.pk).order_by("-timestamp", "-id")
+
+
+@pytest.mark.django_db
+class TestActivityKeysetPagination:
+    def _page(self, queryset, query: str):
+        paginator = ActivityKeysetPagination()
+        rows = paginator.paginate_queryset(queryset, _keyset_request(query))
+        return rows, paginator.get_paginated_response([row.message for row in rows]).data
+
+    def test_walk_matches_offset_order_across_timestamp_ties(self, logs):
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            rows, data = self._page(logs, f"cursor={cursor}&page_size=2")
+            assert len(rows) <= 2
+            assert "count" not in data
+            seen.extend(data["results"])
+            cursor = _cursor(data["next"])
+
+        assert seen == [log.message for log in logs]
+
+    def test_previous_link_returns_the_prior_page(self, logs):
+        _rows, first = self._page(logs, "cursor=&page_size=3")
+        _rows, second = self._page(logs, f"cursor={_cursor(first['next'])}&page_size=3")
+        _rows, back = self._page(logs, f"cursor={_cursor(second['previous'])}&page_size=3")
+
+        assert first["previous"] is None
+        assert back["results"] == first["results"]
+        assert back["previous"] is None
+
+    def test_count_is_only_added_on_request(self, logs):
+        _rows, exact = self._page(logs, "cursor=&count=exact")
+        _rows, estimate = self._page(logs, "cursor=&count=estimate")
+
+        assert (exact["count"], exact["count_is_exact"]) == (7, True)
+        # Small result sets are recounted exactly instead of trusting the planner.
+        assert (estimate["count"], estimate["count_is_exact"]) == (7, True)
+
+    def test_nullable_ordering_and_bad_cursors_are_rejected(self, logs):
+        with pytest.raises(ValidationError):
+            self._page(logs.order_by("execution_id", "id"), "cursor=")
+        with pytest.raises(ValidationError):
+            self._page(logs, "cursor=not-a-cursor")
+        _rows, first = self._page(logs, "cursor=&page_size=2")
+        with pytest.raises(ValidationError):
+            self._page(logs.order_by("timestamp", "id"), f"cursor={_cursor(first['next'])}")
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [("", 100), ("page_size=25", 25), ("page_size=0", 100), ("page_size=-3", 100)],
+    )
+    def test_page_size_falls_back_to_the_default(self, query, expected):
+        assert ActivityKeysetPagination().get_page_size(_keyset_request(query)) == expected
+
+    def test_page_size_is_capped(self):
+        paginator = ActivityKeysetPagination()
+        request = _keyset_request("page_size=abc")
+        assert paginator.get_page_size(request) == paginator.page_size
+        request = _keyset_request(f"page_size={paginator.max_page_size + 1}")
+        assert paginator.get_page_size(request) == paginator.max_page_size